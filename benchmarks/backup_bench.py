@@ -0,0 +1,140 @@
+"""
+DERİN - Backup Benchmark
+════════════════════════
+Günlük değişim simülasyonu (SQLite benzeri sayfa güncellemeleri, büyüyen
+checkpoint, yeni ses profilleri, silinen dosyalar) üzerinde her gün snapshot:
+tam kopya vs artımlı chunk deposu. Sonunda prune + gc + geri yükleme doğrulaması.
+
+    python benchmarks/backup_bench.py [--days 14] [--size-mb 256]
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import hashlib
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.backup_store import BackupRepository
+
+PAGE = 4096
+
+
+def random_bytes(rng: random.Random, n: int) -> bytes:
+    """Yarı sıkıştırılabilir veri (embedding / metin karışımı gibi)"""
+    half = n // 2
+    return rng.randbytes(half) + bytes(rng.choice(b"derin hafiza ") for _ in range(64)) * ((n - half) // 64 + 1)
+
+
+def build_tree(root: Path, size_mb: int, rng: random.Random):
+    (root / "vector_store").mkdir(parents=True)
+    (root / "checkpoints").mkdir()
+    (root / "voice_profiles").mkdir()
+    db_size = size_mb * 1024 * 1024 * 3 // 4
+    with open(root / "vector_store" / "chroma.sqlite3", "wb") as f:
+        for _ in range(db_size // (1 << 20)):
+            f.write(random_bytes(rng, 1 << 20))
+    for i in range(4):
+        with open(root / "vector_store" / f"segment_{i}.bin", "wb") as f:
+            f.write(random_bytes(rng, size_mb * 1024 * 1024 // 32))
+    with open(root / "checkpoints" / "lora_adapter.pt", "wb") as f:
+        f.write(random_bytes(rng, size_mb * 1024 * 1024 // 8))
+    for i in range(20):
+        (root / "voice_profiles" / f"person_{i}.npy").write_bytes(rng.randbytes(64 * 1024))
+
+
+def churn(root: Path, day: int, rng: random.Random):
+    """Bir günlük değişim"""
+    db = root / "vector_store" / "chroma.sqlite3"
+    size = db.stat().st_size
+    with open(db, "r+b") as f:
+        # Sayfa güncellemeleri (%0.2; çoğu sıcak bölgede - son %10) + sona ekleme
+        pages = size // PAGE
+        for _ in range(max(1, pages // 500)):
+            hot = rng.random() < 0.8
+            page = rng.randrange(pages - pages // 10, pages) if hot else rng.randrange(pages)
+            f.seek(page * PAGE)
+            f.write(rng.randbytes(PAGE))
+        f.seek(0, os.SEEK_END)
+        f.write(random_bytes(rng, 2 << 20))
+    with open(root / "checkpoints" / "lora_adapter.pt", "ab") as f:
+        f.write(random_bytes(rng, 1 << 20))
+    (root / "voice_profiles" / f"new_{day}.npy").write_bytes(rng.randbytes(64 * 1024))
+    old = sorted((root / "voice_profiles").glob("person_*.npy"))
+    if old and day % 3 == 0:
+        old[0].unlink()
+
+
+def tree_digest(root: Path) -> dict:
+    return {p.relative_to(root).as_posix(): hashlib.blake2b(p.read_bytes()).hexdigest()
+            for p in sorted(root.rglob("*")) if p.is_file()}
+
+
+def dir_size(root: Path) -> int:
+    return sum(p.stat().st_size for p in root.rglob("*") if p.is_file())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backup benchmark")
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--chunk-kb", type=int, default=256)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    work = Path(tempfile.mkdtemp(prefix="derin_backup_bench_"))
+    try:
+        data = work / "data"
+        build_tree(data, args.size_mb, rng)
+        targets = {name: data / name for name in ("vector_store", "checkpoints", "voice_profiles")}
+        repo = BackupRepository(work / "repo", chunk_size=args.chunk_kb * 1024)
+
+        full_total = full_time = 0.0
+        print(f"{'gün':>4}{'veri':>10}{'tam kopya':>12}{'yeni':>10}{'tekrar':>10}{'depoya':>10}{'artımlı':>10}")
+        for day in range(args.days):
+            if day:
+                churn(data, day, rng)
+                time.sleep(0.01)  # mtime çözünürlüğü
+
+            copy_dir = work / "full_copy"
+            started = time.perf_counter()
+            shutil.copytree(data, copy_dir)
+            copy_s = time.perf_counter() - started
+            full_time += copy_s
+            full_total += dir_size(copy_dir)
+            shutil.rmtree(copy_dir)
+
+            m = repo.backup(targets, tag=f"day{day}")
+            print(f"{day:>4}{m['total_size_bytes'] / 2**20:>8.0f}MB{copy_s:>10.2f}s"
+                  f"{m['new_bytes'] / 2**20:>8.1f}MB{m['reused_bytes'] / 2**20:>8.0f}MB"
+                  f"{m['stored_bytes'] / 2**20:>8.1f}MB{m['duration_seconds']:>9.2f}s")
+
+        status = repo.get_status()
+        print(f"\nTam kopyalar: {full_total / 2**20:.0f} MB, {full_time:.1f}s  |  "
+              f"chunk deposu: {status['total_size_mb']:.0f} MB ({status['total_backups']} snapshot)")
+
+        removed = repo.prune(keep_last=2, keep_daily=3, keep_weekly=0, keep_monthly=0)
+        freed = repo.gc()
+        print(f"Prune: {len(removed)} snapshot silindi, gc {freed['chunks_removed']} chunk / "
+              f"{freed['bytes_freed'] / 2**20:.0f} MB boşalttı → {repo.get_status()['total_size_mb']:.0f} MB")
+
+        latest = repo.snapshot_ids()[-1]
+        restored = repo.restore(latest, work / "restored")
+        ok = all(tree_digest(work / "restored" / name) == tree_digest(data / name) for name in targets)
+        print(f"Geri yükleme: {restored['files']} dosya, {restored['bytes'] / 2**20:.0f} MB, "
+              f"{restored['duration_seconds']:.2f}s - {'birebir aynı' if ok else 'FARKLI!'}")
+        verify = repo.verify(latest)
+        print(f"Doğrulama: {verify['chunks']} chunk, {len(verify['errors'])} hata")
+        if not ok or verify["errors"]:
+            sys.exit(1)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+DERİN - Batch Recall Benchmark
+══════════════════════════════
+Tur başına birden fazla hatırlama sorgusu (konuşma, sahne, aktif hedefler):
+sorgu başına ayrı arama vs tek vektörize geçiş (core.batch_recall).
+
+    python benchmarks/batch_recall_bench.py [--sizes 10000 100000 1000000] [--queries 8]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.batch_recall import RecallWeights, batch_topk, memory_prior
+
+DIM = 384
+
+
+def make_memory(n: int, rng: np.random.Generator, now: float):
+    memory = np.empty((n, DIM), dtype=np.float32)
+    for start in range(0, n, 100_000):
+        block = rng.standard_normal((min(100_000, n - start), DIM), dtype=np.float32)
+        memory[start:start + len(block)] = block / np.linalg.norm(block, axis=1, keepdims=True)
+    importance = rng.beta(2, 5, n).astype(np.float32)
+    touched = now - rng.uniform(0, 365 * 86400, n)
+    return memory, importance, touched
+
+
+def per_query(queries, memory, importance, touched, weights, k, now):
+    """Eski yol: her sorgu kendi aramasını ve skorlamasını yapar"""
+    results = []
+    for q in queries:
+        scores = weights.similarity * (memory @ q) + memory_prior(importance, touched, weights, now)
+        top = np.argpartition(scores, -k)[-k:]
+        results.append(top[np.argsort(-scores[top])])
+    return np.stack(results)
+
+
+def batched(queries, memory, importance, touched, weights, k, now):
+    prior = memory_prior(importance, touched, weights, now)
+    idx, _, _ = batch_topk(queries, memory, prior, k, weights.similarity)
+    return idx
+
+
+def timed(fn, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch recall benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=8)
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(5)
+    now = time.time()
+    weights = RecallWeights()
+    print(f"{args.queries} sorgu/tur, top-{args.k}, d={DIM}")
+    print(f"{'anı':>10}{'sorgu başına':>15}{'batch':>12}{'hız':>8}")
+    for n in args.sizes:
+        memory, importance, touched = make_memory(n, rng, now)
+        queries = memory[rng.choice(n, args.queries, replace=False)] + 0.1 * rng.standard_normal(
+            (args.queries, DIM), dtype=np.float32)
+        queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+        repeat = 5 if n <= 100_000 else 2
+        single_s, expected = timed(lambda: per_query(queries, memory, importance, touched, weights, args.k, now),
+                                   repeat)
+        batch_s, got = timed(lambda: batched(queries, memory, importance, touched, weights, args.k, now), repeat)
+        assert (expected == got).all(), "batch sonucu farklı"
+        print(f"{n:>10,}{single_s * 1000:>13.1f}ms{batch_s * 1000:>10.1f}ms{single_s / batch_s:>7.1f}x")
+        del memory
+
+
+if __name__ == "__main__":
+    main()
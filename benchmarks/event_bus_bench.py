@@ -0,0 +1,99 @@
+"""
+DERİN - Event Bus Mikro Benchmark
+═════════════════════════════════
+1, 10 ve 100 abone ile publish→deliver gecikmesi (p50/p99) ve events/sec.
+
+    python benchmarks/event_bus_bench.py [--events 20000] [--workers 4]
+"""
+
+import sys
+import time
+import argparse
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.event_bus import EventBus, PRIORITY_HIGH
+from core.latency_tracer import percentile
+
+
+def run(subscribers: int, events: int, workers: int, batch_size: int) -> dict:
+    bus = EventBus(workers=workers, batch_size=batch_size, default_capacity=events)
+    latencies = []
+    lock = threading.Lock()
+    expected = subscribers * events
+    done = threading.Event()
+
+    def on_event(event):
+        latency = time.perf_counter() - event.timestamp
+        with lock:
+            latencies.append(latency)
+            if len(latencies) >= expected:
+                done.set()
+
+    for _ in range(subscribers):
+        bus.subscribe("BENCH", on_event)
+    bus.start()
+
+    started = time.perf_counter()
+    for i in range(events):
+        bus.publish("BENCH", {"i": i}, source="bench")
+    publish_elapsed = time.perf_counter() - started
+    done.wait(timeout=60.0)
+    elapsed = time.perf_counter() - started
+    bus.stop()
+
+    latencies.sort()
+    return {
+        "subscribers": subscribers,
+        "delivered": len(latencies),
+        "publish_per_sec": events / publish_elapsed,
+        "deliver_per_sec": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+
+def run_priority(workers: int, batch_size: int, backlog: int = 5000) -> float:
+    """Normal trafik kuyruktayken yüksek öncelikli olayın gecikmesi (ms)"""
+    bus = EventBus(workers=workers, batch_size=batch_size, default_capacity=backlog * 2)
+    received = threading.Event()
+    result = {}
+
+    def on_reflex(event):
+        result["latency"] = time.perf_counter() - event.timestamp
+        received.set()
+
+    for _ in range(10):
+        bus.subscribe("BENCH", lambda event: sum(range(200)))
+    bus.subscribe("REFLEX_STOP_AUDIO", on_reflex)
+    for i in range(backlog):
+        bus.publish("BENCH", {"i": i})
+    bus.start()
+    bus.publish("REFLEX_STOP_AUDIO", {}, source="brainstem", priority=PRIORITY_HIGH)
+    received.wait(timeout=10.0)
+    bus.stop()
+    return result.get("latency", float("nan")) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event bus mikro benchmark")
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    print(f"{'abone':>6} {'teslim':>9} {'publish/s':>12} {'deliver/s':>12} {'p50 ms':>9} {'p99 ms':>9}")
+    for subscribers in (1, 10, 100):
+        events = max(args.events // subscribers, 200)
+        r = run(subscribers, events, args.workers, args.batch_size)
+        print(f"{r['subscribers']:>6} {r['delivered']:>9} {r['publish_per_sec']:>12,.0f} "
+              f"{r['deliver_per_sec']:>12,.0f} {r['p50_ms']:>9.3f} {r['p99_ms']:>9.3f}")
+
+    print(f"\nÖncelik şeridi: 10 abonede 5000 olay birikmişken refleks gecikmesi "
+          f"{run_priority(args.workers, args.batch_size):.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+DERİN - Event Store Benchmark
+═════════════════════════════
+Sentetik çok milyonluk hayat günlüğü (aylar boyunca) üzerinde sorgu süreleri:
+segmentli/indeksli depo vs tüm günlüğü okuyup filtreleme.
+
+    python benchmarks/event_store_bench.py [--events 2000000] [--days 180]
+"""
+
+import sys
+import time
+import json
+import random
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.event_store import EventStore
+
+# (tip, ağırlık) - nadir tipler indeksin farkını gösterir
+TYPES = (("vision", 50), ("conversation", 25), ("emotion", 15), ("system", 9), ("milestone", 1))
+PEOPLE = ("Ali", "Ayşe", "Mehmet", None)
+
+
+def generate(count: int, start: float, days: float, seed: int = 7):
+    rng = random.Random(seed)
+    names = [t for t, _ in TYPES]
+    weights = [w for _, w in TYPES]
+    step = days * 86400 / count
+    ts = start
+    for i in range(count):
+        ts += rng.expovariate(1 / step)
+        event_type = rng.choices(names, weights)[0]
+        yield event_type, ts, {"summary": f"{event_type} olayı #{i}", "person": rng.choice(PEOPLE),
+                               "valence": round(rng.uniform(-1, 1), 3)}
+
+
+def naive_query(path: Path, since=None, until=None, types=None, limit=None):
+    """Eski yol: her şeyi yükle, filtrele"""
+    events = []
+    for segment in sorted(path.glob("seg-*.log")):
+        with open(segment, "rb") as f:
+            events.extend(json.loads(line) for line in f)
+    out = [e for e in events
+           if (since is None or e["ts"] >= since) and (until is None or e["ts"] <= until)
+           and (types is None or e["type"] in types)]
+    return out[-limit:] if limit else out
+
+
+def timed(fn, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Event store benchmark")
+    parser.add_argument("--events", type=int, default=2_000_000)
+    parser.add_argument("--days", type=float, default=180)
+    parser.add_argument("--segment-mb", type=int, default=16)
+    parser.add_argument("--naive", action="store_true", help="Tüm günlüğü okuyan yolu da ölç (yavaş)")
+    args = parser.parse_args()
+
+    directory = Path(tempfile.mkdtemp(prefix="derin_event_store_"))
+    try:
+        store = EventStore(directory, max_segment_bytes=args.segment_mb << 20)
+        start = time.time() - args.days * 86400
+        started = time.perf_counter()
+        batch = []
+        for record in generate(args.events, start, args.days):
+            batch.append(record)
+            if len(batch) == 10_000:
+                store.append_many(batch)
+                batch = []
+        store.append_many(batch)
+        write_s = time.perf_counter() - started
+        stats = store.get_stats()
+        print(f"{args.events:,} olay, {args.days:g} gün, {stats['segments']} segment, "
+              f"{stats['bytes'] / 1e6:.0f} MB  (yazma {args.events / write_s:,.0f} olay/s)")
+
+        reader = EventStore(directory, readonly=True)
+        middle = start + args.days * 86400 / 2
+        end = start + args.days * 86400
+        cases = [
+            ("son 20", lambda: reader.latest(20), {"limit": 20}),
+            ("son 20 milestone", lambda: reader.latest(20, types=["milestone"]),
+             {"types": {"milestone"}, "limit": 20}),
+            ("1 saat pencere (ortada)", lambda: reader.query(since=middle, until=middle + 3600),
+             {"since": middle, "until": middle + 3600}),
+            ("1 gün emotion (ortada)",
+             lambda: reader.query(since=middle, until=middle + 86400, types=["emotion"]),
+             {"since": middle, "until": middle + 86400, "types": {"emotion"}}),
+            ("son 1 saat Ali", lambda: reader.query(since=end - 3600, person="Ali"), None),
+        ]
+        print(f"\n  {'sorgu':<28}{'sonuç':>8}{'indeksli':>12}{'tam tarama':>14}")
+        for name, fn, naive_args in cases:
+            elapsed, result = timed(fn)
+            naive = "-"
+            if args.naive and naive_args is not None:
+                naive_s, expected = timed(lambda: naive_query(directory, **naive_args), repeat=1)
+                assert [e["ts"] for e in result] == [e["ts"] for e in expected], name
+                naive = f"{naive_s * 1000:.0f}ms"
+            print(f"  {name:<28}{len(result):>8}{elapsed * 1000:>10.2f}ms{naive:>14}")
+
+        started = time.perf_counter()
+        removed = store.compact()
+        print(f"\n  compact: {removed} segment birleşti ({(time.perf_counter() - started) * 1000:.0f}ms)")
+        store.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
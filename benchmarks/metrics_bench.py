@@ -0,0 +1,137 @@
+"""
+DERİN - Metrics Benchmark
+═════════════════════════
+Metrik kayıt maliyeti (işlem başına ns, boş döngü düşülmüş) ve scrape süresi.
+Karşılaştırma: her artırmada kilit alan sayaç.
+
+    python benchmarks/metrics_bench.py [--ops 1000000] [--threads 4] [--series 2000]
+"""
+
+import sys
+import time
+import argparse
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.metrics import MetricsRegistry
+
+
+class LockedCounter:
+    """Karşılaştırma: klasik kilitli sayaç"""
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+def per_op_ns(fn, ops: int) -> float:
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        fn(ops)
+        best = min(best, time.perf_counter() - started)
+    return best / ops * 1e9
+
+
+def threaded_ns(fn, ops: int, threads: int) -> float:
+    """Toplam duvar saati / toplam işlem (tüm thread'ler birlikte)"""
+    workers = [threading.Thread(target=fn, args=(ops // threads,)) for _ in range(threads)]
+    started = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return (time.perf_counter() - started) / ops * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Metrics benchmark")
+    parser.add_argument("--ops", type=int, default=1_000_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--series", type=int, default=2000, help="Scrape testi için etiketli seri sayısı")
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total")
+    labeled = registry.counter("bench_labeled_total", labels=("layer",))
+    child = labeled.labels(layer="reflex")
+    gauge = registry.gauge("bench_gauge")
+    histogram = registry.histogram("bench_seconds")
+    locked = LockedCounter()
+
+    def baseline(n):
+        for _ in range(n):
+            pass
+
+    def run_counter(n):
+        inc = counter.inc
+        for _ in range(n):
+            inc()
+
+    def run_child(n):
+        inc = child.inc
+        for _ in range(n):
+            inc()
+
+    def run_labels(n):
+        for _ in range(n):
+            labeled.labels(layer="reflex").inc()
+
+    def run_gauge(n):
+        set_ = gauge.set
+        for i in range(n):
+            set_(i)
+
+    def run_histogram(n):
+        observe = histogram.observe
+        for i in range(n):
+            observe(0.003)
+
+    def run_timer(n):
+        for _ in range(n):
+            with histogram.time():
+                pass
+
+    def run_locked(n):
+        inc = locked.inc
+        for _ in range(n):
+            inc()
+
+    base = per_op_ns(baseline, args.ops)
+    print(f"{args.ops:,} işlem, boş döngü {base:.0f}ns/işlem (aşağıdakilerden düşüldü)\n")
+    print(f"{'işlem':<34}{'1 thread':>12}{f'{args.threads} thread':>12}")
+    cases = [
+        ("counter.inc()", run_counter),
+        ("labels(...) önceden alınmış .inc()", run_child),
+        ("labels(layer=...).inc()", run_labels),
+        ("gauge.set()", run_gauge),
+        ("histogram.observe()", run_histogram),
+        ("with histogram.time()", run_timer),
+        ("kilitli sayaç (karşılaştırma)", run_locked),
+    ]
+    for name, fn in cases:
+        single = per_op_ns(fn, args.ops) - base
+        multi = threaded_ns(fn, args.ops, args.threads) - base
+        print(f"{name:<34}{single:>10.0f}ns{multi:>10.0f}ns")
+
+    expected = args.ops * 3 + args.ops // args.threads * args.threads
+    assert counter._default.value == expected, "thread'li sayaç değer kaybetti"
+
+    # Scrape: --series etiketli seri + histogram
+    scraped = registry.histogram("bench_scrape_seconds", labels=("topic",))
+    for i in range(args.series):
+        scraped.labels(topic=f"t{i}").observe(i * 1e-4)
+    started = time.perf_counter()
+    text = registry.exposition()
+    elapsed = time.perf_counter() - started
+    print(f"\nScrape: {text.count(chr(10)):,} satır, {len(text) / 1024:.0f}KB, {elapsed * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+DERİN - Speculative Response Benchmark
+══════════════════════════════════════
+Sahte katman gecikmeleriyle doğrudan cevap ↔ spekülatif cevap:
+algılanan (ilk söz) ve nihai gecikme p50/p95.
+
+    python benchmarks/speculative_bench.py [--queries 40] [--cortical-ms 1200] [--social-ms 150]
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.latency_tracer import percentile
+from core.speculative_response import SpeculationPolicy, SpeculativeResponder
+
+
+def fake_generate(latencies_ms, jitter: float):
+    """Katman başına ortalama gecikme ± jitter kadar uyuyan üretici"""
+    def generate(layer, prompt, max_tokens=None):
+        base = latencies_ms[layer]
+        time.sleep(max(0.0, random.gauss(base, base * jitter)) / 1000)
+        return f"{layer}: {prompt[:20]}"
+    return generate
+
+
+def run(responder: SpeculativeResponder, queries: int):
+    perceived, final = [], []
+    for i in range(queries):
+        result = responder.respond(f"soru {i}")
+        perceived.append(result.perceived_ms)
+        final.append(result.final_ms)
+    return sorted(perceived), sorted(final)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Speculative response benchmark")
+    parser.add_argument("--queries", type=int, default=40)
+    parser.add_argument("--cortical-ms", type=float, default=1200.0)
+    parser.add_argument("--social-ms", type=float, default=150.0)
+    parser.add_argument("--jitter", type=float, default=0.2, help="Gecikme sapması (ortalamanın oranı)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    latencies = {"cortical": args.cortical_ms, "social": args.social_ms, "reflex": args.social_ms / 2}
+    generate = fake_generate(latencies, args.jitter)
+    route = lambda query: "cortical"
+
+    cases = [
+        ("doğrudan (spekülasyon yok)", SpeculationPolicy(draft_layers={})),
+        ("spekülatif ack", SpeculationPolicy(mode="ack")),
+        ("spekülatif draft", SpeculationPolicy(mode="draft")),
+    ]
+    print(f"{args.queries} soru, cortical ~{args.cortical_ms:.0f}ms, social ~{args.social_ms:.0f}ms\n")
+    print(f"{'mod':<28}{'algılanan p50':>15}{'p95':>9}{'nihai p50':>12}{'p95':>9}")
+    for name, policy in cases:
+        responder = SpeculativeResponder(route, generate, policy=policy)
+        try:
+            perceived, final = run(responder, args.queries)
+        finally:
+            responder.shutdown()
+        print(f"{name:<28}{percentile(perceived, 50):>13.0f}ms{percentile(perceived, 95):>7.0f}ms"
+              f"{percentile(final, 50):>10.0f}ms{percentile(final, 95):>7.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
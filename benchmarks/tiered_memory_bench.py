@@ -0,0 +1,102 @@
+"""
+DERİN - Tiered Memory Benchmark
+═══════════════════════════════
+Bir yıllık anı simülasyonu: her gün yeni anılar (konu kümeleri, önem dağılımı),
+günde bir göç, gün içinde hatırlama sorguları (çoğu yakın konulardan).
+Ay sonlarında: katman boyutları, vektör RAM'i, hatırlama gecikmesi; karşılaştırma
+için her şeyi RAM'de tutan düz matris.
+
+    python benchmarks/tiered_memory_bench.py [--days 365] [--per-day 300]
+"""
+
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.tiered_memory import TieredMemory, TierPolicy
+
+DIM = 384
+
+
+class SimClock:
+    def __init__(self, start: float):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiered memory benchmark")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--per-day", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=40, help="Günlük hatırlama sorgusu")
+    parser.add_argument("--topics", type=int, default=400)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(11)
+    centers = rng.standard_normal((args.topics, DIM)).astype(np.float32)
+    centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+
+    def sample(topics):
+        v = centers[topics] + 0.7 * rng.standard_normal((len(topics), DIM)).astype(np.float32) / np.sqrt(DIM)
+        return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+    directory = Path(tempfile.mkdtemp(prefix="derin_tiered_memory_"))
+    clock = SimClock(time.time() - args.days * 86400)
+    memory = TieredMemory(DIM, TierPolicy(), directory=directory, clock=clock)
+    flat = np.zeros((args.days * args.per_day, DIM), dtype=np.float32)
+    total = 0
+    lat, flat_lat = [], []
+    searches = recalls = 0
+    print(f"{'ay':>3}{'anı':>9}{'sıcak':>7}{'ılık':>7}{'soğuk':>8}{'RAM':>9}{'düz RAM':>10}"
+          f"{'p50':>8}{'p95':>8}{'düz p50':>9}{'soğuk arama':>13}")
+    try:
+        for day in range(args.days):
+            # Her gün o dönemin "gündemindeki" konular ağırlıklı
+            active = rng.choice(args.topics, 20, replace=False)
+            topics = np.where(rng.random(args.per_day) < 0.7, rng.choice(active, args.per_day),
+                              rng.integers(0, args.topics, args.per_day))
+            vectors = sample(topics)
+            importance = np.clip(rng.beta(2, 5, args.per_day) + (rng.random(args.per_day) < 0.01) * 0.6, 0, 1)
+            for i in range(args.per_day):
+                clock.now += 86400 / args.per_day
+                memory.add(f"gün {day} anı {i} konu {topics[i]}", vectors[i], float(importance[i]))
+            flat[total:total + args.per_day] = vectors
+            total += args.per_day
+            memory.migrate()
+
+            queries = sample(np.where(rng.random(args.queries) < 0.8, rng.choice(active, args.queries),
+                                      rng.integers(0, args.topics, args.queries)))
+            for q in queries:
+                started = time.perf_counter()
+                memory.recall(q, k=5)
+                lat.append(time.perf_counter() - started)
+                started = time.perf_counter()
+                scores = flat[:total] @ q
+                np.argpartition(scores, -5)[-5:]
+                flat_lat.append(time.perf_counter() - started)
+
+            if (day + 1) % 30 == 0 or day + 1 == args.days:
+                stats = memory.get_stats()
+                p50, p95 = np.percentile(np.array(lat) * 1000, [50, 95])
+                print(f"{(day + 1) // 30:>3}{total:>9}{stats['hot']:>7}{stats['warm']:>7}{stats['cold']:>8}"
+                      f"{stats['vector_ram_mb']:>7.1f}MB{flat[:total].nbytes / 2**20:>8.1f}MB"
+                      f"{p50:>6.2f}ms{p95:>6.2f}ms{np.median(flat_lat) * 1000:>7.2f}ms"
+                      f"{(stats['cold_searches'] - searches) / max(stats['recalls'] - recalls, 1) * 100:>11.1f}%")
+                lat, flat_lat = [], []
+                searches, recalls = stats['cold_searches'], stats['recalls']
+        print(f"\nSoğuk isabet: {memory.stats['cold_hits']}, geri yüklenen: {memory.stats['promoted']}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""
+DERİN - Backup Store
+════════════════════
+İçerik adresli, chunk tekilleştirmeli artımlı yedekleme.
+
+    backups/
+        chunks/ab/ab12...       blake2b(ham veri) adlı sıkıştırılmış chunk'lar
+        snapshots/20261018-030000.json   snapshot manifest'i (dosya → chunk listesi)
+        lock                    backup / prune / gc aynı anda çalışmaz
+
+    • Değişmemiş dosya (boyut + mtime aynı) okunmadan önceki chunk listesini kullanır
+    • Değişen dosyada sadece değişen chunk'lar yazılır (SQLite sayfaları, ekleme yapılan
+      checkpoint'ler); aynı chunk farklı dosyalarda da bir kez saklanır
+    • Hash + sıkıştırma + yazma thread havuzunda (zlib/hashlib GIL'i bırakır)
+    • Manifest yeni / yeniden kullanılan bayt sayılarını raporlar
+    • Saklama: son N + günlük / haftalık / aylık; gc() referanssız chunk'ları siler
+    • Geri yükleme chunk chunk akar (bellek = birkaç chunk), hash doğrulanır
+
+Hedefler config.yaml → backup.targets; benchmark: python benchmarks/backup_bench.py
+"""
+
+import os
+import json
+import time
+import zlib
+import fcntl
+import hashlib
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_TARGETS = {
+    "vector_store": "data/vector_store",
+    "checkpoints": "checkpoints",
+    "voice_profiles": "voice/profiles",
+}
+
+# Chunk başlığı: sıkıştırılmış / ham (sıkışmayan veri, ör. zaten sıkıştırılmış ses)
+_ZLIB = b"z"
+_RAW = b"r"
+
+
+class BackupError(RuntimeError):
+    """Bozuk chunk / eksik snapshot"""
+
+
+def _chunk_id(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+class BackupRepository:
+    """
+    repo = BackupRepository("backups")
+    manifest = repo.backup({"vector_store": "data/vector_store"})
+    repo.restore(manifest["id"], "/tmp/restore")
+    """
+
+    def __init__(self, root, chunk_size: int = 256 << 10, compression_level: int = 3,
+                 workers: Optional[int] = None):
+        self.root = Path(root)
+        self.chunk_dir = self.root / "chunks"
+        self.snapshot_dir = self.root / "snapshots"
+        self.chunk_size = chunk_size
+        self.compression_level = compression_level
+        self.workers = workers or min(8, os.cpu_count() or 2)
+        self.chunk_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self._known: Optional[set] = None
+        self._known_lock = threading.Lock()
+
+    # ─── Ortak ──────────────────────────────────────────────────
+
+    @contextmanager
+    def _locked(self):
+        with open(self.root / "lock", "w") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _chunk_path(self, chunk_id: str) -> Path:
+        return self.chunk_dir / chunk_id[:2] / chunk_id
+
+    def _load_known(self) -> set:
+        known = set()
+        for sub in os.scandir(self.chunk_dir):
+            if sub.is_dir():
+                known.update(entry.name for entry in os.scandir(sub.path) if not entry.name.endswith(".tmp"))
+        return known
+
+    def _atomic_write(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    # ─── Yedekleme ──────────────────────────────────────────────
+
+    def _store_chunk(self, data: bytes, stats: Dict) -> str:
+        """Hash'le; yeniyse sıkıştırıp yaz. (worker thread)"""
+        chunk_id = _chunk_id(data)
+        with self._known_lock:
+            new = chunk_id not in self._known
+            if new:
+                self._known.add(chunk_id)
+        if new:
+            packed = zlib.compress(data, self.compression_level)
+            payload = _ZLIB + packed if len(packed) < len(data) else _RAW + data
+            self._atomic_write(self._chunk_path(chunk_id), payload)
+        with self._known_lock:
+            if new:
+                stats["new_bytes"] += len(data)
+                stats["new_chunks"] += 1
+                stats["stored_bytes"] += len(payload)
+            else:
+                stats["reused_bytes"] += len(data)
+                stats["reused_chunks"] += 1
+        return chunk_id
+
+    def _scan(self, targets: Dict[str, Path]) -> Iterator[tuple]:
+        for name, base in targets.items():
+            base = Path(base)
+            if not base.exists():
+                continue
+            for directory, _, files in os.walk(base):
+                for filename in sorted(files):
+                    path = Path(directory) / filename
+                    if path.is_symlink() or not path.is_file():
+                        continue
+                    yield f"{name}/{path.relative_to(base).as_posix()}", path
+
+    def backup(self, targets: Optional[Dict[str, str]] = None, tag: str = "") -> Dict:
+        """Artımlı snapshot al; manifest özetini döndür"""
+        targets = {name: Path(path) if Path(path).is_absolute() else ROOT_DIR / path
+                   for name, path in (targets or DEFAULT_TARGETS).items()}
+        started = time.perf_counter()
+        with self._locked():
+            self._known = self._load_known()
+            previous = self.latest()
+            previous_files = {f["path"]: f for f in (previous or {}).get("files", [])}
+            stats = {"new_bytes": 0, "reused_bytes": 0, "new_chunks": 0, "reused_chunks": 0,
+                     "stored_bytes": 0, "unchanged_files": 0}
+            files = []
+            window = self.workers * 4  # Bellekte bekleyen chunk sınırı
+            with ThreadPoolExecutor(self.workers, thread_name_prefix="backup") as pool:
+                pending: deque = deque()
+                for rel, path in self._scan(targets):
+                    st = path.stat()
+                    entry = {"path": rel, "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                             "mode": st.st_mode & 0o7777}
+                    old = previous_files.get(rel)
+                    if old and old["size"] == st.st_size and old["mtime_ns"] == st.st_mtime_ns:
+                        entry["chunks"] = old["chunks"]
+                        with self._known_lock:
+                            stats["reused_bytes"] += st.st_size
+                            stats["reused_chunks"] += len(old["chunks"])
+                            stats["unchanged_files"] += 1
+                        files.append(entry)
+                        continue
+                    futures = []
+                    with open(path, "rb") as f:
+                        while True:
+                            data = f.read(self.chunk_size)
+                            if not data:
+                                break
+                            while len(pending) >= window:
+                                pending.popleft().result()
+                            future = pool.submit(self._store_chunk, data, stats)
+                            pending.append(future)
+                            futures.append(future)
+                    entry["chunks"] = futures
+                    files.append(entry)
+                for entry in files:
+                    entry["chunks"] = [c if isinstance(c, str) else c.result() for c in entry["chunks"]]
+
+            snapshot_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+            while (self.snapshot_dir / f"{snapshot_id}.json").exists():
+                snapshot_id += "a"
+            total = sum(f["size"] for f in files)
+            manifest = {
+                "id": snapshot_id,
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "tag": tag,
+                "targets": sorted(targets),
+                "file_count": len(files),
+                "total_size_bytes": total,
+                **stats,
+                "duration_seconds": time.perf_counter() - started,
+                "files": files,
+            }
+            self._atomic_write(self.snapshot_dir / f"{snapshot_id}.json",
+                               json.dumps(manifest, separators=(",", ":")).encode("utf-8"))
+            self._known = None
+        return self.summary(manifest)
+
+    @staticmethod
+    def summary(manifest: Dict) -> Dict:
+        """Dosya listesi olmadan manifest"""
+        return {k: v for k, v in manifest.items() if k != "files"}
+
+    # ─── Snapshot'lar ───────────────────────────────────────────
+
+    def snapshot_ids(self) -> List[str]:
+        return sorted(p.stem for p in self.snapshot_dir.glob("*.json"))
+
+    def load_manifest(self, snapshot_id: str) -> Dict:
+        path = self.snapshot_dir / f"{snapshot_id}.json"
+        if not path.exists():
+            raise BackupError(f"Snapshot yok: {snapshot_id}")
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def latest(self) -> Optional[Dict]:
+        ids = self.snapshot_ids()
+        return self.load_manifest(ids[-1]) if ids else None
+
+    def snapshots(self) -> List[Dict]:
+        return [self.summary(self.load_manifest(i)) for i in self.snapshot_ids()]
+
+    # ─── Geri yükleme ───────────────────────────────────────────
+
+    def read_chunk(self, chunk_id: str) -> bytes:
+        try:
+            payload = self._chunk_path(chunk_id).read_bytes()
+        except FileNotFoundError:
+            raise BackupError(f"Eksik chunk: {chunk_id}") from None
+        data = zlib.decompress(payload[1:]) if payload[:1] == _ZLIB else payload[1:]
+        if _chunk_id(data) != chunk_id:
+            raise BackupError(f"Bozuk chunk: {chunk_id}")
+        return data
+
+    def _stream(self, chunk_ids: Sequence[str], pool: ThreadPoolExecutor) -> Iterator[bytes]:
+        """Sıralı chunk akışı; sonraki birkaç chunk önden okunur"""
+        pending: deque = deque()
+        ids = iter(chunk_ids)
+        for chunk_id in ids:
+            pending.append(pool.submit(self.read_chunk, chunk_id))
+            if len(pending) >= self.workers * 2:
+                break
+        while pending:
+            data = pending.popleft().result()
+            next_id = next(ids, None)
+            if next_id is not None:
+                pending.append(pool.submit(self.read_chunk, next_id))
+            yield data
+
+    def iter_file(self, snapshot_id: str, path: str) -> Iterator[bytes]:
+        """Tek dosyayı akış olarak oku (ör. stdout'a)"""
+        for entry in self.load_manifest(snapshot_id)["files"]:
+            if entry["path"] == path:
+                with ThreadPoolExecutor(self.workers) as pool:
+                    yield from self._stream(entry["chunks"], pool)
+                return
+        raise BackupError(f"{snapshot_id} içinde yok: {path}")
+
+    def restore(self, snapshot_id: str, destination, include: Optional[Sequence[str]] = None) -> Dict:
+        """Snapshot'ı destination/<hedef>/... altına yaz. include: yol önekleri"""
+        manifest = self.load_manifest(snapshot_id)
+        destination = Path(destination)
+        started = time.perf_counter()
+        restored = {"files": 0, "bytes": 0}
+        with ThreadPoolExecutor(self.workers, thread_name_prefix="restore") as pool:
+            for entry in manifest["files"]:
+                if include and not any(entry["path"].startswith(p) for p in include):
+                    continue
+                target = destination / entry["path"]
+                target.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    for data in self._stream(entry["chunks"], pool):
+                        f.write(data)
+                os.chmod(tmp, entry["mode"])
+                os.utime(tmp, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+                os.replace(tmp, target)
+                restored["files"] += 1
+                restored["bytes"] += entry["size"]
+        restored["duration_seconds"] = time.perf_counter() - started
+        return restored
+
+    def verify(self, snapshot_id: str) -> Dict:
+        """Tüm chunk'ları oku ve hash'lerini doğrula"""
+        manifest = self.load_manifest(snapshot_id)
+        chunk_ids = {c for f in manifest["files"] for c in f["chunks"]}
+        errors = []
+        with ThreadPoolExecutor(self.workers) as pool:
+            for chunk_id, future in [(c, pool.submit(self.read_chunk, c)) for c in chunk_ids]:
+                try:
+                    future.result()
+                except BackupError as e:
+                    errors.append(str(e))
+        return {"chunks": len(chunk_ids), "errors": errors}
+
+    # ─── Saklama / çöp toplama ──────────────────────────────────
+
+    def prune(self, keep_last: int = 3, keep_daily: int = 7, keep_weekly: int = 4,
+              keep_monthly: int = 6) -> List[str]:
+        """Saklama politikası dışındaki snapshot manifest'lerini sil (chunk'lar gc() ile)"""
+        with self._locked():
+            ids = self.snapshot_ids()[::-1]  # En yeni önce
+            keep = set(ids[:keep_last])
+            for count, bucket in ((keep_daily, "%Y-%m-%d"), (keep_weekly, "%G-%V"), (keep_monthly, "%Y-%m")):
+                seen = []
+                for snapshot_id in ids:
+                    key = datetime.strptime(snapshot_id[:15], "%Y%m%d-%H%M%S").strftime(bucket)
+                    if key not in seen:
+                        if len(seen) >= count:
+                            break
+                        seen.append(key)
+                        keep.add(snapshot_id)
+            removed = [i for i in ids if i not in keep]
+            for snapshot_id in removed:
+                (self.snapshot_dir / f"{snapshot_id}.json").unlink()
+        return removed
+
+    def gc(self) -> Dict:
+        """Hiçbir snapshot'ın referans vermediği chunk'ları sil (mark & sweep)"""
+        with self._locked():
+            referenced = set()
+            for snapshot_id in self.snapshot_ids():
+                for entry in self.load_manifest(snapshot_id)["files"]:
+                    referenced.update(entry["chunks"])
+            removed = freed = 0
+            for sub in os.scandir(self.chunk_dir):
+                if not sub.is_dir():
+                    continue
+                for entry in os.scandir(sub.path):
+                    if entry.name not in referenced:
+                        freed += entry.stat().st_size
+                        os.unlink(entry.path)
+                        removed += 1
+        return {"chunks_removed": removed, "bytes_freed": freed}
+
+    def get_status(self) -> Dict:
+        ids = self.snapshot_ids()
+        stored = sum(entry.stat().st_size
+                     for sub in os.scandir(self.chunk_dir) if sub.is_dir()
+                     for entry in os.scandir(sub.path))
+        return {
+            "total_backups": len(ids),
+            "latest_backup": ids[-1] if ids else None,
+            "total_size_mb": stored / 1024 / 1024,
+        }
+
+
+# Singleton
+_repository: Optional[BackupRepository] = None
+_lock = threading.Lock()
+
+
+def get_backup_repository() -> BackupRepository:
+    """config.yaml → backup bölümü"""
+    global _repository
+    with _lock:
+        if _repository is None:
+            from core.platform_config import get_section
+            config = get_section("backup", default={}) or {}
+            root = Path(config.get("repository", "backups"))
+            _repository = BackupRepository(
+                root if root.is_absolute() else ROOT_DIR / root,
+                chunk_size=int(config.get("chunk_size_kb", 256)) * 1024,
+                compression_level=config.get("compression_level", 3),
+                workers=config.get("workers"),
+            )
+        return _repository
+
+
+def backup_targets() -> Dict[str, str]:
+    from core.platform_config import get_section
+    return get_section("backup", "targets", default=None) or DEFAULT_TARGETS
+
+
+def retention_policy() -> Dict[str, int]:
+    from core.platform_config import get_section
+    return get_section("backup", "retention", default=None) or {}
@@ -0,0 +1,107 @@
+"""
+DERİN - Batch Recall
+════════════════════
+Çok sorgulu vektörize hatırlama çekirdeği.
+
+    sorgular (Q×d: konuşma, sahne, hedefler)
+        │
+        ▼
+    skor = w_sim · cos(q, m) + w_rec · 0.5^(yaş / yarılanma) + w_imp · önem
+              └── blok blok GEMM ──┘   └──── sorgudan bağımsız, batch başına bir kez ────┘
+        │
+        ▼
+    sorgu başına top-k (argpartition, blok arası birleştirme)
+
+    • Bellek matrisi her blok için bir kez okunur (sorgu başına değil)
+    • float16 depolanan vektörler blok blok float32'ye çevrilir (geçici bellek sınırlı)
+
+TieredMemory.recall_batch / recall_many bunu kullanır;
+benchmark: python benchmarks/batch_recall_bench.py
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class RecallWeights:
+    similarity: float = 1.0
+    recency: float = 0.1
+    importance: float = 0.2
+    half_life_days: float = 30.0
+
+
+def memory_prior(importance: np.ndarray, touched: np.ndarray, weights: RecallWeights,
+                 now: Optional[float] = None) -> np.ndarray:
+    """Sorgudan bağımsız skor kısmı (yakınlık + önem), float32"""
+    now = time.time() if now is None else now
+    age_days = np.maximum(0.0, now - touched) / 86400
+    recency = np.exp2(-age_days / weights.half_life_days)
+    return (weights.recency * recency + weights.importance * importance).astype(np.float32)
+
+
+def batch_topk(queries: np.ndarray, memory: np.ndarray, prior: Optional[np.ndarray], k: int,
+               similarity_weight: float = 1.0, block: int = 16384) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    queries (Q×d, normalize) × memory (N×d) → (indeks, skor, benzerlik), her biri Q×k,
+    skora göre azalan. N < k ise k = N.
+    """
+    queries = np.asarray(queries, dtype=np.float32)
+    if queries.ndim == 1:
+        queries = queries[None, :]
+    n = len(memory)
+    k = min(k, n)
+    q = len(queries)
+    if k == 0:
+        empty = np.zeros((q, 0))
+        return empty.astype(np.int64), empty.astype(np.float32), empty.astype(np.float32)
+
+    best_idx = np.zeros((q, 0), dtype=np.int64)
+    best_score = np.zeros((q, 0), dtype=np.float32)
+    rows = np.arange(q)[:, None]
+    for start in range(0, n, block):
+        chunk = memory[start:start + block]
+        sims = queries @ chunk.T.astype(np.float32, copy=False)
+        scores = sims * similarity_weight
+        if prior is not None:
+            scores += prior[start:start + len(chunk)]
+        if len(chunk) > k:
+            part = np.argpartition(scores, -k, axis=1)[:, -k:]
+        else:
+            part = np.broadcast_to(np.arange(len(chunk)), (q, len(chunk)))
+        idx = np.concatenate([best_idx, part + start], axis=1)
+        score = np.concatenate([best_score, scores[rows, part]], axis=1)
+        if idx.shape[1] > k:
+            keep = np.argpartition(score, -k, axis=1)[:, -k:]
+            idx, score = idx[rows, keep], score[rows, keep]
+        best_idx, best_score = idx, score
+
+    order = np.argsort(-best_score, axis=1)
+    best_idx, best_score = best_idx[rows, order], best_score[rows, order]
+    similarity = np.einsum("qd,qkd->qk", queries, memory[best_idx].astype(np.float32))
+    return best_idx, best_score, similarity
+
+
+def context_queries(utterance: Optional[str] = None, scene: Optional[str] = None,
+                    goal_manager=None, max_goals: int = 5) -> Dict[str, str]:
+    """Tur bağlamından etiketli sorgu metinleri (konuşma, sahne, aktif hedefler)"""
+    texts: Dict[str, str] = {}
+    if utterance:
+        texts["utterance"] = utterance
+    if scene:
+        texts["scene"] = scene
+    goals: List = []
+    if goal_manager is not None:
+        # get_active: GoalManager API (main.py durum raporu da bunu kullanır)
+        for name in ("get_active", "get_active_goals", "active_goals"):
+            attr = getattr(goal_manager, name, None)
+            if attr is not None:
+                goals = list(attr() if callable(attr) else attr)
+                break
+    for i, goal in enumerate(goals[:max_goals]):
+        text = getattr(goal, "description", None) or getattr(goal, "name", None) or str(goal)
+        texts[f"goal:{i}"] = text
+    return texts
@@ -0,0 +1,344 @@
+"""
+DERİN - Batch Scheduler
+═══════════════════════
+Katman başına continuous-batching istek zamanlayıcısı.
+
+Kullanıcı turu, kesme (interruption), proaktif konuşma (HumanLikeBrain),
+merak araştırması ve denetim aynı modelleri paylaşır. Her katmanın önünde
+bir zamanlayıcı durur:
+
+    submit ──▶ [öncelik kuyruğu] ──admit──▶ aktif batch ──decode step──▶ token
+                                   ▲            │
+                                   └─ preempt ──┘ (kullanıcı konuşunca arka plan bekler)
+
+    • Öncelik: USER_TURN > INTERRUPTION > PROACTIVE > BACKGROUND
+    • Her decode adımında batch'e yeni istek girebilir, biten çıkar
+    • max_batch / max_wait ayarları
+    • Kuyruk derinliği ve tokens/sec metrikleri
+
+Model arayüzü (BatchModel): decode(requests) -> her istek için sıradaki
+token ya da None (bitti). StubModel token başına maliyet simüle eder.
+"""
+
+import time
+import heapq
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from enum import IntEnum
+from typing import Dict, List, Optional
+
+
+class Priority(IntEnum):
+    """Düşük değer = yüksek öncelik"""
+    USER_TURN = 0
+    INTERRUPTION = 1
+    PROACTIVE = 2
+    BACKGROUND = 3
+
+
+class GenerationRequest:
+    """Zamanlayıcıdaki tek üretim isteği (preempt edilince kaldığı yerden devam eder)"""
+
+    def __init__(self, prompt: str, priority: Priority = Priority.USER_TURN,
+                 max_tokens: int = 256, source: str = ""):
+        self.prompt = prompt
+        self.priority = Priority(priority)
+        self.max_tokens = max_tokens
+        self.source = source
+        self.tokens: List[str] = []
+        self.future: Future = Future()
+        self.created_at = time.monotonic()
+        self.first_token_at: Optional[float] = None
+        self.preemptions = 0
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    @property
+    def text(self) -> str:
+        return "".join(self.tokens)
+
+    def result(self, timeout: Optional[float] = None) -> str:
+        return self.future.result(timeout)
+
+
+class StubModel:
+    """
+    CPU test modeli: decode adımı = sabit maliyet + batch başına marjinal maliyet.
+    Batch büyüdükçe token başına maliyet düşer (gerçek GPU davranışı gibi).
+    """
+
+    def __init__(self, step_cost: float = 0.02, per_request_cost: float = 0.002, token: str = "x "):
+        self.step_cost = step_cost
+        self.per_request_cost = per_request_cost
+        self.token = token
+
+    def decode(self, requests: List[GenerationRequest]) -> List[Optional[str]]:
+        time.sleep(self.step_cost + self.per_request_cost * len(requests))
+        return [None if len(r.tokens) >= r.max_tokens else self.token for r in requests]
+
+
+class LayerScheduler:
+    """Tek katman için continuous batching"""
+
+    def __init__(self, layer: str, model, max_batch: int = 8, max_wait: float = 0.01,
+                 metrics_window: float = 10.0):
+        self.layer = layer
+        self._model = model
+        self.base_max_batch = max_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._metrics_window = metrics_window
+
+        self._queue = []  # (priority, seq, request)
+        self._seq = itertools.count()
+        self._active: List[GenerationRequest] = []
+        self._cond = threading.Condition()
+        self._running = False
+        self._background_hold_until = 0.0
+        self._token_log: deque = deque()  # (t, n)
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"submitted": 0, "completed": 0, "cancelled": 0, "preempted": 0,
+                      "steps": 0, "tokens": 0, "errors": 0}
+
+    # ─── Dış API ────────────────────────────────────────────────
+
+    def submit(self, request: GenerationRequest) -> GenerationRequest:
+        with self._cond:
+            heapq.heappush(self._queue, (request.priority, next(self._seq), request))
+            self.stats["submitted"] += 1
+            self._cond.notify()
+        return request
+
+    def preempt_background(self, hold_seconds: float = 5.0):
+        """Kullanıcı konuşuyor: aktif arka plan işleri kuyruğa döner, hold süresince alınmaz"""
+        with self._cond:
+            self._background_hold_until = time.monotonic() + hold_seconds
+            for request in [r for r in self._active if r.priority >= Priority.BACKGROUND]:
+                self._requeue_locked(request)
+            self._cond.notify()
+
+    def scale_batch(self, factor: float):
+        """QoS: batch boyutunu taban değere göre ölçekle (aktif fazlası sonraki adımlarda biter)"""
+        with self._cond:
+            self.max_batch = max(1, int(self.base_max_batch * factor))
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name=f"batch-{self.layer}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+        with self._cond:
+            pending = [r for _, _, r in self._queue] + self._active
+            self._queue.clear()
+            self._active.clear()
+        for request in pending:
+            if not request.future.done():
+                request.future.set_exception(RuntimeError("Zamanlayıcı durduruldu"))
+
+    # ─── Zamanlama ──────────────────────────────────────────────
+
+    def _requeue_locked(self, request: GenerationRequest):
+        self._active.remove(request)
+        request.preemptions += 1
+        self.stats["preempted"] += 1
+        heapq.heappush(self._queue, (request.priority, next(self._seq), request))
+
+    def _background_held(self) -> bool:
+        return time.monotonic() < self._background_hold_until
+
+    def _admit_locked(self):
+        """Kuyruktan aktif batch'e al; gerekirse düşük öncelikli aktifleri preempt et"""
+        held = []
+        while self._queue:
+            priority, seq, request = self._queue[0]
+            if request.cancelled:
+                heapq.heappop(self._queue)
+                self._finish(request, cancelled=True)
+                continue
+            if priority >= Priority.BACKGROUND and self._background_held():
+                held.append(heapq.heappop(self._queue))
+                continue
+            if len(self._active) >= self.max_batch:
+                worst = max(self._active, key=lambda r: r.priority)
+                if worst.priority <= priority or worst.priority < Priority.PROACTIVE:
+                    break
+                self._requeue_locked(worst)
+            heapq.heappop(self._queue)
+            self._active.append(request)
+        for item in held:
+            heapq.heappush(self._queue, item)
+
+    def _wait_for_work_locked(self):
+        while self._running:
+            self._admit_locked()
+            if self._active:
+                return
+            if self._queue and self._background_held():
+                self._cond.wait(max(0.0, self._background_hold_until - time.monotonic()))
+            else:
+                self._cond.wait()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                was_idle = not self._active
+                self._wait_for_work_locked()
+                if not self._running:
+                    return
+                # Boştan başlıyorsak batch'in dolması için kısa bekle (kullanıcı turu beklemez)
+                if was_idle and self.max_wait > 0 and len(self._active) < self.max_batch \
+                        and min(r.priority for r in self._active) > Priority.USER_TURN:
+                    self._cond.wait(self.max_wait)
+                    self._admit_locked()
+                batch = list(self._active)
+
+            try:
+                tokens = self._model.decode(batch)
+            except Exception as e:
+                with self._cond:
+                    self.stats["errors"] += 1
+                    for request in batch:
+                        if request in self._active:
+                            self._active.remove(request)
+                        if not request.future.done():
+                            request.future.set_exception(e)
+                continue
+
+            now = time.monotonic()
+            with self._cond:
+                self.stats["steps"] += 1
+                produced = 0
+                for request, token in zip(batch, tokens):
+                    if request not in self._active:
+                        continue  # Bu adım sırasında preempt edildi (token geçerli değil)
+                    if request.cancelled:
+                        self._active.remove(request)
+                        self._finish(request, cancelled=True)
+                    elif token is None:
+                        self._active.remove(request)
+                        self._finish(request)
+                    else:
+                        if request.first_token_at is None:
+                            request.first_token_at = now
+                        request.tokens.append(token)
+                        produced += 1
+                self.stats["tokens"] += produced
+                self._token_log.append((now, produced))
+
+    def _finish(self, request: GenerationRequest, cancelled: bool = False):
+        if cancelled:
+            self.stats["cancelled"] += 1
+            if not request.future.done():
+                request.future.cancel()
+                if not request.future.cancelled():
+                    request.future.set_exception(RuntimeError("İstek iptal edildi"))
+        else:
+            self.stats["completed"] += 1
+            if not request.future.done():
+                request.future.set_result(request.text)
+
+    # ─── Metrikler ──────────────────────────────────────────────
+
+    def tokens_per_second(self) -> float:
+        with self._cond:
+            cutoff = time.monotonic() - self._metrics_window
+            while self._token_log and self._token_log[0][0] < cutoff:
+                self._token_log.popleft()
+            if not self._token_log:
+                return 0.0
+            span = max(time.monotonic() - self._token_log[0][0], 1e-3)
+            return sum(n for _, n in self._token_log) / span
+
+    def get_stats(self) -> Dict:
+        tps = self.tokens_per_second()
+        with self._cond:
+            depth = {p.name.lower(): 0 for p in Priority}
+            for priority, _, _ in self._queue:
+                depth[Priority(priority).name.lower()] += 1
+            return {
+                "queue_depth": depth,
+                "active": len(self._active),
+                "tokens_per_sec": tps,
+                **self.stats,
+            }
+
+
+class BatchSchedulerPool:
+    """Multi-model manager'daki her katman için bir LayerScheduler"""
+
+    def __init__(self, **defaults):
+        self._defaults = defaults
+        self._schedulers: Dict[str, LayerScheduler] = {}
+        self._lock = threading.Lock()
+        self._batch_scale = 1.0
+
+    def add_layer(self, layer: str, model, **kwargs) -> LayerScheduler:
+        """Katman ekle (zaten varsa mevcut zamanlayıcı döner)"""
+        with self._lock:
+            if layer in self._schedulers:
+                return self._schedulers[layer]
+            scheduler = LayerScheduler(layer, model, **{**self._defaults, **kwargs})
+            scheduler.scale_batch(self._batch_scale)
+            self._schedulers[layer] = scheduler
+        scheduler.start()
+        return scheduler
+
+    def has_layer(self, layer: str) -> bool:
+        with self._lock:
+            return layer in self._schedulers
+
+    def submit(self, layer: str, prompt: str, priority: Priority = Priority.USER_TURN,
+               max_tokens: int = 256, source: str = "") -> GenerationRequest:
+        with self._lock:
+            scheduler = self._schedulers[layer]
+        return scheduler.submit(GenerationRequest(prompt, priority, max_tokens, source))
+
+    def generate(self, layer: str, prompt: str, priority: Priority = Priority.USER_TURN,
+                 max_tokens: Optional[int] = None, timeout: Optional[float] = None, source: str = "") -> str:
+        """Senkron kısa yol: submit + sonucu bekle (zaman aşımında istek iptal edilir)"""
+        request = self.submit(layer, prompt, priority, max_tokens or 256, source)
+        try:
+            return request.result(timeout)
+        except FutureTimeout:
+            request.cancel()
+            raise
+
+    def preempt_background(self, hold_seconds: float = 5.0):
+        with self._lock:
+            schedulers = list(self._schedulers.values())
+        for scheduler in schedulers:
+            scheduler.preempt_background(hold_seconds)
+
+    def scale_batch(self, factor: float):
+        with self._lock:
+            self._batch_scale = factor
+            schedulers = list(self._schedulers.values())
+        for scheduler in schedulers:
+            scheduler.scale_batch(factor)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            schedulers = dict(self._schedulers)
+        return {layer: s.get_stats() for layer, s in schedulers.items()}
+
+    def stop(self, timeout: float = 2.0):
+        """Tüm katmanlar toplam `timeout` saniye içinde durur"""
+        with self._lock:
+            schedulers = list(self._schedulers.values())
+        deadline = time.monotonic() + timeout
+        for scheduler in schedulers:
+            scheduler.stop(timeout=max(0.0, deadline - time.monotonic()))
@@ -0,0 +1,239 @@
+"""
+DERİN - Boot Graph
+══════════════════
+Deklaratif modül bağımlılık grafiği + thread-pool boot zamanlayıcı.
+
+Her organ bir BootStage olarak tanımlanır; bağımlılıkları bitince
+havuzdaki bir thread'de başlatılır. Birbirinden bağımsız organlar
+eşzamanlı açılır, toplam boot süresi en uzun bağımlılık zinciri kadardır.
+
+Kullanım:
+    graph = BootGraph()
+    graph.add("brainstem", boot_brainstem)
+    graph.add("broca", boot_broca, deps=["brainstem"])
+    report = graph.run(max_workers=4)
+    print(report.format())
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+class BootError(RuntimeError):
+    """Kritik bir boot aşaması başarısız oldu"""
+
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(f"Boot aşaması '{stage}' başarısız: {error}")
+        self.stage = stage
+        self.error = error
+
+
+@dataclass
+class BootStage:
+    """Tek bir boot aşaması (organ)"""
+    name: str
+    func: Callable[[], object]
+    deps: Sequence[str] = ()
+    critical: bool = True  # False ise hata boot'u durdurmaz
+
+
+@dataclass
+class StageTiming:
+    """Aşama zaman ölçümü (boot başlangıcına göre saniye)"""
+    name: str
+    deps: Sequence[str]
+    start: float = 0.0
+    end: float = 0.0
+    status: str = "pending"  # pending, ok, failed, skipped
+    error: Optional[str] = None
+    thread: str = ""
+
+    @property
+    def duration(self) -> float:
+        return max(0.0, self.end - self.start)
+
+
+@dataclass
+class BootReport:
+    """Boot sonucu: aşama süreleri ve kritik yol"""
+    timings: Dict[str, StageTiming] = field(default_factory=dict)
+    wall_time: float = 0.0
+    workers: int = 1
+
+    @property
+    def serial_time(self) -> float:
+        """Aşamalar sırayla çalışsaydı geçecek süre"""
+        return sum(t.duration for t in self.timings.values())
+
+    @property
+    def failed(self) -> List[str]:
+        return [n for n, t in self.timings.items() if t.status == "failed"]
+
+    def critical_path(self) -> List[str]:
+        """
+        Boot'u geciktiren zincir.
+
+        En son biten aşamadan geriye doğru, her adımda en geç biten
+        bağımlılığı takip eder. Sonuç baştan sona sıralıdır.
+        """
+        done = [t for t in self.timings.values() if t.status in ("ok", "failed")]
+        if not done:
+            return []
+        current = max(done, key=lambda t: t.end)
+        path = [current.name]
+        while True:
+            parents = [self.timings[d] for d in current.deps
+                       if d in self.timings and self.timings[d].status in ("ok", "failed")]
+            if not parents:
+                break
+            current = max(parents, key=lambda t: t.end)
+            path.append(current.name)
+        path.reverse()
+        return path
+
+    def to_dict(self) -> Dict:
+        return {
+            "wall_time": self.wall_time,
+            "serial_time": self.serial_time,
+            "workers": self.workers,
+            "critical_path": self.critical_path(),
+            "stages": {
+                n: {
+                    "start": t.start,
+                    "end": t.end,
+                    "duration": t.duration,
+                    "status": t.status,
+                    "error": t.error,
+                    "deps": list(t.deps),
+                }
+                for n, t in self.timings.items()
+            },
+        }
+
+    def format(self) -> str:
+        """İnsan okunur tablo"""
+        lines = [f"Boot: {self.wall_time:.2f}s duvar saati, "
+                 f"{self.serial_time:.2f}s seri toplam ({self.workers} worker)"]
+        path = set(self.critical_path())
+        for t in sorted(self.timings.values(), key=lambda t: (t.start, t.name)):
+            mark = "*" if t.name in path else " "
+            line = f" {mark} {t.name:<22} {t.start:7.3f}s +{t.duration:6.3f}s  {t.status}"
+            if t.error:
+                line += f" ({t.error})"
+            lines.append(line)
+        lines.append("Kritik yol: " + " → ".join(self.critical_path()))
+        return "\n".join(lines)
+
+
+class BootGraph:
+    """Bağımlılık grafiği + paralel çalıştırıcı"""
+
+    def __init__(self):
+        self._stages: Dict[str, BootStage] = {}
+
+    def add(self, name: str, func: Callable[[], object],
+            deps: Sequence[str] = (), critical: bool = True) -> BootStage:
+        if name in self._stages:
+            raise ValueError(f"Aşama zaten tanımlı: {name}")
+        stage = BootStage(name=name, func=func, deps=tuple(deps), critical=critical)
+        self._stages[name] = stage
+        return stage
+
+    @property
+    def stages(self) -> Dict[str, BootStage]:
+        return dict(self._stages)
+
+    def dependents(self) -> Dict[str, List[str]]:
+        """name -> bu aşamaya bağımlı aşamalar"""
+        result = {n: [] for n in self._stages}
+        for stage in self._stages.values():
+            for dep in stage.deps:
+                result[dep].append(stage.name)
+        return result
+
+    def topological_order(self) -> List[str]:
+        """Bağımlılık sırası (tanım sırası korunur). Döngüde ValueError."""
+        for stage in self._stages.values():
+            for dep in stage.deps:
+                if dep not in self._stages:
+                    raise ValueError(f"'{stage.name}' bilinmeyen aşamaya bağımlı: {dep}")
+
+        remaining = {n: set(s.deps) for n, s in self._stages.items()}
+        order = []
+        while remaining:
+            ready = [n for n, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Bağımlılık döngüsü: {sorted(remaining)}")
+            for n in ready:
+                order.append(n)
+                del remaining[n]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def run(self, max_workers: int = 4) -> BootReport:
+        """
+        Grafiği çalıştır.
+
+        Kritik aşama hata verirse yeni aşama başlatılmaz, çalışanlar
+        beklenir ve BootError fırlatılır. Kritik olmayan aşamaların
+        hatası sadece rapora yazılır; bağımlıları yine çalışır.
+        """
+        order = self.topological_order()
+        report = BootReport(
+            timings={n: StageTiming(n, self._stages[n].deps) for n in order},
+            workers=max(1, max_workers),
+        )
+        pending = {n: set(self._stages[n].deps) for n in order}
+        dependents = self.dependents()
+        fatal: Optional[BootError] = None
+        t0 = time.perf_counter()
+
+        def execute(stage: BootStage):
+            timing = report.timings[stage.name]
+            timing.thread = threading.current_thread().name
+            timing.start = time.perf_counter() - t0
+            try:
+                stage.func()
+                timing.status = "ok"
+            except BaseException as e:
+                timing.status = "failed"
+                timing.error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                timing.end = time.perf_counter() - t0
+
+        with ThreadPoolExecutor(max_workers=report.workers,
+                                thread_name_prefix="boot") as pool:
+            running = {}
+
+            def submit_ready():
+                for n in [n for n, deps in pending.items() if not deps]:
+                    del pending[n]
+                    running[pool.submit(execute, self._stages[n])] = n
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None and self._stages[name].critical and fatal is None:
+                        fatal = BootError(name, error)
+                    for child in dependents[name]:
+                        if child in pending:
+                            pending[child].discard(name)
+                if fatal is None:
+                    submit_ready()
+
+        for n in pending:
+            report.timings[n].status = "skipped"
+        report.wall_time = time.perf_counter() - t0
+
+        if fatal is not None:
+            fatal.report = report
+            raise fatal
+        return report
@@ -0,0 +1,247 @@
+"""
+DERİN - Event-Driven Control Loop
+═════════════════════════════════
+Ana döngüdeki 5 saniyelik polling yerine olay tabanlı kontrol.
+
+    Hypothalamus ──HYPOTHALAMUS_STATE──▶ Event Bus ──▶ Debouncer ──▶ limbic
+                                                               ├──▶ occipital.set_fps
+                                                               ├──▶ vision_scheduler.set_budget
+                                                               └──▶ meta_cognition
+
+Hypothalamus durumu değiştiğinde (enerji, uyku, sıcaklık → vision FPS)
+bir olay yayınlanır. Hızlı ardışık değişiklikler Debouncer'da birleştirilir;
+her tüketici sadece en son durumu görür.
+
+Boşta uyanmalar: hypothalamus push callback sunuyorsa durum tarafında hiç
+yoktur (sunmuyorsa izleme thread'i en fazla `max_interval` = 0.5 sn'de bir);
+meta-cognition yükü hypothalamus dışı girdilere bağlı olduğundan ayrıca
+`meta_interval` (5 sn) aralıkla bir kez yenilenir.
+"""
+
+import time
+import heapq
+import threading
+from typing import Any, Callable, Dict, Optional
+
+HYPOTHALAMUS_STATE = "HYPOTHALAMUS_STATE"
+
+
+def event_payload(event) -> Any:
+    """Event Bus olayından payload (Event.data veya düz dict)"""
+    return getattr(event, "data", event)
+
+
+class Debouncer:
+    """
+    Anahtar bazlı birleştirme + gecikme.
+
+    submit(key, value) son değeri saklar; `delay` kadar sessizlik olunca
+    (veya ilk submit'ten `max_wait` geçince) callback bir kez çağrılır.
+    Tek bir worker thread vardır ve iş yokken süresiz bekler.
+    """
+
+    def __init__(self, name: str = "debouncer"):
+        self._cond = threading.Condition()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._heap = []  # (deadline, key)
+        self._running = True
+        self.stats = {"submitted": 0, "fired": 0}
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, key: str, value: Any, callback: Callable[[Any], None],
+               delay: float = 0.02, max_wait: float = 0.1):
+        now = time.monotonic()
+        with self._cond:
+            self.stats["submitted"] += 1
+            entry = self._pending.get(key)
+            if entry is None:
+                entry = {"first": now}
+                self._pending[key] = entry
+            entry["value"] = value
+            entry["callback"] = callback
+            entry["deadline"] = min(now + delay, entry["first"] + max_wait)
+            heapq.heappush(self._heap, (entry["deadline"], key))
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while self._running:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    deadline, key = self._heap[0]
+                    entry = self._pending.get(key)
+                    if entry is None or entry["deadline"] != deadline:
+                        heapq.heappop(self._heap)  # Eski (birleştirilmiş) kayıt
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        self._cond.wait(remaining)
+                        continue
+                    heapq.heappop(self._heap)
+                    del self._pending[key]
+                    break
+                else:
+                    return
+                self.stats["fired"] += 1
+
+            try:
+                entry["callback"](entry["value"])
+            except Exception as e:
+                print(f"[CONTROL] {key} handler hatası: {e}")
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        self._thread.join(timeout=1.0)
+
+
+def snapshot_hypothalamus(hypothalamus) -> Dict[str, Any]:
+    """Tüketicilerin ihtiyaç duyduğu hypothalamus alanları"""
+    state = hypothalamus.state
+    snapshot = {
+        "energy": state.energy,
+        "is_sleeping": state.is_sleeping,
+        "vision_fps": hypothalamus.get_vision_fps(),
+    }
+    temperature = getattr(state, "temperature", None)
+    if temperature is not None:
+        snapshot["temperature"] = temperature
+    return snapshot
+
+
+class HypothalamusStatePublisher:
+    """
+    Hypothalamus durum değişikliklerini Event Bus'a yayınlar.
+
+    Hypothalamus register_state_callback() sunuyorsa doğrudan ona bağlanır
+    (push, boşta sıfır uyanma). Sunmuyorsa `fallback_interval` aralıkla
+    durumu karşılaştırır ve sadece değiştiğinde yayınlar; durum değişmedikçe
+    aralık `max_interval`'e kadar ikiye katlanır. Tavan 1 sn'nin altında tutulur:
+    termal / uyku değişikliği en geç `max_interval` içinde tüketicilere ulaşır.
+    """
+
+    def __init__(self, hypothalamus, event_bus, fallback_interval: float = 0.1,
+                 max_interval: float = 0.5):
+        self._hypothalamus = hypothalamus
+        self._event_bus = event_bus
+        self._fallback_interval = fallback_interval
+        self._max_interval = max(max_interval, fallback_interval)
+        self._last: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if hasattr(self._hypothalamus, 'register_state_callback'):
+            self._hypothalamus.register_state_callback(lambda *_: self.check())
+        else:
+            self._thread = threading.Thread(target=self._watch, name="hypothalamus-watch", daemon=True)
+            self._thread.start()
+        self.check()  # İlk durum
+
+    def check(self) -> bool:
+        """Durum değiştiyse yayınla"""
+        snapshot = snapshot_hypothalamus(self._hypothalamus)
+        with self._lock:
+            if snapshot == self._last:
+                return False
+            self._last = snapshot
+        self._event_bus.publish(HYPOTHALAMUS_STATE, snapshot, source="hypothalamus")
+        return True
+
+    def _watch(self):
+        interval = self._fallback_interval
+        while not self._stop_event.wait(interval):
+            try:
+                changed = self.check()
+            except Exception as e:
+                changed = False
+                print(f"[CONTROL] Hypothalamus izleme hatası: {e}")
+            # Değişiklik → hızlı izle; sakin → geri çekil
+            interval = self._fallback_interval if changed else min(interval * 2, self._max_interval)
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+
+
+class EventDrivenControlLoop:
+    """
+    HYPOTHALAMUS_STATE olaylarını limbic / occipital / meta-cognition'a dağıtır.
+
+    Bilişsel yük hypothalamus dışındaki girdilere de bağlı olduğundan
+    meta-cognition ayrıca `meta_interval` saniyede bir güncellenir
+    (aynı Debouncer anahtarı: durum olayı gelirse yavaş güncellemeyi öne çeker).
+    Boşta döngünün tek periyodik uyanması budur; 0/None verilirse kapanır.
+    """
+
+    def __init__(self, event_bus, limbic=None, occipital=None, meta_cognition=None,
+                 vision_scheduler=None, max_vision_fps: float = 30.0,
+                 delay: float = 0.02, max_wait: float = 0.1, meta_interval: float = 5.0):
+        self._event_bus = event_bus
+        self._limbic = limbic
+        self._occipital = occipital
+        self._vision_scheduler = vision_scheduler
+        self._max_vision_fps = max_vision_fps
+        self._meta_cognition = meta_cognition
+        self._delay = delay
+        self._max_wait = max_wait
+        self._meta_interval = meta_interval
+        self._debouncer = Debouncer(name="control-loop")
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return dict(self._debouncer.stats)
+
+    def start(self):
+        self._event_bus.subscribe(HYPOTHALAMUS_STATE, self._on_state)
+        if self._meta_cognition:
+            self._schedule_meta_refresh(None)
+
+    def _on_state(self, event):
+        state = event_payload(event)
+        if self._limbic:
+            self._debounce("limbic", state, self._update_limbic)
+        if (self._occipital or self._vision_scheduler) and "vision_fps" in state:
+            # Termal throttle gecikmesin - birleştir ama bekletme
+            self._debouncer.submit("occipital", state, self._update_occipital, delay=0.0, max_wait=0.0)
+        if self._meta_cognition:
+            self._debounce("meta_cognition", state, self._update_meta_cognition)
+
+    def _debounce(self, key, state, callback):
+        self._debouncer.submit(key, state, callback, delay=self._delay, max_wait=self._max_wait)
+
+    def _update_limbic(self, state):
+        self._limbic.update_from_hypothalamus(
+            state["energy"],
+            state["is_sleeping"] or state["energy"] < 30
+        )
+
+    def _update_occipital(self, state):
+        if self._occipital:
+            self._occipital.set_fps(state["vision_fps"])
+        if self._vision_scheduler:
+            # Termal bütçe modeller arasında önceliğe göre paylaşılır
+            self._vision_scheduler.set_budget(state["vision_fps"] / self._max_vision_fps)
+
+    def _update_meta_cognition(self, state):
+        try:
+            self._meta_cognition.update_cognitive_load()
+        finally:
+            self._schedule_meta_refresh(state)
+
+    def _schedule_meta_refresh(self, state):
+        """Durum değişmese de yavaş periyodik bilişsel yük güncellemesi"""
+        if self._meta_interval:
+            self._debouncer.submit("meta_cognition", state, self._update_meta_cognition,
+                                   delay=self._meta_interval, max_wait=self._meta_interval)
+
+    def stop(self):
+        if hasattr(self._event_bus, 'unsubscribe'):
+            self._event_bus.unsubscribe(HYPOTHALAMUS_STATE, self._on_state)
+        self._debouncer.stop()
@@ -0,0 +1,263 @@
+"""
+DERİN - Control Socket
+══════════════════════
+Çalışan organizmaya yerel kontrol API'si (Unix domain socket, JSON-lines).
+
+    derin_cli ──{"id":1,"method":"status","params":{}}\\n──▶ data/runtime/derin.sock
+              ◀─{"id":1,"ok":true,"result":{...}}\\n──────── DerinCNS (canlı bellek)
+
+    • CLI her komutta singleton kurmaz; cevap canlı durumdan gelir (ms)
+    • Daemon kapalıysa CLI aynı sorgu fonksiyonlarını yerelde çalıştırır (offline mod)
+    • Bir bağlantıda birden fazla istek gönderilebilir
+    • Soket dosyası sadece sahibine açık (0600)
+
+Sorgular (status, events, people, news, backup) bu modülde tanımlıdır;
+daemon ve offline CLI aynı fonksiyonları kullanır.
+"""
+
+import os
+import json
+import socket
+import threading
+import socketserver
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.runtime_stats import RUNTIME_DIR
+
+SOCKET_PATH = RUNTIME_DIR / "derin.sock"
+
+
+class DaemonUnavailable(ConnectionError):
+    """Çalışan Derin yok (soket yok / bağlantı reddedildi)"""
+
+
+class RemoteError(RuntimeError):
+    """Daemon isteği işlerken hata verdi"""
+
+
+# ─── Sorgular (daemon + offline ortak) ──────────────────────────
+
+def query_status() -> Dict[str, Any]:
+    from core.autonomous_manager import get_autonomous_manager
+    return get_autonomous_manager().get_status()
+
+
+def query_events(lines: int = 20, since: Optional[float] = None, until: Optional[float] = None,
+                 types: Optional[List[str]] = None, person: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Hayat günlüğü sorgusu (core.event_store). since verilirse pencerenin başından, değilse son `lines` olay."""
+    from core.event_store import get_event_store
+    store = get_event_store(readonly=True)
+    filters = {"since": since, "until": until, "types": types, "person": person}
+    if since is not None:
+        events = store.query(limit=lines, **filters)
+    else:
+        events = store.latest(lines, **filters)
+    if events or any(v is not None for v in filters.values()):
+        return events
+    # Depo henüz boş - eski life logger'a düş
+    try:
+        from core.life_logger import get_life_logger
+    except ImportError:
+        return []
+    return list(get_life_logger().get_recent_events(lines))[-lines:]
+
+
+def person_to_dict(person) -> Dict[str, Any]:
+    return {
+        "name": person.name,
+        "relationship": getattr(person.relationship, "value", person.relationship),
+        "total_interactions": person.total_interactions,
+        "interests": list(person.interests),
+    }
+
+
+def query_people() -> List[Dict[str, Any]]:
+    from personality.multi_user_manager import get_multi_user_manager
+    return [person_to_dict(p) for p in get_multi_user_manager().list_all_people()]
+
+
+def query_news() -> str:
+    from core.daily_news_absorption import get_daily_news
+    return get_daily_news().get_todays_summary()
+
+
+def run_backup(tag: str = "manual") -> Dict[str, Any]:
+    """Artımlı snapshot + saklama politikası + çöp toplama (core.backup_store)"""
+    from core.backup_store import backup_targets, get_backup_repository, retention_policy
+    repo = get_backup_repository()
+    manifest = repo.backup(backup_targets(), tag=tag)
+    manifest["pruned"] = repo.prune(**retention_policy())
+    manifest["gc"] = repo.gc()
+    return manifest
+
+
+def query_backups() -> List[Dict[str, Any]]:
+    from core.backup_store import get_backup_repository
+    return get_backup_repository().snapshots()
+
+
+DEFAULT_HANDLERS: Dict[str, Callable[..., Any]] = {
+    "status": query_status,
+    "events": query_events,
+    "people": query_people,
+    "news": query_news,
+    "backup": run_backup,
+    "backups": query_backups,
+}
+
+
+# ─── Sunucu ─────────────────────────────────────────────────────
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.control.dispatch(line)
+            self.wfile.write(json.dumps(response, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class ControlServer:
+    """
+    server = ControlServer()
+    server.register("status", lambda: {...})
+    server.start()
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or SOCKET_PATH)
+        self._handlers: Dict[str, Callable[..., Any]] = {}
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"requests": 0, "errors": 0}
+
+    def register(self, method: str, handler: Callable[..., Any]):
+        self._handlers[method] = handler
+
+    @property
+    def methods(self) -> List[str]:
+        return sorted(self._handlers)
+
+    def dispatch(self, line: bytes) -> Dict[str, Any]:
+        self.stats["requests"] += 1
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            method = request["method"]
+            handler = self._handlers.get(method)
+            if handler is None:
+                raise KeyError(f"Bilinmeyen metod: {method}")
+            result = handler(**(request.get("params") or {}))
+            return {"id": request_id, "ok": True, "result": result}
+        except Exception as e:
+            self.stats["errors"] += 1
+            return {"id": request_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    def start(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            # Önceki süreçten kalan soket - canlı biri dinliyorsa devralma
+            try:
+                with ControlClient(self.path, timeout=0.5) as client:
+                    client.call("ping")
+                raise RuntimeError(f"Başka bir Derin zaten çalışıyor: {self.path}")
+            except DaemonUnavailable:
+                self.path.unlink()
+        self.register("ping", lambda: "pong")
+        self.register("methods", lambda: self.methods)
+        # Soket baştan sadece sahibine açık oluşur (bind ile chmod arasında pencere yok)
+        old_umask = os.umask(0o077)
+        try:
+            self._server = _Server(str(self.path), _Handler)
+        finally:
+            os.umask(old_umask)
+        self._server.control = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="control-socket",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# ─── İstemci ────────────────────────────────────────────────────
+
+class ControlClient:
+    """Thin client: client.call("events", lines=20)"""
+
+    def __init__(self, path: Optional[Path] = None, timeout: float = 5.0):
+        self.path = Path(path or SOCKET_PATH)
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._file = None
+        self._next_id = 0
+
+    def _connect(self):
+        if self._sock is not None:
+            return
+        if not self.path.exists():
+            raise DaemonUnavailable(f"Soket yok: {self.path}")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.path))
+        except OSError as e:
+            sock.close()
+            raise DaemonUnavailable(str(e)) from e
+        self._sock = sock
+        self._file = sock.makefile("rb")
+
+    def call(self, method: str, **params) -> Any:
+        self._connect()
+        self._next_id += 1
+        request = {"id": self._next_id, "method": method, "params": params}
+        try:
+            self._sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            line = self._file.readline()
+        except OSError as e:  # socket.timeout / TimeoutError dahil: takılan daemon = yok
+            self.close()
+            raise DaemonUnavailable(f"{method}: {e or 'zaman aşımı'}") from e
+        if not line:
+            self.close()
+            raise DaemonUnavailable("Bağlantı kapandı")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise RemoteError(response.get("error"))
+        return response.get("result")
+
+    def close(self):
+        if self._file:
+            self._file.close()
+        if self._sock:
+            self._sock.close()
+        self._sock = self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def query(method: str, offline: Callable[..., Any], timeout: float = 5.0,
+          **params) -> Tuple[Any, bool]:
+    """(sonuç, canlı_mı): daemon'a sor; çalışmıyorsa offline(**params) yerelde çalışır"""
+    try:
+        with ControlClient(timeout=timeout) as client:
+            return client.call(method, **params), True
+    except DaemonUnavailable:
+        return offline(**params), False
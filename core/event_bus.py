@@ -0,0 +1,379 @@
+"""
+DERİN - Event Bus (Sinir Ağı)
+═════════════════════════════
+Yüksek verimli olay veriyolu.
+
+    publish ──▶ topic id ──▶ abone 1 [ring: high | normal] ─┐
+                         ├─▶ abone 2 [ring: high | normal] ─┼─▶ worker havuzu ──▶ callback(event)
+                         └─▶ ...                            ┘   (batch teslim)
+
+    • Önceden kayıtlı topic id'leri (string karşılaştırması yok)
+    • __slots__'lı kompakt Event nesneleri
+    • Abone başına sınırlı ring buffer: drop_oldest veya block politikası
+    • Öncelik şeridi: brainstem refleksleri normal trafiği beklemez
+    • Batch teslim: bir abonenin bekleyen olayları tek seferde işlenir
+    • Abone sırası korunur (aynı abone iki worker'da paralel çalışmaz)
+
+Eski API uyumludur: publish(topic, data, source=...), subscribe(topic, callback),
+start(), stop(). Callback Event alır (event.data = payload).
+
+Mikro benchmark: python benchmarks/event_bus_bench.py
+"""
+
+import time
+import itertools
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Öncelik şeritleri
+PRIORITY_NORMAL = 0
+PRIORITY_HIGH = 1
+
+# Taşma politikaları
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+
+WILDCARD = "*"
+
+# Sistemde kullanılan topic'ler (id'leri sabit; yeni topic'ler ilk kullanımda kaydolur)
+STANDARD_TOPICS = {
+    # Konuşma hattı
+    "USER_SPEECH_STARTED": PRIORITY_HIGH,
+    "USER_SPEECH_TEXT": PRIORITY_NORMAL,
+    "AI_SPEECH_TEXT": PRIORITY_NORMAL,
+    "AI_SPEECH_DELTA": PRIORITY_NORMAL,
+    "GENERATION_STARTED": PRIORITY_NORMAL,
+    "GENERATION_FINISHED": PRIORITY_NORMAL,
+    "PLAYBACK_STARTED": PRIORITY_NORMAL,
+    # Brainstem refleksleri
+    "REFLEX_STOP_AUDIO": PRIORITY_HIGH,
+    "REFLEX_ABORT_GENERATION": PRIORITY_HIGH,
+    "AUDIO_REFLEX": PRIORITY_HIGH,
+    # Biyoloji / kontrol
+    "HYPOTHALAMUS_STATE": PRIORITY_NORMAL,
+    "MODEL_LAYER_READY": PRIORITY_NORMAL,
+    # Persona
+    "PERSONA_CHANGED": PRIORITY_NORMAL,
+    "PERSONALITY_UPDATED": PRIORITY_NORMAL,
+    "VALUES_UPDATED": PRIORITY_NORMAL,
+    "IDENTITY_UPDATED": PRIORITY_NORMAL,
+}
+
+
+class TopicRegistry:
+    """topic adı ↔ int id (+ varsayılan öncelik)"""
+
+    def __init__(self, topics: Optional[Dict[str, int]] = None):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._priority: List[int] = []
+        self._lock = threading.Lock()
+        self.register(WILDCARD)
+        for name, priority in (topics or {}).items():
+            self.register(name, priority)
+
+    def register(self, name: str, priority: int = PRIORITY_NORMAL) -> int:
+        with self._lock:
+            topic_id = self._ids.get(name)
+            if topic_id is None:
+                topic_id = len(self._names)
+                self._ids[name] = topic_id
+                self._names.append(name)
+                self._priority.append(priority)
+            return topic_id
+
+    def id(self, name: str) -> int:
+        topic_id = self._ids.get(name)
+        return topic_id if topic_id is not None else self.register(name)
+
+    def name(self, topic_id: int) -> str:
+        return self._names[topic_id]
+
+    def priority(self, topic_id: int) -> int:
+        return self._priority[topic_id]
+
+    def names(self) -> List[str]:
+        return list(self._names)
+
+
+class Event:
+    """Kompakt olay nesnesi"""
+    __slots__ = ("topic_id", "topic", "data", "source", "timestamp", "seq", "priority")
+
+    def __init__(self, topic_id: int, topic: str, data, source: str, timestamp: float,
+                 seq: int, priority: int):
+        self.topic_id = topic_id
+        self.topic = topic
+        self.data = data
+        self.source = source
+        self.timestamp = timestamp
+        self.seq = seq
+        self.priority = priority
+
+    @property
+    def type(self) -> str:
+        return self.topic
+
+    def __repr__(self):
+        return f"Event({self.topic}#{self.seq} from {self.source})"
+
+
+class Subscription:
+    """Abone + sınırlı iki şeritli ring buffer"""
+    __slots__ = ("topic_id", "callback", "capacity", "policy", "batch", "block_timeout",
+                 "high", "normal", "lock", "not_full", "scheduled", "running", "active",
+                 "delivered", "dropped", "errors")
+
+    def __init__(self, topic_id: int, callback: Callable, capacity: int, policy: str,
+                 batch: bool, block_timeout: float):
+        self.topic_id = topic_id
+        self.callback = callback
+        self.capacity = capacity
+        self.policy = policy
+        self.batch = batch
+        self.block_timeout = block_timeout
+        self.high: deque = deque()
+        self.normal: deque = deque()
+        self.lock = threading.Lock()
+        self.not_full = threading.Condition(self.lock)
+        self.scheduled = False
+        self.running = False
+        self.active = True
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self.high) + len(self.normal)
+
+    def offer(self, event: Event, high: bool) -> bool:
+        """Olayı ring'e koy. Zamanlanması gerekiyorsa True."""
+        with self.lock:
+            if not self.active:
+                return False
+            if len(self.high) + len(self.normal) >= self.capacity:
+                if self.policy == BLOCK:
+                    deadline = time.monotonic() + self.block_timeout
+                    while self.active and len(self.high) + len(self.normal) >= self.capacity:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not self.not_full.wait(remaining):
+                            break
+                if len(self.high) + len(self.normal) >= self.capacity:
+                    # drop_oldest (veya block zaman aşımı): önce normal şeritten at
+                    (self.normal or self.high).popleft()
+                    self.dropped += 1
+            (self.high if high else self.normal).append(event)
+            if not self.scheduled or high:
+                self.scheduled = True
+                return True
+            return False
+
+    def take(self, limit: int) -> List[Event]:
+        """Kilit altında: önce high şeridinden en fazla limit olay"""
+        events = []
+        while self.high and len(events) < limit:
+            events.append(self.high.popleft())
+        while self.normal and len(events) < limit:
+            events.append(self.normal.popleft())
+        if events:
+            self.not_full.notify_all()
+        return events
+
+
+class EventBus:
+    """Topic tabanlı, abone başına sınırlı kuyruklu olay veriyolu"""
+
+    def __init__(self, workers: int = 4, batch_size: int = 32, default_capacity: int = 1024,
+                 registry: Optional[TopicRegistry] = None):
+        self.registry = registry or TopicRegistry(STANDARD_TOPICS)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.default_capacity = default_capacity
+
+        self._subs: Dict[int, Tuple[Subscription, ...]] = {}  # copy-on-write
+        self._subs_lock = threading.Lock()
+        self._ready_high: deque = deque()
+        self._ready: deque = deque()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._running = False
+        self._seq = itertools.count(1)
+        self.stats = {"published": 0}
+
+    # ─── Abonelik ───────────────────────────────────────────────
+
+    def subscribe(self, topic: str, callback: Callable, capacity: Optional[int] = None,
+                  policy: str = DROP_OLDEST, batch: bool = False,
+                  block_timeout: float = 0.05) -> Subscription:
+        """
+        callback(event) veya batch=True ise callback([event, ...]).
+        topic="*" tüm olayları alır.
+        """
+        topic_id = self.registry.id(topic)
+        sub = Subscription(topic_id, callback, capacity or self.default_capacity,
+                           policy, batch, block_timeout)
+        with self._subs_lock:
+            self._subs[topic_id] = self._subs.get(topic_id, ()) + (sub,)
+        return sub
+
+    def unsubscribe(self, topic: str, callback: Callable) -> bool:
+        topic_id = self.registry.id(topic)
+        with self._subs_lock:
+            subs = self._subs.get(topic_id, ())
+            keep = tuple(s for s in subs if s.callback != callback)
+            removed = [s for s in subs if s.callback == callback]
+            self._subs[topic_id] = keep
+        for sub in removed:
+            with sub.lock:
+                sub.active = False
+                sub.high.clear()
+                sub.normal.clear()
+                sub.not_full.notify_all()
+        return bool(removed)
+
+    # ─── Yayın ──────────────────────────────────────────────────
+
+    def publish(self, topic: str, data=None, source: str = "", priority: Optional[int] = None) -> Event:
+        registry = self.registry
+        topic_id = registry.id(topic)
+        if priority is None:
+            priority = registry.priority(topic_id)
+        event = Event(topic_id, topic, data, source, time.perf_counter(), next(self._seq), priority)
+        self.stats["published"] += 1
+
+        high = priority >= PRIORITY_HIGH
+        subs = self._subs.get(topic_id, ())
+        wildcard = self._subs.get(0, ())
+        for sub in (subs + wildcard) if wildcard else subs:
+            if sub.offer(event, high):
+                self._schedule(sub, high)
+        return event
+
+    def _schedule(self, sub: Subscription, high: bool):
+        with self._cond:
+            (self._ready_high if high else self._ready).append(sub)
+            self._cond.notify()
+
+    # ─── Teslim ─────────────────────────────────────────────────
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"event-bus-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _next_ready(self) -> Optional[Subscription]:
+        with self._cond:
+            while self._running and not self._ready_high and not self._ready:
+                self._cond.wait()
+            if self._ready_high:
+                return self._ready_high.popleft()
+            if self._ready:
+                return self._ready.popleft()
+            return None
+
+    def _worker(self):
+        while True:
+            sub = self._next_ready()
+            if sub is None:
+                return
+            self._drain(sub)
+
+    def _drain(self, sub: Subscription):
+        with sub.lock:
+            if sub.running:
+                return  # Başka worker teslim ediyor; bitince yeniden zamanlar
+            sub.running = True
+            sub.scheduled = False
+            events = sub.take(self.batch_size)
+
+        try:
+            if sub.batch and events:
+                self._deliver(sub, events)
+            elif not sub.batch:
+                for event in events:
+                    self._deliver(sub, event)
+        finally:
+            with sub.lock:
+                sub.running = False
+                sub.delivered += len(events)
+                pending = sub.depth > 0 and sub.active
+                high = bool(sub.high)
+                if pending:
+                    sub.scheduled = True
+            if pending:
+                self._schedule(sub, high)
+
+    def _deliver(self, sub: Subscription, payload):
+        try:
+            sub.callback(payload)
+        except Exception as e:
+            sub.errors += 1
+            print(f"[EVENT BUS] {self.registry.name(sub.topic_id)} abone hatası: {e}")
+
+    def drain(self, timeout: float = 2.0) -> bool:
+        """Bekleyen tüm olaylar teslim edilene kadar bekle. Hepsi teslim edildi mi?"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.pending() == 0 and not self._busy():
+                return True
+            time.sleep(0.005)
+        return self.pending() == 0
+
+    def _busy(self) -> bool:
+        with self._subs_lock:
+            subs = [s for group in self._subs.values() for s in group]
+        return any(s.running for s in subs)
+
+    def pending(self) -> int:
+        with self._subs_lock:
+            subs = [s for group in self._subs.values() for s in group]
+        return sum(s.depth for s in subs)
+
+    def stop(self, drain_timeout: float = 0.0):
+        """Worker'ları durdur (drain_timeout > 0 ise önce kuyrukları boşalt)"""
+        if drain_timeout > 0 and self._running:
+            self.drain(drain_timeout)
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+        self._threads.clear()
+
+    # ─── Metrikler ──────────────────────────────────────────────
+
+    def get_stats(self) -> Dict:
+        with self._subs_lock:
+            groups = dict(self._subs)
+        topics = {}
+        for topic_id, subs in groups.items():
+            if not subs:
+                continue
+            topics[self.registry.name(topic_id)] = {
+                "subscribers": len(subs),
+                "queue_depth": sum(s.depth for s in subs),
+                "max_queue_depth": max(s.depth for s in subs),
+                "delivered": sum(s.delivered for s in subs),
+                "dropped": sum(s.dropped for s in subs),
+                "errors": sum(s.errors for s in subs),
+            }
+        return {"published": self.stats["published"], "topics": topics}
+
+
+# Singleton
+_event_bus: Optional[EventBus] = None
+_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    global _event_bus
+    with _lock:
+        if _event_bus is None:
+            _event_bus = EventBus()
+        return _event_bus
@@ -0,0 +1,556 @@
+"""
+DERİN - Event Store (Hayat Günlüğü Deposu)
+══════════════════════════════════════════
+Segmentli, sadece-ekleme (append-only) olay deposu.
+
+    data/life_log/
+        segments.json              mühürlü segmentlerin listesi (min/max ts, sayılar)
+        seg-00000001.log           JSON-lines: {"ts":..,"type":"..",...}
+        seg-00000001.idx.npz       seyrek zaman indeksi + tip başına (ts, offset) dizileri
+        seg-00000002.log           aktif segment (indekssiz, zamana göre sıralı)
+
+    • Kayıtlar zaman sırasındadır (ts geriye gidemez) → segment atlama + ikili arama
+    • Okumalar mmap ile; sadece gereken satırlar parse edilir
+    • Segment boyutu / süresi aşılınca rotasyon; küçük segmentler compact() ile birleşir
+    • Sorgu maliyeti günlüğün toplam boyutundan değil, istenen pencereden bağımsızdır
+
+Kullanım:
+    store = get_event_store()
+    store.append("conversation", summary="Ali ile sohbet", person="Ali")
+    store.query(since=t0, until=t1, types=["emotion"], limit=50)
+    store.latest(20)
+    for event in store.follow(): ...
+
+Benchmark: python benchmarks/event_store_bench.py
+"""
+
+import os
+import re
+import json
+import mmap
+import time
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+STORE_DIR = Path(__file__).resolve().parent.parent / "data" / "life_log"
+MANIFEST = "segments.json"
+_TYPE_RE = re.compile(r"[^\w.\-:]")
+
+# Event bus'tan hayat günlüğüne yazılan topic'ler (token akışı gibi gürültü hariç)
+LIFE_LOG_TOPICS = ("USER_SPEECH_TEXT", "AI_SPEECH_TEXT", "MODEL_LAYER_READY", "QOS_TIER_CHANGED",
+                   "PERSONA_CHANGED")
+
+
+def _segment_name(seq: int) -> str:
+    return f"seg-{seq:08d}"
+
+
+def _header(line: bytes) -> Tuple[float, str]:
+    """Satırı tamamen parse etmeden (ts, type) - kayıtlar her zaman bu alanlarla başlar"""
+    comma = line.index(b",", 6)
+    ts = float(line[6:comma])
+    end = line.index(b'"', comma + 9)
+    return ts, line[comma + 9:end].decode("utf-8")
+
+
+def _lines(mm, start: int, end: int) -> Iterator[Tuple[int, bytes]]:
+    pos = start
+    while pos < end:
+        nl = mm.find(b"\n", pos, end)
+        if nl < 0:
+            return  # Yarım yazılmış son satır
+        yield pos, mm[pos:nl]
+        pos = nl + 1
+
+
+def _lines_reverse(mm, start: int, end: int, chunk: int = 1 << 16) -> Iterator[Tuple[int, bytes]]:
+    """[start, end) aralığındaki tam satırlar, sondan başa"""
+    # Son satır tamamlanmamışsa atla
+    if end > start and mm[end - 1:end] != b"\n":
+        nl = mm.rfind(b"\n", start, end)
+        end = nl + 1 if nl >= 0 else start
+    pos = end
+    while pos > start:
+        lo = max(start, pos - chunk)
+        block = mm[lo:pos]
+        if lo > start:
+            first_nl = block.find(b"\n")
+            if first_nl < 0:
+                chunk *= 2
+                continue
+            lo += first_nl + 1
+            block = block[first_nl + 1:]
+        lines = block.split(b"\n")[:-1]
+        offset = pos
+        for line in reversed(lines):
+            offset -= len(line) + 1
+            yield offset, line
+        pos = lo
+
+
+def _bisect(mm, size: int, ts: float, right: bool = False) -> int:
+    """ts'den küçük (right=True ise küçük-eşit) olmayan ilk kaydın offset'i"""
+    lo, hi = 0, size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        line_start = 0 if mid == 0 else mm.rfind(b"\n", 0, mid) + 1
+        nl = mm.find(b"\n", line_start)
+        if nl < 0:
+            hi = line_start
+            continue
+        line_ts, _ = _header(mm[line_start:nl])
+        if line_ts < ts or (right and line_ts == ts):
+            lo = nl + 1
+        else:
+            hi = line_start
+    return lo
+
+
+class _Segment:
+    def __init__(self, directory: Path, seq: int, meta: Optional[Dict] = None):
+        self.seq = seq
+        self.name = _segment_name(seq)
+        self.path = directory / f"{self.name}.log"
+        self.index_path = directory / f"{self.name}.idx.npz"
+        self.meta = meta  # None → aktif (mühürsüz)
+
+    @property
+    def sealed(self) -> bool:
+        return self.meta is not None
+
+
+class EventStore:
+    """Segmentli hayat günlüğü (tek yazıcı, çok okuyucu - okuyucular ayrı süreç olabilir)"""
+
+    def __init__(self, directory: Optional[Path] = None, readonly: bool = False,
+                 max_segment_bytes: int = 16 << 20, max_segment_seconds: float = 86400.0,
+                 index_every: int = 64, index_cache: int = 8):
+        self.directory = Path(directory or STORE_DIR)
+        self.readonly = readonly
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_seconds = max_segment_seconds
+        self.index_every = index_every
+        self._lock = threading.RLock()
+        self._indexes: "OrderedDict[str, Dict[str, np.ndarray]]" = OrderedDict()
+        self._index_cache = index_cache
+        self._manifest: List[Dict] = []
+        self._manifest_mtime = None
+        self._file = None
+        self._active: Optional[_Segment] = None
+        self._active_state: Dict = {}
+        self.stats = {"appended": 0, "rotations": 0, "compactions": 0}
+
+        if not readonly:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._recover()
+
+    # ─── Manifest ───────────────────────────────────────────────
+
+    def _manifest_path(self) -> Path:
+        return self.directory / MANIFEST
+
+    def _load_manifest(self):
+        path = self._manifest_path()
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._manifest, self._manifest_mtime = [], None
+            return
+        if mtime != self._manifest_mtime:
+            with open(path, "r", encoding="utf-8") as f:
+                self._manifest = json.load(f)
+            self._manifest_mtime = mtime
+
+    def _save_manifest(self):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".segments.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._manifest, f)
+        os.replace(tmp, self._manifest_path())
+        self._manifest_mtime = self._manifest_path().stat().st_mtime_ns
+
+    def _segments(self) -> List[_Segment]:
+        """Mühürlü segmentler + manifest'te olmayan (aktif) segment dosyaları, sırayla"""
+        self._load_manifest()
+        sealed = {m["seq"]: m for m in self._manifest}
+        segments = [_Segment(self.directory, seq, meta) for seq, meta in sorted(sealed.items())]
+        for path in sorted(self.directory.glob("seg-*.log")):
+            seq = int(path.stem.split("-")[1])
+            if seq not in sealed:
+                segments.append(_Segment(self.directory, seq))
+        segments.sort(key=lambda s: s.seq)
+        return segments
+
+    # ─── Yazma ──────────────────────────────────────────────────
+
+    def _recover(self):
+        """Açılış: yarım satırı kes, birden fazla mühürsüz segment varsa eskileri mühürle"""
+        unsealed = [s for s in self._segments() if not s.sealed]
+        for segment in unsealed[:-1]:
+            self._seal(segment, self._scan_index(segment))
+        if unsealed:
+            self._open_active(unsealed[-1])
+        else:
+            last = max([m["seq"] for m in self._manifest], default=0)
+            self._open_active(_Segment(self.directory, last + 1))
+
+    def _open_active(self, segment: _Segment):
+        segment.path.touch(exist_ok=True)
+        size = segment.path.stat().st_size
+        if size:
+            with open(segment.path, "rb+") as f:
+                f.seek(max(0, size - 1))
+                if f.read(1) != b"\n":
+                    # Çökme sonrası yarım satır
+                    data = segment.path.read_bytes()
+                    size = data.rfind(b"\n") + 1
+                    f.truncate(size)
+        self._active = segment
+        self._active_state = self._scan_index(segment)
+        self._file = open(segment.path, "ab")
+
+    def _scan_index(self, segment: _Segment) -> Dict:
+        """Segment dosyasından indeks durumunu yeniden kur"""
+        state = {"sparse": [], "types": {}, "count": 0, "min_ts": None, "max_ts": None, "bytes": 0}
+        size = segment.path.stat().st_size
+        if not size:
+            return state
+        with open(segment.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset, line in _lines(mm, 0, size):
+                ts, event_type = _header(line)
+                self._index_record(state, ts, event_type, offset)
+            state["bytes"] = size
+        return state
+
+    def _index_record(self, state: Dict, ts: float, event_type: str, offset: int):
+        if state["count"] % self.index_every == 0:
+            state["sparse"].append((ts, offset))
+        type_ts, type_off = state["types"].setdefault(event_type, ([], []))
+        type_ts.append(ts)
+        type_off.append(offset)
+        if state["min_ts"] is None:
+            state["min_ts"] = ts
+        state["max_ts"] = ts
+        state["count"] += 1
+
+    def _seal(self, segment: _Segment, state: Dict):
+        if state["count"] == 0:
+            segment.path.unlink(missing_ok=True)
+            return
+        arrays = {
+            "sparse_ts": np.array([t for t, _ in state["sparse"]], dtype=np.float64),
+            "sparse_off": np.array([o for _, o in state["sparse"]], dtype=np.int64),
+        }
+        type_names = sorted(state["types"])
+        for i, name in enumerate(type_names):
+            type_ts, type_off = state["types"][name]
+            arrays[f"t{i}_ts"] = np.array(type_ts, dtype=np.float64)
+            arrays[f"t{i}_off"] = np.array(type_off, dtype=np.int64)
+        tmp = segment.index_path.with_suffix(".tmp.npz")
+        np.savez(tmp, **arrays)
+        os.replace(tmp, segment.index_path)
+
+        self._load_manifest()
+        self._manifest = [m for m in self._manifest if m["seq"] != segment.seq]
+        self._manifest.append({
+            "seq": segment.seq, "min_ts": state["min_ts"], "max_ts": state["max_ts"],
+            "count": state["count"], "bytes": segment.path.stat().st_size,
+            "types": {name: len(state["types"][name][0]) for name in type_names},
+        })
+        self._manifest.sort(key=lambda m: m["seq"])
+        self._save_manifest()
+
+    def _rotate(self):
+        self._file.close()
+        self._seal(self._active, self._active_state)
+        self.stats["rotations"] += 1
+        self._open_active(_Segment(self.directory, self._active.seq + 1))
+
+    def _encode(self, event_type: str, ts: float, fields: Dict) -> Tuple[float, str, bytes]:
+        event_type = _TYPE_RE.sub("_", event_type or "unknown")
+        last = self._active_state["max_ts"]
+        if last is not None and ts < last:
+            ts = last  # Kayıt zamanı geriye gidemez (sıralı arama için)
+        record = {"ts": ts, "type": event_type}
+        record.update((k, v) for k, v in fields.items() if k not in ("ts", "type"))
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+        return ts, event_type, line.encode("utf-8") + b"\n"
+
+    def _needs_rotation(self, ts: float) -> bool:
+        state = self._active_state
+        if state["count"] == 0:
+            return False
+        return (state["bytes"] >= self.max_segment_bytes
+                or ts - state["min_ts"] >= self.max_segment_seconds)
+
+    def append(self, event_type: str, ts: Optional[float] = None, **fields) -> Dict:
+        """Olay ekle; yazılan kaydı döndür"""
+        return self.append_many([(event_type, ts, fields)])[-1]
+
+    def append_many(self, events: Iterable[Tuple[str, Optional[float], Dict]]) -> List[Dict]:
+        """[(type, ts, fields), ...] - tek flush ile toplu ekleme"""
+        if self.readonly:
+            raise PermissionError("Salt okunur event store")
+        written = []
+        with self._lock:
+            for event_type, ts, fields in events:
+                ts = time.time() if ts is None else ts
+                if self._needs_rotation(ts):
+                    self._file.flush()
+                    self._rotate()
+                ts, event_type, data = self._encode(event_type, ts, fields)
+                offset = self._active_state["bytes"]
+                self._file.write(data)
+                self._active_state["bytes"] += len(data)
+                self._index_record(self._active_state, ts, event_type, offset)
+                written.append({"ts": ts, "type": event_type, **fields})
+            self._file.flush()
+            self.stats["appended"] += len(written)
+        return written
+
+    def attach_event_bus(self, event_bus, topics: Sequence[str] = LIFE_LOG_TOPICS):
+        """Topic'leri batch olarak hayat günlüğüne yaz"""
+        from core.control_loop import event_payload
+
+        def on_events(events):
+            records = []
+            for event in events:
+                payload = event_payload(event)
+                fields = dict(payload) if isinstance(payload, dict) else {"data": payload}
+                fields.setdefault("summary", str(fields.get("text", ""))[:200])
+                fields["source"] = getattr(event, "source", "")
+                records.append((getattr(event, "topic", "event").lower(), None, fields))
+            self.append_many(records)
+
+        for topic in topics:
+            event_bus.subscribe(topic, on_events, batch=True)
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    # ─── Okuma ──────────────────────────────────────────────────
+
+    def _index(self, segment: _Segment) -> Dict[str, np.ndarray]:
+        with self._lock:
+            index = self._indexes.get(segment.name)
+            if index is not None:
+                self._indexes.move_to_end(segment.name)
+                return index
+        with np.load(segment.index_path) as data:
+            index = {key: data[key] for key in data.files}
+        names = sorted(segment.meta["types"])
+        index["types"] = {name: (index.pop(f"t{i}_ts"), index.pop(f"t{i}_off"))
+                          for i, name in enumerate(names)}
+        with self._lock:
+            self._indexes[segment.name] = index
+            while len(self._indexes) > self._index_cache:
+                self._indexes.popitem(last=False)
+        return index
+
+    def _iter_segment(self, segment: _Segment, since: Optional[float], until: Optional[float],
+                      types: Optional[set], reverse: bool) -> Iterator[bytes]:
+        size = segment.path.stat().st_size
+        if size == 0:
+            return
+        with open(segment.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if segment.sealed and types is not None:
+                # Tip indeksi: sadece eşleşen satırlar okunur
+                index = self._index(segment)
+                parts = [index["types"][t] for t in types if t in index["types"]]
+                if not parts:
+                    return
+                ts = np.concatenate([p[0] for p in parts])
+                offsets = np.concatenate([p[1] for p in parts])
+                order = np.argsort(offsets, kind="stable")
+                ts, offsets = ts[order], offsets[order]
+                lo = np.searchsorted(ts, since, "left") if since is not None else 0
+                hi = np.searchsorted(ts, until, "right") if until is not None else len(ts)
+                selected = offsets[lo:hi]
+                for offset in (selected[::-1] if reverse else selected):
+                    offset = int(offset)
+                    yield mm[offset:mm.find(b"\n", offset)]
+                return
+
+            if segment.sealed:
+                # Seyrek zaman indeksi: pencereyi kapsayan bloklar
+                index = self._index(segment)
+                sparse_ts, sparse_off = index["sparse_ts"], index["sparse_off"]
+                start = 0
+                if since is not None:
+                    i = int(np.searchsorted(sparse_ts, since, "left")) - 1
+                    start = int(sparse_off[i]) if i >= 0 else 0
+                end = size
+                if until is not None:
+                    j = int(np.searchsorted(sparse_ts, until, "right"))
+                    end = int(sparse_off[j]) if j < len(sparse_off) else size
+            else:
+                # Aktif segment: sıralı dosyada ikili arama
+                start = _bisect(mm, size, since) if since is not None else 0
+                end = _bisect(mm, size, until, right=True) if until is not None else size
+
+            lines = _lines_reverse(mm, start, end) if reverse else _lines(mm, start, end)
+            for _, line in lines:
+                ts, event_type = _header(line)
+                if since is not None and ts < since:
+                    if reverse:
+                        return
+                    continue
+                if until is not None and ts > until:
+                    if reverse:
+                        continue
+                    return
+                if types is not None and event_type not in types:
+                    continue
+                yield line
+
+    def query(self, since: Optional[float] = None, until: Optional[float] = None,
+              types: Optional[Sequence[str]] = None, person: Optional[str] = None,
+              limit: Optional[int] = None, newest_first: bool = False) -> List[Dict]:
+        """Zaman penceresi / tip / kişi filtresi. newest_first=True → limit en yenilerden alınır."""
+        type_set = set(types) if types else None
+        segments = self._segments()
+        if newest_first:
+            segments.reverse()
+        results = []
+        for segment in segments:
+            meta = segment.meta
+            if meta is not None:
+                if since is not None and meta["max_ts"] < since:
+                    continue
+                if until is not None and meta["min_ts"] > until:
+                    continue
+                if type_set is not None and not type_set.intersection(meta["types"]):
+                    continue
+            for line in self._iter_segment(segment, since, until, type_set, newest_first):
+                event = json.loads(line)
+                if person is not None and event.get("person") != person:
+                    continue
+                results.append(event)
+                if limit is not None and len(results) >= limit:
+                    return results
+        return results
+
+    def latest(self, n: int = 20, **filters) -> List[Dict]:
+        """En yeni n olay (kronolojik sırada)"""
+        return list(reversed(self.query(limit=n, newest_first=True, **filters)))
+
+    def follow(self, types: Optional[Sequence[str]] = None, person: Optional[str] = None,
+               poll_interval: float = 0.5, stop: Optional[threading.Event] = None) -> Iterator[Dict]:
+        """Yeni olayları geldikçe ver (tail -f; rotasyonu takip eder)"""
+        type_set = set(types) if types else None
+        segments = self._segments()
+        segment = segments[-1] if segments else _Segment(self.directory, 1)
+        position = segment.path.stat().st_size if segment.path.exists() else 0
+        while stop is None or not stop.is_set():
+            size = segment.path.stat().st_size if segment.path.exists() else 0
+            if size > position:
+                with open(segment.path, "rb") as f:
+                    f.seek(position)
+                    data = f.read(size - position)
+                complete = data.rfind(b"\n") + 1
+                position += complete
+                for line in data[:complete].splitlines():
+                    _, event_type = _header(line)
+                    if type_set is not None and event_type not in type_set:
+                        continue
+                    event = json.loads(line)
+                    if person is None or event.get("person") == person:
+                        yield event
+                continue
+            next_segment = _Segment(self.directory, segment.seq + 1)
+            if next_segment.path.exists():
+                segment, position = next_segment, 0
+                continue
+            time.sleep(poll_interval)
+
+    # ─── Bakım ──────────────────────────────────────────────────
+
+    def compact(self, small_bytes: Optional[int] = None) -> int:
+        """Ardışık küçük mühürlü segmentleri birleştir. Kaldırılan segment sayısı."""
+        if self.readonly:
+            raise PermissionError("Salt okunur event store")
+        small_bytes = small_bytes or self.max_segment_bytes // 4
+        removed = 0
+        with self._lock:
+            self._load_manifest()
+            groups, current = [], []
+            for meta in self._manifest:
+                size = sum(m["bytes"] for m in current)
+                if meta["bytes"] < small_bytes and size + meta["bytes"] <= self.max_segment_bytes:
+                    current.append(meta)
+                else:
+                    if len(current) > 1:
+                        groups.append(current)
+                    current = [meta] if meta["bytes"] < small_bytes else []
+            if len(current) > 1:
+                groups.append(current)
+
+            for group in groups:
+                target = _Segment(self.directory, group[0]["seq"])
+                tmp = target.path.with_suffix(".compact")
+                with open(tmp, "wb") as out:
+                    for meta in group:
+                        with open(_Segment(self.directory, meta["seq"]).path, "rb") as f:
+                            out.write(f.read())
+                os.replace(tmp, target.path)
+                for meta in group[1:]:
+                    old = _Segment(self.directory, meta["seq"])
+                    old.path.unlink(missing_ok=True)
+                    old.index_path.unlink(missing_ok=True)
+                    self._indexes.pop(old.name, None)
+                self._indexes.pop(target.name, None)
+                drop = {m["seq"] for m in group[1:]}
+                self._manifest = [m for m in self._manifest if m["seq"] not in drop]
+                self._seal(target, self._scan_index(target))
+                removed += len(group) - 1
+            if removed:
+                self.stats["compactions"] += 1
+        return removed
+
+    def drop_before(self, ts: float) -> int:
+        """Tamamı ts'den eski mühürlü segmentleri sil (saklama politikası)"""
+        with self._lock:
+            self._load_manifest()
+            old = [m for m in self._manifest if m["max_ts"] < ts]
+            for meta in old:
+                segment = _Segment(self.directory, meta["seq"])
+                segment.path.unlink(missing_ok=True)
+                segment.index_path.unlink(missing_ok=True)
+                self._indexes.pop(segment.name, None)
+            if old:
+                self._manifest = [m for m in self._manifest if m["max_ts"] >= ts]
+                self._save_manifest()
+            return len(old)
+
+    def get_stats(self) -> Dict:
+        segments = self._segments()
+        sealed = [s.meta for s in segments if s.sealed]
+        active_count = self._active_state.get("count", 0) if self._active else None
+        return {
+            **self.stats,
+            "segments": len(segments),
+            "sealed_events": sum(m["count"] for m in sealed),
+            "active_events": active_count,
+            "bytes": sum(s.path.stat().st_size for s in segments if s.path.exists()),
+        }
+
+
+# Singleton
+_event_store: Optional[EventStore] = None
+_lock = threading.Lock()
+
+
+def get_event_store(readonly: bool = False) -> EventStore:
+    """Süreç başına tek yazıcı; CLI readonly=True ile açar"""
+    global _event_store
+    with _lock:
+        if _event_store is None or (_event_store.readonly and not readonly):
+            _event_store = EventStore(readonly=readonly)
+        return _event_store
@@ -0,0 +1,267 @@
+"""
+DERİN - Frame Bus (Görsel Sinir Yolu)
+═════════════════════════════════════
+Kamera karelerinin kopyasız paylaşımı.
+
+    kamera ──write()──▶ [shared memory ring: slot 0 | slot 1 | ... | slot N-1]
+                                     │ (refcount)
+              ┌──────────────┬───────┴──────┬───────────────┐
+          detection     face recog        VLM         stereo depth
+          (read-only NumPy görünümleri, kopya yok)
+
+    • Üretici kareyi bir kez yazar (veya acquire_write() ile doğrudan slota decode eder)
+    • Tüketiciler FrameHandle alır: .array (salt okunur), .seq, .timestamp, .camera_id
+    • Referansı tutulan slot üzerine yazılmaz; tüm slotlar meşgulse kare düşürülür
+    • pair() stereo için iki kameradan zaman damgası en yakın kareleri eşler
+
+Bellek multiprocessing.shared_memory'dedir; başka bir süreç aynı ada
+bağlanıp (FrameBus.attach) slotları okuyabilir. Referans sayımı süreç içidir.
+
+Benchmark: python benchmarks/frame_bus_bench.py
+"""
+
+import time
+import threading
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class FrameHandle:
+    """Slot üzerinde salt okunur, referans sayımlı görünüm"""
+    __slots__ = ("_bus", "slot", "seq", "timestamp", "camera_id", "array")
+
+    def __init__(self, bus: "FrameBus", slot: int, seq: int, timestamp: float, camera_id: int,
+                 array: np.ndarray):
+        self._bus = bus
+        self.slot = slot
+        self.seq = seq
+        self.timestamp = timestamp
+        self.camera_id = camera_id
+        self.array = array
+
+    def release(self):
+        if self._bus is not None:
+            self.array = None
+            self._bus._release(self.slot)
+            self._bus = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def __del__(self):
+        # Unutulan handle slotu sonsuza kadar kilitlemesin
+        try:
+            self.release()
+        except Exception:
+            pass
+
+    def __repr__(self):
+        return f"FrameHandle(cam={self.camera_id} seq={self.seq} slot={self.slot})"
+
+
+class FrameBus:
+    """Shared memory kare halkası"""
+
+    def __init__(self, width: int = 1280, height: int = 720, channels: int = 3, slots: int = 8,
+                 name: Optional[str] = None, create: bool = True):
+        self.shape = (height, width, channels)
+        self.frame_bytes = height * width * channels
+        self.slots = slots
+        self._shm = shared_memory.SharedMemory(name=name, create=create,
+                                               size=self.frame_bytes * slots)
+        self._owner = create
+        self._frames = np.ndarray((slots,) + self.shape, dtype=np.uint8, buffer=self._shm.buf)
+
+        self._cond = threading.Condition()
+        self._refcount = [0] * slots
+        self._writing = [False] * slots
+        self._meta: List[Optional[Tuple[int, float, int]]] = [None] * slots  # (seq, ts, cam)
+        self._latest: Dict[int, int] = {}  # camera_id -> slot
+        self._next_slot = 0
+        self._seq = 0
+        self.stats = {"written": 0, "dropped_busy": 0, "reads": 0}
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @classmethod
+    def attach(cls, name: str, width: int = 1280, height: int = 720, channels: int = 3,
+               slots: int = 8) -> "FrameBus":
+        """Başka süreçteki halkaya bağlan"""
+        return cls(width, height, channels, slots, name=name, create=False)
+
+    # ─── Üretici ────────────────────────────────────────────────
+
+    def _claim_slot_locked(self) -> Optional[int]:
+        for offset in range(self.slots):
+            slot = (self._next_slot + offset) % self.slots
+            if self._refcount[slot] == 0 and not self._writing[slot]:
+                self._next_slot = (slot + 1) % self.slots
+                self._writing[slot] = True
+                # Yazılırken okunmasın
+                for cam, latest in list(self._latest.items()):
+                    if latest == slot:
+                        del self._latest[cam]
+                self._meta[slot] = None
+                return slot
+        return None
+
+    def acquire_write(self) -> Optional[Tuple[int, np.ndarray]]:
+        """(slot, yazılabilir görünüm) - kamera doğrudan buraya decode eder; commit() ile yayınla"""
+        with self._cond:
+            slot = self._claim_slot_locked()
+            if slot is None:
+                self.stats["dropped_busy"] += 1
+                return None
+        return slot, self._frames[slot]
+
+    def commit(self, slot: int, timestamp: Optional[float] = None, camera_id: int = 0) -> int:
+        with self._cond:
+            self._seq += 1
+            self._meta[slot] = (self._seq, timestamp if timestamp is not None else time.time(), camera_id)
+            self._writing[slot] = False
+            self._latest[camera_id] = slot
+            self.stats["written"] += 1
+            self._cond.notify_all()
+            return self._seq
+
+    def write(self, frame: np.ndarray, timestamp: Optional[float] = None, camera_id: int = 0) -> Optional[int]:
+        """Kareyi halkaya yaz (tek kopya). Sequence numarası veya düşürüldüyse None."""
+        claimed = self.acquire_write()
+        if claimed is None:
+            return None
+        slot, view = claimed
+        np.copyto(view, frame.reshape(self.shape), casting="no")
+        return self.commit(slot, timestamp, camera_id)
+
+    # ─── Tüketici ───────────────────────────────────────────────
+
+    def _handle_locked(self, slot: int) -> FrameHandle:
+        seq, timestamp, camera_id = self._meta[slot]
+        self._refcount[slot] += 1
+        self.stats["reads"] += 1
+        view = self._frames[slot].view()
+        view.flags.writeable = False
+        return FrameHandle(self, slot, seq, timestamp, camera_id, view)
+
+    def latest(self, camera_id: int = 0) -> Optional[FrameHandle]:
+        with self._cond:
+            slot = self._latest.get(camera_id)
+            return self._handle_locked(slot) if slot is not None else None
+
+    def wait_next(self, after_seq: int = 0, camera_id: int = 0,
+                  timeout: Optional[float] = None) -> Optional[FrameHandle]:
+        """after_seq'ten yeni ilk kare (araya giren kareler atlanır - en güncel verilir)"""
+        def ready():
+            slot = self._latest.get(camera_id)
+            return slot is not None and self._meta[slot][0] > after_seq
+
+        with self._cond:
+            if not self._cond.wait_for(ready, timeout):
+                return None
+            return self._handle_locked(self._latest[camera_id])
+
+    def pair(self, left_camera: int = 0, right_camera: int = 1,
+             max_skew: float = 0.010) -> Optional[Tuple[FrameHandle, FrameHandle]]:
+        """Stereo: iki kameradan zaman damgası farkı max_skew altındaki en yeni çift"""
+        with self._cond:
+            left = [s for s, m in enumerate(self._meta) if m and m[2] == left_camera]
+            right = [s for s, m in enumerate(self._meta) if m and m[2] == right_camera]
+            best = None
+            for ls in left:
+                for rs in right:
+                    skew = abs(self._meta[ls][1] - self._meta[rs][1])
+                    if skew <= max_skew:
+                        newest = min(self._meta[ls][0], self._meta[rs][0])
+                        if best is None or newest > best[0]:
+                            best = (newest, ls, rs)
+            if best is None:
+                return None
+            return self._handle_locked(best[1]), self._handle_locked(best[2])
+
+    def _release(self, slot: int):
+        with self._cond:
+            if self._refcount[slot] > 0:
+                self._refcount[slot] -= 1
+
+    # ─── Yaşam döngüsü ──────────────────────────────────────────
+
+    def get_stats(self) -> Dict:
+        with self._cond:
+            return {
+                **self.stats,
+                "slots": self.slots,
+                "in_use": sum(1 for r in self._refcount if r),
+                "frame_bytes": self.frame_bytes,
+                "last_seq": self._seq,
+            }
+
+    def close(self):
+        """Belleği bırak (sahibiyse unlink). Açık handle'lar geçersiz olur."""
+        self._frames = None
+        try:
+            self._shm.close()
+        except BufferError:
+            return  # Dışarıda hâlâ görünüm var; süreç bitince serbest kalır
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class SyntheticFrameSource:
+    """CPU test kaynağı: hareketli gradyan + kayan kutu"""
+
+    def __init__(self, width: int = 1280, height: int = 720, fps: float = 30.0, camera_id: int = 0):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.camera_id = camera_id
+        self._base = np.tile(np.linspace(0, 255, width, dtype=np.uint8), (height, 1))
+        self._index = 0
+
+    def next_frame(self) -> np.ndarray:
+        frame = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        shift = (self._index * 4) % self.width
+        frame[..., 0] = np.roll(self._base, shift, axis=1)
+        frame[..., 1] = frame[..., 0][::-1]
+        frame[..., 2] = self._index % 256
+        x = (self._index * 8) % max(1, self.width - 64)
+        frame[self.height // 2 - 32:self.height // 2 + 32, x:x + 64] = 255
+        self._index += 1
+        return frame
+
+    def run(self, bus: FrameBus, frames: int, realtime: bool = False):
+        interval = 1.0 / self.fps
+        for _ in range(frames):
+            started = time.monotonic()
+            claimed = bus.acquire_write()
+            if claimed is not None:
+                slot, view = claimed
+                view[...] = self.next_frame()
+                bus.commit(slot, camera_id=self.camera_id)
+            if realtime:
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
+# Singleton
+_frame_bus: Optional[FrameBus] = None
+_lock = threading.Lock()
+
+
+def get_frame_bus() -> FrameBus:
+    """config.yaml → vision.camera.resolution boyutunda halka"""
+    global _frame_bus
+    with _lock:
+        if _frame_bus is None:
+            from core.platform_config import get_section
+            width, height = get_section("vision", "camera", "resolution", default=[1280, 720])
+            _frame_bus = FrameBus(width=width, height=height)
+        return _frame_bus
@@ -0,0 +1,226 @@
+"""
+DERİN - Hardware Info
+═════════════════════
+Hafif donanım sorguları (CPU, RAM, disk, GPU, sıcaklık).
+
+Ağır kütüphaneler sadece gerektiğinde ve sırayla denenir:
+
+    GPU:   pynvml (ms'ler) ──▶ nvidia-smi ──▶ torch.cuda (allow_torch=True ise, saniyeler)
+    Isı:   /sys/class/thermal (Jetson dahil) ──▶ NVML GPU sıcaklığı
+    CPU:   psutil ──▶ /proc/stat ──▶ os.getloadavg
+
+derin_cli health ve QoS governor bu modülü kullanır; torch import edilmez.
+"""
+
+import os
+import glob
+import time
+import shutil
+import subprocess
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+GB = 1024 ** 3
+THERMAL_GLOB = "/sys/class/thermal/thermal_zone*/temp"
+
+
+@dataclass
+class GPUInfo:
+    name: str
+    memory_used_bytes: int
+    memory_total_bytes: int
+    temperature: Optional[float] = None
+    source: str = "nvml"
+
+    @property
+    def memory_fraction(self) -> float:
+        return self.memory_used_bytes / self.memory_total_bytes if self.memory_total_bytes else 0.0
+
+    def to_dict(self) -> Dict:
+        return {**asdict(self), "memory_fraction": self.memory_fraction}
+
+
+# ─── CPU / bellek / disk ────────────────────────────────────────
+
+def _read_proc_stat():
+    with open("/proc/stat") as f:
+        fields = [int(x) for x in f.readline().split()[1:]]
+    return fields[3] + fields[4], sum(fields)  # (idle + iowait, toplam)
+
+
+def cpu_percent(interval: float = 0.1) -> Optional[float]:
+    try:
+        import psutil
+        return psutil.cpu_percent(interval=interval)
+    except ImportError:
+        pass
+    try:
+        idle0, total0 = _read_proc_stat()
+        time.sleep(interval)
+        idle1, total1 = _read_proc_stat()
+        if total1 == total0:
+            return None
+        return 100.0 * (1 - (idle1 - idle0) / (total1 - total0))
+    except (OSError, ValueError, IndexError):
+        try:
+            return min(100.0, os.getloadavg()[0] / (os.cpu_count() or 1) * 100)
+        except (OSError, AttributeError):
+            return None
+
+
+class CPUSampler:
+    """Bloklamayan CPU ölçümü: iki read() arasındaki kullanım"""
+
+    def __init__(self):
+        self._last = None
+
+    def read(self) -> Optional[float]:
+        try:
+            current = _read_proc_stat()
+        except (OSError, ValueError, IndexError):
+            return cpu_percent(interval=0.0)
+        previous, self._last = self._last, current
+        if previous is None or current[1] == previous[1]:
+            return None
+        return 100.0 * (1 - (current[0] - previous[0]) / (current[1] - previous[1]))
+
+
+def memory() -> Dict[str, float]:
+    """{"total_bytes", "used_bytes", "percent"}"""
+    try:
+        import psutil
+        mem = psutil.virtual_memory()
+        return {"total_bytes": mem.total, "used_bytes": mem.used, "percent": mem.percent}
+    except ImportError:
+        pass
+    info = {}
+    with open("/proc/meminfo") as f:
+        for line in f:
+            key, value = line.split(":", 1)
+            info[key] = int(value.split()[0]) * 1024
+    total = info["MemTotal"]
+    used = total - info.get("MemAvailable", info.get("MemFree", 0))
+    return {"total_bytes": total, "used_bytes": used, "percent": 100.0 * used / total}
+
+
+def disk(path: str = "/") -> Dict[str, float]:
+    usage = shutil.disk_usage(path)
+    return {"total_bytes": usage.total, "used_bytes": usage.used,
+            "percent": 100.0 * usage.used / usage.total if usage.total else 0.0}
+
+
+# ─── Sıcaklık ───────────────────────────────────────────────────
+
+def thermal_zones(pattern: str = THERMAL_GLOB) -> Dict[str, float]:
+    """zone tipi → °C"""
+    zones = {}
+    for path in glob.glob(pattern):
+        try:
+            with open(path) as f:
+                temp = int(f.read().strip()) / 1000.0
+            name = os.path.basename(os.path.dirname(path))
+            type_path = os.path.join(os.path.dirname(path), "type")
+            if os.path.exists(type_path):
+                with open(type_path) as f:
+                    name = f.read().strip() or name
+            zones[name] = max(temp, zones.get(name, temp))
+        except (OSError, ValueError):
+            continue
+    return zones
+
+
+def max_temperature() -> Optional[float]:
+    zones = thermal_zones()
+    if zones:
+        return max(zones.values())
+    gpus = gpu_info()
+    temps = [g.temperature for g in gpus if g.temperature is not None]
+    return max(temps) if temps else None
+
+
+# ─── GPU ────────────────────────────────────────────────────────
+
+_nvml_ready: Optional[bool] = None
+
+
+def _nvml():
+    global _nvml_ready
+    if _nvml_ready is False:
+        return None
+    try:
+        import pynvml
+        if not _nvml_ready:
+            pynvml.nvmlInit()
+            _nvml_ready = True
+        return pynvml
+    except Exception:
+        _nvml_ready = False
+        return None
+
+
+def _gpu_info_nvml() -> Optional[List[GPUInfo]]:
+    pynvml = _nvml()
+    if pynvml is None:
+        return None
+    gpus = []
+    for i in range(pynvml.nvmlDeviceGetCount()):
+        handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+        name = pynvml.nvmlDeviceGetName(handle)
+        mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        try:
+            temp = float(pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU))
+        except Exception:
+            temp = None
+        gpus.append(GPUInfo(name.decode() if isinstance(name, bytes) else name,
+                            mem.used, mem.total, temp, "nvml"))
+    return gpus
+
+
+def _gpu_info_smi() -> Optional[List[GPUInfo]]:
+    if not shutil.which("nvidia-smi"):
+        return None
+    try:
+        out = subprocess.run(
+            ["nvidia-smi", "--query-gpu=name,memory.used,memory.total,temperature.gpu",
+             "--format=csv,noheader,nounits"],
+            capture_output=True, text=True, timeout=2.0, check=True).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    gpus = []
+    for line in out.strip().splitlines():
+        name, used, total, temp = [x.strip() for x in line.split(",")]
+        gpus.append(GPUInfo(name, int(float(used)) * 1024 ** 2, int(float(total)) * 1024 ** 2,
+                            float(temp) if temp.replace(".", "").isdigit() else None, "nvidia-smi"))
+    return gpus
+
+
+def _gpu_info_torch() -> Optional[List[GPUInfo]]:
+    try:
+        import torch
+    except ImportError:
+        return None
+    if not torch.cuda.is_available():
+        return []
+    return [GPUInfo(torch.cuda.get_device_name(i), torch.cuda.memory_allocated(i),
+                    torch.cuda.get_device_properties(i).total_memory, None, "torch")
+            for i in range(torch.cuda.device_count())]
+
+
+def gpu_info(allow_torch: bool = False, allow_smi: bool = True) -> List[GPUInfo]:
+    """Bulunan GPU'lar (hiçbir yol çalışmazsa boş liste)"""
+    probes = [_gpu_info_nvml]
+    if allow_smi:
+        probes.append(_gpu_info_smi)
+    if allow_torch:
+        probes.append(_gpu_info_torch)
+    for probe in probes:
+        gpus = probe()
+        if gpus is not None:
+            return gpus
+    return []
+
+
+def gpu_memory_fraction(allow_smi: bool = True) -> Optional[float]:
+    """Periyodik çağıranlar allow_smi=False ile sadece NVML kullanır (süreç başlatmaz)"""
+    gpus = gpu_info(allow_smi=allow_smi)
+    return max(g.memory_fraction for g in gpus) if gpus else None
@@ -0,0 +1,163 @@
+"""
+DERİN - Latency Tracer
+══════════════════════
+Konuşma hattı gecikme ölçümü (FAZ 8 hedefi: ~200ms ilk ses).
+
+    temporal (transcript) → frontal (generation start/end/abort)
+                          → broca (playback start) → brainstem (stop_audio)
+
+Her aşama utterance_id ile damgalanır. Aşamalar arası süreler
+sabit boyutlu örnek pencerelerinde tutulur ve p50/p95/p99 olarak
+dışa aktarılır. mark() çağrısı bir dict yazımı kadar ucuzdur.
+
+Kullanım:
+    tracer = get_latency_tracer()
+    tracer.attach_event_bus(bus)                    # topic'lerden damga
+    brainstem.register_stop_audio(tracer.wrap(broca.stop_audio, STOP_AUDIO))
+    tracer.get_stats()["intervals"]["transcript_to_first_audio"]["p95_ms"]
+"""
+
+import math
+import time
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Dict, List, Optional
+
+# Aşamalar
+TRANSCRIPT = "transcript"
+GENERATION_START = "generation_start"
+GENERATION_END = "generation_end"
+GENERATION_ABORT = "generation_abort"
+PLAYBACK_START = "playback_start"
+STOP_AUDIO = "stop_audio"
+
+# Event Bus topic → aşama
+TOPIC_STAGES = {
+    "USER_SPEECH_TEXT": TRANSCRIPT,
+    "GENERATION_STARTED": GENERATION_START,
+    "GENERATION_FINISHED": GENERATION_END,
+    "PLAYBACK_STARTED": PLAYBACK_START,
+}
+
+# (metrik, başlangıç aşaması, bitiş aşaması)
+INTERVALS = [
+    ("transcript_to_generation_start", TRANSCRIPT, GENERATION_START),
+    ("transcript_to_first_audio", TRANSCRIPT, PLAYBACK_START),
+    ("generation_start_to_first_audio", GENERATION_START, PLAYBACK_START),
+    ("generation", GENERATION_START, GENERATION_END),
+    ("generation_to_abort", GENERATION_START, GENERATION_ABORT),
+    ("playback_to_stop", PLAYBACK_START, STOP_AUDIO),
+]
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Sıralı listede yakın-sıra (nearest-rank) yüzdelik"""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1, math.ceil(p / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[k]
+
+
+class LatencyTracer:
+    """utterance_id ile ilişkilendirilmiş span damgaları"""
+
+    def __init__(self, window: int = 1000, max_open: int = 256,
+                 clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._open: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+        self._max_open = max_open
+        self._samples: Dict[str, deque] = {name: deque(maxlen=window) for name, _, _ in INTERVALS}
+        self._counts: Dict[str, int] = {}
+        self._current: Optional[str] = None
+        self._seq = 0
+
+    # ─── Damgalama ──────────────────────────────────────────────
+
+    def new_utterance(self) -> str:
+        with self._lock:
+            self._seq += 1
+            return f"u{self._seq}"
+
+    def mark(self, stage: str, utterance_id: Optional[str] = None, t: Optional[float] = None):
+        """
+        Aşama damgası. utterance_id verilmezse transcript için yeni id
+        üretilir, diğer aşamalar son transcript'e bağlanır.
+        """
+        t = self._clock() if t is None else t
+        with self._lock:
+            if utterance_id is None:
+                if stage == TRANSCRIPT or self._current is None:
+                    self._seq += 1
+                    utterance_id = f"u{self._seq}"
+                else:
+                    utterance_id = self._current
+            if stage == TRANSCRIPT:
+                self._current = utterance_id
+
+            spans = self._open.get(utterance_id)
+            if spans is None:
+                spans = self._open[utterance_id] = {}
+                if len(self._open) > self._max_open:
+                    self._open.popitem(last=False)
+            if stage in spans:
+                return utterance_id  # İlk damga geçerli (örn. ilk ses)
+            spans[stage] = t
+            self._counts[stage] = self._counts.get(stage, 0) + 1
+
+            for name, start, end in INTERVALS:
+                if end == stage and start in spans:
+                    self._samples[name].append(t - spans[start])
+                elif start == stage and end in spans:
+                    self._samples[name].append(spans[end] - t)
+        return utterance_id
+
+    def wrap(self, func: Callable, stage: str) -> Callable:
+        """Callback'i sarmala: çağrıldığında aşamayı damgala"""
+        def wrapped(*args, **kwargs):
+            self.mark(stage)
+            return func(*args, **kwargs)
+        wrapped.__name__ = getattr(func, "__name__", "wrapped")
+        return wrapped
+
+    def attach_event_bus(self, event_bus, topic_stages: Optional[Dict[str, str]] = None):
+        """Event Bus topic'lerinden otomatik damga (payload'da utterance_id olabilir)"""
+        from core.control_loop import event_payload
+
+        for topic, stage in (topic_stages or TOPIC_STAGES).items():
+            def handler(event, stage=stage):
+                payload = event_payload(event)
+                uid = payload.get("utterance_id") if isinstance(payload, dict) else None
+                self.mark(stage, uid)
+            event_bus.subscribe(topic, handler)
+
+    # ─── Raporlama ──────────────────────────────────────────────
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Metrik başına count / p50 / p95 / p99 / max (ms)"""
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self._samples.items()}
+            counts = dict(self._counts)
+        stats = {}
+        for name, values in samples.items():
+            stats[name] = {
+                "count": len(values),
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": (values[-1] * 1000) if values else 0.0,
+            }
+        return {"intervals": stats, "stage_counts": counts}
+
+
+# Singleton
+_tracer: Optional[LatencyTracer] = None
+_lock = threading.Lock()
+
+
+def get_latency_tracer() -> LatencyTracer:
+    global _tracer
+    with _lock:
+        if _tracer is None:
+            _tracer = LatencyTracer()
+        return _tracer
@@ -0,0 +1,517 @@
+"""
+DERİN - Metrics Registry
+════════════════════════
+Organ metrikleri için hafif kayıt defteri + Prometheus metin formatı.
+
+    Counter    inc()        → thread başına hücre, kilit yok (okurken toplanır)
+    Gauge      set()/inc()  → tek değer (set atomik; inc/dec kısa kilit)
+    Histogram  observe()    → sabit kovalar, thread başına sayaçlar, kilit yok
+    Collector  fn()         → okuma anında organın get_stats()'ından örnekler
+                              (event bus, katman tokens/sec, QoS kademesi: kayıt maliyeti sıfır)
+
+    registry.exposition()  → text/plain; version=0.0.4
+    MetricsHTTPServer      → http://127.0.0.1:9464/metrics (config.yaml → system.metrics)
+
+Kayıt maliyeti: python benchmarks/metrics_bench.py
+"""
+
+import math
+import time
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Saniye cinsinden gecikme kovaları (0.5ms … 10s)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Collector örneği: (ad, tip, yardım, etiketler, değer)
+Sample = Tuple[str, str, str, Dict[str, str], float]
+
+
+class _Shards:
+    """
+    Thread başına değer hücreleri: yazan thread yalnızca kendi hücresine dokunur
+    (kilit yok); okuyucu tüm hücreleri toplar. Kilit sadece yeni thread ilk yazdığında.
+    """
+
+    def __init__(self, width: int):
+        self._width = width
+        self._local = threading.local()
+        self._cells: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def cell(self) -> List[float]:
+        try:
+            return self._local.cell
+        except AttributeError:
+            cell = [0.0] * self._width
+            with self._lock:
+                self._cells.append(cell)
+            self._local.cell = cell
+            return cell
+
+    def totals(self) -> List[float]:
+        with self._lock:
+            cells = list(self._cells)
+        totals = [0.0] * self._width
+        for cell in cells:
+            for i, value in enumerate(cell):
+                totals[i] += value
+        return totals
+
+
+class _CounterChild:
+    __slots__ = ("_shards",)
+
+    def __init__(self):
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1.0):
+        self._shards.cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._shards.totals()[0]
+
+
+class _GaugeChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_shards", "_sum_index")
+
+    def __init__(self, bounds: Sequence[float]):
+        self._bounds = tuple(bounds)
+        # [kova_0 … kova_n-1, +Inf, toplam]
+        self._sum_index = len(self._bounds) + 1
+        self._shards = _Shards(len(self._bounds) + 2)
+
+    def observe(self, value: float):
+        cell = self._shards.cell()
+        cell[bisect_left(self._bounds, value)] += 1
+        cell[self._sum_index] += value
+
+    def time(self) -> "_Timer":
+        """with histogram.time(): ... → süreyi saniye olarak gözle"""
+        return _Timer(self)
+
+    def snapshot(self) -> Tuple[List[float], float, float]:
+        """(kümülatif kova sayıları, toplam, adet)"""
+        totals = self._shards.totals()
+        cumulative, running = [], 0.0
+        for count in totals[:self._sum_index]:
+            running += count
+            cumulative.append(running)
+        return cumulative, totals[self._sum_index], running
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_started")
+
+    def __init__(self, histogram: _HistogramChild):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._started)
+
+
+class _Metric:
+    """Etiketli metrik ailesi; etiketsizse doğrudan inc/set/observe"""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str = "", labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+        if not self.label_names:
+            self._default = self._child(())
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _child(self, key: Tuple[str, ...]):
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def labels(self, *values, **kwargs):
+        """Etiket değerleri için alt metrik (sıcak yolda bir kez alıp saklayın)"""
+        if kwargs:
+            values = tuple(str(kwargs[name]) for name in self.label_names)
+        if len(values) != len(self.label_names):
+            raise ValueError(f"{self.name}: etiketler {self.label_names}, verilen {values}")
+        return self._child(tuple(str(v) for v in values))
+
+    def children(self) -> List[Tuple[Dict[str, str], Any]]:
+        with self._lock:
+            items = list(self._children.items())
+        return [(dict(zip(self.label_names, key)), child) for key, child in items]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self.children():
+            yield self.name, labels, child.value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float):
+        self._default.set(value)
+
+    def inc(self, amount: float = 1.0):
+        self._default.inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self._default.dec(amount)
+
+    def samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        for labels, child in self.children():
+            yield self.name, labels, child.value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str = "", labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help, labels)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def time(self) -> _Timer:
+        return self._default.time()
+
+    def samples(self) -> Iterable[Tuple[str, Dict[str, str], float]]:
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for labels, child in self.children():
+            cumulative, total, count = child.snapshot()
+            for bound, value in zip(bounds, cumulative):
+                yield f"{self.name}_bucket", {**labels, "le": bound}, value
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+# ─── Kayıt defteri ──────────────────────────────────────────────
+
+class MetricsRegistry:
+    """
+    registry = get_metrics_registry()
+    recalls = registry.counter("derin_memory_recalls_total", "Hatırlama sorguları", labels=("mode",))
+    recalls.labels(mode="single").inc()
+    registry.register_collector("qos", qos_collector(governor))
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[Sample]]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"scrapes": 0, "collector_errors": 0}
+
+    def _get_or_create(self, cls, name: str, help: str, labels: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labels, **kwargs)
+            elif not isinstance(metric, cls) or metric.label_names != tuple(labels):
+                raise ValueError(f"Metrik farklı tip/etiketlerle kayıtlı: {name}")
+            return metric
+
+    def counter(self, name: str, help: str = "", labels: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labels)
+
+    def gauge(self, name: str, help: str = "", labels: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labels)
+
+    def histogram(self, name: str, help: str = "", labels: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labels, buckets=buckets)
+
+    def register_collector(self, name: str, collect: Callable[[], Iterable[Sample]]):
+        """Okuma anında çağrılır; aynı adla tekrar kayıt öncekinin yerine geçer"""
+        with self._lock:
+            self._collectors[name] = collect
+
+    def unregister_collector(self, name: str):
+        with self._lock:
+            self._collectors.pop(name, None)
+
+    def families(self) -> List[Dict[str, Any]]:
+        """JSON'a çevrilebilir görünüm: [{name, type, help, samples: [[ad, etiketler, değer]]}]"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.items())
+        families: Dict[str, Dict[str, Any]] = {}
+        for metric in metrics:
+            families[metric.name] = {"name": metric.name, "type": metric.kind, "help": metric.help,
+                                     "samples": [list(s) for s in metric.samples()]}
+        for collector_name, collect in collectors:
+            try:
+                samples = list(collect())
+            except Exception as e:
+                self.stats["collector_errors"] += 1
+                print(f"[METRICS] {collector_name} toplayıcı hatası: {e}")
+                continue
+            for name, kind, help, labels, value in samples:
+                family = families.setdefault(name, {"name": name, "type": kind, "help": help, "samples": []})
+                family["samples"].append([name, {k: str(v) for k, v in labels.items()}, value])
+        self.stats["scrapes"] += 1
+        return sorted(families.values(), key=lambda f: f["name"])
+
+    def exposition(self) -> str:
+        return format_exposition(self.families())
+
+
+def _format_value(value: float) -> str:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_exposition(families: List[Dict[str, Any]], match: Optional[str] = None) -> str:
+    """Prometheus metin formatı (match: ad alt dizgisi filtresi)"""
+    lines = []
+    for family in families:
+        if match and match not in family["name"]:
+            continue
+        if family.get("help"):
+            lines.append(f"# HELP {family['name']} {_escape(family['help'])}")
+        lines.append(f"# TYPE {family['name']} {family['type']}")
+        for name, labels, value in family["samples"]:
+            if labels:
+                rendered = ",".join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+                lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+            else:
+                lines.append(f"{name} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# ─── HTTP uç noktası ────────────────────────────────────────────
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.server.registry.exposition().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Her scrape'i konsola basma
+
+
+class MetricsHTTPServer:
+    """Yerel /metrics uç noktası (varsayılan sadece 127.0.0.1)"""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9464):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), _MetricsHandler)
+        self._server.daemon_threads = True
+        self._server.registry = self.registry
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# ─── Hazır toplayıcılar (organ get_stats → örnekler) ────────────
+
+def event_bus_collector(event_bus) -> Callable[[], List[Sample]]:
+    def collect():
+        stats = event_bus.get_stats()
+        samples = [("derin_event_bus_published_total", "counter", "Yayınlanan olaylar", {},
+                    stats["published"])]
+        for topic, t in stats["topics"].items():
+            labels = {"topic": topic}
+            samples += [
+                ("derin_event_bus_queue_depth", "gauge", "Abone kuyruklarında bekleyen olaylar", labels,
+                 t["queue_depth"]),
+                ("derin_event_bus_max_queue_depth", "gauge", "En dolu abone kuyruğu", labels,
+                 t["max_queue_depth"]),
+                ("derin_event_bus_delivered_total", "counter", "Teslim edilen olaylar", labels, t["delivered"]),
+                ("derin_event_bus_dropped_total", "counter", "Kuyruk dolu olduğu için düşen olaylar", labels,
+                 t["dropped"]),
+            ]
+        return samples
+    return collect
+
+
+def batch_scheduler_collector(pool) -> Callable[[], List[Sample]]:
+    def collect():
+        samples = []
+        for layer, s in pool.get_stats().items():
+            labels = {"layer": layer}
+            samples += [
+                ("derin_model_tokens_per_second", "gauge", "Katman başına üretim hızı", labels,
+                 s["tokens_per_sec"]),
+                ("derin_model_tokens_total", "counter", "Üretilen token", labels, s["tokens"]),
+                ("derin_model_active_requests", "gauge", "Batch'teki istekler", labels, s["active"]),
+            ]
+            for priority, depth in s["queue_depth"].items():
+                samples.append(("derin_model_queue_depth", "gauge", "Bekleyen üretim istekleri",
+                                {**labels, "priority": priority}, depth))
+        return samples
+    return collect
+
+
+def vision_collector(scheduler, target_fps: float) -> Callable[[], List[Sample]]:
+    def collect():
+        stats = scheduler.get_stats()
+        samples = [
+            ("derin_vision_fps", "gauge", "İşlenen kare hızı (gerçek / hedef)", {"kind": "actual"},
+             stats.get("fps", 0.0)),
+            ("derin_vision_fps", "gauge", "İşlenen kare hızı (gerçek / hedef)", {"kind": "target"}, target_fps),
+            ("derin_vision_budget", "gauge", "Etkin görme hesaplama bütçesi (0-1)", {}, stats["budget"]),
+            ("derin_vision_frames_total", "counter", "İşlenen kareler", {}, stats["frames"]),
+        ]
+        for model, m in stats["models"].items():
+            samples += [
+                ("derin_vision_model_hz", "gauge", "Model çalışma hızı (gerçek / izin verilen)",
+                 {"model": model, "kind": "actual"}, m.get("hz", 0.0)),
+                ("derin_vision_model_hz", "gauge", "Model çalışma hızı (gerçek / izin verilen)",
+                 {"model": model, "kind": "allowed"}, m["allowed_hz"]),
+            ]
+        return samples
+    return collect
+
+
+def qos_collector(governor) -> Callable[[], List[Sample]]:
+    from core.qos_governor import Tier
+
+    def collect():
+        status = governor.get_status()
+        samples = [("derin_qos_tier", "gauge", "Termal/yük kademesi (0=NORMAL)", {},
+                    int(Tier[status["tier"]]))]
+        for field, help in (("temperature", "En sıcak termal bölge (°C)"),
+                            ("cpu_percent", "CPU kullanımı (%)"),
+                            ("gpu_memory_fraction", "GPU bellek doluluğu (0-1)")):
+            if status.get(field) is not None:
+                samples.append((f"derin_qos_{field}", "gauge", help, {}, status[field]))
+        return samples
+    return collect
+
+
+def tiered_memory_collector(memory) -> Callable[[], List[Sample]]:
+    def collect():
+        stats = memory.get_stats()
+        return [("derin_memory_records", "gauge", "Katman başına anı", {"tier": tier}, stats[tier])
+                for tier in ("hot", "warm", "cold")] + [
+            ("derin_memory_vector_ram_bytes", "gauge", "RAM'deki vektörler", {},
+             stats["vector_ram_mb"] * 1024 * 1024)]
+    return collect
+
+
+def prefix_cache_collector(cache) -> Callable[[], List[Sample]]:
+    def collect():
+        stats = cache.get_stats()
+        return [
+            ("derin_prefix_cache_hit_ratio", "gauge", "Persona ön eki önbellek isabet oranı", {},
+             stats["hit_rate"]),
+            ("derin_prefix_cache_hits_total", "counter", "Önbellekten verilen ön ekler", {}, stats["hits"]),
+            ("derin_prefix_cache_misses_total", "counter", "Yeniden kodlanan ön ekler", {}, stats["misses"]),
+            ("derin_prefix_cache_saved_prefill_tokens_total", "counter", "Önbellek sayesinde atlanan prefill token",
+             {}, stats["saved_prefill_tokens"]),
+            ("derin_prefix_cache_invalidations_total", "counter", "Ön ek geçersiz kılmaları", {},
+             stats["invalidations"]),
+        ]
+    return collect
+
+
+def speculative_collector(responder) -> Callable[[], List[Sample]]:
+    def collect():
+        stats = responder.get_stats()
+        samples = [("derin_speculative_responses_total", "counter", "Spekülatif cevap sonuçları",
+                    {"outcome": outcome}, n) for outcome, n in stats["counts"].items()]
+        for layer, s in stats["layers"].items():
+            for kind in ("perceived", "final"):
+                for q in ("p50", "p95"):
+                    samples.append(("derin_speculative_latency_seconds", "gauge",
+                                    "Algılanan (ilk söz) / nihai cevap gecikmesi",
+                                    {"layer": layer, "kind": kind, "quantile": q},
+                                    s[f"{kind}_{q}_ms"] / 1000))
+        return samples
+    return collect
+
+
+# Singleton
+_registry: Optional[MetricsRegistry] = None
+_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    global _registry
+    with _lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+        return _registry
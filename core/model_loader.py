@@ -0,0 +1,185 @@
+"""
+DERİN - Model Load Pipeline
+═══════════════════════════
+Arka planda aşamalı model yükleme.
+
+Boot sırasında başlar; reflex katmanı yüklenir yüklenmez sistem cevap
+verebilir. Üst katmanlar (social → social_plus → cortical) geldikçe
+on_layer_ready callback'leri ile yönlendirme canlı olarak yükseltilir.
+
+Sabit bekleme yerine MemoryPressureGate kullanılır: bir sonraki model
+ancak bellekte yeri varsa yüklenir, yer varsa hiç beklenmez.
+"""
+
+import time
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+GB = 1024 ** 3
+
+# (katman, model adı, açıklama) - öncelik sırasına göre
+DEFAULT_LOAD_ORDER: List[Tuple[str, str, str]] = [
+    ("reflex", "Qwen-3B", "Hızlı tepkiler için"),
+    ("social", "Qwen-8B", "Sohbet için"),
+    ("social_plus", "Qwen-14B", "Detaylı sohbet için"),
+    ("cortical", "Qwen-70B", "Derin düşünme için"),
+    # Coder modelleri lazy-load - sadece kod sorgusu gelince
+]
+
+
+def _system_available_bytes() -> Optional[int]:
+    """Kullanılabilir (unified) bellek; psutil yoksa None"""
+    try:
+        import psutil
+        return psutil.virtual_memory().available
+    except ImportError:
+        return None
+
+
+class MemoryPressureGate:
+    """
+    Bellek baskısına göre yükleme izni.
+
+    available - reserve >= required olduğunda hemen izin verir.
+    Aksi halde bellek boşalana kadar (veya timeout) kısa aralıklarla bekler.
+    """
+
+    def __init__(self, reserve_bytes: int = 2 * GB, poll_interval: float = 0.25,
+                 timeout: float = 120.0,
+                 available_fn: Callable[[], Optional[int]] = _system_available_bytes):
+        self.reserve_bytes = reserve_bytes
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self._available_fn = available_fn
+
+    def fits(self, required_bytes: int) -> bool:
+        available = self._available_fn()
+        if available is None:
+            return True  # Ölçemiyorsak engelleme
+        return available - self.reserve_bytes >= required_bytes
+
+    def admit(self, required_bytes: int, cancel: Optional[threading.Event] = None) -> bool:
+        """İzin verilirse True, timeout/iptal olursa False"""
+        deadline = time.monotonic() + self.timeout
+        while not self.fits(required_bytes):
+            if time.monotonic() >= deadline:
+                return False
+            if cancel is not None:
+                if cancel.wait(self.poll_interval):
+                    return False
+            else:
+                time.sleep(self.poll_interval)
+        return True
+
+
+class ModelLoadPipeline(threading.Thread):
+    """Arka plan model yükleme thread'i"""
+
+    def __init__(self, manager, load_order: Sequence[Tuple[str, str, str]] = DEFAULT_LOAD_ORDER,
+                 layer_sizes: Optional[Dict[str, int]] = None,
+                 gate: Optional[MemoryPressureGate] = None,
+                 log: Callable[[str], None] = print):
+        super().__init__(name="model-loader", daemon=True)
+        self._manager = manager
+        self._load_order = list(load_order)
+        self._layer_sizes = layer_sizes or {}
+        self._gate = gate or MemoryPressureGate()
+        self._log = log
+
+        self._stop_event = threading.Event()
+        self._cond = threading.Condition()
+        self._ready: Dict[str, float] = {}   # katman -> yüklenme süresi (s)
+        self._failed: Dict[str, str] = {}
+        self._callbacks: List[Callable[[str], None]] = []
+        self._started_at = 0.0
+
+    # ─── Callback / durum ───────────────────────────────────────
+
+    def on_layer_ready(self, callback: Callable[[str], None]):
+        """Katman yüklendiğinde çağrılacak callback (loader thread'inde)"""
+        self._callbacks.append(callback)
+
+    def is_ready(self, layer: str) -> bool:
+        with self._cond:
+            return layer in self._ready
+
+    @property
+    def ready_layers(self) -> List[str]:
+        with self._cond:
+            return list(self._ready)
+
+    @property
+    def done(self) -> bool:
+        with self._cond:
+            return len(self._ready) + len(self._failed) >= len(self._load_order)
+
+    def wait_for_layer(self, layer: str, timeout: Optional[float] = None) -> bool:
+        """Katman yüklenene (veya yüklenemeyene) kadar bekle"""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: layer in self._ready or layer in self._failed or self.stopped,
+                timeout=timeout,
+            )
+            return layer in self._ready
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+
+    def stop(self):
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def get_status(self) -> Dict:
+        with self._cond:
+            return {
+                "ready": dict(self._ready),
+                "failed": dict(self._failed),
+                "pending": [l for l, _, _ in self._load_order
+                            if l not in self._ready and l not in self._failed],
+            }
+
+    # ─── Yükleme ────────────────────────────────────────────────
+
+    def run(self):
+        self._started_at = time.monotonic()
+        total = len(self._load_order)
+
+        for i, (layer, model_name, description) in enumerate(self._load_order, 1):
+            if self.stopped:
+                break
+
+            size = self._layer_sizes.get(layer, 0)
+            if not self._gate.admit(size, cancel=self._stop_event):
+                if not self.stopped:
+                    self._finish(layer, error=f"bellek yetersiz ({size / GB:.0f}GB gerekli)")
+                    self._log(f"[MODEL] [{i}/{total}] {model_name} atlandı: bellek yetersiz")
+                continue
+
+            self._log(f"[MODEL] [{i}/{total}] {model_name} yükleniyor... ({description})")
+            t0 = time.monotonic()
+            try:
+                self._manager.load_model(layer)
+            except Exception as e:
+                self._finish(layer, error=str(e))
+                self._log(f"[MODEL]     └── {model_name} yüklenemedi: {e}")
+                continue
+
+            elapsed = time.monotonic() - t0
+            self._finish(layer)
+            self._log(f"[MODEL]     └── {model_name} yüklendi ({elapsed:.1f}s)")
+
+            for callback in self._callbacks:
+                try:
+                    callback(layer)
+                except Exception as e:
+                    self._log(f"[MODEL] on_layer_ready hatası ({layer}): {e}")
+
+    def _finish(self, layer: str, error: Optional[str] = None):
+        with self._cond:
+            if error is None:
+                self._ready[layer] = time.monotonic() - self._started_at
+            else:
+                self._failed[layer] = error
+            self._cond.notify_all()
@@ -0,0 +1,53 @@
+"""
+DERİN - Platform Config
+═══════════════════════
+config.yaml okuyucu. Dosya bir kez okunur ve önbelleğe alınır.
+
+Kullanım:
+    from core.platform_config import load_config, get_platform_profile
+    budget = get_platform_profile("thor").get("vram_budget", {})
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.yaml"
+
+_config: Optional[Dict[str, Any]] = None
+_lock = threading.Lock()
+
+
+def load_config(path: Optional[Path] = None, reload: bool = False) -> Dict[str, Any]:
+    """config.yaml'ı oku (yaml yoksa veya dosya bulunamazsa boş dict)"""
+    global _config
+    if path is not None:
+        return _read(Path(path))
+    with _lock:
+        if _config is None or reload:
+            _config = _read(CONFIG_PATH)
+        return _config
+
+
+def _read(path: Path) -> Dict[str, Any]:
+    try:
+        import yaml
+        with open(path, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except (ImportError, OSError):
+        return {}
+
+
+def get_section(*keys: str, default: Any = None) -> Any:
+    """İç içe anahtar ile bölüm al: get_section("memory", "long_term")"""
+    node: Any = load_config()
+    for key in keys:
+        if not isinstance(node, dict) or key not in node:
+            return default
+        node = node[key]
+    return node
+
+
+def get_platform_profile(platform: str = "thor") -> Dict[str, Any]:
+    """platform_profiles.<platform> bölümü"""
+    return get_section("platform_profiles", platform, default={}) or {}
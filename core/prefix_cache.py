@@ -0,0 +1,176 @@
+"""
+DERİN - Persona Prefix Cache
+════════════════════════════
+Kimlik / kişilik / değerler ön ekinin (system prompt) katman başına
+bir kez kodlanıp tekrar kullanılması.
+
+    get_dna() + get_personality() + get_values() ──▶ prefix metni ──▶ sha256
+                                                                       │
+    layer ──▶ (fingerprint aynı mı?) ── evet ──▶ kodlanmış prefix (KV) ┘
+                                     └─ hayır ─▶ encode(layer, metin)
+
+Prefix sadece kaynak modüller değişince (parmak izi farklılaşınca veya
+PERSONA_CHANGED olayı gelince) yeniden kodlanır. Her isabet, prefix'in
+token sayısı kadar prefill tasarrufu demektir.
+
+Kullanım:
+    cache = PrefixCache(build_persona_prefix, encode=manager.encode_prefix)
+    entry = cache.get("social")      # entry.encoded → generate(past_key_values=...)
+"""
+
+import json
+import time
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+# Bu topic'lerden biri gelince cache temizlenir
+INVALIDATION_TOPICS = ("PERSONA_CHANGED", "PERSONALITY_UPDATED", "VALUES_UPDATED", "IDENTITY_UPDATED")
+
+
+def describe(obj) -> str:
+    """Modülün prompt'a girecek metni (to_prompt / describe / to_dict / str)"""
+    if obj is None:
+        return ""
+    for attr in ("to_prompt", "get_prompt", "describe", "describe_self"):
+        method = getattr(obj, attr, None)
+        if callable(method):
+            return str(method())
+    to_dict = getattr(obj, "to_dict", None)
+    if callable(to_dict):
+        return json.dumps(to_dict(), ensure_ascii=False, sort_keys=True, default=str)
+    return str(obj)
+
+
+def build_persona_prefix() -> str:
+    """DNA + kişilik + değerler → ortak system prompt ön eki"""
+    sections = []
+    try:
+        from core.system.dna import get_dna
+        sections.append(("Kimlik", describe(get_dna())))
+    except Exception:
+        pass
+    try:
+        from core.emergent_personality import get_personality
+        sections.append(("Kişilik", describe(get_personality())))
+    except Exception:
+        pass
+    try:
+        from core.learned_values import get_values
+        sections.append(("Değerler", describe(get_values())))
+    except Exception:
+        pass
+    return "\n\n".join(f"## {title}\n{body}" for title, body in sections if body)
+
+
+def fingerprint(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class PrefixEntry:
+    fingerprint: str
+    text: str
+    encoded: object
+    tokens: int
+
+
+class PrefixCache:
+    """Katman başına kodlanmış persona ön eki"""
+
+    def __init__(self, build_prefix: Callable[[], str] = build_persona_prefix,
+                 encode: Callable[[str, str], object] = lambda layer, text: text,
+                 count_tokens: Callable[[str], int] = lambda text: len(text.split()),
+                 recheck_interval: float = 30.0):
+        """
+        build_prefix() -> metin
+        encode(layer, metin) -> katmana özgü kodlanmış prefix (örn. KV cache)
+        count_tokens(metin) -> token sayısı (istatistik)
+        recheck_interval: olay gelmese de bu aralıkla parmak izi yeniden hesaplanır
+        """
+        self._build_prefix = build_prefix
+        self._encode = encode
+        self._count_tokens = count_tokens
+        self._entries: Dict[str, PrefixEntry] = {}
+        self._lock = threading.Lock()
+        self._layer_locks: Dict[str, threading.Lock] = {}
+        self._current: Optional[tuple] = None  # (fingerprint, text) - invalidate ile sıfırlanır
+        self._recheck_interval = recheck_interval
+        self._built_at = 0.0
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0, "saved_prefill_tokens": 0,
+                      "encoded_tokens": 0}
+
+    def current_prefix(self) -> tuple:
+        """(fingerprint, text) - invalidate veya recheck_interval'e kadar tekrar kullanılır"""
+        with self._lock:
+            fresh = time.monotonic() - self._built_at < self._recheck_interval
+            if self._current is not None and fresh:
+                return self._current
+        self.refresh()
+        with self._lock:
+            return self._current
+
+    def get(self, layer: str) -> PrefixEntry:
+        fp, text = self.current_prefix()
+        with self._lock:
+            entry = self._entries.get(layer)
+            if entry is not None and entry.fingerprint == fp:
+                self.stats["hits"] += 1
+                self.stats["saved_prefill_tokens"] += entry.tokens
+                return entry
+            layer_lock = self._layer_locks.setdefault(layer, threading.Lock())
+
+        # Aynı katman için tek kodlama (diğer katmanlar beklemez)
+        with layer_lock:
+            with self._lock:
+                entry = self._entries.get(layer)
+                if entry is not None and entry.fingerprint == fp:
+                    self.stats["hits"] += 1
+                    self.stats["saved_prefill_tokens"] += entry.tokens
+                    return entry
+            encoded = self._encode(layer, text)
+            tokens = self._count_tokens(text)
+            entry = PrefixEntry(fp, text, encoded, tokens)
+            with self._lock:
+                self._entries[layer] = entry
+                self.stats["misses"] += 1
+                self.stats["encoded_tokens"] += tokens
+            return entry
+
+    def invalidate(self, layer: Optional[str] = None):
+        """Kaynak modül değişti - prefix yeniden hesaplanacak"""
+        with self._lock:
+            self.stats["invalidations"] += 1
+            self._current = None
+            if layer is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(layer, None)
+
+    def refresh(self) -> bool:
+        """Prefix'i yeniden hesapla; değiştiyse eski kodlamalar atılır. Değişti mi?"""
+        text = self._build_prefix()
+        fp = fingerprint(text)
+        with self._lock:
+            changed = self._current is None or self._current[0] != fp
+            self._current = (fp, text)
+            self._built_at = time.monotonic()
+            if changed and self._entries:
+                self.stats["invalidations"] += 1
+                self._entries = {k: v for k, v in self._entries.items() if v.fingerprint == fp}
+        return changed
+
+    def attach_event_bus(self, event_bus, topics=INVALIDATION_TOPICS):
+        for topic in topics:
+            event_bus.subscribe(topic, lambda event: self.invalidate())
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            total = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "hit_rate": self.stats["hits"] / total if total else 0.0,
+                "layers": {k: {"fingerprint": v.fingerprint, "tokens": v.tokens}
+                           for k, v in self._entries.items()},
+            }
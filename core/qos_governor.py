@@ -0,0 +1,320 @@
+"""
+DERİN - QoS Governor
+════════════════════
+Sıcaklık ve yüke göre tüm organlarda koordineli kademeli küçülme.
+
+    sensör (°C, CPU %, GPU bellek) ──▶ kademe ──▶ eylemler
+                                        │
+        NORMAL     tam hız
+        ELEVATED   vision %60, en büyük katman social_plus, batch ×0.75, gece işleri ertelenir
+        CRITICAL   vision %30, en büyük katman social, batch ×0.5, arka plan düşünceleri durur
+        EMERGENCY  vision %10, sadece reflex, batch ×0.25
+
+    • Yükselme anında; düşme histerezis payı + min_dwell sonrasında
+    • Her geçiş loglanır ve QOS_TIER_CHANGED olayı yayınlanır
+    • SimulatedSensor ile donanımsız test edilebilir
+
+Eşikler config.yaml → platform_profiles.<platform>.thermal ve
+scheduling.resources (max_cpu_percent, gpu_memory_fraction).
+"""
+
+import time
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+QOS_TIER_CHANGED = "QOS_TIER_CHANGED"
+
+
+class Tier(IntEnum):
+    NORMAL = 0
+    ELEVATED = 1
+    CRITICAL = 2
+    EMERGENCY = 3
+
+
+# Kademe → eylem tabloları
+VISION_BUDGET = {Tier.NORMAL: 1.0, Tier.ELEVATED: 0.6, Tier.CRITICAL: 0.3, Tier.EMERGENCY: 0.1}
+BATCH_SCALE = {Tier.NORMAL: 1.0, Tier.ELEVATED: 0.75, Tier.CRITICAL: 0.5, Tier.EMERGENCY: 0.25}
+MAX_LAYER = {Tier.NORMAL: None, Tier.ELEVATED: "social_plus", Tier.CRITICAL: "social",
+             Tier.EMERGENCY: "reflex"}
+# Bellek/hesap maliyetine göre küçükten büyüğe
+LAYER_ORDER = ("reflex", "social", "social_plus", "coder", "cortical")
+
+
+@dataclass
+class SensorReading:
+    temperature: Optional[float] = None       # °C
+    cpu_percent: Optional[float] = None       # 0-100
+    gpu_memory_fraction: Optional[float] = None  # 0-1
+
+
+@dataclass
+class QoSPolicy:
+    warning_temp: float = 75.0
+    critical_temp: float = 85.0
+    emergency_temp: float = 95.0
+    max_cpu_percent: float = 80.0
+    gpu_memory_fraction: float = 0.8
+    temp_hysteresis: float = 3.0      # °C
+    load_hysteresis: float = 10.0     # CPU yüzde puanı (GPU için /100)
+    min_dwell: float = 10.0           # Düşmeden önce kademede kalma süresi (s)
+
+    @classmethod
+    def from_config(cls, platform: str = "thor", **overrides) -> "QoSPolicy":
+        from core.platform_config import get_platform_profile, get_section
+        thermal = get_platform_profile(platform).get("thermal", {})
+        resources = get_section("scheduling", "resources", default={}) or {}
+        values = {
+            "warning_temp": thermal.get("warning_temp", cls.warning_temp),
+            "critical_temp": thermal.get("critical_temp", cls.critical_temp),
+            "emergency_temp": thermal.get("emergency_temp", cls.emergency_temp),
+            "max_cpu_percent": resources.get("max_cpu_percent", cls.max_cpu_percent),
+            "gpu_memory_fraction": resources.get("gpu_memory_fraction", cls.gpu_memory_fraction),
+        }
+        values.update(overrides)
+        return cls(**values)
+
+    def _temp_tier(self, temperature: float, margin: float) -> Tier:
+        if temperature >= self.emergency_temp - margin:
+            return Tier.EMERGENCY
+        if temperature >= self.critical_temp - margin:
+            return Tier.CRITICAL
+        if temperature >= self.warning_temp - margin:
+            return Tier.ELEVATED
+        return Tier.NORMAL
+
+    def _load_tier(self, reading: SensorReading, margin: float) -> Tier:
+        tier = Tier.NORMAL
+        if reading.cpu_percent is not None:
+            if reading.cpu_percent >= min(99.0, self.max_cpu_percent + 15) - margin:
+                tier = Tier.CRITICAL
+            elif reading.cpu_percent >= self.max_cpu_percent - margin:
+                tier = Tier.ELEVATED
+        if reading.gpu_memory_fraction is not None:
+            if reading.gpu_memory_fraction >= self.gpu_memory_fraction - margin / 100:
+                tier = max(tier, Tier.ELEVATED)
+        return tier
+
+    def classify(self, reading: SensorReading, current: Tier = Tier.NORMAL) -> Tier:
+        """
+        Okumanın kademesi. Histerezis: mevcut kademede kalmak için eşiğin
+        histerezis payı kadar altına inmek gerekir.
+        """
+        def tier_for(temp_margin: float, load_margin: float) -> Tier:
+            tier = Tier.NORMAL
+            if reading.temperature is not None:
+                tier = self._temp_tier(reading.temperature, temp_margin)
+            return max(tier, self._load_tier(reading, load_margin))
+
+        raw = tier_for(0.0, 0.0)
+        if raw >= current:
+            return raw
+        # Düşüş: payla tekrar değerlendir, mevcut kademeyi aşmadan
+        return min(current, tier_for(self.temp_hysteresis, self.load_hysteresis))
+
+
+# ─── Sensörler ──────────────────────────────────────────────────
+
+class SystemSensor:
+    """Linux thermal zone + CPU yükü + (varsa) NVML GPU belleği (core.hardware_info)"""
+
+    def __init__(self):
+        from core.hardware_info import CPUSampler
+        self._cpu = CPUSampler()
+
+    def read(self) -> SensorReading:
+        from core import hardware_info
+        zones = hardware_info.thermal_zones()
+        return SensorReading(max(zones.values()) if zones else None,
+                             self._cpu.read(),
+                             hardware_info.gpu_memory_fraction(allow_smi=False))
+
+
+class SimulatedSensor:
+    """Test için önceden tanımlı okuma dizisi (bitince son okuma tekrarlanır)"""
+
+    def __init__(self, readings: Iterable[SensorReading]):
+        self._readings = iter(readings)
+        self._last = SensorReading()
+
+    def read(self) -> SensorReading:
+        self._last = next(self._readings, self._last)
+        return self._last
+
+
+# ─── Governor ───────────────────────────────────────────────────
+
+class QoSGovernor:
+    """Sensörü periyodik okuyup kademe geçişlerinde eylemleri uygular"""
+
+    def __init__(self, sensor, policy: Optional[QoSPolicy] = None, interval: float = 2.0,
+                 event_bus=None, clock: Callable[[], float] = time.monotonic):
+        self._sensor = sensor
+        self.policy = policy or QoSPolicy()
+        self.interval = interval
+        self._event_bus = event_bus
+        self._clock = clock
+        self._actions: Dict[str, Callable[[Tier], None]] = {}
+        self._lock = threading.Lock()
+        self._tier = Tier.NORMAL
+        self._tier_since = clock()
+        self._last_reading = SensorReading()
+        self.transitions: deque = deque(maxlen=100)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def tier(self) -> Tier:
+        return self._tier
+
+    def add_action(self, name: str, apply: Callable[[Tier], None]):
+        """apply(tier) her geçişte çağrılır (kayıtta mevcut kademe hemen uygulanır)"""
+        with self._lock:
+            self._actions[name] = apply
+            tier = self._tier
+        self._apply(name, apply, tier)
+
+    def _apply(self, name: str, apply: Callable[[Tier], None], tier: Tier):
+        try:
+            apply(tier)
+        except Exception as e:
+            print(f"[QOS] {name} eylemi hatası: {e}")
+
+    def evaluate(self, reading: Optional[SensorReading] = None) -> Tier:
+        """Bir okuma işle (verilmezse sensörden oku); geçiş varsa eylemleri uygula"""
+        reading = reading or self._sensor.read()
+        now = self._clock()
+        with self._lock:
+            self._last_reading = reading
+            current = self._tier
+            target = self.policy.classify(reading, current)
+            if target < current and now - self._tier_since < self.policy.min_dwell:
+                return current  # Dalgalanmayı önle
+            if target == current:
+                return current
+            self._tier = target
+            self._tier_since = now
+            actions = list(self._actions.items())
+            self.transitions.append({"at": time.time(), "from": current.name, "to": target.name,
+                                     "temperature": reading.temperature,
+                                     "cpu_percent": reading.cpu_percent,
+                                     "gpu_memory_fraction": reading.gpu_memory_fraction})
+
+        print(f"[QOS] {current.name} → {target.name} ({self._describe(reading)})")
+        for name, apply in actions:
+            self._apply(name, apply, target)
+        if self._event_bus:
+            self._event_bus.publish(QOS_TIER_CHANGED, {"tier": target.name, "previous": current.name},
+                                    source="qos_governor")
+        return target
+
+    @staticmethod
+    def _describe(reading: SensorReading) -> str:
+        parts = []
+        if reading.temperature is not None:
+            parts.append(f"{reading.temperature:.1f}°C")
+        if reading.cpu_percent is not None:
+            parts.append(f"CPU %{reading.cpu_percent:.0f}")
+        if reading.gpu_memory_fraction is not None:
+            parts.append(f"GPU bellek %{reading.gpu_memory_fraction * 100:.0f}")
+        return ", ".join(parts) or "sensör yok"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name="qos-governor", daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.evaluate()
+            except Exception as e:
+                print(f"[QOS] Sensör hatası: {e}")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+
+    # ─── Anlık görüntü (--warm-start) ──────────────────────────
+
+    def get_state(self) -> Dict:
+        with self._lock:
+            return {"tier": self._tier.name, "transitions": list(self.transitions)}
+
+    def set_state(self, state: Dict):
+        """Önceki kademeyle başla (ısınmış cihazda NORMAL'den tekrar tırmanmamak için)"""
+        tier = Tier[state["tier"]]
+        with self._lock:
+            self._tier = tier
+            self._tier_since = self._clock()
+            self.transitions.extend(state.get("transitions", []))
+            actions = list(self._actions.items())
+        for name, apply in actions:
+            self._apply(name, apply, tier)
+
+    def get_status(self) -> Dict:
+        with self._lock:
+            reading = self._last_reading
+            return {
+                "tier": self._tier.name,
+                "since": time.time() - (self._clock() - self._tier_since),
+                "temperature": reading.temperature,
+                "cpu_percent": reading.cpu_percent,
+                "gpu_memory_fraction": reading.gpu_memory_fraction,
+                "actions": list(self._actions),
+                "transitions": list(self.transitions)[-10:],
+            }
+
+
+# ─── Hazır eylemler ─────────────────────────────────────────────
+
+def vision_action(vision_scheduler) -> Callable[[Tier], None]:
+    return lambda tier: vision_scheduler.set_budget_cap(VISION_BUDGET[tier])
+
+
+def batch_action(batch_pool) -> Callable[[Tier], None]:
+    return lambda tier: batch_pool.scale_batch(BATCH_SCALE[tier])
+
+
+def night_action(residency) -> Callable[[Tier], None]:
+    return lambda tier: residency.defer_night_mode(tier >= Tier.ELEVATED)
+
+
+def allowed_layers(layers: Sequence[str], tier: Tier) -> List[str]:
+    """Kademenin izin verdiği katmanlar (sıra korunur)"""
+    ceiling = MAX_LAYER[tier]
+    if ceiling is None:
+        return list(layers)
+    limit = LAYER_ORDER.index(ceiling)
+    return [l for l in layers if l in LAYER_ORDER and LAYER_ORDER.index(l) <= limit]
+
+
+def pause_action(organs: Sequence, pause_at: Tier = Tier.CRITICAL) -> Callable[[Tier], None]:
+    """pause_background()/resume_background() veya pause()/resume() sunan organlar"""
+    def apply(tier: Tier):
+        paused = tier >= pause_at
+        for organ in organs:
+            if organ is None:
+                continue
+            for pause_name, resume_name in (("pause_background", "resume_background"), ("pause", "resume")):
+                method = getattr(organ, pause_name if paused else resume_name, None)
+                if callable(method):
+                    method()
+                    break
+    return apply
+
+
+# Singleton
+_governor: Optional[QoSGovernor] = None
+_lock = threading.Lock()
+
+
+def get_qos_governor(platform: str = "thor", event_bus=None) -> QoSGovernor:
+    global _governor
+    with _lock:
+        if _governor is None:
+            _governor = QoSGovernor(SystemSensor(), QoSPolicy.from_config(platform), event_bus=event_bus)
+        return _governor
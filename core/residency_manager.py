@@ -0,0 +1,347 @@
+"""
+DERİN - Residency Manager
+═════════════════════════
+VRAM / unified-memory bütçe zamanlayıcısı.
+
+config.yaml → platform_profiles.<platform>.vram_budget bütçelerini uygular:
+    • Her katman (reflex, social, ..., coder) ve vision kendi bütçesini aşamaz
+    • Toplam (total_gb) dolunca düşük öncelikli + en uzun süredir kullanılmayan
+      (LRU) sabitlenmemiş katman boşaltılır
+    • Gece optimizasyonu için coder, social_plus boşaltılarak içeri alınır
+      (main.py: hypothalamus uykuya geçince; QoS sıcakken ertelenir)
+    • vision, occipital boot olurken sabitlenerek (pin) bütçeye alınır
+
+Modellerin kendisiyle ilgilenmez; boyutu bilen her nesne (size_bytes / nbytes)
+yeterlidir. Bu sayede CPU'da sahte modellerle test edilebilir.
+
+Kullanım:
+    manager = get_budgeted_model_manager(platform="thor")
+    manager.load_model("reflex")          # bütçe kontrolü + gerekirse eviction
+    get_residency_manager().admit("vision", kind="vision", pin=True)
+"""
+
+import time
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+GB = 1024 ** 3
+
+# Yüksek = daha geç boşaltılır
+DEFAULT_PRIORITIES = {
+    "reflex": 100,
+    "vision": 90,
+    "social": 80,
+    "cortical": 70,
+    "social_plus": 60,
+    "coder": 40,
+}
+
+
+class ResidencyError(MemoryError):
+    """Bütçe yetersiz veya katman kendi bütçesini aşıyor"""
+
+
+@dataclass
+class ResidentItem:
+    """Bellekte (veya yüklenmekte) olan iş yükü"""
+    name: str
+    kind: str            # "model" | "vision"
+    size_bytes: int
+    priority: int
+    pinned: bool = False
+    loading: bool = False
+    last_used: float = 0.0
+    handle: object = None
+
+
+def measure_size(obj) -> Optional[int]:
+    """Nesnenin bildirdiği boyut (size_bytes() / size_bytes / nbytes)"""
+    for attr in ("size_bytes", "nbytes"):
+        value = getattr(obj, attr, None)
+        if callable(value):
+            value = value()
+        if isinstance(value, (int, float)) and value > 0:
+            return int(value)
+    return None
+
+
+class ResidencyManager:
+    """Bütçeye göre admit / pin / evict"""
+
+    def __init__(self, budgets: Dict[str, int], capacity_bytes: int,
+                 priorities: Optional[Dict[str, int]] = None,
+                 unload_fn: Optional[Callable[[str], None]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.budgets = dict(budgets)
+        self.capacity_bytes = capacity_bytes
+        self.priorities = dict(DEFAULT_PRIORITIES, **(priorities or {}))
+        self._unload_fn = unload_fn
+        self._clock = clock
+        self._items: Dict[str, ResidentItem] = {}
+        self._lock = threading.RLock()
+        self._night_swapped: List[str] = []
+        self._night_deferred = False
+        self.stats = {"admitted": 0, "evicted": 0, "rejected": 0}
+
+    @classmethod
+    def from_profile(cls, profile: Dict, **kwargs) -> "ResidencyManager":
+        """platform_profiles.<platform> bölümünden oluştur"""
+        budget = profile.get("vram_budget", {})
+        budgets = {
+            key[:-3]: int(value * GB)
+            for key, value in budget.items()
+            if key.endswith("_gb") and key not in ("total_gb", "buffer_gb")
+        }
+        total = budget.get("total_gb") or sum(budgets.values()) / GB
+        return cls(budgets, int(total * GB), **kwargs)
+
+    # ─── Sorgular ───────────────────────────────────────────────
+
+    @property
+    def used_bytes(self) -> int:
+        with self._lock:
+            return sum(i.size_bytes for i in self._items.values())
+
+    @property
+    def free_bytes(self) -> int:
+        return self.capacity_bytes - self.used_bytes
+
+    def is_resident(self, name: str) -> bool:
+        with self._lock:
+            item = self._items.get(name)
+            return item is not None and not item.loading
+
+    def resident(self) -> List[str]:
+        with self._lock:
+            return [n for n, i in self._items.items() if not i.loading]
+
+    def get_status(self) -> Dict:
+        with self._lock:
+            return {
+                "capacity_gb": self.capacity_bytes / GB,
+                "used_gb": self.used_bytes / GB,
+                "items": {
+                    n: {"kind": i.kind, "size_gb": i.size_bytes / GB, "priority": i.priority,
+                        "pinned": i.pinned, "loading": i.loading}
+                    for n, i in self._items.items()
+                },
+                "night_mode": bool(self._night_swapped),
+                "night_deferred": self._night_deferred,
+                **self.stats,
+            }
+
+    # ─── Admission / eviction ───────────────────────────────────
+
+    def admit(self, name: str, size_bytes: Optional[int] = None, kind: str = "model",
+              priority: Optional[int] = None, pin: bool = False,
+              loader: Optional[Callable[[], object]] = None) -> object:
+        """
+        İş yükünü bütçeye al.
+
+        Yer açmak için gerekirse daha düşük/eşit öncelikli, sabitlenmemiş
+        öğeler LRU sırasıyla boşaltılır. loader verilirse kilit dışında
+        çağrılır; döndürdüğü nesne boyut bildiriyorsa gerçek boyut kaydedilir.
+        Sığmazsa ResidencyError.
+        """
+        budget = self.budgets.get(name)
+        if size_bytes is None:
+            size_bytes = budget or 0
+        if priority is None:
+            priority = self.priorities.get(name, 50)
+
+        with self._lock:
+            existing = self._items.get(name)
+            if existing is not None:
+                existing.last_used = self._clock()
+                existing.pinned = existing.pinned or pin
+                return existing.handle
+
+            self._check_budget(name, size_bytes, budget)
+            self._make_room(size_bytes, priority)
+            item = ResidentItem(name, kind, size_bytes, priority, pinned=pin,
+                                loading=loader is not None, last_used=self._clock())
+            self._items[name] = item
+
+        if loader is not None:
+            try:
+                handle = loader()
+            except BaseException:
+                with self._lock:
+                    self._items.pop(name, None)
+                raise
+            with self._lock:
+                item.handle = handle
+                item.loading = False
+                actual = measure_size(handle)
+                if actual is not None and actual != item.size_bytes:
+                    try:
+                        self._check_budget(name, actual, budget)
+                        self._make_room(actual - item.size_bytes, priority, exclude=name)
+                    except ResidencyError:
+                        self._items.pop(name, None)
+                        self._unload(name)
+                        raise
+                    item.size_bytes = actual
+
+        with self._lock:
+            self.stats["admitted"] += 1
+        return item.handle
+
+    def _check_budget(self, name: str, size_bytes: int, budget: Optional[int]):
+        if budget is not None and size_bytes > budget:
+            self.stats["rejected"] += 1
+            raise ResidencyError(
+                f"{name}: {size_bytes / GB:.1f}GB, bütçe {budget / GB:.1f}GB")
+
+    def _make_room(self, needed: int, priority: int, exclude: Optional[str] = None):
+        """Kilit altında çağrılır"""
+        free = self.capacity_bytes - sum(i.size_bytes for i in self._items.values())
+        if needed <= free:
+            return
+
+        victims = sorted(
+            (i for i in self._items.values()
+             if not i.pinned and not i.loading and i.priority <= priority and i.name != exclude),
+            key=lambda i: (i.priority, i.last_used),
+        )
+        chosen = []
+        for victim in victims:
+            if free >= needed:
+                break
+            chosen.append(victim)
+            free += victim.size_bytes
+
+        if free < needed:
+            self.stats["rejected"] += 1
+            raise ResidencyError(
+                f"{needed / GB:.1f}GB gerekli, boşaltılabilir alan {free / GB:.1f}GB")
+
+        for victim in chosen:
+            self.evict(victim.name)
+
+    def evict(self, name: str) -> bool:
+        """Öğeyi bellekten çıkar (sabitli olsa bile)"""
+        with self._lock:
+            item = self._items.pop(name, None)
+            if item is None:
+                return False
+            self.stats["evicted"] += 1
+        self._unload(name)
+        return True
+
+    def _unload(self, name: str):
+        if self._unload_fn is not None:
+            self._unload_fn(name)
+
+    def touch(self, name: str):
+        """Kullanım zamanını güncelle (LRU)"""
+        with self._lock:
+            item = self._items.get(name)
+            if item is not None:
+                item.last_used = self._clock()
+
+    def pin(self, name: str, pinned: bool = True):
+        with self._lock:
+            if name in self._items:
+                self._items[name].pinned = pinned
+
+    def unpin(self, name: str):
+        self.pin(name, False)
+
+    # ─── Gece modu ──────────────────────────────────────────────
+
+    def swap(self, incoming: str, outgoing: str, loader: Optional[Callable[[], object]] = None,
+             pin: bool = True) -> object:
+        """outgoing'i boşaltıp incoming'i al"""
+        if self.evict(outgoing):
+            with self._lock:
+                self._night_swapped.append(outgoing)
+        return self.admit(incoming, pin=pin, loader=loader)
+
+    def defer_night_mode(self, deferred: bool = True):
+        """QoS: sıcak/yüklü iken gece takası yapılmaz"""
+        self._night_deferred = deferred
+
+    def enter_night_mode(self, loader: Optional[Callable[[], object]] = None) -> object:
+        """Gece optimizasyonu: social_plus → coder (ertelenmişse None)"""
+        if self._night_deferred:
+            print("[RESIDENCY] Gece modu ertelendi (QoS)")
+            return None
+        return self.swap("coder", "social_plus", loader=loader)
+
+    def exit_night_mode(self, reload: Optional[Callable[[str], object]] = None):
+        """coder'ı boşalt, gece için çıkarılan katmanları geri yükle"""
+        with self._lock:
+            self.evict("coder")
+            swapped, self._night_swapped = self._night_swapped, []
+        for name in swapped:
+            self.admit(name, loader=(lambda n=name: reload(n)) if reload else None)
+
+
+class BudgetedModelManager:
+    """
+    MultiModelManager sarmalayıcı - tüm yüklemeler ResidencyManager'dan geçer.
+    Bilinmeyen metodlar alttaki manager'a aktarılır.
+    """
+
+    def __init__(self, manager, residency: ResidencyManager):
+        self._manager = manager
+        self.residency = residency
+        if residency._unload_fn is None:
+            residency._unload_fn = self._unload_layer
+
+    def _unload_layer(self, layer: str):
+        if hasattr(self._manager, 'unload_model'):
+            self._manager.unload_model(layer)
+
+    def load_model(self, layer: str, pin: bool = False):
+        return self.residency.admit(layer, pin=pin,
+                                    loader=lambda: self._manager.load_model(layer))
+
+    def unload_model(self, layer: str) -> bool:
+        return self.residency.evict(layer)
+
+    def get_model(self, layer: str):
+        """Kullanım = LRU güncellemesi; bellekte değilse yükle (lazy coder)"""
+        if not self.residency.is_resident(layer):
+            self.load_model(layer)
+        self.residency.touch(layer)
+        if hasattr(self._manager, 'get_model'):
+            return self._manager.get_model(layer)
+        return None
+
+    def enter_night_mode(self):
+        return self.residency.enter_night_mode(loader=lambda: self._manager.load_model("coder"))
+
+    def exit_night_mode(self):
+        self.residency.exit_night_mode(reload=self._manager.load_model)
+
+    def __getattr__(self, name):
+        return getattr(self._manager, name)
+
+
+# Singleton
+_residency: Optional[ResidencyManager] = None
+_budgeted: Optional[BudgetedModelManager] = None
+_lock = threading.Lock()
+
+
+def get_residency_manager(platform: str = "thor") -> ResidencyManager:
+    global _residency
+    with _lock:
+        if _residency is None:
+            from core.platform_config import get_platform_profile
+            _residency = ResidencyManager.from_profile(get_platform_profile(platform))
+        return _residency
+
+
+def get_budgeted_model_manager(platform: str = "thor") -> BudgetedModelManager:
+    """get_multi_model_manager() + bütçe uygulaması"""
+    global _budgeted
+    residency = get_residency_manager(platform)
+    with _lock:
+        if _budgeted is None:
+            from core.multi_model_manager import get_multi_model_manager
+            _budgeted = BudgetedModelManager(get_multi_model_manager(platform=platform), residency)
+        return _budgeted
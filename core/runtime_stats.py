@@ -0,0 +1,109 @@
+"""
+DERİN - Runtime Stats
+═════════════════════
+Çalışan organizmanın istatistik anlık görüntüleri (data/runtime/*.json).
+
+CNS periyodik olarak yazar, derin_cli ayrı bir süreçten okur.
+Yazma atomiktir (geçici dosya + rename), okuyucu yarım dosya görmez.
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+RUNTIME_DIR = Path(__file__).resolve().parent.parent / "data" / "runtime"
+
+
+def snapshot_path(name: str, directory: Optional[Path] = None) -> Path:
+    return Path(directory or RUNTIME_DIR) / f"{name}.json"
+
+
+def write_snapshot(name: str, data: Dict[str, Any], directory: Optional[Path] = None) -> Path:
+    """data + yazılma zamanını atomik olarak kaydet"""
+    path = snapshot_path(name, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"written_at": time.time(), "data": data}
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, default=str)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    return path
+
+
+def read_snapshot(name: str, directory: Optional[Path] = None,
+                  max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """{"written_at": ..., "data": ...} veya dosya yoksa (ya da max_age'den eskiyse) None"""
+    try:
+        with open(snapshot_path(name, directory), "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if max_age is not None and time.time() - snapshot.get("written_at", 0) > max_age:
+        return None
+    return snapshot
+
+
+class RuntimeStatsExporter:
+    """
+    Kayıtlı organların istatistiklerini periyodik olarak yazar.
+
+        exporter.register("latency", tracer.get_stats)
+        exporter.start()
+    """
+
+    def __init__(self, interval: float = 10.0, directory: Optional[Path] = None):
+        self.interval = interval
+        self.directory = directory
+        self._providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, provider: Callable[[], Dict[str, Any]]):
+        with self._lock:
+            self._providers[name] = provider
+
+    def collect(self) -> Dict[str, Dict[str, Any]]:
+        """Tüm sağlayıcıların canlı değerleri (control socket 'metrics')"""
+        with self._lock:
+            providers = list(self._providers.items())
+        result = {}
+        for name, provider in providers:
+            try:
+                result[name] = provider()
+            except Exception as e:
+                result[name] = {"error": str(e)}
+        return result
+
+    def export_all(self):
+        with self._lock:
+            providers = list(self._providers.items())
+        for name, provider in providers:
+            try:
+                write_snapshot(name, provider(), self.directory)
+            except Exception as e:
+                print(f"[STATS] {name} yazılamadı: {e}")
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name="stats-export", daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while not self._stop_event.wait(self.interval):
+            self.export_all()
+
+    def stop(self, flush: bool = True):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+        if flush:
+            self.export_all()
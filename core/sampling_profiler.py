@@ -0,0 +1,337 @@
+"""
+DERİN - Sampling Profiler
+═════════════════════════
+Çalışan organizmanın thread'lerinden periyodik yığın örnekleri (yeniden başlatmadan).
+
+    sampler thread ──(her interval)──▶ sys._current_frames()
+        │                                 │
+        │                                 ▼
+        │            "organ;thread;modül:fonksiyon;…" → örnek sayısı
+        ▼
+    ek yük ölçülür: örnek maliyeti / aralık > max_overhead → aralık büyür
+
+    • mode="cpu": yığın, thread'in son örnekten beri harcadığı CPU µs'si ile ağırlıklanır
+      (bekleyen / uyuyan thread'ler payı bozmaz; pthread_getcpuclockid).
+      mode="wall": her thread her örnekte 1
+    • Organ eşlemesi: thread → boot aşaması (DerinCNS._stage_threads), yoksa thread adı
+    • Collapsed stack çıktısı (flamegraph.pl / speedscope uyumlu) veya doğrudan SVG flame graph
+    • Sürekli mod: config.yaml → development.profile_performance
+      İsteğe bağlı: derin profile --seconds N (control socket "profile")
+    • Ölçülen ek yük get_stats()["overhead"] (örnekleme süresi / duvar saati)
+"""
+
+import os
+import re
+import sys
+import time
+import zlib
+import threading
+from collections import Counter
+from html import escape
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OTHER_STACKS = "[diğer]"
+
+# Thread adındaki numara / havuz sonekleri ("event-bus-3", "boot_1") → aynı organ
+_THREAD_SUFFIX = re.compile(r"[-_ ]?\d+$")
+
+
+def _short_path(path: str) -> str:
+    if path.startswith(ROOT):
+        return os.path.relpath(path, ROOT)
+    marker = "site-packages" + os.sep
+    if marker in path:
+        return path.split(marker, 1)[1]
+    return os.path.basename(path)
+
+
+def thread_group(name: str) -> str:
+    return _THREAD_SUFFIX.sub("", name) or name
+
+
+def thread_cpu_time(ident: int) -> Optional[float]:
+    """Thread'in CPU süresi (s); platform desteklemiyorsa / thread bittiyse None"""
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(ident))
+    except (AttributeError, OSError, OverflowError):
+        return None
+
+
+class SamplingProfiler:
+    """
+    profiler = SamplingProfiler(organ_map=cns._thread_organs)
+    profiler.start()
+    profiler.window(10) → 10 saniyelik collapsed stack sayıları
+    """
+
+    def __init__(self, interval: float = 0.01, max_overhead: float = 0.01, max_stacks: int = 20000,
+                 max_depth: int = 64, organ_map: Optional[Callable[[], Dict[int, str]]] = None,
+                 organ_map_refresh: float = 5.0, mode: str = "cpu"):
+        """
+        interval:     hedef örnekleme aralığı (s)
+        max_overhead: örnekleme süresinin duvar saatine oranı üst sınırı (0.01 = %1)
+        max_stacks:   farklı yığın sayısı sınırı; aşılınca yeni yığınlar thread başına tek satırda toplanır
+        organ_map:    () → {thread ident: organ adı}
+        mode:         "cpu" (sadece CPU'da çalışan thread'ler) veya "wall" (hepsi)
+        """
+        self.base_interval = interval
+        self.interval = interval
+        self.max_overhead = max_overhead
+        self.max_stacks = max_stacks
+        self.max_depth = max_depth
+        self._organ_map = organ_map
+        self._organ_map_refresh = organ_map_refresh
+        self._organs: Dict[int, str] = {}
+        self._organs_at = float("-inf")
+        self.mode = mode
+        self._cpu_times: Dict[int, float] = {}
+        self._counts: Counter = Counter()
+        self._code_names: Dict[object, str] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._sample_time = 0.0
+        self._started_at: Optional[float] = None
+        self.stats = {"samples": 0, "truncated": 0, "idle_skipped": 0}
+
+    @property
+    def unit(self) -> str:
+        return "µs CPU" if self.mode == "cpu" else "örnek"
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ─── Örnekleme ──────────────────────────────────────────────
+
+    def _frame_name(self, code) -> str:
+        name = self._code_names.get(code)
+        if name is None:
+            name = f"{_short_path(code.co_filename)}:{code.co_name}"
+            self._code_names[code] = name
+        return name
+
+    def _organ_for(self, ident: int, thread_name: str) -> str:
+        return self._organs.get(ident) or thread_group(thread_name)
+
+    def sample(self):
+        """Tüm thread'lerin anlık yığını (sampler thread'i hariç)"""
+        now = time.monotonic()
+        if self._organ_map and now - self._organs_at >= self._organ_map_refresh:
+            try:
+                self._organs = self._organ_map()
+            except Exception as e:
+                print(f"[PROFILER] Organ eşlemesi hatası: {e}")
+            self._organs_at = now
+
+        own = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        stacks = []
+        idle = 0
+        cpu_times = {}
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            weight = 1
+            if self.mode == "cpu":
+                cpu = thread_cpu_time(ident)
+                if cpu is not None:
+                    cpu_times[ident] = cpu
+                    previous = self._cpu_times.get(ident)
+                    weight = round((cpu - previous) * 1e6) if previous is not None else 0
+                    if weight < 1:
+                        idle += 1
+                        continue
+            frames = []
+            while frame is not None and len(frames) < self.max_depth:
+                frames.append(self._frame_name(frame.f_code))
+                frame = frame.f_back
+            thread_name = names.get(ident, f"thread-{ident}")
+            frames.append(thread_name)
+            frames.append(self._organ_for(ident, thread_name))
+            frames.reverse()
+            stacks.append((";".join(frames), weight))
+
+        self._cpu_times = cpu_times
+        with self._lock:
+            self.stats["idle_skipped"] += idle
+            for stack, weight in stacks:
+                if stack not in self._counts and len(self._counts) >= self.max_stacks:
+                    organ, thread_name = stack.split(";", 2)[:2]
+                    stack = f"{organ};{thread_name};{OTHER_STACKS}"
+                    self.stats["truncated"] += 1
+                self._counts[stack] += weight
+            self.stats["samples"] += 1
+
+    def _loop(self):
+        while not self._stop_event.wait(self.interval):
+            started = time.perf_counter()
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"[PROFILER] Örnekleme hatası: {e}")
+            cost = time.perf_counter() - started
+            self._sample_time += cost
+            # Ek yük sınırı: örnek maliyeti aralığın max_overhead kesrini aşmasın
+            self.interval = max(self.base_interval, cost / self.max_overhead)
+
+    def start(self):
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._started_at = time.monotonic()
+        self._sample_time = 0.0
+        self._thread = threading.Thread(target=self._loop, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    # ─── Sonuçlar ───────────────────────────────────────────────
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+    def window(self, seconds: float) -> Dict[str, int]:
+        """
+        Sonraki `seconds` saniyenin örnekleri. Sürekli mod açıksa fark alınır,
+        değilse profiler bu süre için başlatılıp durdurulur.
+        """
+        if self.running:
+            before = self.counts()
+            time.sleep(seconds)
+            after = self.counts()
+            return {stack: n - before.get(stack, 0) for stack, n in after.items() if n > before.get(stack, 0)}
+        self.reset()
+        self.start()
+        try:
+            time.sleep(seconds)
+        finally:
+            self.stop()
+        return self.counts()
+
+    def get_stats(self) -> Dict:
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        with self._lock:
+            stacks = len(self._counts)
+        return {
+            **self.stats,
+            "running": self.running,
+            "mode": self.mode,
+            "unit": self.unit,
+            "interval_ms": self.interval * 1000,
+            "stacks": stacks,
+            "overhead": self._sample_time / elapsed if elapsed and self.running else 0.0,
+        }
+
+
+# ─── Biçimlendirme ──────────────────────────────────────────────
+
+def format_collapsed(counts: Dict[str, int]) -> str:
+    """Brendan Gregg collapsed formatı: "a;b;c 42" (flamegraph.pl, speedscope)"""
+    return "".join(f"{stack} {n}\n" for stack, n in sorted(counts.items()))
+
+
+def summarize(counts: Dict[str, int], top: int = 15, unit: str = "örnek") -> str:
+    """Organ / thread başına pay + en sık görülen yaprak fonksiyonlar"""
+    total = sum(counts.values())
+    if not total:
+        return "Örnek yok"
+    by_organ: Counter = Counter()
+    by_thread: Counter = Counter()
+    leaves: Counter = Counter()
+    for stack, n in counts.items():
+        parts = stack.split(";")
+        by_organ[parts[0]] += n
+        by_thread[(parts[0], parts[1])] += n
+        leaves[parts[-1]] += n
+    lines = [f"{total} {unit}", "", f"{'organ':<24}{'pay':>7}"]
+    lines += [f"{organ:<24}{n / total:>6.1%}" for organ, n in by_organ.most_common()]
+    lines += ["", f"{'organ / thread':<48}{'pay':>7}"]
+    lines += [f"{organ + ' / ' + thread:<48}{n / total:>6.1%}" for (organ, thread), n in by_thread.most_common(top)]
+    lines += ["", f"{'yaprak fonksiyon':<64}{'pay':>7}"]
+    lines += [f"{leaf[:63]:<64}{n / total:>6.1%}" for leaf, n in leaves.most_common(top)]
+    return "\n".join(lines)
+
+
+def _build_tree(counts: Dict[str, int]) -> Dict:
+    root = {"name": "all", "value": 0, "children": {}}
+    for stack, n in counts.items():
+        node = root
+        node["value"] += n
+        for part in stack.split(";"):
+            node = node["children"].setdefault(part, {"name": part, "value": 0, "children": {}})
+            node["value"] += n
+    return root
+
+
+def flame_graph_svg(counts: Dict[str, int], title: str = "DERİN", width: int = 1200,
+                    row_height: int = 16, min_width: float = 0.5, unit: str = "örnek") -> str:
+    """Bağımsız SVG flame graph (ek araç gerekmez; kutunun üstüne gelince ayrıntı)"""
+    root = _build_tree(counts)
+    total = root["value"] or 1
+    rects: List[Tuple[float, int, float, str, int]] = []
+    depth_max = 0
+
+    def walk(node, x: float, depth: int):
+        nonlocal depth_max
+        w = node["value"] / total * width
+        if w < min_width:
+            return
+        depth_max = max(depth_max, depth)
+        rects.append((x, depth, w, node["name"], node["value"]))
+        child_x = x
+        for child in sorted(node["children"].values(), key=lambda c: c["name"]):
+            walk(child, child_x, depth + 1)
+            child_x += child["value"] / total * width
+
+    walk(root, 0.0, 0)
+    top = 24
+    height = top + (depth_max + 1) * row_height + 4
+    out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+           f'font-family="monospace" font-size="11">',
+           f'<text x="4" y="16" font-size="13">{escape(title)} - {total} {escape(unit)}</text>']
+    for x, depth, w, name, value in rects:
+        y = height - 4 - (depth + 1) * row_height
+        hue = zlib.crc32(name.split(":")[0].encode("utf-8")) % 40 + 10
+        label = escape(name)
+        out.append(f'<g><title>{label} ({value} {escape(unit)}, {value / total:.1%})</title>'
+                   f'<rect x="{x:.1f}" y="{y}" width="{w:.1f}" height="{row_height - 1}" '
+                   f'fill="hsl({hue},80%,60%)"/>')
+        chars = int(w / 7)
+        if chars >= 3:
+            text = name if len(name) <= chars else name[:chars - 2] + ".."
+            out.append(f'<text x="{x + 2:.1f}" y="{y + row_height - 4}">{escape(text)}</text>')
+        out.append("</g>")
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
+
+
+# Singleton
+_profiler: Optional[SamplingProfiler] = None
+_lock = threading.Lock()
+
+
+def get_sampling_profiler(**kwargs) -> SamplingProfiler:
+    """config.yaml → development.profiler (ilk çağrıdaki kwargs ayarları ezer)"""
+    global _profiler
+    with _lock:
+        if _profiler is None:
+            from core.platform_config import get_section
+            config = get_section("development", "profiler", default={}) or {}
+            options = {"interval": config.get("interval_ms", 10) / 1000,
+                       "max_overhead": config.get("max_overhead", 0.01),
+                       "max_stacks": config.get("max_stacks", 20000),
+                       "mode": config.get("mode", "cpu")}
+            options.update(kwargs)
+            _profiler = SamplingProfiler(**options)
+        return _profiler
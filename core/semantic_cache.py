@@ -0,0 +1,211 @@
+"""
+DERİN - Semantic Response Cache
+═══════════════════════════════
+Reflex sınıfı sorgular (selamlaşma, kısa sohbet) için embedding tabanlı
+cevap önbelleği. HierarchicalBrain'in önünde durur; isabet olursa
+hiçbir LLM çağrılmaz (3B router dahil).
+
+    sorgu ──▶ MiniLM embedding ──▶ kullanıcı kapsamı ──▶ cos ≥ eşik? ──▶ cevap
+                                                           └─ hayır ─▶ LLM → put()
+
+    • Kullanıcı başına ayrı kapsam (Ali'ye verilen cevap Ayşe'ye dönmez)
+    • LRU + TTL eviction
+    • Persona parmak izi veya limbic mood kovası değişince otomatik temizlik
+
+Embedding modeli config.yaml → model.embedding.name (all-MiniLM-L6-v2).
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+
+@dataclass
+class CacheEntry:
+    query: str
+    response: str
+    vector: np.ndarray
+    created_at: float
+    layer: str = "reflex"
+
+
+def make_sentence_embedder(model_name: Optional[str] = None) -> Callable[[List[str]], np.ndarray]:
+    """sentence-transformers embedder (ilk çağrıda yüklenir, normalize vektör)"""
+    if model_name is None:
+        from core.platform_config import get_section
+        model_name = get_section("model", "embedding", "name", default="all-MiniLM-L6-v2")
+
+    state = {}
+    lock = threading.Lock()
+
+    def embed(texts: List[str]) -> np.ndarray:
+        with lock:
+            if "model" not in state:
+                from sentence_transformers import SentenceTransformer
+                state["model"] = SentenceTransformer(model_name, device="cpu")
+        return np.asarray(state["model"].encode(texts, normalize_embeddings=True), dtype=np.float32)
+
+    return embed
+
+
+class _UserScope:
+    """Tek kullanıcının girdileri + vektör matrisi (lazy yeniden kurulur)"""
+
+    def __init__(self):
+        self.entries: "OrderedDict[int, CacheEntry]" = OrderedDict()
+        self.matrix: Optional[np.ndarray] = None
+        self.keys: List[int] = []
+
+    def rebuild(self):
+        self.keys = list(self.entries)
+        self.matrix = (np.stack([self.entries[k].vector for k in self.keys])
+                       if self.keys else None)
+
+
+class SemanticCache:
+    """Kullanıcı kapsamlı, LRU + TTL semantik cevap önbelleği"""
+
+    def __init__(self, embed: Callable[[List[str]], np.ndarray],
+                 threshold: float = 0.92, ttl_seconds: float = 3600.0,
+                 max_entries_per_user: int = 256, cacheable_layers=("reflex",),
+                 clock: Callable[[], float] = time.time):
+        self._embed = embed
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_user = max_entries_per_user
+        self.cacheable_layers = set(cacheable_layers)
+        self._clock = clock
+        self._scopes: Dict[str, _UserScope] = {}
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._context = (None, None)  # (persona_version, mood_bucket)
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0,
+                      "expired": 0, "invalidations": 0}
+
+    # ─── Bağlam (persona / mood) ────────────────────────────────
+
+    def set_context(self, persona_version: Optional[str], mood_bucket: Optional[str]) -> bool:
+        """Persona veya mood kovası değiştiyse tüm cache temizlenir. Temizlendi mi?"""
+        context = (persona_version, mood_bucket)
+        with self._lock:
+            if context == self._context:
+                return False
+            changed = self._context != (None, None)
+            self._context = context
+            if changed:
+                self._clear_locked()
+            return changed
+
+    def invalidate(self, user_id: Optional[str] = None):
+        with self._lock:
+            if user_id is None:
+                self._clear_locked()
+            elif self._scopes.pop(user_id, None) is not None:
+                self.stats["invalidations"] += 1
+
+    def _clear_locked(self):
+        if self._scopes:
+            self.stats["invalidations"] += 1
+        self._scopes.clear()
+
+    # ─── Sorgu ──────────────────────────────────────────────────
+
+    def _vector(self, query: str) -> np.ndarray:
+        vector = np.asarray(self._embed([query])[0], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, query: str, user_id: str = "default") -> Optional[str]:
+        """Yeterince benzer ve taze cevap varsa döndür"""
+        with self._lock:
+            scope = self._scopes.get(user_id)
+            if scope is None or not scope.entries:
+                self.stats["misses"] += 1
+                return None
+
+        vector = self._vector(query)
+        now = self._clock()
+
+        with self._lock:
+            scope = self._scopes.get(user_id)
+            if scope is None:
+                self.stats["misses"] += 1
+                return None
+            self._expire_locked(scope, now)
+            if scope.matrix is None:
+                self.stats["misses"] += 1
+                return None
+            scores = scope.matrix @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                self.stats["misses"] += 1
+                return None
+            key = scope.keys[best]
+            scope.entries.move_to_end(key)  # LRU
+            self.stats["hits"] += 1
+            return scope.entries[key].response
+
+    def put(self, query: str, response: str, user_id: str = "default", layer: str = "reflex") -> bool:
+        """Cevabı sakla (sadece cacheable_layers). Saklandı mı?"""
+        if layer not in self.cacheable_layers or not response:
+            return False
+        vector = self._vector(query)
+        with self._lock:
+            scope = self._scopes.setdefault(user_id, _UserScope())
+            self._seq += 1
+            scope.entries[self._seq] = CacheEntry(query, response, vector, self._clock(), layer)
+            while len(scope.entries) > self.max_entries_per_user:
+                scope.entries.popitem(last=False)
+                self.stats["evictions"] += 1
+            scope.rebuild()
+            self.stats["stores"] += 1
+        return True
+
+    def _expire_locked(self, scope: _UserScope, now: float):
+        cutoff = now - self.ttl_seconds
+        expired = [k for k, e in scope.entries.items() if e.created_at < cutoff]
+        if expired:
+            for k in expired:
+                del scope.entries[k]
+            self.stats["expired"] += len(expired)
+            scope.rebuild()
+
+    # ─── Anlık görüntü (--warm-start) ──────────────────────────
+
+    def get_state(self) -> Dict:
+        """Girdiler vektörleriyle birlikte (geri yüklemede yeniden embedding yok)"""
+        with self._lock:
+            return {"context": self._context, "seq": self._seq,
+                    "scopes": {user: [(e.query, e.response, e.vector, e.created_at, e.layer)
+                                      for e in scope.entries.values()]
+                               for user, scope in self._scopes.items()}}
+
+    def set_state(self, state: Dict):
+        now = self._clock()
+        with self._lock:
+            self._context = tuple(state["context"])
+            self._scopes.clear()
+            for user, entries in state["scopes"].items():
+                scope = _UserScope()
+                for query, response, vector, created_at, layer in entries:
+                    self._seq += 1
+                    scope.entries[self._seq] = CacheEntry(query, response, vector, created_at, layer)
+                self._expire_locked(scope, now)
+                if scope.entries:
+                    scope.rebuild()
+                    self._scopes[user] = scope
+            self._seq = max(self._seq, state.get("seq", 0))
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            total = self.stats["hits"] + self.stats["misses"]
+            return {
+                **self.stats,
+                "hit_rate": self.stats["hits"] / total if total else 0.0,
+                "entries": sum(len(s.entries) for s in self._scopes.values()),
+                "users": len(self._scopes),
+            }
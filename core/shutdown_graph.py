@@ -0,0 +1,189 @@
+"""
+DERİN - Shutdown Graph
+══════════════════════
+Boot grafiğinin tersi: bir organ, ona bağımlı organların hepsi durduktan
+sonra durdurulur. Birbirinden bağımsız organlar paralel durur; tüm kapanış
+tek bir global süre sınırı (deadline) altındadır.
+
+    boot:      event_bus ──▶ life_log ──▶ control_socket
+    kapanış:   control_socket ──▶ life_log ──▶ event_bus
+
+    • Her adım kendi daemon thread'inde (takılan organ kapanışı kilitlemez)
+    • Süre dolunca: çalışan adımlar "timeout", başlamamışlar "skipped"
+    • Rapor hangi organın süreyi aştığını söyler
+
+Kullanım:
+    graph = ShutdownGraph.reverse_of(boot_graph, {"broca": broca.stop, ...})
+    graph.add("drain", bus.drain, after=["control_loop"], before=["life_log"])
+    report = graph.run(deadline=10.0)
+    print(report.format())
+"""
+
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from core.boot_graph import StageTiming
+
+
+@dataclass
+class ShutdownStep:
+    name: str
+    func: Callable[[], object]
+    after: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class ShutdownReport:
+    timings: Dict[str, StageTiming] = field(default_factory=dict)
+    wall_time: float = 0.0
+    deadline: float = 0.0
+
+    @property
+    def overdue(self) -> List[str]:
+        """Süre dolduğunda hâlâ çalışan adımlar"""
+        return [n for n, t in self.timings.items() if t.status == "timeout"]
+
+    @property
+    def skipped(self) -> List[str]:
+        return [n for n, t in self.timings.items() if t.status == "skipped"]
+
+    @property
+    def failed(self) -> List[str]:
+        return [n for n, t in self.timings.items() if t.status == "failed"]
+
+    @property
+    def clean(self) -> bool:
+        return not (self.overdue or self.skipped or self.failed)
+
+    def to_dict(self) -> Dict:
+        return {
+            "wall_time": self.wall_time,
+            "deadline": self.deadline,
+            "overdue": self.overdue,
+            "skipped": self.skipped,
+            "steps": {n: {"start": t.start, "duration": t.duration, "status": t.status, "error": t.error}
+                      for n, t in self.timings.items()},
+        }
+
+    def format(self) -> str:
+        lines = [f"Kapanış: {self.wall_time:.2f}s / {self.deadline:.1f}s sınır"]
+        for t in sorted(self.timings.values(), key=lambda t: (t.status == "skipped", t.start, t.name)):
+            line = f"   {t.name:<22} {t.start:7.3f}s +{t.duration:6.3f}s  {t.status}"
+            if t.error:
+                line += f" ({t.error})"
+            lines.append(line)
+        if self.overdue:
+            lines.append("Süreyi aşan: " + ", ".join(self.overdue))
+        return "\n".join(lines)
+
+
+class ShutdownGraph:
+    """Ters bağımlılık sıralı, paralel, süre sınırlı kapanış"""
+
+    def __init__(self):
+        self._steps: Dict[str, ShutdownStep] = {}
+        self._deadline_at: Optional[float] = None
+
+    def add(self, name: str, func: Callable[[], object], after: Sequence[str] = (),
+            before: Sequence[str] = ()) -> ShutdownStep:
+        """
+        after:  bu adımdan önce bitmesi gerekenler
+        before: bu adım bitmeden başlamaması gerekenler
+        """
+        if name in self._steps:
+            raise ValueError(f"Adım zaten tanımlı: {name}")
+        step = ShutdownStep(name, func, set(after))
+        self._steps[name] = step
+        for other in before:
+            if other in self._steps:
+                self._steps[other].after.add(name)
+        return step
+
+    @classmethod
+    def reverse_of(cls, boot_graph, stops: Dict[str, Callable[[], object]]) -> "ShutdownGraph":
+        """
+        Boot grafiğinden kapanış grafiği. Durdurma fonksiyonu olmayan aşamalar
+        atlanır; bağımlılıkları onların üzerinden geçişli olarak korunur.
+        """
+        dependents = boot_graph.dependents()
+        graph = cls()
+        for name in boot_graph.topological_order():
+            if name not in stops:
+                continue
+            after, seen, frontier = set(), set(), list(dependents[name])
+            while frontier:
+                child = frontier.pop()
+                if child in seen:
+                    continue
+                seen.add(child)
+                if child in stops:
+                    after.add(child)
+                else:
+                    frontier.extend(dependents[child])
+            graph.add(name, stops[name], after=after)
+        return graph
+
+    @property
+    def steps(self) -> Dict[str, ShutdownStep]:
+        return dict(self._steps)
+
+    def remaining(self, cap: Optional[float] = None) -> float:
+        """Çalışırken global süreden kalan (adımlar join/drain süresi için kullanır)"""
+        if self._deadline_at is None:
+            return cap if cap is not None else 0.0
+        left = max(0.0, self._deadline_at - time.monotonic())
+        return min(left, cap) if cap is not None else left
+
+    def run(self, deadline: float = 10.0) -> ShutdownReport:
+        for step in self._steps.values():
+            unknown = step.after - set(self._steps)
+            step.after -= unknown  # Hiç kurulmamış organlar beklenmez
+
+        report = ShutdownReport(timings={n: StageTiming(n, tuple(s.after)) for n, s in self._steps.items()},
+                                deadline=deadline)
+        t0 = time.monotonic()
+        self._deadline_at = t0 + deadline
+        cond = threading.Condition()
+        done: Set[str] = set()
+        started: Set[str] = set()
+
+        def execute(step: ShutdownStep):
+            timing = report.timings[step.name]
+            timing.start = time.monotonic() - t0
+            try:
+                step.func()
+                timing.status = "ok"
+            except Exception as e:
+                timing.status = "failed"
+                timing.error = f"{type(e).__name__}: {e}"
+            finally:
+                timing.end = time.monotonic() - t0
+                with cond:
+                    done.add(step.name)
+                    cond.notify_all()
+
+        with cond:
+            while len(done) < len(self._steps):
+                for name, step in self._steps.items():
+                    if name not in started and step.after <= done:
+                        started.add(name)
+                        report.timings[name].status = "running"
+                        threading.Thread(target=execute, args=(step,), name=f"shutdown-{name}",
+                                         daemon=True).start()
+                left = self._deadline_at - time.monotonic()
+                if left <= 0 or (started == done and len(done) < len(self._steps)):
+                    break  # Süre doldu (ya da kalan adımlar bekledikleri adımlar yüzünden başlayamıyor)
+                cond.wait(left)
+
+        now = time.monotonic() - t0
+        for name, timing in report.timings.items():
+            if name not in started:
+                timing.status = "skipped"
+            elif name not in done:
+                timing.status = "timeout"
+                timing.end = now
+        report.wall_time = now
+        self._deadline_at = None
+        return report
@@ -0,0 +1,267 @@
+"""
+DERİN - Speculative Response
+════════════════════════════
+"Önce refleks, sonra yükselt" cevap modu (HierarchicalBrain için).
+
+Derin bir soru cortical'a yönlendirildiğinde 70B cevabı saniyeler sürer.
+Bu sürede küçük bir katman (reflex / social) paralel olarak kısa bir
+karşılık ya da taslak üretir:
+
+    route ──▶ cortical ───────────────────────────────▶ commit (upgrade)
+         └──▶ reflex: "Hmm, güzel soru..." ──speak──┘      veya
+                                                        commit (draft)
+
+Kurallar (SpeculationPolicy):
+    • ack   : kısa onay cümlesi hazır olunca konuşulur, cevap upgrade'den gelir
+    • draft : taslak hazır olunca konuşulur; upgrade gelirse onu düzeltir,
+              zaman aşımına uğrarsa taslak commit edilir
+    • Upgrade grace süresi içinde gelirse taslak hiç konuşulmaz (superseded)
+    • Taslak en fazla draft_timeout_s beklenir; upgrade taslaktan önce gelirse
+      taslak iptal edilir / sonucu yok sayılır
+    • Taslaklar ayrı bir havuzda çalışır: zaman aşımına uğrayıp hâlâ süren
+      upgrade'ler (thread'ler öldürülemez) taslak üretimini bekletmez;
+      kuyrukta bekleyen upgrade zaman aşımında iptal edilir (abandoned)
+
+Algılanan gecikme (ilk konuşulan söz) ve nihai gecikme katman başına
+ölçülür; get_stats() p50/p95 verir (derin latency, /metrics).
+Benchmark: python benchmarks/speculative_bench.py
+"""
+
+import time
+import random
+import threading
+from collections import deque
+from concurrent.futures import (CancelledError, FIRST_COMPLETED, ThreadPoolExecutor,
+                                TimeoutError as FutureTimeout, wait)
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+ACK_PROMPT = ("Kullanıcı şunu sordu: \"{query}\". Cevabı henüz verme; "
+              "düşündüğünü belirten tek kısa, doğal bir cümle söyle.")
+
+FALLBACK_ACKS = [
+    "Hmm, güzel soru, bir düşüneyim.",
+    "Bir saniye, toparlıyorum.",
+    "Bunu biraz düşünmem lazım.",
+]
+
+
+@dataclass
+class SpeculationPolicy:
+    """Ne zaman ve nasıl spekülasyon yapılacağı"""
+    # Hedef katman → taslak katmanı
+    draft_layers: Dict[str, str] = field(default_factory=lambda: {
+        "cortical": "social",
+        "social_plus": "reflex",
+    })
+    mode: str = "ack"                    # "ack" | "draft"
+    upgrade_grace_ms: float = 250.0      # Bu süre içinde upgrade gelirse taslak konuşulmaz
+    upgrade_timeout_s: float = 20.0      # Aşılırsa taslak commit edilir (draft modu)
+    draft_timeout_s: float = 1.5         # Taslak bundan uzun sürerse beklenmez (konuşulmaz)
+    max_draft_tokens: int = 24
+    fallback_layer: str = "reflex"       # Taslak katmanı hazır değilse
+
+    def draft_layer_for(self, layer: str) -> Optional[str]:
+        return self.draft_layers.get(layer)
+
+
+@dataclass
+class SpeculativeResult:
+    text: str
+    layer: str                          # Cevabı commit eden katman
+    committed: str                      # "direct" | "upgrade" | "draft"
+    routed_layer: str = ""              # Yönlendirme kararı (ölçümler buna göre)
+    spoken: List[Tuple[str, str]] = field(default_factory=list)  # (kind, text)
+    draft_text: Optional[str] = None
+    perceived_ms: float = 0.0           # İlk konuşulan söze kadar
+    final_ms: float = 0.0               # Nihai cevaba kadar
+
+
+class SpeculativeResponder:
+    """route + generate üzerinde spekülatif cevap"""
+
+    def __init__(self, route: Callable[[str], str],
+                 generate: Callable[[str, str, Optional[int]], str],
+                 on_speak: Optional[Callable[[str, str], None]] = None,
+                 policy: Optional[SpeculationPolicy] = None,
+                 is_layer_ready: Callable[[str], bool] = lambda layer: True,
+                 on_result: Optional[Callable[[str, "SpeculativeResult"], None]] = None,
+                 window: int = 500, max_workers: int = 4):
+        """
+        route(query) -> katman
+        generate(layer, prompt, max_tokens) -> metin
+        on_speak(text, kind) - kind: "ack" | "draft" | "answer"
+        on_result(query, result) - commit sonrası (örn. denetim kuyruğu)
+        """
+        self._route = route
+        self._generate = generate
+        self._on_speak = on_speak or (lambda text, kind: None)
+        self.policy = policy or SpeculationPolicy()
+        self._is_layer_ready = is_layer_ready
+        self._on_result = on_result
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="speculate")
+        self._draft_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="speculate-draft")
+        self._lock = threading.Lock()
+        self._perceived: Dict[str, deque] = {}
+        self._final: Dict[str, deque] = {}
+        self._window = window
+        self._counts = {"direct": 0, "upgrade": 0, "draft": 0, "superseded": 0, "acked": 0,
+                        "drafted": 0, "abandoned": 0}
+
+    @classmethod
+    def from_brain(cls, brain, **kwargs) -> "SpeculativeResponder":
+        """HierarchicalBrain.select_layer / generate üzerinden"""
+        return cls(
+            route=brain.select_layer,
+            generate=lambda layer, prompt, max_tokens=None: brain.generate(
+                prompt, layer=layer, max_tokens=max_tokens),
+            **kwargs,
+        )
+
+    # ─── Cevap ──────────────────────────────────────────────────
+
+    def respond(self, query: str) -> SpeculativeResult:
+        t0 = time.perf_counter()
+        elapsed_ms = lambda: (time.perf_counter() - t0) * 1000
+        layer = self._route(query)
+        draft_layer = self._pick_draft_layer(layer)
+
+        if draft_layer is None:
+            text = self._generate(layer, query, None)
+            result = SpeculativeResult(text, layer, "direct", routed_layer=layer)
+            self._speak(result, "answer", text)
+            result.perceived_ms = result.final_ms = elapsed_ms()
+            return self._record(query, result)
+
+        upgrade = self._pool.submit(self._generate, layer, query, None)
+        draft = self._draft_pool.submit(self._draft, draft_layer, query)
+        policy = self.policy
+
+        # 1) Upgrade grace içinde geldi mi? Taslak hiç konuşulmaz.
+        try:
+            text = upgrade.result(timeout=policy.upgrade_grace_ms / 1000.0)
+            result = SpeculativeResult(text, layer, "upgrade", routed_layer=layer)
+            self._speak(result, "answer", text)
+            result.perceived_ms = result.final_ms = elapsed_ms()
+            draft.cancel()
+            self._count("superseded")
+            return self._record(query, result)
+        except FutureTimeout:
+            pass
+
+        # 2) Taslak ya da upgrade, hangisi önce gelirse (taslak en fazla draft_timeout_s beklenir)
+        wait([upgrade, draft], timeout=policy.draft_timeout_s, return_when=FIRST_COMPLETED)
+        result = SpeculativeResult("", layer, "upgrade", routed_layer=layer)
+        if upgrade.done():
+            draft.cancel()  # Geç kalan taslak konuşulmaz
+            self._count("superseded")
+        else:
+            # Hazır taslak hemen konuşulur (ack: kısa onay, draft: taslak cevap)
+            result.draft_text = self._safe_result(draft)
+            if result.draft_text:
+                kind = "ack" if policy.mode == "ack" else "draft"
+                self._speak(result, kind, result.draft_text)
+                result.perceived_ms = elapsed_ms()
+                self._count("acked" if kind == "ack" else "drafted")
+
+        # 3) Upgrade'i bekle; draft modunda zaman aşımında taslak commit edilir
+        try:
+            text = upgrade.result(timeout=policy.upgrade_timeout_s)
+            result.text = text
+            self._speak(result, "answer", text)
+        except Exception as e:
+            if isinstance(e, FutureTimeout):
+                upgrade.cancel()  # Kuyruktaysa hiç çalışmaz; çalışıyorsa sonucu yok sayılır
+                self._count("abandoned")
+            draft_text = result.draft_text or self._safe_result(draft)
+            if policy.mode == "draft" and draft_text:
+                result.text, result.layer, result.committed = draft_text, draft_layer, "draft"
+                if not result.draft_text:  # Geç gelen taslak henüz konuşulmadı
+                    self._speak(result, "draft", draft_text)
+            else:
+                raise RuntimeError(f"{layer} cevap veremedi: {e}") from e
+
+        result.final_ms = elapsed_ms()
+        if not result.perceived_ms:
+            result.perceived_ms = result.final_ms
+        return self._record(query, result)
+
+    def _pick_draft_layer(self, layer: str) -> Optional[str]:
+        draft_layer = self.policy.draft_layer_for(layer)
+        if draft_layer is None:
+            return None
+        if self._is_layer_ready(draft_layer):
+            return draft_layer
+        fallback = self.policy.fallback_layer
+        if fallback != layer and self._is_layer_ready(fallback):
+            return fallback
+        return None
+
+    def _draft(self, layer: str, query: str) -> str:
+        if self.policy.mode == "ack":
+            prompt = ACK_PROMPT.format(query=query)
+        else:
+            prompt = query
+        try:
+            return self._generate(layer, prompt, self.policy.max_draft_tokens)
+        except Exception:
+            return random.choice(FALLBACK_ACKS) if self.policy.mode == "ack" else ""
+
+    @staticmethod
+    def _safe_result(future) -> Optional[str]:
+        """Bitmiş taslağın sonucu; bitmemiş / iptal / hatalıysa None (asla beklemez)"""
+        if not future.done():
+            return None
+        try:
+            return future.result(timeout=0)
+        except (CancelledError, Exception):
+            return None
+
+    def _speak(self, result: SpeculativeResult, kind: str, text: str):
+        result.spoken.append((kind, text))
+        try:
+            self._on_speak(text, kind)
+        except Exception as e:
+            print(f"[SPECULATE] Konuşma hatası: {e}")
+
+    # ─── Ölçüm ──────────────────────────────────────────────────
+
+    def _count(self, key: str):
+        with self._lock:
+            self._counts[key] += 1
+
+    def _record(self, query: str, result: SpeculativeResult) -> SpeculativeResult:
+        with self._lock:
+            self._counts[result.committed] += 1
+            layer = result.routed_layer or result.layer
+            self._perceived.setdefault(layer, deque(maxlen=self._window)).append(result.perceived_ms)
+            self._final.setdefault(layer, deque(maxlen=self._window)).append(result.final_ms)
+        if self._on_result is not None:
+            try:
+                self._on_result(query, result)
+            except Exception as e:
+                print(f"[SPECULATE] on_result hatası: {e}")
+        return result
+
+    def get_stats(self) -> Dict:
+        """Katman başına algılanan / nihai gecikme p50/p95 (ms)"""
+        from core.latency_tracer import percentile
+
+        with self._lock:
+            perceived = {k: sorted(v) for k, v in self._perceived.items()}
+            final = {k: sorted(v) for k, v in self._final.items()}
+            counts = dict(self._counts)
+        layers = {}
+        for layer in perceived:
+            layers[layer] = {
+                "count": len(perceived[layer]),
+                "perceived_p50_ms": percentile(perceived[layer], 50),
+                "perceived_p95_ms": percentile(perceived[layer], 95),
+                "final_p50_ms": percentile(final[layer], 50),
+                "final_p95_ms": percentile(final[layer], 95),
+            }
+        return {"layers": layers, "counts": counts}
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False)
+        self._draft_pool.shutdown(wait=False)
@@ -0,0 +1,322 @@
+"""
+DERİN - Streaming Speech Pipeline
+═════════════════════════════════
+Frontal token akışı → cümle/yan cümle parçaları → Broca TTS → ses.
+
+    tokens ──▶ [chunker] ──text q──▶ [synth] ──audio q──▶ [play]
+
+Üç aşama ayrı thread'lerde çalışır: N. parça çalınırken N+1 sentezlenir,
+N+2 hâlâ üretilebilir. İlk ses, tüm metni değil ilk cümleyi bekler (FAZ 8).
+
+Barge-in: cancel() üretimi, sentezi ve çalmayı birlikte durdurur.
+Brainstem'in stop_audio / abort_generation callback'lerine bağlanır.
+
+Kullanım:
+    pipeline = StreamingSpeechPipeline(broca.synthesize, sink=broca)
+    pipeline.speak(frontal.generate_stream(prompt))
+    brainstem.register_stop_audio(pipeline.cancel)
+"""
+
+import re
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, List, Optional
+
+_SENTENCE_END = re.compile(r'[.!?…]+["\')\]]*\s')
+_CLAUSE_END = re.compile(r'[,;:—]\s')
+
+_DONE = object()
+
+
+class SentenceChunker:
+    """
+    Token deltalarını konuşulabilir parçalara böler.
+
+    Cümle sonunda her zaman keser; yan cümle sınırında (virgül vb.)
+    parça min_clause_chars'ı geçtiyse keser; max_chars'ta boşluktan zorla keser.
+    İlk parça için first_min_chars daha düşüktür - ilk ses hızlı gelsin.
+    """
+
+    def __init__(self, min_clause_chars: int = 40, max_chars: int = 200, first_min_chars: int = 12):
+        self.min_clause_chars = min_clause_chars
+        self.max_chars = max_chars
+        self.first_min_chars = first_min_chars
+        self._buffer = ""
+        self._emitted = 0
+
+    def feed(self, delta: str) -> List[str]:
+        self._buffer += delta
+        chunks = []
+        while True:
+            cut = self._find_cut()
+            if cut is None:
+                break
+            chunk, self._buffer = self._buffer[:cut].strip(), self._buffer[cut:]
+            if chunk:
+                chunks.append(chunk)
+                self._emitted += 1
+        return chunks
+
+    def flush(self) -> List[str]:
+        chunk, self._buffer = self._buffer.strip(), ""
+        if chunk:
+            self._emitted += 1
+            return [chunk]
+        return []
+
+    def _find_cut(self) -> Optional[int]:
+        buf = self._buffer
+        min_chars = self.first_min_chars if self._emitted == 0 else 1
+        for match in _SENTENCE_END.finditer(buf):
+            if match.end() >= min_chars:
+                return match.end()
+
+        min_clause = self.first_min_chars if self._emitted == 0 else self.min_clause_chars
+        for match in _CLAUSE_END.finditer(buf):
+            if match.end() >= min_clause:
+                return match.end()
+
+        if len(buf) >= self.max_chars:
+            space = buf.rfind(" ", 0, self.max_chars)
+            return space + 1 if space > 0 else self.max_chars
+        return None
+
+
+class TokenStream:
+    """Push tabanlı token kaynağı (Event Bus deltaları için iterator)"""
+
+    def __init__(self):
+        self._queue: "queue.Queue" = queue.Queue()
+
+    def push(self, delta: str):
+        self._queue.put(delta)
+
+    def close(self):
+        self._queue.put(_DONE)
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                return
+            yield item
+
+
+class NullAudioSink:
+    """Ses çıkışı olmayan ortamlar / testler için"""
+
+    def __init__(self):
+        self.played: List[object] = []
+        self.stopped = 0
+
+    def play(self, audio):
+        self.played.append(audio)
+
+    def stop_audio(self):
+        self.stopped += 1
+
+
+class StreamingSpeechPipeline:
+    """Token akışından parça parça konuşma"""
+
+    def __init__(self, synthesize: Callable[[str], object], sink=None,
+                 chunker_factory: Callable[[], SentenceChunker] = SentenceChunker,
+                 audio_queue_size: int = 2, tracer=None):
+        self._synthesize = synthesize
+        self._sink = sink or NullAudioSink()
+        self._chunker_factory = chunker_factory
+        self._audio_queue_size = audio_queue_size
+        self._tracer = tracer
+        self._lock = threading.Lock()
+        self._session: Optional["_Session"] = None
+        self.stats = {"utterances": 0, "chunks": 0, "cancelled": 0}
+
+    @property
+    def is_speaking(self) -> bool:
+        with self._lock:
+            return self._session is not None and not self._session.finished.is_set()
+
+    def speak(self, tokens: Iterable[str], utterance_id: Optional[str] = None,
+              interrupt: bool = True) -> "_Session":
+        """
+        Yeni konuşma başlat. interrupt=True süren konuşmayı keser;
+        False ise yeni parça üretilip sentezlenir ama çalma öncekinin bitmesini bekler.
+        """
+        after = None
+        if interrupt:
+            self.cancel()
+        else:
+            with self._lock:
+                if self._session is not None and not self._session.finished.is_set():
+                    after = self._session
+        session = _Session(self, tokens, utterance_id, after=after)
+        with self._lock:
+            self._session = session
+            self.stats["utterances"] += 1
+        session.start()
+        return session
+
+    def speak_text(self, text: str, utterance_id: Optional[str] = None,
+                   interrupt: bool = True) -> "_Session":
+        """Hazır metni parçalı konuş (ilk cümle hemen sentezlenir)"""
+        return self.speak(iter([text]), utterance_id, interrupt=interrupt)
+
+    def cancel(self):
+        """Barge-in: üretim + sentez + çalma birlikte durur"""
+        with self._lock:
+            session = self._session
+        if session is not None and not session.finished.is_set():
+            session.cancel()
+            with self._lock:
+                self.stats["cancelled"] += 1
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            session = self._session
+        return session.finished.wait(timeout) if session else True
+
+    def attach_event_bus(self, event_bus, topic: str = "AI_SPEECH_DELTA"):
+        """
+        Frontal'ın push deltaları: {"utterance_id", "delta", "final"}.
+        Yeni utterance_id yeni konuşma başlatır. Düşen delta cümleyi bozacağı
+        için abonelik BLOCK politikasıyla (kuyruk doluysa yayıncı bekler).
+        """
+        from core.control_loop import event_payload
+        from core.event_bus import BLOCK
+
+        streams = {}
+
+        def on_delta(event):
+            payload = event_payload(event)
+            uid = payload.get("utterance_id")
+            stream = streams.get(uid)
+            if stream is None:
+                streams.clear()
+                stream = streams[uid] = TokenStream()
+                self.speak(stream, uid)
+            if payload.get("delta"):
+                stream.push(payload["delta"])
+            if payload.get("final"):
+                stream.close()
+                streams.pop(uid, None)
+
+        event_bus.subscribe(topic, on_delta, policy=BLOCK)
+
+    def _mark(self, stage: str, utterance_id: Optional[str]):
+        """utterance_id olmayan konuşmalar (speak_text vb.) izlenmez"""
+        if self._tracer is not None and utterance_id is not None:
+            self._tracer.mark(stage, utterance_id)
+
+
+class _Session:
+    """Tek bir konuşmanın üç thread'i"""
+
+    def __init__(self, pipeline: StreamingSpeechPipeline, tokens: Iterable[str],
+                 utterance_id: Optional[str], after: Optional["_Session"] = None):
+        self._pipeline = pipeline
+        self._after = after  # Çalmadan önce bitmesi beklenen konuşma
+        self._tokens = tokens
+        self.utterance_id = utterance_id
+        self.cancelled = threading.Event()
+        self.finished = threading.Event()
+        self._text_q: "queue.Queue" = queue.Queue()
+        self._audio_q: "queue.Queue" = queue.Queue(maxsize=pipeline._audio_queue_size)
+        self.chunks: List[str] = []
+        self._threads = [
+            threading.Thread(target=self._generate, name="speech-generate", daemon=True),
+            threading.Thread(target=self._synth, name="speech-synth", daemon=True),
+            threading.Thread(target=self._play, name="speech-play", daemon=True),
+        ]
+
+    def start(self):
+        for t in self._threads:
+            t.start()
+
+    def cancel(self):
+        self.cancelled.set()
+        if self._after is not None:
+            self._after.cancel()
+        close = getattr(self._tokens, "close", None)
+        if callable(close):
+            try:
+                close()  # Generator / TokenStream - üretimi kes
+            except (RuntimeError, ValueError):
+                pass  # Başka thread'de çalışan generator
+        stop = getattr(self._pipeline._sink, "stop_audio", None)
+        if callable(stop):
+            stop()
+        # Bekleyen thread'leri uyandır
+        self._text_q.put(_DONE)
+        try:
+            self._audio_q.put_nowait(_DONE)
+        except queue.Full:
+            pass
+
+    def _generate(self):
+        from core.latency_tracer import GENERATION_START, GENERATION_END
+        pipeline = self._pipeline
+        chunker = pipeline._chunker_factory()
+        pipeline._mark(GENERATION_START, self.utterance_id)
+        try:
+            for delta in self._tokens:
+                if self.cancelled.is_set():
+                    return
+                for chunk in chunker.feed(delta):
+                    self._text_q.put(chunk)
+            if not self.cancelled.is_set():
+                for chunk in chunker.flush():
+                    self._text_q.put(chunk)
+                pipeline._mark(GENERATION_END, self.utterance_id)
+        except Exception as e:
+            print(f"[SPEECH] Üretim hatası: {e}")
+        finally:
+            self._text_q.put(_DONE)
+
+    def _synth(self):
+        pipeline = self._pipeline
+        try:
+            while not self.cancelled.is_set():
+                chunk = self._text_q.get()
+                if chunk is _DONE or self.cancelled.is_set():
+                    break
+                audio = pipeline._synthesize(chunk)
+                if self.cancelled.is_set():
+                    break
+                self.chunks.append(chunk)
+                self._put_audio(audio)
+        except Exception as e:
+            print(f"[SPEECH] Sentez hatası: {e}")
+        finally:
+            self._put_audio(_DONE)
+
+    def _put_audio(self, item):
+        while not self.cancelled.is_set():
+            try:
+                self._audio_q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _play(self):
+        from core.latency_tracer import PLAYBACK_START
+        pipeline = self._pipeline
+        first = True
+        try:
+            while not self.cancelled.is_set():
+                audio = self._audio_q.get()
+                if audio is _DONE or self.cancelled.is_set():
+                    break
+                if first and self._after is not None:
+                    while not self._after.finished.wait(0.05):
+                        if self.cancelled.is_set():
+                            return
+                if first:
+                    pipeline._mark(PLAYBACK_START, self.utterance_id)
+                    first = False
+                pipeline._sink.play(audio)
+                with pipeline._lock:
+                    pipeline.stats["chunks"] += 1
+        except Exception as e:
+            print(f"[SPEECH] Çalma hatası: {e}")
+        finally:
+            self.finished.set()
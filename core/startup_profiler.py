@@ -0,0 +1,181 @@
+"""
+DERİN - Startup Profiler
+════════════════════════
+--profile-startup: import süresi ağacı (python -X importtime benzeri, süreç içi).
+
+    with ImportProfiler() as profiler:
+        cns.boot()
+    print(profiler.format(min_ms=5))
+
+    main.py                         12.0ms kümülatif
+      core.boot_graph                1.1ms
+      transformers                 840.2ms
+        torch                      610.7ms
+
+Her modülün exec süresi ölçülür; iç içe importlar thread başına yığınla
+ebeveynine bağlanır (paralel boot aşamaları ayrı ağaçlar oluşturur).
+"""
+
+import sys
+import time
+import threading
+import importlib.abc
+from typing import Dict, List, Optional
+
+
+class _ImportNode:
+    __slots__ = ("name", "cumulative", "children", "thread")
+
+    def __init__(self, name: str, thread: str):
+        self.name = name
+        self.cumulative = 0.0
+        self.children: List["_ImportNode"] = []
+        self.thread = thread
+
+    @property
+    def self_time(self) -> float:
+        return self.cumulative - sum(c.cumulative for c in self.children)
+
+
+class _TimedLoader:
+    """Loader vekili: exec_module süresini ölçer, geri kalanı asıl loader'a bırakır"""
+
+    def __init__(self, loader, profiler: "ImportProfiler", name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        node = self._profiler._enter(self._name)
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            node.cumulative = time.perf_counter() - started
+            self._profiler._exit()
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """sys.meta_path başına takılan, import sürelerini ağaç olarak toplayan bulucu"""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._roots: List[_ImportNode] = []
+        self._lock = threading.Lock()
+        self._active = False
+
+    # ─── meta_path ──────────────────────────────────────────────
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self, fullname)
+                    return spec
+            return None
+        finally:
+            self._local.finding = False
+
+    def _stack(self) -> List[_ImportNode]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self, name: str) -> _ImportNode:
+        node = _ImportNode(name, threading.current_thread().name)
+        stack = self._stack()
+        if stack:
+            stack[-1].children.append(node)
+        else:
+            with self._lock:
+                self._roots.append(node)
+        stack.append(node)
+        return node
+
+    def _exit(self):
+        self._stack().pop()
+
+    # ─── Yaşam döngüsü ──────────────────────────────────────────
+
+    def start(self) -> "ImportProfiler":
+        if not self._active:
+            sys.meta_path.insert(0, self)
+            self._active = True
+        return self
+
+    def stop(self):
+        if self._active:
+            sys.meta_path.remove(self)
+            self._active = False
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ─── Rapor ──────────────────────────────────────────────────
+
+    @property
+    def total(self) -> float:
+        with self._lock:
+            return sum(r.cumulative for r in self._roots)
+
+    def top(self, n: int = 10) -> List[Dict]:
+        """Kendi süresi (self) en yüksek modüller"""
+        flat = []
+
+        def walk(node):
+            flat.append(node)
+            for child in node.children:
+                walk(child)
+
+        with self._lock:
+            for root in self._roots:
+                walk(root)
+        flat.sort(key=lambda n: n.self_time, reverse=True)
+        return [{"module": n.name, "self_ms": n.self_time * 1000, "cumulative_ms": n.cumulative * 1000}
+                for n in flat[:n]]
+
+    def format(self, min_ms: float = 5.0, max_depth: int = 6) -> str:
+        lines = [f"Import süresi: {self.total * 1000:.0f}ms toplam (≥{min_ms:g}ms gösteriliyor)"]
+
+        def walk(node: _ImportNode, depth: int):
+            if node.cumulative * 1000 < min_ms or depth > max_depth:
+                return
+            thread = f"  [{node.thread}]" if depth == 0 and node.thread != "MainThread" else ""
+            lines.append(f"{'  ' * depth}{node.name:<{max(1, 44 - 2 * depth)}} "
+                         f"{node.cumulative * 1000:8.1f}ms  (self {node.self_time * 1000:.1f}ms){thread}")
+            for child in sorted(node.children, key=lambda c: c.cumulative, reverse=True):
+                walk(child, depth + 1)
+
+        with self._lock:
+            roots = sorted(self._roots, key=lambda r: r.cumulative, reverse=True)
+        for root in roots:
+            walk(root, 0)
+        return "\n".join(lines)
+
+
+_profiler: Optional[ImportProfiler] = None
+
+
+def start_import_profiler() -> ImportProfiler:
+    """Süreç genelinde tek profiler (main / derin_cli --profile-startup)"""
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler().start()
+    return _profiler
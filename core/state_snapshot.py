@@ -0,0 +1,260 @@
+"""
+DERİN - State Snapshot
+══════════════════════
+Organizmanın çalışma durumunun sürümlü anlık görüntüsü (--warm-start için).
+
+    data/state/organism.snap
+        DERINSNP | u16 format | u32 başlık uzunluğu | başlık JSON | organ yükleri
+        başlık: {"created_at", "organs": {ad: {offset, length, crc, version}}}
+        yük:    zlib(pickle(organ.get_state()))
+
+    • Yazma arka plan thread'inde; tmp dosya + fsync + atomik rename,
+      önceki görüntü organism.snap.prev olarak kalır (bozuksa ona düşülür)
+    • Organ başına sürüm: kayıtlı sürüm ≠ görüntüdeki sürüm → o organ soğuk açılır
+    • Geri yükleme organ başına zamanlanır ve raporlanır
+    • Bir organın yakalama/geri yükleme hatası diğerlerini etkilemez
+
+Organ arayüzü: get_state() -> picklable, set_state(state) (veya export_state/import_state).
+"""
+
+import os
+import json
+import time
+import zlib
+import pickle
+import struct
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+SNAPSHOT_PATH = Path(__file__).resolve().parent.parent / "data" / "state" / "organism.snap"
+FORMAT_VERSION = 1
+MAGIC = b"DERINSNP"
+_PREFIX = struct.Struct("<8sHI")
+
+# Organ hook adları (tercih sırasıyla)
+STATE_HOOKS = (("get_state", "set_state"), ("export_state", "import_state"))
+
+
+class SnapshotError(RuntimeError):
+    """Okunamayan / uyumsuz anlık görüntü"""
+
+
+@dataclass
+class _Provider:
+    capture: Callable[[], Any]
+    restore: Callable[[Any], None]
+    version: int = 1
+
+
+class Snapshot:
+    """Okunmuş görüntü: başlık hemen, organ yükleri istendiğinde açılır"""
+
+    def __init__(self, path: Path, header: Dict, payload: bytes):
+        self.path = path
+        self.header = header
+        self._payload = payload
+
+    @property
+    def created_at(self) -> float:
+        return self.header["created_at"]
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+    @property
+    def organs(self) -> List[str]:
+        return list(self.header["organs"])
+
+    def version(self, name: str) -> Optional[int]:
+        entry = self.header["organs"].get(name)
+        return entry["version"] if entry else None
+
+    def state(self, name: str) -> Any:
+        entry = self.header["organs"][name]
+        blob = self._payload[entry["offset"]:entry["offset"] + entry["length"]]
+        if zlib.crc32(blob) != entry["crc"]:
+            raise SnapshotError(f"{name}: CRC uyuşmuyor")
+        return pickle.loads(zlib.decompress(blob))
+
+
+def read_snapshot(path: Optional[Path] = None) -> Snapshot:
+    path = Path(path or SNAPSHOT_PATH)
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < _PREFIX.size:
+        raise SnapshotError(f"Kısa dosya: {path}")
+    magic, fmt, header_len = _PREFIX.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError(f"Anlık görüntü değil: {path}")
+    if fmt != FORMAT_VERSION:
+        raise SnapshotError(f"Format sürümü {fmt} (beklenen {FORMAT_VERSION})")
+    start = _PREFIX.size
+    header = json.loads(data[start:start + header_len])
+    return Snapshot(path, header, data[start + header_len:])
+
+
+def load_latest(path: Optional[Path] = None, max_age: Optional[float] = None) -> Optional[Snapshot]:
+    """Geçerli en yeni görüntü (asıl dosya bozuksa .prev); yoksa / çok eskiyse None"""
+    path = Path(path or SNAPSHOT_PATH)
+    for candidate in (path, path.with_name(path.name + ".prev")):
+        try:
+            snapshot = read_snapshot(candidate)
+        except (OSError, ValueError, SnapshotError) as e:
+            if candidate.exists():
+                print(f"[SNAPSHOT] {candidate.name} okunamadı: {e}")
+            continue
+        if max_age is not None and snapshot.age > max_age:
+            print(f"[SNAPSHOT] {candidate.name} çok eski ({snapshot.age / 3600:.1f} saat)")
+            return None
+        return snapshot
+    return None
+
+
+class StateSnapshotter:
+    """
+    snapshotter = StateSnapshotter()
+    snapshotter.register_organ("limbic", limbic)
+    snapshotter.start(interval=60)
+    """
+
+    def __init__(self, path: Optional[Path] = None, level: int = 3):
+        self.path = Path(path or SNAPSHOT_PATH)
+        self.level = level
+        self._providers: Dict[str, _Provider] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_save: Dict[str, Any] = {}
+        self.stats = {"saves": 0, "errors": 0}
+
+    # ─── Kayıt ──────────────────────────────────────────────────
+
+    def register(self, name: str, capture: Callable[[], Any], restore: Callable[[Any], None],
+                 version: int = 1):
+        with self._lock:
+            self._providers[name] = _Provider(capture, restore, version)
+
+    def register_organ(self, name: str, organ, version: Optional[int] = None) -> bool:
+        """get_state/set_state (veya export_state/import_state) sunan organı kaydet"""
+        if organ is None:
+            return False
+        for get_name, set_name in STATE_HOOKS:
+            capture, restore = getattr(organ, get_name, None), getattr(organ, set_name, None)
+            if callable(capture) and callable(restore):
+                self.register(name, capture, restore, version or getattr(organ, "STATE_VERSION", 1))
+                return True
+        return False
+
+    @property
+    def organs(self) -> List[str]:
+        with self._lock:
+            return sorted(self._providers)
+
+    # ─── Yakalama / yazma ───────────────────────────────────────
+
+    def capture(self) -> Tuple[Dict[str, Tuple[bytes, int]], Dict[str, str]]:
+        """Organ başına sıkıştırılmış yük; hata veren organlar ayrı raporlanır"""
+        with self._lock:
+            providers = list(self._providers.items())
+        blobs, errors = {}, {}
+        for name, provider in providers:
+            try:
+                state = provider.capture()
+                blobs[name] = (zlib.compress(pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL),
+                                             self.level), provider.version)
+            except Exception as e:
+                errors[name] = f"{type(e).__name__}: {e}"
+        return blobs, errors
+
+    def save(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        blobs, errors = self.capture()
+        organs, offset = {}, 0
+        for name, (blob, version) in blobs.items():
+            organs[name] = {"offset": offset, "length": len(blob), "crc": zlib.crc32(blob), "version": version}
+            offset += len(blob)
+        header = json.dumps({"created_at": time.time(), "organs": organs}).encode("utf-8")
+
+        with self._write_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header)))
+                f.write(header)
+                for blob, _ in blobs.values():
+                    f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+            if self.path.exists():
+                os.replace(self.path, self.path.with_name(self.path.name + ".prev"))
+            os.replace(tmp, self.path)
+
+        self.stats["saves"] += 1
+        if errors:
+            self.stats["errors"] += len(errors)
+        self.last_save = {"at": time.time(), "bytes": _PREFIX.size + len(header) + offset,
+                          "organs": len(blobs), "errors": errors,
+                          "duration_ms": (time.perf_counter() - started) * 1000}
+        return self.last_save
+
+    def start(self, interval: float = 60.0):
+        """Periyodik kayıt (ana döngünün dışında)"""
+        def loop():
+            while not self._stop_event.wait(interval):
+                try:
+                    self.save()
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    print(f"[SNAPSHOT] Kayıt hatası: {e}")
+
+        self._thread = threading.Thread(target=loop, name="state-snapshot", daemon=True)
+        self._thread.start()
+
+    def stop(self, final_save: bool = True):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        if final_save:
+            self.save()
+
+    # ─── Geri yükleme ───────────────────────────────────────────
+
+    def restore(self, snapshot: Snapshot, name: str) -> Dict[str, Any]:
+        """Tek organı geri yükle; {"ok", "ms", "error"}"""
+        with self._lock:
+            provider = self._providers.get(name)
+        if provider is None:
+            return {"ok": False, "ms": 0.0, "error": "kayıtlı değil"}
+        if name not in snapshot.header["organs"]:
+            return {"ok": False, "ms": 0.0, "error": "görüntüde yok"}
+        if snapshot.version(name) != provider.version:
+            return {"ok": False, "ms": 0.0,
+                    "error": f"sürüm {snapshot.version(name)} ≠ {provider.version}"}
+        started = time.perf_counter()
+        try:
+            provider.restore(snapshot.state(name))
+            return {"ok": True, "ms": (time.perf_counter() - started) * 1000, "error": None}
+        except Exception as e:
+            return {"ok": False, "ms": (time.perf_counter() - started) * 1000,
+                    "error": f"{type(e).__name__}: {e}"}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "organs": self.organs, "last_save": self.last_save}
+
+
+def format_restore_report(report: Dict[str, Dict[str, Any]], snapshot: Optional[Snapshot] = None) -> str:
+    lines = []
+    if snapshot is not None:
+        lines.append(f"Warm start: {snapshot.path.name} ({snapshot.age:.0f}s önce)")
+    total = 0.0
+    for name, result in sorted(report.items(), key=lambda item: -item[1]["ms"]):
+        total += result["ms"]
+        status = "✓" if result["ok"] else f"✗ {result['error']}"
+        lines.append(f"  {name:<22}{result['ms']:>8.1f}ms  {status}")
+    lines.append(f"  {'toplam':<22}{total:>8.1f}ms  ({sum(r['ok'] for r in report.values())}/{len(report)} organ)")
+    return "\n".join(lines)
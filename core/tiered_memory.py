@@ -0,0 +1,673 @@
+"""
+DERİN - Tiered Memory
+═════════════════════
+Episodik / vektör hafıza için sıcak-ılık-soğuk katmanlar.
+
+    add() ──▶ HOT   RAM, son / önemli anılar (tam arama)        ≤ hot_capacity
+               │ önem azaldıkça
+               ▼
+              WARM  RAM, IVF (k-means) ANN indeksi, float16     ≤ memory.long_term.max_entries
+               │ archive_threshold_days + importance_threshold, taşarsa prune_percentage
+               ▼
+              COLD  disk, int8 vektör + zlib metadata segmentleri
+                    sadece ıska durumunda aranır; isabet ılık katmana geri döner
+
+    • Önem zamanla yarılanır (half_life_days); erişim anıyı tazeler
+    • Sıcak + ılık katman sınırlı → RAM ve arama süresi yaş ile büyümez
+    • Soğuk segmentlerin küçük centroid özetleri RAM'de; ıskada sadece en yakın
+      birkaç segment açılır
+
+Ayarlar config.yaml → memory.long_term; benchmark: python benchmarks/tiered_memory_bench.py
+"""
+
+import os
+import json
+import math
+import time
+import uuid
+import zlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.metrics import get_metrics_registry
+
+TIER_DIR = Path(__file__).resolve().parent.parent / "data" / "memory_tiers"
+HOT, WARM, COLD = "hot", "warm", "cold"
+
+
+@dataclass
+class MemoryRecord:
+    id: str
+    text: str
+    vector: Optional[np.ndarray]    # float32, normalize (ılık katmanda None - vektör indekste)
+    created_at: float
+    importance: float = 0.5         # 0-1 (kayıt anındaki)
+    last_access: float = 0.0
+    access_count: int = 0
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def to_meta(self) -> Dict[str, Any]:
+        return {"id": self.id, "text": self.text, "created_at": self.created_at,
+                "importance": self.importance, "last_access": self.last_access,
+                "access_count": self.access_count, "metadata": self.metadata}
+
+    @classmethod
+    def from_meta(cls, meta: Dict[str, Any], vector: np.ndarray) -> "MemoryRecord":
+        return cls(vector=np.asarray(vector, dtype=np.float32), **meta)
+
+
+@dataclass
+class TierPolicy:
+    max_entries: int = 10000            # Ilık katman sınırı
+    importance_threshold: float = 0.3   # Bu skorun altındaki eski anılar arşive
+    prune_percentage: float = 0.2       # Taşmada arşivlenen oran
+    archive_threshold_days: float = 30.0
+    half_life_days: float = 30.0        # Önem yarılanma süresi
+    hot_capacity: int = 512
+    hot_max_age_days: float = 1.0       # Bundan eski ve önemsiz anılar ılık katmana
+    pinned_importance: float = 0.9      # Bu önemdeki anılar sıcakta kalır (kapasite izin verdikçe)
+    miss_threshold: float = 0.55        # Sıcak+ılık en iyi skor bunun altındaysa soğuk arama
+    cold_segment_size: int = 4096
+    cold_probe: int = 3                 # Iskada açılan soğuk segment sayısı
+
+    @classmethod
+    def from_config(cls, **overrides) -> "TierPolicy":
+        from core.platform_config import get_section
+        long_term = get_section("memory", "long_term", default={}) or {}
+        values = {key: long_term[key] for key in
+                  ("max_entries", "importance_threshold", "prune_percentage", "archive_threshold_days",
+                   "half_life_days", "hot_capacity", "miss_threshold")
+                  if key in long_term}
+        values.setdefault("half_life_days", values.get("archive_threshold_days", cls.half_life_days))
+        values.update(overrides)
+        return cls(**values)
+
+    def score(self, record: MemoryRecord, now: float) -> float:
+        """Zamanla azalan önem; erişim anıyı tazeler"""
+        last = max(record.created_at, record.last_access)
+        age_days = max(0.0, now - last) / 86400
+        decay = 0.5 ** (age_days / self.half_life_days)
+        return record.importance * decay + 0.05 * math.log1p(record.access_count)
+
+
+def kmeans(x: np.ndarray, k: int, iters: int = 8, seed: int = 0) -> np.ndarray:
+    """Küresel k-means (cosine); normalize centroid'ler"""
+    rng = np.random.default_rng(seed)
+    k = min(k, len(x))
+    centroids = x[rng.choice(len(x), k, replace=False)].astype(np.float32)
+    for _ in range(iters):
+        assign = np.argmax(x @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, x)
+        counts = np.bincount(assign, minlength=k)
+        empty = counts == 0
+        sums[empty] = x[rng.choice(len(x), int(empty.sum()))]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = sums / np.maximum(norms, 1e-12)
+    return centroids
+
+
+class IVFIndex:
+    """Düz (flat) depolama + k-means kaba nicemleyici; liste sıralaması değişiklikte tembel kurulur"""
+
+    def __init__(self, dim: int, nlist: int = 64, nprobe: int = 8):
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self._vectors = np.zeros((0, dim), dtype=np.float16)
+        self._assign = np.zeros(0, dtype=np.int32)
+        self._importance = np.zeros(0, dtype=np.float32)   # Batch recall skoru için
+        self._touched = np.zeros(0, dtype=np.float64)      # max(created_at, last_access)
+        self._ids: List[str] = []
+        self._slot: Dict[str, int] = {}
+        self.centroids: Optional[np.ndarray] = None
+        self._trained_size = 0
+        self._order: Optional[np.ndarray] = None
+        self._bounds: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._slot
+
+    @property
+    def nbytes(self) -> int:
+        n = len(self._ids)
+        return self._vectors[:n].nbytes + n * 16 + (
+            self.centroids.nbytes if self.centroids is not None else 0)
+
+    def _grow(self, need: int):
+        capacity = len(self._vectors)
+        if need <= capacity:
+            return
+        capacity = max(need, capacity * 2, 256)
+        vectors = np.zeros((capacity, self.dim), dtype=np.float16)
+        vectors[:len(self._ids)] = self._vectors[:len(self._ids)]
+        self._vectors = vectors
+        for name in ("_assign", "_importance", "_touched"):
+            old = getattr(self, name)
+            grown = np.zeros(capacity, dtype=old.dtype)
+            grown[:len(self._ids)] = old[:len(self._ids)]
+            setattr(self, name, grown)
+
+    def add(self, ids: Sequence[str], vectors: np.ndarray, importance=0.0, touched=0.0):
+        if not len(ids):
+            return
+        n = len(self._ids)
+        self._grow(n + len(ids))
+        self._vectors[n:n + len(ids)] = vectors
+        self._importance[n:n + len(ids)] = importance
+        self._touched[n:n + len(ids)] = touched
+        self._assign[n:n + len(ids)] = (np.argmax(vectors @ self.centroids.T, axis=1)
+                                        if self.centroids is not None else 0)
+        for i, memory_id in enumerate(ids):
+            self._slot[memory_id] = n + i
+            self._ids.append(memory_id)
+        self._order = None
+        self._maybe_train()
+
+    def remove(self, memory_id: str):
+        slot = self._slot.pop(memory_id)
+        last = len(self._ids) - 1
+        if slot != last:
+            moved = self._ids[last]
+            self._vectors[slot] = self._vectors[last]
+            self._assign[slot] = self._assign[last]
+            self._importance[slot] = self._importance[last]
+            self._touched[slot] = self._touched[last]
+            self._ids[slot] = moved
+            self._slot[moved] = slot
+        self._ids.pop()
+        self._order = None
+
+    def _maybe_train(self):
+        n = len(self._ids)
+        if n < self.nlist * 8 or (self.centroids is not None and n < self._trained_size * 2):
+            return
+        sample = self._vectors[:n]
+        if n > 20000:
+            sample = sample[np.random.default_rng(n).choice(n, 20000, replace=False)]
+        self.centroids = kmeans(sample.astype(np.float32), self.nlist)
+        self._assign[:n] = np.argmax(self._vectors[:n].astype(np.float32) @ self.centroids.T, axis=1)
+        self._trained_size = n
+        self._order = None
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        n = len(self._ids)
+        if n == 0:
+            return []
+        if self.centroids is None:
+            candidates = np.arange(n)
+        else:
+            if self._order is None:
+                self._order = np.argsort(self._assign[:n], kind="stable")
+                self._bounds = np.searchsorted(self._assign[:n][self._order], np.arange(self.nlist + 1))
+            probe = np.argsort(self.centroids @ query)[::-1][:self.nprobe]
+            candidates = np.concatenate([self._order[self._bounds[c]:self._bounds[c + 1]] for c in probe])
+        scores = self._vectors[candidates].astype(np.float32) @ query
+        top = np.argsort(scores)[::-1][:k]
+        return [(self._ids[candidates[i]], float(scores[i])) for i in top]
+
+    def vector(self, memory_id: str) -> np.ndarray:
+        return self._vectors[self._slot[memory_id]].astype(np.float32)
+
+    def touch(self, memory_id: str, ts: float):
+        self._touched[self._slot[memory_id]] = ts
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(vektörler, önem, son temas) - batch recall için görünümler"""
+        n = len(self._ids)
+        return self._vectors[:n], self._importance[:n], self._touched[:n]
+
+    def ids_at(self, slots) -> List[str]:
+        return [self._ids[i] for i in slots]
+
+
+class _ColdSegment:
+    """Disk: int8 vektör + ölçek + zlib metadata; RAM: centroid özeti"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with np.load(path.with_suffix(".sum.npz")) as summary:
+            self.centroids = summary["centroids"].astype(np.float32)
+            self.count = int(summary["count"])
+
+    @staticmethod
+    def write(path: Path, records: List[MemoryRecord], clusters: int = 16) -> "_ColdSegment":
+        vectors = np.stack([r.vector for r in records]).astype(np.float32)
+        scales = np.maximum(np.abs(vectors).max(axis=1), 1e-12) / 127
+        quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+        meta = zlib.compress(json.dumps([r.to_meta() for r in records], ensure_ascii=False).encode("utf-8"))
+        np.savez(path, vectors=quantized, scales=scales.astype(np.float32),
+                 meta=np.frombuffer(meta, dtype=np.uint8))
+        np.savez(path.with_suffix(".sum.npz"), centroids=kmeans(vectors, clusters).astype(np.float16),
+                 count=len(records))
+        return _ColdSegment(path)
+
+    def load(self) -> Tuple[np.ndarray, List[Dict]]:
+        with np.load(self.path) as data:
+            vectors = data["vectors"].astype(np.float32) * data["scales"][:, None]
+            meta = json.loads(zlib.decompress(data["meta"].tobytes()))
+        return vectors, meta
+
+
+class TieredMemory:
+    """
+    memory = TieredMemory(dim=384)
+    memory.add("Ali ile kahve içtik", vector, importance=0.7)
+    memory.recall(query_vector, k=5)
+    """
+
+    def __init__(self, dim: int = 384, policy: Optional[TierPolicy] = None,
+                 directory: Optional[Path] = None, embed: Optional[Callable[[List[str]], np.ndarray]] = None,
+                 clock: Callable[[], float] = time.time, migrate_interval: float = 600.0,
+                 segment_cache: int = 2):
+        self.dim = dim
+        self.policy = policy or TierPolicy()
+        self.directory = Path(directory or TIER_DIR)
+        self._embed = embed
+        self._clock = clock
+        self.migrate_interval = migrate_interval
+        self._lock = threading.RLock()
+        self._records: Dict[str, MemoryRecord] = {}       # Sıcak + ılık
+        self._hot: "OrderedDict[str, None]" = OrderedDict()
+        self._hot_matrix: Optional[np.ndarray] = None
+        self._hot_keys: List[str] = []
+        self._warm = IVFIndex(dim)
+        self._cold: List[_ColdSegment] = []
+        self._cold_pending: List[MemoryRecord] = []
+        self._segment_cache: "OrderedDict[Path, Tuple[np.ndarray, List[Dict]]]" = OrderedDict()
+        self._segment_cache_size = segment_cache
+        self._live_generation = 0                           # live-<n>.npy sayacı
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"added": 0, "recalls": 0, "cold_searches": 0, "cold_hits": 0,
+                      "to_warm": 0, "to_cold": 0, "promoted": 0}
+        latency = get_metrics_registry().histogram("derin_memory_recall_seconds", "Hatırlama gecikmesi",
+                                                   labels=("mode",))
+        self._recall_latency = latency.labels(mode="single")
+        self._batch_recall_latency = latency.labels(mode="batch")
+        self._load()
+
+    # ─── Ekleme ─────────────────────────────────────────────────
+
+    def _normalize(self, vector) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        return vector / max(float(np.linalg.norm(vector)), 1e-12)
+
+    def add(self, text: str, vector=None, importance: float = 0.5, metadata: Optional[Dict] = None,
+            created_at: Optional[float] = None, memory_id: Optional[str] = None) -> str:
+        if vector is None:
+            vector = self._embed([text])[0]
+        now = self._clock()
+        record = MemoryRecord(memory_id or uuid.uuid4().hex, text, self._normalize(vector),
+                              created_at if created_at is not None else now, float(importance),
+                              metadata=metadata or {})
+        with self._lock:
+            self._records[record.id] = record
+            self._hot[record.id] = None
+            self._hot_matrix = None
+            self.stats["added"] += 1
+            if len(self._hot) > self.policy.hot_capacity * 2:
+                self._demote_hot_locked(now)
+        return record.id
+
+    # ─── Arama ──────────────────────────────────────────────────
+
+    def _hot_search(self, query: np.ndarray, k: int) -> List[Tuple[str, float]]:
+        if not self._hot:
+            return []
+        if self._hot_matrix is None:
+            self._hot_keys = list(self._hot)
+            self._hot_matrix = np.stack([self._records[i].vector for i in self._hot_keys])
+        scores = self._hot_matrix @ query
+        top = np.argsort(scores)[::-1][:k]
+        return [(self._hot_keys[i], float(scores[i])) for i in top]
+
+    def _cold_search(self, query: np.ndarray, k: int) -> List[Tuple[MemoryRecord, float]]:
+        """Centroid özetiyle en yakın segmentler + bekleyen arşiv"""
+        self.stats["cold_searches"] += 1
+        candidates: List[Tuple[MemoryRecord, float]] = []
+        if self._cold_pending:
+            matrix = np.stack([r.vector for r in self._cold_pending])
+            scores = matrix @ query
+            candidates.extend((self._cold_pending[i], float(scores[i])) for i in np.argsort(scores)[::-1][:k])
+        if self._cold:
+            closeness = [float(np.max(s.centroids @ query)) for s in self._cold]
+            for idx in np.argsort(closeness)[::-1][:self.policy.cold_probe]:
+                segment = self._cold[idx]
+                vectors, meta = self._segment(segment)
+                scores = vectors @ query
+                for i in np.argsort(scores)[::-1][:k]:
+                    if meta[i]["id"] not in self._records:
+                        candidates.append((MemoryRecord.from_meta(meta[i], vectors[i]), float(scores[i])))
+        seen, unique = set(), []
+        for record, score in sorted(candidates, key=lambda c: c[1], reverse=True):
+            if record.id not in seen:
+                seen.add(record.id)
+                unique.append((record, score))
+        return unique[:k]
+
+    def _segment(self, segment: _ColdSegment):
+        cached = self._segment_cache.get(segment.path)
+        if cached is None:
+            cached = segment.load()
+            self._segment_cache[segment.path] = cached
+            while len(self._segment_cache) > self._segment_cache_size:
+                self._segment_cache.popitem(last=False)
+        else:
+            self._segment_cache.move_to_end(segment.path)
+        return cached
+
+    def recall(self, query, k: int = 5, min_score: float = 0.0,
+               search_cold: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """En benzer k anı. search_cold=None → sadece ıskada (en iyi skor < miss_threshold)"""
+        started = time.perf_counter()
+        query = self._normalize(query)
+        now = self._clock()
+        with self._lock:
+            self.stats["recalls"] += 1
+            hits = [(memory_id, score, HOT) for memory_id, score in self._hot_search(query, k)]
+            hits += [(memory_id, score, WARM) for memory_id, score in self._warm.search(query, k)]
+            hits.sort(key=lambda h: h[1], reverse=True)
+            best = hits[0][1] if hits else -1.0
+            if search_cold or (search_cold is None and best < self.policy.miss_threshold):
+                cold_hits = self._cold_search(query, k)
+                cold = {record.id: record for record, _ in cold_hits}
+                if cold:
+                    hits += [(record.id, score, COLD) for record, score in cold_hits]
+                    hits.sort(key=lambda h: h[1], reverse=True)
+                    if hits[0][2] == COLD:
+                        self.stats["cold_hits"] += 1
+                    for memory_id, score, tier in hits[:k]:
+                        if tier == COLD and score >= min_score:
+                            self._promote_locked(cold[memory_id])
+                    hits = [h for h in hits if h[0] in self._records]
+
+            results = []
+            for memory_id, score, tier in hits[:k]:
+                if score < min_score:
+                    continue
+                record = self._records[memory_id]
+                self._touch_locked(record, now)
+                results.append({"id": record.id, "text": record.text, "score": score, "tier": tier,
+                                "importance": record.importance, "created_at": record.created_at,
+                                "metadata": record.metadata})
+        self._recall_latency.observe(time.perf_counter() - started)
+        return results
+
+    def recall_text(self, text: str, k: int = 5, **kwargs) -> List[Dict[str, Any]]:
+        return self.recall(self._embed([text])[0], k, **kwargs)
+
+    def _touch_locked(self, record: MemoryRecord, now: float):
+        record.last_access = now
+        record.access_count += 1
+        if record.id in self._warm:
+            self._warm.touch(record.id, now)
+
+    def recall_batch(self, queries, k: int = 5, weights=None,
+                     search_cold: Optional[bool] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Çok sorgu tek geçişte: skor = benzerlik + yakınlık + önem (core.batch_recall).
+        Sıcak ve ılık katman vektörize; soğuk arşiv sadece ıskalayan sorgular için.
+        """
+        from core.batch_recall import RecallWeights, batch_topk, memory_prior
+        started = time.perf_counter()
+        weights = weights or RecallWeights(half_life_days=self.policy.half_life_days)
+        queries = np.asarray(queries, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[None, :]
+        queries = queries / np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        now = self._clock()
+        with self._lock:
+            self.stats["recalls"] += len(queries)
+            candidates: List[List[Tuple[float, float, str, str]]] = [[] for _ in queries]
+            hot_ids = list(self._hot)
+            if hot_ids:
+                records = [self._records[i] for i in hot_ids]
+                matrix = np.stack([r.vector for r in records])
+                prior = memory_prior(np.array([r.importance for r in records], dtype=np.float32),
+                                     np.array([max(r.created_at, r.last_access) for r in records]),
+                                     weights, now)
+                idx, score, sim = batch_topk(queries, matrix, prior, k, weights.similarity)
+                for q in range(len(queries)):
+                    candidates[q] += [(score[q, j], sim[q, j], hot_ids[idx[q, j]], HOT)
+                                      for j in range(idx.shape[1])]
+            if len(self._warm):
+                vectors, importance, touched = self._warm.arrays()
+                prior = memory_prior(importance, touched, weights, now)
+                idx, score, sim = batch_topk(queries, vectors, prior, k, weights.similarity)
+                for q in range(len(queries)):
+                    ids = self._warm.ids_at(idx[q])
+                    candidates[q] += [(score[q, j], sim[q, j], ids[j], WARM) for j in range(len(ids))]
+
+            results = []
+            for q, hits in enumerate(candidates):
+                hits.sort(key=lambda h: h[0], reverse=True)
+                best = max((h[1] for h in hits), default=-1.0)
+                if search_cold or (search_cold is None and best < self.policy.miss_threshold):
+                    # Iska: tekil yol (arşiv araması + geri yükleme)
+                    results.append(self.recall(queries[q], k, search_cold=True))
+                    continue
+                batch = []
+                for score, sim, memory_id, tier in hits[:k]:
+                    record = self._records[memory_id]
+                    self._touch_locked(record, now)
+                    batch.append({"id": record.id, "text": record.text, "score": float(score),
+                                  "similarity": float(sim), "tier": tier, "importance": record.importance,
+                                  "created_at": record.created_at, "metadata": record.metadata})
+                results.append(batch)
+        self._batch_recall_latency.observe(time.perf_counter() - started)
+        return results
+
+    def recall_many(self, texts: Dict[str, str], k: int = 5, **kwargs) -> Dict[str, List[Dict[str, Any]]]:
+        """Etiketli metinler (bkz. batch_recall.context_queries) → etiket başına top-k; tek embed çağrısı"""
+        if not texts:
+            return {}
+        labels = list(texts)
+        vectors = self._embed([texts[label] for label in labels])
+        return dict(zip(labels, self.recall_batch(vectors, k, **kwargs)))
+
+    def _promote_locked(self, record: MemoryRecord):
+        """Soğuktan ılığa (arşivdeki kopya kalır; canlı kopya öncelikli)"""
+        if record.id in self._records:
+            return
+        self._records[record.id] = record
+        self._to_warm_locked([record.id])
+        self._cold_pending = [r for r in self._cold_pending if r.id != record.id]
+        self.stats["promoted"] += 1
+
+    def _to_warm_locked(self, ids: List[str]):
+        """Ilık indekse ekle; vektör artık sadece indekste (float16)"""
+        records = [self._records[i] for i in ids]
+        self._warm.add(ids, np.stack([r.vector for r in records]),
+                       importance=np.array([r.importance for r in records], dtype=np.float32),
+                       touched=np.array([max(r.created_at, r.last_access) for r in records]))
+        for record in records:
+            record.vector = None
+
+    # ─── Göç ────────────────────────────────────────────────────
+
+    def _demote_hot_locked(self, now: float) -> int:
+        policy = self.policy
+        scored = sorted(self._hot, key=lambda i: policy.score(self._records[i], now), reverse=True)
+        keep = set()
+        for memory_id in scored:
+            record = self._records[memory_id]
+            young = now - record.created_at < policy.hot_max_age_days * 86400
+            pinned = record.importance >= policy.pinned_importance
+            if len(keep) < policy.hot_capacity and (young or pinned
+                                                   or policy.score(record, now) >= policy.importance_threshold):
+                keep.add(memory_id)
+        moved = [i for i in self._hot if i not in keep]
+        for memory_id in moved:
+            del self._hot[memory_id]
+        if moved:
+            self._to_warm_locked(moved)
+            self._hot_matrix = None
+            self.stats["to_warm"] += len(moved)
+        return len(moved)
+
+    def _archive_locked(self, now: float) -> int:
+        policy = self.policy
+        warm_ids = list(self._warm._ids)
+        scores = {i: policy.score(self._records[i], now) for i in warm_ids}
+        stale_before = now - policy.archive_threshold_days * 86400
+        archive = {i for i in warm_ids
+                   if max(self._records[i].created_at, self._records[i].last_access) < stale_before
+                   and scores[i] < policy.importance_threshold}
+        remaining = len(warm_ids) - len(archive)
+        if remaining > policy.max_entries:
+            target = int(policy.max_entries * (1 - policy.prune_percentage))
+            rest = sorted((i for i in warm_ids if i not in archive), key=scores.get)
+            archive.update(rest[:remaining - target])
+        for memory_id in archive:
+            record = self._records.pop(memory_id)
+            record.vector = self._warm.vector(memory_id)
+            self._warm.remove(memory_id)
+            self._cold_pending.append(record)
+        while len(self._cold_pending) >= policy.cold_segment_size:
+            self._flush_cold_locked(policy.cold_segment_size)
+        self.stats["to_cold"] += len(archive)
+        return len(archive)
+
+    def _flush_cold_locked(self, count: Optional[int] = None):
+        if not self._cold_pending:
+            return
+        count = count or len(self._cold_pending)
+        records, self._cold_pending = self._cold_pending[:count], self._cold_pending[count:]
+        cold_dir = self.directory / "cold"
+        cold_dir.mkdir(parents=True, exist_ok=True)
+        seq = len(self._cold) + 1
+        path = cold_dir / f"seg-{seq:06d}.npz"
+        while path.exists():
+            seq += 1
+            path = cold_dir / f"seg-{seq:06d}.npz"
+        self._cold.append(_ColdSegment.write(path, records))
+
+    def migrate(self) -> Dict[str, int]:
+        """sıcak → ılık → soğuk (arka plan thread'i periyodik çağırır)"""
+        now = self._clock()
+        with self._lock:
+            return {"to_warm": self._demote_hot_locked(now), "to_cold": self._archive_locked(now)}
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, name="tiered-memory", daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        while not self._stop_event.wait(self.migrate_interval):
+            try:
+                self.migrate()
+            except Exception as e:
+                print(f"[MEMORY] Göç hatası: {e}")
+
+    def stop(self, save: bool = True):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        if save:
+            self.save()
+
+    # ─── Kalıcılık ──────────────────────────────────────────────
+
+    def save(self):
+        """
+        Sıcak + ılık katman ve bekleyen arşiv diske (data/memory_tiers/live.*).
+
+        Vektörler her kayıtta yeni bir live-<n>.npy'ye yazılır; live.json onu adıyla
+        ve satır sayısıyla gösterir. İkisi de tmp + os.replace ile yazıldığından
+        yarıda kesilen kayıt eski json + eski npy çiftini bozmaz.
+        """
+        with self._lock:
+            self._flush_cold_locked()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            records = list(self._records.values())
+            vectors = (np.stack([r.vector if r.vector is not None else self._warm.vector(r.id)
+                                 for r in records]).astype(np.float16)
+                       if records else np.zeros((0, self.dim), dtype=np.float16))
+            self._live_generation += 1
+            name = f"live-{self._live_generation}.npy"
+            tmp = self.directory / (name + ".tmp")
+            with open(tmp, "wb") as f:
+                np.save(f, vectors)
+            os.replace(tmp, self.directory / name)
+
+            state = {"records": [r.to_meta() for r in records], "hot": list(self._hot),
+                     "vectors": name, "count": len(records), "generation": self._live_generation}
+            tmp = self.directory / "live.json.tmp"
+            tmp.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.directory / "live.json")
+
+            # Artık gösterilmeyen vektör dosyaları (eski kayıtlar, eski live.npy)
+            for stale in self.directory.glob("live*.npy"):
+                if stale.name != name:
+                    stale.unlink(missing_ok=True)
+
+    def _load(self):
+        cold_dir = self.directory / "cold"
+        if cold_dir.exists():
+            self._cold = [_ColdSegment(p) for p in sorted(cold_dir.glob("seg-*.npz"))
+                          if not p.name.endswith(".sum.npz")]
+        live = self.directory / "live.json"
+        if not live.exists():
+            return
+        state = json.loads(live.read_text(encoding="utf-8"))
+        self._live_generation = state.get("generation", 0)
+        vectors = np.load(self.directory / state.get("vectors", "live.npy")).astype(np.float32)
+        if len(vectors) != len(state["records"]) or state.get("count", len(vectors)) != len(vectors):
+            # zip sessizce kısaltır / yanlış vektör eşler → canlı katman soğuk açılır (arşiv korunur)
+            print(f"[MEMORY] live.json ({len(state['records'])} kayıt) ↔ vektörler ({len(vectors)}) "
+                  f"uyuşmuyor, canlı katman yüklenmedi")
+            return
+        hot = set(state["hot"])
+        warm_ids = []
+        for meta, vector in zip(state["records"], vectors):
+            record = MemoryRecord.from_meta(meta, vector)
+            self._records[record.id] = record
+            if record.id in hot:
+                self._hot[record.id] = None
+            else:
+                warm_ids.append(record.id)
+        if warm_ids:
+            self._to_warm_locked(warm_ids)
+
+    # ─── İstatistik ─────────────────────────────────────────────
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            cold_count = sum(s.count for s in self._cold) + len(self._cold_pending)
+            ram = (len(self._hot) * self.dim * 4 + self._warm.nbytes
+                   + sum(s.centroids.nbytes for s in self._cold)
+                   + sum(v.nbytes for v, _ in self._segment_cache.values()))
+            return {
+                **self.stats,
+                "hot": len(self._hot),
+                "warm": len(self._warm),
+                "cold": cold_count,
+                "cold_segments": len(self._cold),
+                "vector_ram_mb": ram / 1024 / 1024,
+            }
+
+
+# Singleton
+_memory: Optional[TieredMemory] = None
+_lock = threading.Lock()
+
+
+def get_tiered_memory() -> TieredMemory:
+    """config.yaml → memory.long_term; embedding model.embedding.name (ilk text sorgusunda yüklenir)"""
+    global _memory
+    with _lock:
+        if _memory is None:
+            from core.platform_config import get_section
+            from core.semantic_cache import make_sentence_embedder
+            dim = get_section("model", "embedding", "dimension", default=384)
+            _memory = TieredMemory(dim=dim, policy=TierPolicy.from_config(), embed=make_sentence_embedder())
+        return _memory
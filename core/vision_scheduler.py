@@ -0,0 +1,353 @@
+"""
+DERİN - Vision Scheduler
+════════════════════════
+Aynı kareyi YOLO, yüz tanıma ve VLM arasında ritimlerine göre paylaştırır.
+
+    kare ──▶ değişim dedektörü ──┬─ hareket yok ──▶ son sonuçlar (detection atlanır)
+                                 ├─ hareket ──────▶ detection (her kare)
+                                 │                     └─ yeni track ─▶ yüz tanıma
+                                 └─ sahne değişti ─▶ VLM
+
+    • Ritimler: EVERY_FRAME (hareket kapılı), NEW_TRACKS, SCENE_CHANGE
+    • Termal bütçe (0..1) modellerin önceliğine göre paylaştırılır:
+      önce yüksek öncelikli modelin talebi karşılanır, kalan alta geçer
+    • Atlanan her çalıştırma için tahmini tasarruf (ms) raporlanır
+
+Modeller sadece callable'dır: run(frame) -> sonuç. Detection sonucu
+track_id içeren sözlükler listesiyse yüz tanıma yeni track'lerde tetiklenir.
+CPU'da sentetik veya kayıtlı video ile test edilebilir (iter_video_frames).
+"""
+
+import math
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+import numpy as np
+
+EVERY_FRAME = "every_frame"
+NEW_TRACKS = "new_tracks"
+SCENE_CHANGE = "scene_change"
+
+
+def default_track_ids(result) -> Set:
+    """Detection çıktısından track id'leri ([{"track_id": ..}, ...] veya .track_id)"""
+    ids = set()
+    for item in result or ():
+        track_id = item.get("track_id") if isinstance(item, dict) else getattr(item, "track_id", None)
+        if track_id is not None:
+            ids.add(track_id)
+    return ids
+
+
+class ChangeDetector:
+    """Blok ortalamalı gri küçük kare ile hareket ve sahne değişimi"""
+
+    def __init__(self, motion_threshold: float = 0.002, scene_threshold: float = 0.5,
+                 pixel_threshold: float = 12.0, block: int = 16):
+        """
+        motion_threshold: önceki kareye göre değişen blok oranı (hareket)
+        scene_threshold: son anahtar kareye göre değişen blok oranı (sahne değişimi)
+        pixel_threshold: bloğun "değişti" sayılması için ortalama parlaklık farkı (0-255)
+        """
+        self.motion_threshold = motion_threshold
+        self.scene_threshold = scene_threshold
+        self.pixel_threshold = pixel_threshold
+        self.block = block
+        self._previous: Optional[np.ndarray] = None
+        self._keyframe: Optional[np.ndarray] = None
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        b = self.block
+        h, w = frame.shape[0] // b * b, frame.shape[1] // b * b
+        gray = frame[:h, :w].mean(axis=2) if frame.ndim == 3 else frame[:h, :w].astype(np.float32)
+        return gray.reshape(h // b, b, w // b, b).mean(axis=(1, 3)).astype(np.float32)
+
+    def _changed(self, a: np.ndarray, b: np.ndarray) -> float:
+        return float((np.abs(a - b) > self.pixel_threshold).mean())
+
+    def update(self, frame: np.ndarray) -> Dict[str, float]:
+        thumb = self._thumbnail(frame)
+        if self._previous is None or self._previous.shape != thumb.shape:
+            self._previous = self._keyframe = thumb
+            return {"motion": 1.0, "scene": 1.0, "moved": True, "scene_changed": True}
+
+        motion = self._changed(thumb, self._previous)
+        scene = self._changed(thumb, self._keyframe)
+        self._previous = thumb
+        scene_changed = scene >= self.scene_threshold
+        if scene_changed:
+            self._keyframe = thumb
+        return {"motion": motion, "scene": scene,
+                "moved": motion >= self.motion_threshold, "scene_changed": scene_changed}
+
+
+@dataclass
+class VisionModel:
+    name: str
+    run: Callable[[np.ndarray], Any]
+    cadence: str = EVERY_FRAME
+    priority: int = 0            # Düşük = önemli
+    max_hz: float = 30.0
+    cost_ms: float = 10.0        # İlk tahmin; ölçülen maliyetle EMA güncellenir
+    min_hz: float = 0.0          # Bütçe daralsa da önce bu taban ayrılır
+    allowed_hz: float = 30.0
+    last_run: float = float("-inf")
+    last_result: Any = None
+    runs: int = 0
+    hz: float = 0.0              # Ölçülen çalışma hızı (EMA)
+    skipped: Dict[str, int] = field(default_factory=dict)
+
+
+def _ema_rate(rate: float, previous: float, now: float) -> float:
+    """Ardışık olay aralığından hız (Hz) EMA'sı"""
+    interval = now - previous
+    if not math.isfinite(interval) or interval <= 0:
+        return rate
+    return 1.0 / interval if rate == 0.0 else 0.8 * rate + 0.2 / interval
+
+
+class VisionScheduler:
+    """Model başına ritim + hareket kapısı + termal bütçe paylaşımı"""
+
+    def __init__(self, detector: Optional[ChangeDetector] = None,
+                 compute_budget_ms: float = 1000.0,
+                 track_ids: Callable[[Any], Set] = default_track_ids,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        compute_budget_ms: saniyede harcanabilecek toplam model süresi (budget=1.0'da)
+        """
+        self._detector = detector or ChangeDetector()
+        self._compute_budget_ms = compute_budget_ms
+        self._track_ids = track_ids
+        self._clock = clock
+        self._models: List[VisionModel] = []
+        self._lock = threading.RLock()          # Kayıt / bütçe / istatistik (kısa)
+        self._process_lock = threading.Lock()   # process() çağrılarını sıralar (model çalışırken tutulur)
+        self._known_tracks: Set = set()
+        self._budget = 1.0
+        self._budget_cap = 1.0
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self.stats = {"frames": 0, "static_frames": 0, "scene_changes": 0}
+        self._fps = 0.0
+        self._last_frame = float("-inf")
+
+    # ─── Kayıt / bütçe ──────────────────────────────────────────
+
+    def register(self, name: str, run: Callable[[np.ndarray], Any], cadence: str = EVERY_FRAME,
+                 priority: int = 0, max_hz: float = 30.0, cost_ms: float = 10.0,
+                 min_hz: float = 0.0) -> VisionModel:
+        with self._lock:
+            model = VisionModel(name, run, cadence, priority, max_hz, cost_ms, min(min_hz, max_hz),
+                                allowed_hz=max_hz)
+            self._models.append(model)
+            self._models.sort(key=lambda m: m.priority)
+            self._allocate_locked()
+            return model
+
+    def set_budget(self, fraction: float):
+        """Termal throttle: 1.0 tam hız, 0.3 → toplam bütçenin %30'u"""
+        with self._lock:
+            self._budget = max(0.0, min(1.0, fraction))
+            self._allocate_locked()
+
+    def set_budget_cap(self, fraction: float):
+        """QoS governor tavanı - hypothalamus bütçesi bunu aşamaz"""
+        with self._lock:
+            self._budget_cap = max(0.0, min(1.0, fraction))
+            self._allocate_locked()
+
+    @property
+    def effective_budget(self) -> float:
+        return min(self._budget, self._budget_cap)
+
+    def _allocate_locked(self):
+        """Önce min_hz tabanları, kalan bütçe öncelik sırasıyla (saniyede ms cinsinden)"""
+        remaining = self._compute_budget_ms * self.effective_budget
+        granted = {}
+        for model in self._models:
+            floor = min(model.min_hz * model.cost_ms, remaining)
+            granted[model.name] = floor
+            remaining -= floor
+        for model in self._models:
+            extra = min(model.max_hz * model.cost_ms - granted[model.name], remaining)
+            granted[model.name] += max(0.0, extra)
+            remaining -= max(0.0, extra)
+        for model in self._models:
+            model.allowed_hz = (granted[model.name] / model.cost_ms if model.cost_ms > 0
+                                else model.max_hz)
+
+    # ─── Kare işleme ────────────────────────────────────────────
+
+    def _skip(self, model: VisionModel, reason: str):
+        model.skipped[reason] = model.skipped.get(reason, 0) + 1
+
+    def _due(self, model: VisionModel, now: float) -> bool:
+        if model.allowed_hz <= 0:
+            return False
+        # Kayan nokta birikimi kare aralığını kaçırmasın
+        return now - model.last_run >= 0.999 / model.allowed_hz
+
+    def _run(self, model: VisionModel, frame: np.ndarray, now: float):
+        """Modeli kilit dışında çalıştır; sonuç ve ölçümler kilit altında kaydedilir"""
+        started = time.perf_counter()
+        try:
+            result, ok = model.run(frame), True
+        except Exception as e:
+            result, ok = None, False
+            print(f"[VISION] {model.name} hata: {e}")
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            if ok:
+                model.last_result = result
+            model.cost_ms = 0.8 * model.cost_ms + 0.2 * elapsed_ms
+            model.hz = _ema_rate(model.hz, model.last_run, now)
+            model.last_run = now
+            model.runs += 1
+
+    def _gate_locked(self, model: VisionModel, change: Dict, new_tracks: bool, now: float) -> bool:
+        """Ritim kapısı + bütçe; çalışmayacaksa atlama nedeni sayılır"""
+        if model.cadence == EVERY_FRAME and not change["moved"]:
+            self._skip(model, "static")
+        elif model.cadence == NEW_TRACKS and not new_tracks:
+            self._skip(model, "no_new_tracks")
+        elif model.cadence == SCENE_CHANGE and not change["scene_changed"]:
+            self._skip(model, "no_scene_change")
+        elif not self._due(model, now):
+            self._skip(model, "budget")
+        else:
+            return True
+        return False
+
+    def process(self, frame: np.ndarray) -> Dict[str, Any]:
+        """
+        Kareyi işle; model adı → en güncel sonuç.
+
+        Detection (EVERY_FRAME) bütçe önceliğinden bağımsız olarak önce çalışır;
+        NEW_TRACKS / SCENE_CHANGE kapıları onun sonucuna göre değerlendirilir.
+        Modeller kilit dışında çalışır: get_stats / set_budget bir VLM çıkarımını beklemez.
+        """
+        with self._process_lock:
+            with self._lock:
+                now = self._clock()
+                change = self._detector.update(frame)
+                self._fps = _ema_rate(self._fps, self._last_frame, now)
+                self._last_frame = now
+                self.stats["frames"] += 1
+                if not change["moved"]:
+                    self.stats["static_frames"] += 1
+                if change["scene_changed"]:
+                    self.stats["scene_changes"] += 1
+                detectors = [m for m in self._models if m.cadence == EVERY_FRAME]
+                others = [m for m in self._models if m.cadence != EVERY_FRAME]
+
+            new_tracks = False
+            for model in detectors:
+                with self._lock:
+                    due = self._gate_locked(model, change, False, now)
+                if not due:
+                    continue
+                self._run(model, frame, now)
+                with self._lock:
+                    tracks = self._track_ids(model.last_result)
+                    if tracks - self._known_tracks:
+                        new_tracks = True
+                    self._known_tracks = tracks
+
+            for model in others:
+                with self._lock:
+                    due = self._gate_locked(model, change, new_tracks, now)
+                if due:
+                    self._run(model, frame, now)
+
+            with self._lock:
+                self._allocate_locked()
+                return {m.name: m.last_result for m in self._models}
+
+    # ─── Frame bus ile sürekli çalışma ──────────────────────────
+
+    def attach(self, frame_bus, camera_id: int = 0):
+        """Frame bus'tan en güncel kareleri arka planda işle"""
+        def loop():
+            seq = 0
+            while not self._stop_event.is_set():
+                handle = frame_bus.wait_next(seq, camera_id=camera_id, timeout=0.2)
+                if handle is None:
+                    continue
+                with handle:
+                    seq = handle.seq
+                    self.process(handle.array)
+
+        self._thread = threading.Thread(target=loop, name="vision-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+
+    # ─── Metrikler ──────────────────────────────────────────────
+
+    def _current_rate(self, rate: float, last: float, now: float) -> float:
+        """Uzun süredir olay yoksa eski EMA yerine 0"""
+        return rate if rate > 0 and now - last <= max(2.0, 2.0 / rate) else 0.0
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            now = self._clock()
+            models = {}
+            saved_ms = 0.0
+            for m in self._models:
+                skipped = sum(m.skipped.values())
+                saved = skipped * m.cost_ms
+                saved_ms += saved
+                models[m.name] = {
+                    "runs": m.runs,
+                    "skipped": dict(m.skipped),
+                    "cadence": m.cadence,
+                    "allowed_hz": round(m.allowed_hz, 2),
+                    "hz": round(self._current_rate(m.hz, m.last_run, now), 2),
+                    "cost_ms": round(m.cost_ms, 2),
+                    "saved_ms": round(saved, 1),
+                }
+            total_slots = self.stats["frames"] * len(self._models)
+            total_runs = sum(m.runs for m in self._models)
+            return {
+                **self.stats,
+                "fps": round(self._current_rate(self._fps, self._last_frame, now), 2),
+                "budget": self.effective_budget,
+                "models": models,
+                "saved_ms": round(saved_ms, 1),
+                "saved_fraction": 1 - total_runs / total_slots if total_slots else 0.0,
+            }
+
+
+def iter_video_frames(path: str, max_frames: Optional[int] = None) -> Iterator[np.ndarray]:
+    """Kayıtlı videodan kareler (opencv gerekir)"""
+    import cv2
+    capture = cv2.VideoCapture(path)
+    count = 0
+    try:
+        while max_frames is None or count < max_frames:
+            ok, frame = capture.read()
+            if not ok:
+                return
+            count += 1
+            yield frame
+    finally:
+        capture.release()
+
+
+# Singleton
+_vision_scheduler: Optional[VisionScheduler] = None
+_lock = threading.Lock()
+
+
+def get_vision_scheduler() -> VisionScheduler:
+    global _vision_scheduler
+    with _lock:
+        if _vision_scheduler is None:
+            _vision_scheduler = VisionScheduler()
+        return _vision_scheduler
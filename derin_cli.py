@@ -9,10 +9,21 @@ Derin'i terminal'den kontrol et.
 Kullanım:
     derin status        # Sistem durumu
     derin logs          # Son loglar
+    derin logs --since 2h --type conversation   # Zaman / tip filtresi
+    derin logs -f       # Canlı takip
     derin health        # Sağlık kontrolü
-    derin backup        # Manuel backup
+    derin backup        # Manuel backup (artımlı)
+    derin backup --list # Snapshot'lar
+    derin backup --restore 20261018-030000 --to /tmp/restore
     derin people        # Tanıdığı kişiler
     derin news          # Bugünün haberleri
+    derin latency       # Konuşma hattı gecikmeleri (p50/p95/p99)
+    derin metrics       # Tüm organ metrikleri (Prometheus metin formatı)
+    derin metrics --match event_bus
+    derin profile --seconds 10 > derin.collapsed    # Örnekleyici profiler (collapsed stacks)
+    derin profile --seconds 10 --format svg -o flame.svg
+
+    derin --profile-startup status   # Komut sonrası import süresi ağacı
 """
 
 import sys
@@ -23,18 +34,53 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
+RUNTIME_METRICS = ("semantic_cache", "prefix_cache", "qos", "vision_scheduler", "speculative")
+
+
+def _offline_status():
+    """Daemon yokken: son anlık görüntü taze ise o, değilse manager yerelde kurulur"""
+    from core.runtime_stats import read_snapshot
+    snapshot = read_snapshot("autonomous", max_age=60)
+    if snapshot:
+        return snapshot['data']
+    from core.control_socket import query_status
+    return query_status()
+
+
+def _runtime_metrics(live):
+    """Canlıysa soketten, değilse data/runtime/*.json'dan"""
+    if live:
+        from core.control_socket import ControlClient, DaemonUnavailable
+        try:
+            with ControlClient() as client:
+                return client.call("metrics")
+        except DaemonUnavailable:
+            pass
+    from core.runtime_stats import read_snapshot
+    metrics = {}
+    for name in RUNTIME_METRICS:
+        snapshot = read_snapshot(name)
+        if snapshot:
+            metrics[name] = snapshot['data']
+    return metrics
+
+
+def _mode(live):
+    return "live" if live else "offline"
+
+
 def cmd_status():
     """Sistem durumu"""
-    from core.autonomous_manager import get_autonomous_manager
+    from core.control_socket import query
     
     print("\n" + "="*60)
     print("DERIN v20.0 - System Status")
     print("="*60)
     
-    manager = get_autonomous_manager()
-    status = manager.get_status()
+    status, live = query("status", _offline_status)
     
-    print(f"\nInitialized: {'Yes' if status['initialized'] else 'No'}")
+    print(f"\nMode: {_mode(live)}")
+    print(f"Initialized: {'Yes' if status['initialized'] else 'No'}")
     print(f"Running services: {status['running_services']}")
     
     # Night optimization
@@ -55,133 +101,323 @@ def cmd_status():
         print(f"  Size: {backup.get('total_size_mb', 0):.1f}MB")
         print(f"  Scheduler: {'Active' if backup.get('scheduler_running') else 'Inactive'}")
     
+    metrics = _runtime_metrics(live)
+    
+    # Semantic cache (canlı organizmadan)
+    cache = metrics.get("semantic_cache")
+    if cache:
+        print(f"\nSemantic Cache:")
+        print(f"  Hits / misses: {cache['hits']} / {cache['misses']} ({cache['hit_rate']*100:.0f}%)")
+        print(f"  Entries: {cache['entries']} ({cache['users']} users)")
+    
+    prefix = metrics.get("prefix_cache")
+    if prefix:
+        print(f"\nPrefix Cache:")
+        print(f"  Hits / misses: {prefix['hits']} / {prefix['misses']} ({prefix['hit_rate']*100:.0f}%)")
+        print(f"  Saved prefill: {prefix['saved_prefill_tokens']:,} tokens")
+    
+    qos = metrics.get("qos")
+    if qos:
+        temp = f"{qos['temperature']:.1f}°C" if qos['temperature'] is not None else "n/a"
+        cpu = f"{qos['cpu_percent']:.0f}%" if qos['cpu_percent'] is not None else "n/a"
+        print(f"\nQoS: {qos['tier']}  (temp {temp}, CPU {cpu})")
+        for t in qos['transitions'][-3:]:
+            print(f"  {t['from']} → {t['to']}")
+    
+    vision = metrics.get("vision_scheduler")
+    if vision:
+        print(f"\nVision Scheduler:")
+        print(f"  Budget: {vision['budget']*100:.0f}%  Frames: {vision['frames']} (static {vision['static_frames']})")
+        print(f"  Compute saved: {vision['saved_ms']/1000:.1f}s ({vision['saved_fraction']*100:.0f}% of runs skipped)")
+        for name, model in vision['models'].items():
+            print(f"    {name}: {model['runs']} runs @ ≤{model['allowed_hz']} Hz")
+    
+    print()
+
+
+def _parse_time(value):
+    """'2026-10-01', '2026-10-01T14:30', '90m', '2h', '3d' (şimdiden geriye) → epoch"""
+    import re
+    import time
+    from datetime import datetime
+    if value is None:
+        return None
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smhdw])", value)
+    if match:
+        unit = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}[match.group(2)]
+        return time.time() - float(match.group(1)) * unit
+    return datetime.fromisoformat(value).timestamp()
+
+
+def _print_event(event):
+    from datetime import datetime
+    timestamp = event.get('timestamp')
+    if timestamp is None and 'ts' in event:
+        timestamp = datetime.fromtimestamp(event['ts']).isoformat(sep=' ', timespec='seconds')
+    event_type = event.get('type', 'unknown')
+    summary = event.get('summary') or 'No summary'
+    person = f" ({event['person']})" if event.get('person') else ""
+    
+    print(f"[{timestamp or 'N/A'}] {event_type.upper()}{person}")
+    print(f"  {summary[:80]}")
     print()
 
 
-def cmd_logs(lines=20):
-    """Son logları göster"""
-    from core.life_logger import get_life_logger
+def cmd_logs(lines=20, since=None, until=None, types=None, person=None, follow=False):
+    """Hayat günlüğü: son olaylar veya zaman/tip/kişi filtresi; --follow ile canlı takip"""
+    from core.control_socket import query, query_events
     
     print("\n" + "="*60)
-    print(f"DERIN - Last {lines} Log Entries")
+    print(f"DERIN - Last {lines} Log Entries" if since is None else f"DERIN - Log Entries (max {lines})")
     print("="*60 + "\n")
     
     try:
-        logger = get_life_logger()
-        events = logger.get_recent_events(lines)
+        events, live = query("events", query_events, lines=lines, since=_parse_time(since),
+                             until=_parse_time(until), types=types, person=person)
         
-        for event in events[-lines:]:
-            timestamp = event.get('timestamp', 'N/A')
-            event_type = event.get('type', 'unknown')
-            summary = event.get('summary', 'No summary')
-            
-            print(f"[{timestamp}] {event_type.upper()}")
-            print(f"  {summary[:80]}")
-            print()
+        for event in events:
+            _print_event(event)
+        
+        if follow:
+            # Segment dosyaları doğrudan izlenir (daemon gerekmez)
+            from core.event_store import get_event_store
+            for event in get_event_store(readonly=True).follow(types=types, person=person):
+                _print_event(event)
             
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         print(f"Error: {e}")
 
 
 def cmd_health():
     """Sağlık kontrolü"""
-    import psutil
-    import torch
+    from core import hardware_info
     
     print("\n" + "="*60)
     print("DERIN - Health Check")
     print("="*60)
     
     # CPU
-    cpu_percent = psutil.cpu_percent(interval=1)
-    print(f"\nCPU: {cpu_percent}%")
+    cpu_percent = hardware_info.cpu_percent(interval=0.5)
+    print(f"\nCPU: {cpu_percent:.0f}%" if cpu_percent is not None else "\nCPU: n/a")
     
     # Memory
-    mem = psutil.virtual_memory()
-    print(f"RAM: {mem.percent}% ({mem.used/1024**3:.1f}GB / {mem.total/1024**3:.1f}GB)")
+    mem = hardware_info.memory()
+    print(f"RAM: {mem['percent']:.0f}% ({mem['used_bytes']/1024**3:.1f}GB / {mem['total_bytes']/1024**3:.1f}GB)")
     
-    # GPU
-    if torch.cuda.is_available():
-        print(f"\nGPU: {torch.cuda.get_device_name(0)}")
-        print(f"VRAM: {torch.cuda.memory_allocated()/1024**3:.1f}GB / {torch.cuda.get_device_properties(0).total_memory/1024**3:.1f}GB")
-        
-        # Temperature (if available)
-        try:
-            import pynvml
-            pynvml.nvmlInit()
-            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-            temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
-            print(f"GPU Temp: {temp}°C")
-        except:
-            pass
+    # GPU (NVML / nvidia-smi - torch import edilmez)
+    for gpu in hardware_info.gpu_info():
+        print(f"\nGPU: {gpu.name}")
+        print(f"VRAM: {gpu.memory_used_bytes/1024**3:.1f}GB / {gpu.memory_total_bytes/1024**3:.1f}GB")
+        if gpu.temperature is not None:
+            print(f"GPU Temp: {gpu.temperature:.0f}°C")
+    
+    # Temperature (Jetson thermal zones)
+    temp = hardware_info.max_temperature()
+    if temp is not None:
+        print(f"Max Temp: {temp:.0f}°C")
     
     # Disk
-    disk = psutil.disk_usage('/')
-    print(f"\nDisk: {disk.percent}% ({disk.used/1024**3:.1f}GB / {disk.total/1024**3:.1f}GB)")
+    disk = hardware_info.disk('/')
+    print(f"\nDisk: {disk['percent']:.0f}% ({disk['used_bytes']/1024**3:.1f}GB / {disk['total_bytes']/1024**3:.1f}GB)")
     
     print()
 
 
-def cmd_backup():
-    """Manuel backup oluştur"""
-    from core.automated_backup import get_automated_backup
+def _mb(n):
+    return f"{n/1024/1024:.2f}MB"
+
+
+def cmd_backup(list_only=False, restore=None, to=None, paths=None):
+    """Artımlı backup (çalışan Derin varsa onun üzerinden); listele / geri yükle"""
+    from core.control_socket import query, query_backups, run_backup
+    
+    if list_only:
+        print("\n" + "="*60)
+        print("DERIN - Backups")
+        print("="*60 + "\n")
+        snapshots, live = query("backups", query_backups)
+        if not snapshots:
+            print("No backups yet.")
+        for snap in snapshots:
+            print(f"{snap['id']}  {_mb(snap['total_size_bytes']):>12}  "
+                  f"new {_mb(snap['new_bytes'])}  stored {_mb(snap['stored_bytes'])}  {snap.get('tag', '')}")
+        print()
+        return
+    
+    if restore:
+        # Geri yükleme her zaman yerelde (canlı veri dizinlerine yazılmaz)
+        from core.backup_store import get_backup_repository
+        print("\n" + "="*60)
+        print(f"DERIN - Restoring {restore} → {to}")
+        print("="*60 + "\n")
+        result = get_backup_repository().restore(restore, to, include=paths)
+        print(f"Restored {result['files']} files, {_mb(result['bytes'])} in {result['duration_seconds']:.1f}s")
+        print()
+        return
     
     print("\n" + "="*60)
     print("DERIN - Creating Backup")
     print("="*60 + "\n")
     
-    backup = get_automated_backup()
-    manifest = backup.create_backup()
+    manifest, live = query("backup", run_backup, timeout=3600)
     
-    print(f"Backup created: {manifest['timestamp']}")
+    print(f"Backup created: {manifest['id']} ({_mode(live)})")
     print(f"Targets: {', '.join(manifest['targets'])}")
-    print(f"Size: {manifest['total_size_bytes']/1024/1024:.2f}MB")
+    print(f"Size: {_mb(manifest['total_size_bytes'])} in {manifest['file_count']} files "
+          f"({manifest['unchanged_files']} unchanged)")
+    print(f"New: {_mb(manifest['new_bytes'])} ({manifest['new_chunks']} chunks, "
+          f"{_mb(manifest['stored_bytes'])} compressed)")
+    print(f"Reused: {_mb(manifest['reused_bytes'])} ({manifest['reused_chunks']} chunks)")
     print(f"Duration: {manifest['duration_seconds']:.1f}s")
+    if manifest.get('pruned'):
+        print(f"Pruned: {', '.join(manifest['pruned'])} ({_mb(manifest['gc']['bytes_freed'])} freed)")
     print()
 
 
 def cmd_people():
     """Tanıdığı kişiler"""
-    from personality.multi_user_manager import get_multi_user_manager
+    from core.control_socket import query, query_people
     
     print("\n" + "="*60)
     print("DERIN - People I Know")
     print("="*60 + "\n")
     
-    manager = get_multi_user_manager()
-    people = manager.list_all_people()
+    people, live = query("people", query_people)
     
     if not people:
         print("No one registered yet.")
         return
     
     for person in people:
-        print(f"{person.name}")
-        print(f"  Relationship: {person.relationship.value}")
-        print(f"  Interactions: {person.total_interactions}")
-        print(f"  Interests: {', '.join(person.interests[:3])}")
+        print(f"{person['name']}")
+        print(f"  Relationship: {person['relationship']}")
+        print(f"  Interactions: {person['total_interactions']}")
+        print(f"  Interests: {', '.join(person['interests'][:3])}")
         print()
 
 
 def cmd_news():
     """Bugünün haberleri"""
-    from core.daily_news_absorption import get_daily_news
+    from core.control_socket import query, query_news
     
     print("\n" + "="*60)
     print("DERIN - Today's News")
     print("="*60 + "\n")
     
-    news = get_daily_news()
-    print(news.get_todays_summary())
+    summary, live = query("news", query_news)
+    print(summary)
+    print()
+
+
+def cmd_latency():
+    """Konuşma hattı gecikmeleri"""
+    import time
+    from core.runtime_stats import read_snapshot
+    from core.control_socket import query
+    
+    print("\n" + "="*60)
+    print("DERIN - Speech Pipeline Latency")
+    print("="*60 + "\n")
+    
+    def offline():
+        return read_snapshot("latency")
+    
+    result, live = query("latency", offline)
+    if live:
+        stats = result
+        print("Live\n")
+    elif result:
+        stats = result['data']
+        print(f"Updated {time.time() - result['written_at']:.0f}s ago\n")
+    else:
+        print("No latency data yet (is Derin running?)")
+        return
+    
+    print(f"{'Stage':<34}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, s in stats['intervals'].items():
+        if not s['count']:
+            continue
+        print(f"{name:<34}{s['count']:>7}{s['p50_ms']:>7.0f}ms{s['p95_ms']:>7.0f}ms{s['p99_ms']:>7.0f}ms")
+    
+    counts = stats.get('stage_counts', {})
+    if counts:
+        print("\nEvents: " + ", ".join(f"{k}={v}" for k, v in counts.items()))
+    
+    speculative = _runtime_metrics(live).get('speculative')
+    if speculative and speculative['layers']:
+        print(f"\n{'Speculative (perceived / final)':<34}{'count':>7}{'p50':>9}{'p95':>9}{'final p50':>11}{'p95':>9}")
+        for layer, s in speculative['layers'].items():
+            print(f"{layer:<34}{s['count']:>7}{s['perceived_p50_ms']:>7.0f}ms{s['perceived_p95_ms']:>7.0f}ms"
+                  f"{s['final_p50_ms']:>9.0f}ms{s['final_p95_ms']:>7.0f}ms")
+        print("Outcomes: " + ", ".join(f"{k}={v}" for k, v in speculative['counts'].items()))
     print()
 
 
+def cmd_metrics(match=None):
+    """Organ metrikleri, Prometheus metin formatında (canlıysa soketten)"""
+    import time
+    from core.metrics import format_exposition
+    from core.runtime_stats import read_snapshot
+    from core.control_socket import query
+    
+    def offline():
+        return read_snapshot("prometheus")
+    
+    result, live = query("prometheus", offline)
+    if live:
+        families = result
+    elif result:
+        families = result['data']
+        print(f"# offline: updated {time.time() - result['written_at']:.0f}s ago")
+    else:
+        print("No metrics yet (is Derin running?)")
+        return
+    
+    sys.stdout.write(format_exposition(families, match))
+
+
+def cmd_profile(seconds=10.0, fmt="collapsed", output=None):
+    """Çalışan organizmadan N saniyelik yığın örnekleri (yeniden başlatmadan)"""
+    from core.control_socket import query
+    from core.sampling_profiler import flame_graph_svg, format_collapsed, summarize
+    
+    print(f"Sampling for {seconds:g}s...", file=sys.stderr)
+    result, live = query("profile", lambda **_: None, timeout=seconds + 10, seconds=seconds)
+    if not live:
+        print("Derin is not running (profile needs the live process)", file=sys.stderr)
+        return
+    
+    counts = result['counts']
+    unit = result.get('unit', "samples")
+    if fmt == 'svg':
+        text = flame_graph_svg(counts, title=f"DERİN - {result['seconds']:g}s", unit=unit)
+    elif fmt == 'summary':
+        text = summarize(counts, unit=unit) + "\n"
+    else:
+        text = format_collapsed(counts)
+    
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(summarize(counts, top=5, unit=unit), file=sys.stderr)
+        print(f"\nWrote {output}", file=sys.stderr)
+    else:
+        sys.stdout.write(text)
+    print(f"{result['samples']} samples total, interval {result['interval_ms']:.0f}ms, "
+          f"{result['truncated']} truncated", file=sys.stderr)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="DERIN CLI - Control your AI",
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='Print an import-time tree after the command')
+    
     subparsers = parser.add_subparsers(dest='command', help='Commands')
     
     # status
@@ -190,12 +426,22 @@ def main():
     # logs
     logs_parser = subparsers.add_parser('logs', help='Recent logs')
     logs_parser.add_argument('-n', '--lines', type=int, default=20, help='Number of lines')
+    logs_parser.add_argument('--since', help="Start time: ISO date/time or relative (90m, 2h, 3d)")
+    logs_parser.add_argument('--until', help='End time: ISO date/time or relative')
+    logs_parser.add_argument('--type', dest='types', action='append', help='Event type (repeatable)')
+    logs_parser.add_argument('--person', help='Only events involving this person')
+    logs_parser.add_argument('-f', '--follow', action='store_true', help='Keep printing new events')
     
     # health
     subparsers.add_parser('health', help='Health check')
     
     # backup
-    subparsers.add_parser('backup', help='Create backup')
+    backup_parser = subparsers.add_parser('backup', help='Create backup')
+    backup_parser.add_argument('--list', action='store_true', help='List snapshots')
+    backup_parser.add_argument('--restore', metavar='ID', help='Restore a snapshot')
+    backup_parser.add_argument('--to', default='restore', help='Restore destination directory')
+    backup_parser.add_argument('--path', dest='paths', action='append',
+                               help='Restore only paths with this prefix (e.g. voice_profiles/)')
     
     # people
     subparsers.add_parser('people', help='List people')
@@ -203,25 +449,57 @@ def main():
     # news
     subparsers.add_parser('news', help="Today's news")
     
+    # latency
+    subparsers.add_parser('latency', help='Speech pipeline latency')
+    
+    # metrics
+    metrics_parser = subparsers.add_parser('metrics', help='Organ metrics (Prometheus text format)')
+    metrics_parser.add_argument('--match', help='Only metric names containing this string')
+    
+    # profile
+    profile_parser = subparsers.add_parser('profile', help='Sample thread stacks of the running organism')
+    profile_parser.add_argument('--seconds', type=float, default=10.0, help='Sampling window')
+    profile_parser.add_argument('--format', dest='fmt', choices=['collapsed', 'svg', 'summary'],
+                                default='collapsed', help='collapsed stacks, SVG flame graph or summary')
+    profile_parser.add_argument('-o', '--output', help='Write to file instead of stdout')
+    
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         return
     
+    profiler = None
+    if args.profile_startup:
+        import time
+        from core.startup_profiler import start_import_profiler
+        profiler = start_import_profiler()
+        started = time.perf_counter()
+    
     # Route commands
     if args.command == 'status':
         cmd_status()
     elif args.command == 'logs':
-        cmd_logs(args.lines)
+        cmd_logs(args.lines, args.since, args.until, args.types, args.person, args.follow)
     elif args.command == 'health':
         cmd_health()
     elif args.command == 'backup':
-        cmd_backup()
+        cmd_backup(args.list, args.restore, args.to, args.paths)
     elif args.command == 'people':
         cmd_people()
     elif args.command == 'news':
         cmd_news()
+    elif args.command == 'latency':
+        cmd_latency()
+    elif args.command == 'metrics':
+        cmd_metrics(args.match)
+    elif args.command == 'profile':
+        cmd_profile(args.seconds, args.fmt, args.output)
+    
+    if profiler:
+        profiler.stop()
+        print(profiler.format(min_ms=1))
+        print(f"Command '{args.command}': {(time.perf_counter() - started)*1000:.0f}ms")
 
 
 if __name__ == '__main__':
@@ -7,25 +7,14 @@ Moshi-style full-duplex, biyolojik ritim ve DNA sistemi.
 v20.0: Multi-Model Manager (Thor için) + Autonomous Systems
 """
 
+import os
 import sys
-import time
 import signal
+import argparse
 import threading
-import os
 from colorama import init, Fore, Style
 
-# Colorama başlat
-init()
-
-# Windows console encoding fix (Thor'da gerek yok ama zarar vermez)
-if sys.stdout.encoding != 'utf-8':
-    try:
-        sys.stdout.reconfigure(encoding='utf-8')
-    except AttributeError:
-        # Python < 3.7
-        pass
-
-print(f"""
+BANNER = f"""
 {Fore.CYAN}
 ╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
@@ -37,23 +26,84 @@ print(f"""
 ║                                                               ║
 ╚═══════════════════════════════════════════════════════════════╝
 {Style.RESET_ALL}
-""")
+"""
+
+
+def setup_console():
+    """Colorama + UTF-8 konsol (import anında değil, main() içinde)"""
+    init()
+    # Windows console encoding fix (Thor'da gerek yok ama zarar vermez)
+    if sys.stdout.encoding != 'utf-8':
+        try:
+            sys.stdout.reconfigure(encoding='utf-8')
+        except AttributeError:
+            # Python < 3.7
+            pass
+
+
+def start_autonomous():
+    """AUTONOMOUS SYSTEMS BAŞLAT"""
+    print(f"{Fore.GREEN}[AUTONOMOUS] Starting background systems...{Style.RESET_ALL}")
+    try:
+        from core.autonomous_manager import start_autonomous_systems
+        start_autonomous_systems()
+        print(f"{Fore.GREEN}[AUTONOMOUS] All systems operational ✓{Style.RESET_ALL}\n")
+    except Exception as e:
+        print(f"{Fore.RED}[AUTONOMOUS] Warning: {e}{Style.RESET_ALL}\n")
 
-# AUTONOMOUS SYSTEMS BAŞLAT (YENI)
-print(f"{Fore.GREEN}[AUTONOMOUS] Starting background systems...{Style.RESET_ALL}")
-try:
-    from core.autonomous_manager import start_autonomous_systems
-    start_autonomous_systems()
-    print(f"{Fore.GREEN}[AUTONOMOUS] All systems operational ✓{Style.RESET_ALL}\n")
-except Exception as e:
-    print(f"{Fore.RED}[AUTONOMOUS] Warning: {e}{Style.RESET_ALL}\n")
 
 class DerinCNS:
     """Merkezi Sinir Sistemi - Ana Orkestratör"""
     
-    def __init__(self):
+    # Anlık görüntüye giren organlar: boot aşaması → öznitelik
+    # (get_state/set_state veya export_state/import_state sunanlar kaydedilir)
+    _SNAPSHOT_ORGANS = {
+        "dna": "_dna",
+        "hypothalamus": "_hypothalamus",
+        "hippocampus": "_hippocampus",
+        "limbic": "_limbic",
+        "episodic_memory": "_episodic_memory",
+        "consciousness": "_consciousness",
+        "goal_manager": "_goal_manager",
+        "self_model": "_self_model",
+        "qos_governor": "_qos_governor",
+        "semantic_cache": "_semantic_cache",
+    }
+
+    def __init__(self, boot_workers: int = 4, warm_start: bool = False):
         self._running = False
         self._threads = []
+        self._shutdown_event = threading.Event()
+        self._shutdown_lock = threading.Lock()
+        self._stopped = False
+        self._threads_lock = threading.Lock()
+        self._stage_threads = {}  # boot aşaması → o aşamada başlatılan thread'ler
+        
+        # Olay tabanlı kontrol döngüsü (v20.1)
+        self._control_loop = None
+        self._state_publisher = None
+        
+        # Paralel boot (v20.1)
+        self._boot_workers = boot_workers
+        self._boot_graph = None
+        self._boot_report = None
+        self._container = None
+
+        # Anlık görüntü / warm start (v20.2)
+        self._warm_start = warm_start
+        self._snapshotter = None
+        self._warm_snapshot = None
+        self._restore_report = {}
+        self._snapshot_attached = set()
+
+        # Metrik kayıt defteri + /metrics (v20.2)
+        self._metrics = None
+        self._metrics_server = None
+        self._profiler = None
+        self._identity = None
+        self._latency = None
+        self._stats_exporter = None
+        self._speech_stream = None
         
         # Temel Modüller (v8.0)
         self._event_bus = None
@@ -62,6 +112,11 @@ class DerinCNS:
         self._brainstem = None
         self._temporal = None
         self._occipital = None
+        self._frame_bus = None
+        self._vision_scheduler = None
+        self._qos_governor = None
+        self._control_server = None
+        self._life_log = None
         self._frontal = None
         self._broca = None
         self._limbic = None
@@ -72,6 +127,7 @@ class DerinCNS:
         self._parallel_perception = None
         self._meta_cognition = None
         self._episodic_memory = None
+        self._tiered_memory = None
         
         # v10.2 Chappie/Finch Modüller
         self._eye_contact = None
@@ -83,6 +139,13 @@ class DerinCNS:
         # v11.0 İnsansı Bilinç
         self._consciousness = None
         
+        # v13.0 - v18.0 Kognitif Modüller
+        self._emergent_ai = None
+        self._self_improvement = None
+        self._context_bridge = None
+        self._goal_manager = None
+        self._self_model = None
+        
         # v16.1 Yeni Modüller (Bugün eklendi)
         self._voice_emotion = None
         self._spontaneous_behavior = None
@@ -92,214 +155,519 @@ class DerinCNS:
         
         # v20.0: Multi-Model Manager (Thor için)
         self._model_manager = None
+        self._night_mode = False                # Gece takası (social_plus → coder) yapıldı mı
+        self._night_lock = threading.Lock()
+        self._night_swap_lock = threading.Lock()  # Takaslar sırayla (yükleme uzun sürer)
+        self._kv_cache = None
+        self._hierarchical_brain = None
+        self._model_pipeline = None
+        self._speculative = None
+        self._supervision = None
+        self._prefix_cache = None
+        self._persona_fingerprint = None        # Prefix cache yokken (PERSONA_CHANGED ile sıfırlanır)
+        self._persona_generation = 0
+        self._semantic_cache = None
+        self._batch_scheduler = None
     
-    def _load_models_staged(self):
+    def _boot_models(self):
         """
         Aşamalı model yükleme - Thor için optimize.
-        Modeller teker teker yüklenir, memory spike önlenir.
+        Boot'un geri kalanıyla paralel, arka plan thread'inde çalışır.
+        Modeller bellek izin verdikçe teker teker yüklenir, memory spike önlenir.
         """
-        print(f"{Fore.CYAN}[MODEL] Aşamalı model yükleme başlıyor...{Style.RESET_ALL}")
-        
+        print(f"{Fore.CYAN}[MODEL] Arka plan model yükleme başlıyor...{Style.RESET_ALL}")
+
+        from core.residency_manager import get_budgeted_model_manager
+        from core.model_loader import ModelLoadPipeline, DEFAULT_LOAD_ORDER, GB
+        from core.platform_config import get_platform_profile
+
+        # MultiModelManager + vram_budget uygulaması (admit / pin / evict)
+        self._model_manager = get_budgeted_model_manager(platform="thor")
+
+        # Hierarchical Brain önce kurulur, katmanlar geldikçe yükseltilir
         try:
-            from core.multi_model_manager import get_multi_model_manager
-            self._model_manager = get_multi_model_manager(platform="thor")
-            
-            # Yükleme sırası (öncelik sırasına göre)
-            load_order = [
-                ("reflex", "Qwen-3B", "Hızlı tepkiler için"),
-                ("social", "Qwen-8B", "Sohbet için"),
-                ("social_plus", "Qwen-14B", "Detaylı sohbet için"),
-                ("cortical", "Qwen-70B", "Derin düşünme için"),
-                # Coder modelleri lazy-load - sadece kod sorgusu gelince
-            ]
-            
-            for i, (layer, model_name, description) in enumerate(load_order, 1):
-                print(f"{Fore.YELLOW}[{i}/{len(load_order)}] {model_name} yükleniyor... ({description}){Style.RESET_ALL}")
-                try:
-                    self._model_manager.load_model(layer)
-                    print(f"{Fore.GREEN}    └── {model_name} yüklendi{Style.RESET_ALL}")
-                except Exception as e:
-                    print(f"{Fore.RED}    └── {model_name} yüklenemedi: {e}{Style.RESET_ALL}")
-                
-                # Her model arasında kısa bekleme (memory stabilizasyonu)
-                time.sleep(1)
-            
-            # KV Cache Manager başlat
-            try:
-                from core.kv_cache_manager import get_kv_cache_manager
-                self._kv_cache = get_kv_cache_manager()
-                print(f"{Fore.GREEN}[MODEL] KV Cache Manager aktif{Style.RESET_ALL}")
-            except Exception as e:
-                print(f"{Fore.YELLOW}[MODEL] KV Cache: {e}{Style.RESET_ALL}")
-            
-            # Hierarchical Brain başlat
+            from core.hierarchical_brain import HierarchicalBrain
+            self._hierarchical_brain = HierarchicalBrain()
+            print(f"{Fore.GREEN}[MODEL] Hierarchical Brain aktif{Style.RESET_ALL}")
+        except Exception as e:
+            print(f"{Fore.YELLOW}[MODEL] Hierarchical Brain: {e}{Style.RESET_ALL}")
+
+        # Spekülatif cevap: cortical beklenirken reflex/social kısa karşılık verir
+        brain = self._hierarchical_brain
+        if brain and hasattr(brain, 'select_layer') and hasattr(brain, 'generate'):
+            from core.batch_scheduler import Priority
+            from core.speculative_response import SpeculativeResponder
+            from core.supervision_queue import SupervisionQueue, make_batch_supervisor
+
+            # 70B denetimi arka planda, örneklenmiş ve toplu
+            self._supervision = SupervisionQueue(
+                make_batch_supervisor(lambda prompt: self._generate(prompt, "cortical", priority=Priority.BACKGROUND,
+                                                                    source="supervision")),
+                is_supervisor_ready=lambda: bool(self._model_pipeline and self._model_pipeline.is_ready("cortical")),
+                is_under_load=self._supervision_under_load,
+            )
+            self._supervision.start()
+            self._stats_exporter.register("supervision", self._supervision.get_status)
+            # Worker yoklama yapmaz: cortical hazır olunca / yük değişince uyandırılır
+            if self._event_bus:
+                from core.control_loop import HYPOTHALAMUS_STATE
+                from core.qos_governor import QOS_TIER_CHANGED
+                for topic in ("MODEL_LAYER_READY", QOS_TIER_CHANGED, HYPOTHALAMUS_STATE):
+                    self._event_bus.subscribe(topic, lambda event: self._supervision.notify())
+
+            self._speculative = SpeculativeResponder(
+                route=brain.select_layer,
+                generate=lambda layer, prompt, max_tokens=None: self._generate(
+                    prompt, layer, max_tokens, Priority.USER_TURN, source="speculative"),
+                on_speak=self._speak_response,
+                is_layer_ready=lambda layer: bool(self._model_pipeline and self._model_pipeline.is_ready(layer)),
+                on_result=self._submit_for_supervision,
+            )
+            self._stats_exporter.register("speculative", self._speculative.get_stats)
+            print(f"{Fore.GREEN}[MODEL] Spekülatif cevap + arka plan denetim aktif{Style.RESET_ALL}")
+
+        # KV Cache Manager başlat
+        try:
+            from core.kv_cache_manager import get_kv_cache_manager
+            self._kv_cache = get_kv_cache_manager()
+            print(f"{Fore.GREEN}[MODEL] KV Cache Manager aktif{Style.RESET_ALL}")
+        except Exception as e:
+            print(f"{Fore.YELLOW}[MODEL] KV Cache: {e}{Style.RESET_ALL}")
+
+        budget = get_platform_profile("thor").get("vram_budget", {})
+        layer_sizes = {
+            layer: int(budget.get(f"{layer}_gb", 0) * GB)
+            for layer, _, _ in DEFAULT_LOAD_ORDER
+        }
+
+        self._model_pipeline = ModelLoadPipeline(
+            self._model_manager,
+            layer_sizes=layer_sizes,
+            log=lambda msg: print(f"{Fore.YELLOW}{msg}{Style.RESET_ALL}"),
+        )
+        self._model_pipeline.on_layer_ready(self._on_model_layer_ready)
+        self._model_pipeline.start()
+        self._register_thread("models", self._model_pipeline)
+
+        # Uyku ↔ uyanıklık: gece takası (QoS sıcak/yüklü iken residency erteler)
+        if self._event_bus:
+            from core.control_loop import HYPOTHALAMUS_STATE
+            self._event_bus.subscribe(HYPOTHALAMUS_STATE, self._on_sleep_state)
+
+    def _on_sleep_state(self, event):
+        """Hypothalamus uykuya geçince social_plus → coder, uyanınca geri (yükleme arka planda)"""
+        from core.control_loop import event_payload
+        sleeping = bool(event_payload(event).get("is_sleeping"))
+        with self._night_lock:
+            if sleeping == self._night_mode:
+                return
+            self._night_mode = sleeping
+        threading.Thread(target=self._night_swap, args=(sleeping,), name="night-swap", daemon=True).start()
+
+    def _night_swap(self, sleeping: bool):
+        with self._night_swap_lock:
+            with self._night_lock:
+                if sleeping != self._night_mode:
+                    return  # Bu arada tersine döndü
             try:
-                from core.hierarchical_brain import HierarchicalBrain
-                self._hierarchical_brain = HierarchicalBrain()
-                print(f"{Fore.GREEN}[MODEL] Hierarchical Brain aktif{Style.RESET_ALL}")
+                if sleeping:
+                    self._model_manager.enter_night_mode()
+                else:
+                    self._model_manager.exit_night_mode()
             except Exception as e:
-                print(f"{Fore.YELLOW}[MODEL] Hierarchical Brain: {e}{Style.RESET_ALL}")
-            
-            print(f"{Fore.GREEN}[MODEL] Tüm modeller hazır{Style.RESET_ALL}")
-            
-        except Exception as e:
-            print(f"{Fore.RED}[MODEL] Model yükleme hatası: {e}{Style.RESET_ALL}")
-    
-    def boot(self):
-        """Sistemi başlat - Boot Sequence"""
-        print(f"{Fore.YELLOW}[CNS] Boot sequence başlatılıyor...{Style.RESET_ALL}")
-        
-        # 0. DI Container (Servis Yönetimi)
-        print(f"{Fore.CYAN}[0/15] DI Container...{Style.RESET_ALL}")
+                print(f"{Fore.YELLOW}[MODEL] Gece takası: {e}{Style.RESET_ALL}")
+
+    def _supervision_under_load(self) -> bool:
+        """Riskli olmayan denetimler ertelensin mi? QoS kademesi, yoksa hypothalamus enerjisi"""
+        if self._qos_governor:
+            from core.qos_governor import Tier
+            return self._qos_governor.tier > Tier.NORMAL
+        hypothalamus = self._hypothalamus
+        if hypothalamus and hasattr(hypothalamus, 'state'):
+            return hypothalamus.state.energy < 30
+        return False
+
+    def _submit_for_supervision(self, query: str, result):
+        """Commit edilen cevabı 70B denetim kuyruğuna at (bloklamaz)"""
+        if not self._supervision or result.layer == "cortical":
+            return
+        import uuid
+        from core.supervision_queue import ReviewItem
+        brain = self._hierarchical_brain
+        category = brain.categorize(query) if hasattr(brain, 'categorize') else "chat"
+        self._supervision.submit(ReviewItem(
+            response_id=uuid.uuid4().hex[:12],
+            layer=result.layer,
+            query=query,
+            response=result.text,
+            category=category,
+        ))
+
+    def _boot_batch_scheduler(self):
+        """social / social_plus önünde continuous batching (kullanıcı > kesme > proaktif > arka plan)"""
+        if not self._model_manager or not hasattr(self._model_manager, 'get_batch_model'):
+            print(f"{Fore.YELLOW}    └── Batch scheduler: model manager get_batch_model desteklemiyor{Style.RESET_ALL}")
+            return
+        from core.batch_scheduler import BatchSchedulerPool, Priority
+        self._batch_scheduler = BatchSchedulerPool(max_batch=8, max_wait=0.01)
+        for layer in self._model_pipeline.ready_layers:
+            self._add_batch_layer(layer)
+
+        # Proaktif konuşma (HumanLikeBrain) ve brain'in kendi çağrıları da aynı kuyruktan
+        if self._hierarchical_brain and hasattr(self._hierarchical_brain, 'set_batch_scheduler'):
+            self._hierarchical_brain.set_batch_scheduler(self._batch_scheduler)
+        if self._consciousness and hasattr(self._consciousness, 'set_generate'):
+            self._consciousness.set_generate(
+                lambda prompt, layer=None, max_tokens=None: self._generate(
+                    prompt, layer, max_tokens, Priority.PROACTIVE, source="consciousness"))
+
+        # Kullanıcı konuşmaya başlayınca arka plan işleri beklesin
+        for topic in ("USER_SPEECH_STARTED", "USER_SPEECH_TEXT"):
+            self._event_bus.subscribe(topic, lambda event: self._batch_scheduler.preempt_background())
+        self._stats_exporter.register("batch_scheduler", self._batch_scheduler.get_stats)
+        print(f"{Fore.GREEN}    └── Batch scheduler aktif{Style.RESET_ALL}")
+
+    def _generate(self, prompt: str, layer: str = None, max_tokens: int = None, priority=None,
+                  source: str = "") -> str:
+        """
+        Model çağrılarının tek girişi: batch scheduler'daki katmanlar (social / social_plus)
+        öncelikli kuyruktan, diğerleri doğrudan HierarchicalBrain'den.
+        """
+        from core.batch_scheduler import Priority
+        brain = self._hierarchical_brain
+        pool = self._batch_scheduler
+        if layer is None and pool and hasattr(brain, 'select_layer'):
+            layer = brain.select_layer(prompt)
+        if pool and layer and pool.has_layer(layer):
+            return pool.generate(layer, prompt, priority if priority is not None else Priority.USER_TURN,
+                                 max_tokens, source=source)
+        if layer is None:
+            return brain.generate(prompt)
+        return brain.generate(prompt, layer=layer, max_tokens=max_tokens)
+
+    def _add_batch_layer(self, layer: str):
+        if self._batch_scheduler and layer in ("social", "social_plus"):
+            self._batch_scheduler.add_layer(layer, self._model_manager.get_batch_model(layer))
+
+    def _on_model_layer_ready(self, layer: str):
+        """Yeni katman bellekte - yönlendirmeyi canlı yükselt"""
+        available = self._model_pipeline.ready_layers
+        self._add_batch_layer(layer)
+        self._apply_available_layers()
+
+        if self._event_bus:
+            self._event_bus.publish(
+                "MODEL_LAYER_READY",
+                {"layer": layer, "available_layers": available},
+                source="cns"
+            )
+
+        if self._model_pipeline.done:
+            print(f"{Fore.GREEN}[MODEL] Tüm modeller hazır: {', '.join(available)}{Style.RESET_ALL}")
+
+    def _apply_available_layers(self):
+        """Yönlendirme = hazır katmanlar ∩ QoS kademesinin izin verdikleri"""
+        if not self._hierarchical_brain or not hasattr(self._hierarchical_brain, 'set_available_layers'):
+            return
+        available = self._model_pipeline.ready_layers if self._model_pipeline else []
+        if self._qos_governor:
+            from core.qos_governor import allowed_layers
+            available = allowed_layers(available, self._qos_governor.tier) or available[:1]
+        self._hierarchical_brain.set_available_layers(available)
+
+    # ═══════════════════════════════════════════════════════════════
+    # BOOT AŞAMALARI
+    # Her organ kendi aşamasında açılır; sıra _build_boot_graph()'taki
+    # bağımlılıklardan gelir. Bağımsız organlar paralel başlatılır.
+    # ═══════════════════════════════════════════════════════════════
+
+    def _register_thread(self, stage: str, organ):
+        """Aşamanın başlattığı thread'li organı kaydet (kapanış ve profiler bu eşlemeyi kullanır)"""
+        with self._threads_lock:
+            self._threads.append(organ)
+            self._stage_threads.setdefault(stage, []).append(organ)
+
+    def _boot_container(self):
+        """DI Container (Servis Yönetimi)"""
         from core.container import setup_core_services, get_container
         self._container = setup_core_services()
         print(f"{Fore.GREEN}    └── {len(self._container.get_all())} servis kaydedildi{Style.RESET_ALL}")
-        
-        # 1. Event Bus (Sinir Ağı)
-        print(f"{Fore.CYAN}[1/15] Event Bus...{Style.RESET_ALL}")
+
+    def _boot_event_bus(self):
+        """Event Bus (Sinir Ağı)"""
         from core.event_bus import get_event_bus
         self._event_bus = get_event_bus()
         self._event_bus.start()
-        
-        # 2. DNA (Kimlik)
-        print(f"{Fore.CYAN}[2/15] DNA...{Style.RESET_ALL}")
+
+    def _boot_stats_exporter(self):
+        """data/runtime/*.json - derin_cli'nin okuduğu canlı istatistikler"""
+        from core.runtime_stats import RuntimeStatsExporter
+        self._stats_exporter = RuntimeStatsExporter()
+        self._stats_exporter.register("autonomous", self._autonomous_status)
+        self._stats_exporter.start()
+
+    def _autonomous_status(self):
+        """derin status bunu okur (autonomous manager'ı CLI'da kurmaya gerek kalmaz)"""
+        from core.autonomous_manager import get_autonomous_manager
+        return get_autonomous_manager().get_status()
+
+    def _boot_life_log(self):
+        """Hayat günlüğü (data/life_log - segmentli olay deposu)"""
+        from core.event_store import get_event_store
+        self._life_log = get_event_store()
+        self._life_log.attach_event_bus(self._event_bus)
+        try:
+            from core.life_logger import get_life_logger
+            logger = get_life_logger()
+            if hasattr(logger, "set_event_store"):
+                logger.set_event_store(self._life_log)
+        except ImportError:
+            pass
+        self._stats_exporter.register("life_log", self._life_log.get_stats)
+
+    def _boot_control_socket(self):
+        """derin_cli için yerel kontrol API'si (data/runtime/derin.sock)"""
+        from core.control_socket import ControlServer, DEFAULT_HANDLERS
+        self._control_server = ControlServer()
+        for method, handler in DEFAULT_HANDLERS.items():
+            self._control_server.register(method, handler)
+        self._control_server.register("metrics", self._stats_exporter.collect)
+        self._control_server.register("latency", self._latency.get_stats)
+        self._control_server.start()
+        print(f"{Fore.GREEN}    └── Kontrol soketi: {self._control_server.path}{Style.RESET_ALL}")
+
+    def _boot_latency(self):
+        """Konuşma hattı gecikme izleme (temporal → frontal → broca)"""
+        from core.latency_tracer import get_latency_tracer
+        self._latency = get_latency_tracer()
+        self._latency.attach_event_bus(self._event_bus)
+        self._stats_exporter.register("latency", self._latency.get_stats)
+
+    def _boot_dna(self):
+        """DNA (Kimlik)"""
         from core.system.dna import get_identity, get_dna
-        identity = get_identity()
+        self._identity = get_identity()
         self._dna = get_dna()
-        print(f"{Fore.GREEN}    └── İsim: {identity.name}{Style.RESET_ALL}")
-        
-        # 3. Brainstem (Refleksler)
-        print(f"{Fore.CYAN}[3/15] Brainstem...{Style.RESET_ALL}")
+        print(f"{Fore.GREEN}    └── İsim: {self._identity.name}{Style.RESET_ALL}")
+
+    def _boot_brainstem(self):
+        """Brainstem (Refleksler)"""
         from core.system.brainstem import get_brainstem
         self._brainstem = get_brainstem()
-        
-        # 4. Hypothalamus (Biyoloji)
-        print(f"{Fore.CYAN}[4/15] Hypothalamus...{Style.RESET_ALL}")
+
+    def _boot_hypothalamus(self):
+        """Hypothalamus (Biyoloji)"""
         from core.system.hypothalamus import get_hypothalamus
         self._hypothalamus = get_hypothalamus()
+        self._attach_snapshot("hypothalamus")
         self._hypothalamus.start()
-        self._threads.append(self._hypothalamus)
-        
-        # 5. Hippocampus (Hafıza)
-        print(f"{Fore.CYAN}[5/15] Hippocampus...{Style.RESET_ALL}")
+        self._register_thread("hypothalamus", self._hypothalamus)
+
+    def _boot_hippocampus(self):
+        """Hippocampus (Hafıza)"""
         from core.memory.hippocampus import get_hippocampus
         self._hippocampus = get_hippocampus()
-        
-        # 6. Limbic (Duygular)
-        print(f"{Fore.CYAN}[6/15] Limbic System...{Style.RESET_ALL}")
+
+    def _boot_limbic(self):
+        """Limbic (Duygular)"""
         from core.lobes.limbic import get_limbic
         self._limbic = get_limbic()
-        
-        # 7. Broca (Konuşma)
-        print(f"{Fore.CYAN}[7/15] Broca Area...{Style.RESET_ALL}")
+
+    def _boot_broca(self):
+        """Broca (Konuşma) - brainstem'e stop_audio refleksini bağlar"""
         from core.lobes.broca import get_broca
+        from core.latency_tracer import STOP_AUDIO
         self._broca = get_broca()
         self._broca.start()
-        self._threads.append(self._broca)
-        
-        # Brainstem callback'leri kaydet
-        self._brainstem.register_stop_audio(self._broca.stop_audio)
-        
-        # 8. Frontal (Beyin)
-        print(f"{Fore.CYAN}[8/15] Frontal Lobe...{Style.RESET_ALL}")
+        self._register_thread("broca", self._broca)
+
+        # Brainstem callback'leri kaydet (gecikme izli)
+        self._brainstem.register_stop_audio(self._latency.wrap(self._on_stop_audio, STOP_AUDIO))
+
+    def _boot_frontal(self):
+        """Frontal (Beyin) - brainstem'e abort_generation refleksini bağlar"""
         from core.lobes.frontal import get_frontal
+        from core.latency_tracer import GENERATION_ABORT
         self._frontal = get_frontal()
         self._frontal.start()
-        self._threads.append(self._frontal)
-        
-        # Brainstem callback
-        self._brainstem.register_abort_generation(self._frontal.abort_generation)
-        
-        # 9. Temporal (Kulak) + Occipital (Göz)
-        print(f"{Fore.CYAN}[9/15] Sensory Lobes...{Style.RESET_ALL}")
+        self._register_thread("frontal", self._frontal)
+
+        # Brainstem callback (gecikme izli)
+        self._brainstem.register_abort_generation(
+            self._latency.wrap(self._on_abort_generation, GENERATION_ABORT))
+
+    def _on_stop_audio(self):
+        """Brainstem refleksi: sesi kes (akış dahil)"""
+        if self._speech_stream:
+            self._speech_stream.cancel()
+        self._broca.stop_audio()
+
+    def _on_abort_generation(self):
+        """Brainstem refleksi: üretimi kes (akış dahil)"""
+        if self._speech_stream:
+            self._speech_stream.cancel()
+        self._frontal.abort_generation()
+
+    def _boot_speech_stream(self):
+        """Akışlı konuşma: frontal token deltaları → cümle parçaları → broca"""
+        if not (hasattr(self._broca, 'synthesize') and hasattr(self._broca, 'play')):
+            print(f"{Fore.YELLOW}    └── Broca akışlı sentez desteklemiyor, tam metin modu{Style.RESET_ALL}")
+            return
+        from core.speech_stream import StreamingSpeechPipeline
+        self._speech_stream = StreamingSpeechPipeline(
+            self._broca.synthesize,
+            sink=self._broca,
+            tracer=self._latency,
+        )
+        self._speech_stream.attach_event_bus(self._event_bus)
+        print(f"{Fore.GREEN}    └── Akışlı konuşma aktif (AI_SPEECH_DELTA){Style.RESET_ALL}")
+
+    def _boot_temporal(self):
+        """Temporal (Kulak)"""
         from core.lobes.temporal import get_temporal
-        from core.lobes.occipital import get_occipital
-        
         self._temporal = get_temporal()
         self._temporal.start()
-        self._threads.append(self._temporal)
-        
+        self._register_thread("temporal", self._temporal)
+
+    def _boot_occipital(self):
+        """Occipital (Göz)"""
+        from core.lobes.occipital import get_occipital
         self._occipital = get_occipital()
+        self._attach_frame_bus(self._occipital)
+        self._admit_vision(self._occipital)
         self._occipital.start()
-        self._threads.append(self._occipital)
-        
-        # ═══════════════════════════════════════════════════════════════
-        # v10.1 İNSANSI MODÜLLER
-        # ═══════════════════════════════════════════════════════════════
-        
-        # 10. Brain Integration (Modül Entegrasyonu)
-        print(f"{Fore.CYAN}[10/15] Brain Integration...{Style.RESET_ALL}")
+        self._register_thread("occipital", self._occipital)
+
+    def _admit_vision(self, organ):
+        """Vision modellerini VRAM bütçesine sabitle (LLM katmanları yer açmak için boşaltamaz)"""
+        from core.residency_manager import ResidencyError, get_residency_manager, measure_size
         try:
-            from core.brain_integration import get_brain_integration
-            self._brain_integration = get_brain_integration()
-            # Modülleri bağla
-            self._brain_integration.connect_modules(
-                limbic=self._limbic,
-                hypothalamus=self._hypothalamus,
-                episodic=self._episodic_memory,  # Aşağıda yüklenecek
-                meta=self._meta_cognition  # Aşağıda yüklenecek
-            )
-            print(f"{Fore.GREEN}    └── Beyin entegrasyonu aktif{Style.RESET_ALL}")
-        except Exception as e:
-            print(f"{Fore.RED}    └── Hata: {e}{Style.RESET_ALL}")
-        
-        # 11. Meta-Cognition (Öz-farkındalık)
-        print(f"{Fore.CYAN}[11/15] Meta-Cognition...{Style.RESET_ALL}")
+            get_residency_manager(platform="thor").admit("vision", size_bytes=measure_size(organ),
+                                                         kind="vision", pin=True)
+        except ResidencyError as e:
+            print(f"{Fore.YELLOW}    └── Vision bütçesi: {e}{Style.RESET_ALL}")
+
+    def _attach_frame_bus(self, organ):
+        """Kamera karelerini kopyasız paylaş (organ set_frame_bus destekliyorsa)"""
+        if not hasattr(organ, 'set_frame_bus'):
+            return
+        if self._frame_bus is None:
+            from core.frame_bus import get_frame_bus
+            self._frame_bus = get_frame_bus()
+        organ.set_frame_bus(self._frame_bus)
+
+    def _boot_vision_scheduler(self):
+        """Detection / yüz tanıma / VLM ritim zamanlayıcısı (occipital modellerini kaydeder)"""
+        if not hasattr(self._occipital, 'set_vision_scheduler'):
+            print(f"{Fore.YELLOW}    └── Vision scheduler: occipital desteklemiyor{Style.RESET_ALL}")
+            return
+        from core.vision_scheduler import get_vision_scheduler
+        self._vision_scheduler = get_vision_scheduler()
+        self._occipital.set_vision_scheduler(self._vision_scheduler)
+        if self._frame_bus:
+            self._vision_scheduler.attach(self._frame_bus)
+        self._stats_exporter.register("vision_scheduler", self._vision_scheduler.get_stats)
+        print(f"{Fore.GREEN}    └── Model başına görme ritmi aktif{Style.RESET_ALL}")
+
+    def _boot_meta_cognition(self):
+        """Meta-Cognition (Öz-farkındalık)"""
         try:
             from core.meta_cognition import get_meta_cognition
             self._meta_cognition = get_meta_cognition()
             print(f"{Fore.GREEN}    └── Öz-farkındalık aktif{Style.RESET_ALL}")
         except Exception as e:
-            print(f"{Fore.RED}    └── Hata: {e}{Style.RESET_ALL}")
-        
-        # 12. Episodic Memory (Yaşam Boyu Anılar)
-        print(f"{Fore.CYAN}[12/15] Episodic Memory...{Style.RESET_ALL}")
+            print(f"{Fore.RED}    └── Meta-Cognition hata: {e}{Style.RESET_ALL}")
+
+    def _boot_episodic_memory(self):
+        """Episodic Memory (Yaşam Boyu Anılar)"""
         try:
             from core.episodic_memory import get_episodic_memory
             self._episodic_memory = get_episodic_memory()
             print(f"{Fore.GREEN}    └── Episodik hafıza aktif{Style.RESET_ALL}")
         except Exception as e:
-            print(f"{Fore.RED}    └── Hata: {e}{Style.RESET_ALL}")
-        
-        # Brain Integration'a geç yüklenen modülleri bağla
-        if self._brain_integration:
+            print(f"{Fore.RED}    └── Episodic Memory hata: {e}{Style.RESET_ALL}")
+
+    def _boot_tiered_memory(self):
+        """Sıcak/ılık/soğuk hafıza katmanları (memory.long_term) + arka plan göçü"""
+        from core.tiered_memory import get_tiered_memory
+        self._tiered_memory = get_tiered_memory()
+        for organ in (self._episodic_memory, self._hippocampus):
+            if organ is not None and hasattr(organ, "set_memory_store"):
+                organ.set_memory_store(self._tiered_memory)
+        self._tiered_memory.start()
+        self._stats_exporter.register("tiered_memory", self._tiered_memory.get_stats)
+        stats = self._tiered_memory.get_stats()
+        print(f"{Fore.GREEN}    └── Hafıza katmanları: {stats['hot']} sıcak, {stats['warm']} ılık, "
+              f"{stats['cold']} soğuk{Style.RESET_ALL}")
+
+    def _recall_context(self, utterance=None, scene=None, k=5):
+        """Konuşma + sahne + aktif hedefler için tek vektörize hatırlama"""
+        from core.batch_recall import context_queries
+        return self._tiered_memory.recall_many(context_queries(utterance, scene, self._goal_manager), k)
+
+    def _boot_brain_integration(self):
+        """Brain Integration (Modül Entegrasyonu) - bağlanacak modüller hazır olduktan sonra"""
+        try:
+            from core.brain_integration import get_brain_integration
+            self._brain_integration = get_brain_integration()
             self._brain_integration.connect_modules(
+                limbic=self._limbic,
+                hypothalamus=self._hypothalamus,
                 episodic=self._episodic_memory,
                 meta=self._meta_cognition
             )
-        
-        # ═══════════════════════════════════════════════════════════════
-        # v11.0 İNSANSI BİLİNÇ - Spontan Davranış Sistemi
-        # ═══════════════════════════════════════════════════════════════
-        print(f"{Fore.CYAN}[12.5/15] Human-Like Consciousness...{Style.RESET_ALL}")
+            if self._tiered_memory and hasattr(self._brain_integration, "set_batch_recall"):
+                self._brain_integration.set_batch_recall(self._recall_context)
+            print(f"{Fore.GREEN}    └── Beyin entegrasyonu aktif{Style.RESET_ALL}")
+        except Exception as e:
+            print(f"{Fore.RED}    └── Brain Integration hata: {e}{Style.RESET_ALL}")
+
+    def _boot_consciousness(self):
+        """v11.0 İnsansı Bilinç - Spontan Davranış Sistemi"""
         try:
             from core.consciousness import HumanLikeBrain
             self._consciousness = HumanLikeBrain()
-            
+
             # Callback'leri bağla
             self._consciousness.set_callbacks(
                 visual_callback=lambda: self._occipital.get_latest() if self._occipital and hasattr(self._occipital, 'get_latest') else None,
-                action_callback=lambda text: self._event_bus.publish(
-                    "AI_SPEECH_TEXT",
-                    {"text": text, "is_spontaneous": True},
-                    source="consciousness"
-                ) if self._event_bus else None
+                action_callback=self._speak_spontaneous
             )
-            
+
+            self._attach_snapshot("consciousness")
             self._consciousness.start()
-            self._threads.append(self._consciousness)
+            self._register_thread("consciousness", self._consciousness)
             print(f"{Fore.GREEN}    └── Bilinç akışı ve spontan davranış aktif{Style.RESET_ALL}")
         except Exception as e:
             print(f"{Fore.YELLOW}    └── Bilinç: {e}{Style.RESET_ALL}")
-        
-        # ═══════════════════════════════════════════════════════════════
-        # v13.0 EMERGENT ORGANIC AI - Faz 9 Modülleri
-        # Kişilik, dürtüler, değerler, rasyonellik, kimlik
-        # ═══════════════════════════════════════════════════════════════
-        print(f"{Fore.CYAN}[12.6/15] Emergent Organic AI...{Style.RESET_ALL}")
-        self._emergent_ai = None
-        self._self_improvement = None
-        
+
+    def _speak_spontaneous(self, text: str):
+        """Spontan konuşma - akış varsa ilk cümle hemen seslendirilir, süren cevabı kesmez"""
+        if self._speech_stream:
+            self._speech_stream.speak_text(text, interrupt=False)
+        self._publish_speech(text, "spontaneous", True, source="consciousness")
+
+    def _speak_response(self, text: str, kind: str = "answer"):
+        """Cevap konuşması (kind: ack / draft / answer) - ack'i kesmeden arkasına eklenir"""
+        if self._speech_stream:
+            self._speech_stream.speak_text(text, interrupt=(kind == "ack"))
+        self._publish_speech(text, kind, False, source="hierarchical_brain")
+
+    def _publish_speech(self, text: str, kind: str, is_spontaneous: bool, source: str):
+        """
+        AI_SPEECH_TEXT her söz için yayınlanır (life log ve diğer dinleyiciler).
+        Akış seslendirdiyse streamed=True: broca tekrar seslendirmez, sadece kayıt.
+        """
+        if self._event_bus:
+            self._event_bus.publish(
+                "AI_SPEECH_TEXT",
+                {"text": text, "is_spontaneous": is_spontaneous, "kind": kind,
+                 "streamed": self._speech_stream is not None},
+                source=source
+            )
+
+    def _boot_emergent_ai(self):
+        """v13.0 Emergent Organic AI - Kişilik, dürtüler, değerler, kimlik"""
         try:
             from core.emergent_organic_ai import get_emergent_ai
             self._emergent_ai = get_emergent_ai()
@@ -307,7 +675,9 @@ class DerinCNS:
             print(f"{Fore.GREEN}    └── Ortaya çıkan kişilik aktif{Style.RESET_ALL}")
         except Exception as e:
             print(f"{Fore.YELLOW}    └── Emergent AI: {e}{Style.RESET_ALL}")
-        
+
+    def _boot_self_improvement(self):
+        """Öz-geliştirme koordinatörü"""
         try:
             from core.self_improvement_coordinator import get_self_improvement_coordinator
             self._self_improvement = get_self_improvement_coordinator()
@@ -315,11 +685,9 @@ class DerinCNS:
             print(f"{Fore.GREEN}    └── Öz-geliştirme sistemi aktif{Style.RESET_ALL}")
         except Exception as e:
             print(f"{Fore.YELLOW}    └── Self-Improvement: {e}{Style.RESET_ALL}")
-        
-        # ═══════════════════════════════════════════════════════════════
-        # v18.0 FAZ 1 MODÜLLERİ - Kişilik, Dürtüler, Kimlik, Değerler
-        # ═══════════════════════════════════════════════════════════════
-        print(f"{Fore.CYAN}[12.7/15] FAZ 1 Kognitif Modüller...{Style.RESET_ALL}")
+
+    def _boot_faz1(self):
+        """v18.0 FAZ 1 - Kişilik, Dürtüler, Kimlik, Değerler"""
         faz1_loaded = 0
         try:
             from core.emergent_personality import get_personality
@@ -342,84 +710,75 @@ class DerinCNS:
             faz1_loaded += 1
         except: pass
         print(f"{Fore.GREEN}    └── {faz1_loaded}/4 kognitif modül yüklendi{Style.RESET_ALL}")
-        
-        # ═══════════════════════════════════════════════════════════════
-        # v18.0 FAZ 5-7 MODÜLLERİ - Context Bridge, Goals, Self-Model
-        # ═══════════════════════════════════════════════════════════════
-        print(f"{Fore.CYAN}[12.8/15] FAZ 5-7 Entity Modülleri...{Style.RESET_ALL}")
-        faz5_7_loaded = 0
-        
-        # FAZ 5: Context Bridge
+
+    def _boot_context_bridge(self):
+        """FAZ 5: Context Bridge"""
         try:
             from core.context_bridge import get_context_bridge
             self._context_bridge = get_context_bridge()
-            faz5_7_loaded += 1
             print(f"{Fore.GREEN}    └── ContextBridge: Cross-model context aktif{Style.RESET_ALL}")
         except Exception as e:
             self._context_bridge = None
             print(f"{Fore.YELLOW}    └── ContextBridge: {e}{Style.RESET_ALL}")
-        
-        # FAZ 6: Persistent Goals
+
+    def _boot_goal_manager(self):
+        """FAZ 6: Persistent Goals"""
         try:
             from core.goal_manager import get_goal_manager
             self._goal_manager = get_goal_manager()
             goals_count = len(self._goal_manager.get_active())
-            faz5_7_loaded += 1
             print(f"{Fore.GREEN}    └── GoalManager: {goals_count} aktif hedef (persistent){Style.RESET_ALL}")
         except Exception as e:
             self._goal_manager = None
             print(f"{Fore.YELLOW}    └── GoalManager: {e}{Style.RESET_ALL}")
-        
-        # FAZ 7: Self-Model
+
+    def _boot_self_model(self):
+        """FAZ 7: Self-Model"""
         try:
             from core.self_model import get_self_model
             self._self_model = get_self_model()
             caps = self._self_model.get_stats()["enabled_capabilities"]
-            faz5_7_loaded += 1
             print(f"{Fore.GREEN}    └── SelfModel: {caps} yetenek aktif (persistent){Style.RESET_ALL}")
         except Exception as e:
             self._self_model = None
             print(f"{Fore.YELLOW}    └── SelfModel: {e}{Style.RESET_ALL}")
-        
-        print(f"{Fore.GREEN}    └── {faz5_7_loaded}/3 entity modül yüklendi{Style.RESET_ALL}")
-        
-        # ═══════════════════════════════════════════════════════════════
-        # v10.2 CHAPPIE/FINCH MODÜLLER
-        # ═══════════════════════════════════════════════════════════════
-        
-        # 13. Smooth Motion (Akıcı Hareket)
-        print(f"{Fore.CYAN}[13/15] Smooth Motion...{Style.RESET_ALL}")
+
+    def _boot_smooth_motion(self):
+        """v10.2 Smooth Motion (Akıcı Hareket)"""
         try:
             from robotics.smooth_motion import get_smooth_motion
             self._smooth_motion = get_smooth_motion()
             self._smooth_motion.start()
             print(f"{Fore.GREEN}    └── Akıcı hareket aktif (60 FPS){Style.RESET_ALL}")
         except Exception as e:
-            print(f"{Fore.RED}    └── Hata: {e}{Style.RESET_ALL}")
-        
-        # 14. Continuous Vision (Sürekli Görme)
-        print(f"{Fore.CYAN}[14/15] Continuous Vision...{Style.RESET_ALL}")
+            print(f"{Fore.RED}    └── Smooth Motion hata: {e}{Style.RESET_ALL}")
+
+    def _boot_continuous_vision(self):
+        """Continuous Vision (Sürekli Görme) - servo callback için smooth motion'dan sonra"""
         try:
             from vision.continuous_vision import get_continuous_vision
             self._continuous_vision = get_continuous_vision()
             # Servo callback bağla
             if self._smooth_motion:
                 self._continuous_vision.servo_callback = lambda p, t: self._smooth_motion.move_smooth(pan=p, tilt=t, duration_ms=100)
+            self._attach_frame_bus(self._continuous_vision)
             self._continuous_vision.start()
             print(f"{Fore.GREEN}    └── Sürekli görme aktif{Style.RESET_ALL}")
         except Exception as e:
-            print(f"{Fore.RED}    └── Hata: {e}{Style.RESET_ALL}")
-        
-        # 15. Stereo Coordination (100mm Stereo)
-        print(f"{Fore.CYAN}[15/15] Stereo Coordination...{Style.RESET_ALL}")
+            print(f"{Fore.RED}    └── Continuous Vision hata: {e}{Style.RESET_ALL}")
+
+    def _boot_stereo_coordination(self):
+        """Stereo Coordination (100mm Stereo)"""
         try:
             from vision.stereo_coordination import get_stereo_coordination
             self._stereo_coordination = get_stereo_coordination(baseline_mm=100)
+            self._attach_frame_bus(self._stereo_coordination)
             print(f"{Fore.GREEN}    └── 100mm stereo koordinasyon aktif{Style.RESET_ALL}")
         except Exception as e:
-            print(f"{Fore.RED}    └── Hata: {e}{Style.RESET_ALL}")
-        
-        # Robotik modüller (opsiyonel - servo olmadan simülasyon)
+            print(f"{Fore.RED}    └── Stereo hata: {e}{Style.RESET_ALL}")
+
+    def _boot_robotics(self):
+        """Robotik modüller (opsiyonel - servo olmadan simülasyon)"""
         try:
             from robotics.eye_contact import get_eye_contact
             from robotics.conversational_gestures import get_conversational_gestures
@@ -432,7 +791,367 @@ class DerinCNS:
             print(f"{Fore.GREEN}    └── Göz teması ve jestler aktif{Style.RESET_ALL}")
         except Exception as e:
             print(f"{Fore.YELLOW}    └── Robotik: {e}{Style.RESET_ALL}")
-        
+
+    def _boot_control_loop(self):
+        """Olay tabanlı kontrol: hypothalamus durumu → limbic / occipital / meta-cognition"""
+        from core.control_loop import EventDrivenControlLoop, HypothalamusStatePublisher
+
+        from core.platform_config import get_section
+
+        self._control_loop = EventDrivenControlLoop(
+            self._event_bus,
+            limbic=self._limbic,
+            occipital=self._occipital,
+            meta_cognition=self._meta_cognition,
+            vision_scheduler=self._vision_scheduler,
+            max_vision_fps=get_section("vision", "camera", "fps", default=30),
+        )
+        self._control_loop.start()
+
+        self._state_publisher = HypothalamusStatePublisher(self._hypothalamus, self._event_bus)
+        self._state_publisher.start()
+        print(f"{Fore.GREEN}    └── Olay tabanlı kontrol döngüsü aktif{Style.RESET_ALL}")
+
+    def _boot_qos_governor(self):
+        """Sıcaklık / yük kademeleri → vision, katman, batch, arka plan, gece işleri"""
+        from core.platform_config import get_platform_profile
+        from core import qos_governor as qos
+
+        if not get_platform_profile("thor").get("features", {}).get("thermal_management", True):
+            print(f"{Fore.YELLOW}    └── QoS: thermal_management kapalı{Style.RESET_ALL}")
+            return
+        self._qos_governor = qos.get_qos_governor(platform="thor", event_bus=self._event_bus)
+        # Warm start: kademe eylemler eklenmeden geri yüklenir → her eylem bir kez,
+        # doğrudan kayıtlı kademeyle uygulanır (önce NORMAL sonra eski kademe değil)
+        self._attach_snapshot("qos_governor")
+        if self._vision_scheduler:
+            self._qos_governor.add_action("vision", qos.vision_action(self._vision_scheduler))
+        if self._batch_scheduler:
+            self._qos_governor.add_action("batch", qos.batch_action(self._batch_scheduler))
+        residency = getattr(self._model_manager, 'residency', None)
+        if residency:
+            self._qos_governor.add_action("night_tasks", qos.night_action(residency))
+        self._qos_governor.add_action("layers", lambda tier: self._apply_available_layers())
+        self._qos_governor.add_action("background_thoughts",
+                                      qos.pause_action([self._consciousness, self._emergent_ai]))
+        self._qos_governor.start()
+        self._stats_exporter.register("qos", self._qos_governor.get_status)
+        print(f"{Fore.GREEN}    └── QoS governor aktif ({self._qos_governor.tier.name}){Style.RESET_ALL}")
+
+    def _boot_prefix_cache(self):
+        """Persona ön eki (DNA + kişilik + değerler) katman başına bir kez kodlanır"""
+        manager = self._model_manager
+        if not manager or not hasattr(manager, 'encode_prefix'):
+            print(f"{Fore.YELLOW}    └── Prefix cache: model manager encode_prefix desteklemiyor{Style.RESET_ALL}")
+            return
+        from core.prefix_cache import PrefixCache
+        kwargs = {}
+        if hasattr(manager, 'count_tokens'):
+            kwargs["count_tokens"] = manager.count_tokens
+        self._prefix_cache = PrefixCache(encode=manager.encode_prefix, **kwargs)
+        self._prefix_cache.attach_event_bus(self._event_bus)
+        self._stats_exporter.register("prefix_cache", self._prefix_cache.get_stats)
+        if self._hierarchical_brain and hasattr(self._hierarchical_brain, 'set_prefix_cache'):
+            self._hierarchical_brain.set_prefix_cache(self._prefix_cache)
+        print(f"{Fore.GREEN}    └── Persona prefix cache aktif{Style.RESET_ALL}")
+
+    def _boot_semantic_cache(self):
+        """Reflex sınıfı sorgular için semantik cevap önbelleği + cevap giriş noktası"""
+        try:
+            from core.semantic_cache import SemanticCache, make_sentence_embedder
+            self._semantic_cache = SemanticCache(make_sentence_embedder())
+            self._stats_exporter.register("semantic_cache", self._semantic_cache.get_stats)
+            print(f"{Fore.GREEN}    └── Semantik cache aktif{Style.RESET_ALL}")
+        except Exception as e:
+            print(f"{Fore.YELLOW}    └── Semantik cache: {e}{Style.RESET_ALL}")
+
+        if not self._prefix_cache and self._event_bus:
+            from core.prefix_cache import INVALIDATION_TOPICS
+            for topic in INVALIDATION_TOPICS:
+                self._event_bus.subscribe(topic, self._invalidate_persona)
+
+        if self._frontal and hasattr(self._frontal, 'set_responder'):
+            self._frontal.set_responder(self.respond)
+
+    def _boot_metrics(self):
+        """Organ metrikleri → Prometheus metin formatı (HTTP + derin metrics)"""
+        from core import metrics
+        from core.platform_config import get_section
+
+        registry = self._metrics = metrics.get_metrics_registry()
+        if self._event_bus:
+            registry.register_collector("event_bus", metrics.event_bus_collector(self._event_bus))
+        if self._batch_scheduler:
+            registry.register_collector("batch_scheduler", metrics.batch_scheduler_collector(self._batch_scheduler))
+        if self._vision_scheduler:
+            target_fps = get_section("vision", "camera", "fps", default=30)
+            registry.register_collector("vision", metrics.vision_collector(self._vision_scheduler, target_fps))
+        if self._qos_governor:
+            registry.register_collector("qos", metrics.qos_collector(self._qos_governor))
+        if self._tiered_memory:
+            registry.register_collector("tiered_memory", metrics.tiered_memory_collector(self._tiered_memory))
+        if self._prefix_cache:
+            registry.register_collector("prefix_cache", metrics.prefix_cache_collector(self._prefix_cache))
+        if self._speculative:
+            registry.register_collector("speculative", metrics.speculative_collector(self._speculative))
+
+        self._stats_exporter.register("prometheus", registry.families)
+        if self._control_server:
+            self._control_server.register("prometheus", registry.families)
+
+        config = get_section("system", "metrics", default={}) or {}
+        if config.get("http", True):
+            self._metrics_server = metrics.MetricsHTTPServer(registry, config.get("host", "127.0.0.1"),
+                                                             config.get("port", 9464))
+            try:
+                self._metrics_server.start()
+                print(f"{Fore.GREEN}    └── Metrikler: {self._metrics_server.url}{Style.RESET_ALL}")
+            except OSError as e:
+                self._metrics_server = None
+                print(f"{Fore.YELLOW}    └── Metrik HTTP: {e}{Style.RESET_ALL}")
+
+    def _record_boot_metrics(self):
+        if not self._metrics or not self._boot_report:
+            return
+        stage_seconds = self._metrics.gauge("derin_boot_stage_seconds", "Boot aşama süresi", labels=("stage",))
+        for name, timing in self._boot_report.timings.items():
+            stage_seconds.labels(stage=name).set(timing.duration)
+        self._metrics.gauge("derin_boot_seconds", "Boot duvar saati süresi").set(self._boot_report.wall_time)
+
+    def _thread_organs(self):
+        """Örnekleyici için thread ident → onu başlatan boot aşaması (_register_thread kayıtları)"""
+        with self._threads_lock:
+            stage_threads = {name: list(objects) for name, objects in self._stage_threads.items()}
+        organs = {}
+        for name, objects in stage_threads.items():
+            for obj in objects:
+                candidates = [obj, getattr(obj, '_thread', None)] + list(getattr(obj, '_threads', None) or [])
+                for thread in candidates:
+                    if isinstance(thread, threading.Thread) and thread.ident is not None:
+                        organs[thread.ident] = name
+        return organs
+
+    def _boot_profiler(self):
+        """Örnekleyici profiler: profile_performance açıksa sürekli, değilse derin profile ile"""
+        from core.platform_config import get_section
+        from core.sampling_profiler import get_sampling_profiler
+
+        self._profiler = get_sampling_profiler(organ_map=self._thread_organs)
+        if self._control_server:
+            self._control_server.register("profile", self._profile_window)
+        if get_section("development", "profile_performance", default=False):
+            self._profiler.start()
+            self._stats_exporter.register("profiler", self._profiler.get_stats)
+            print(f"{Fore.GREEN}    └── Sürekli profiler aktif "
+                  f"({self._profiler.interval * 1000:.0f}ms, ek yük ≤ %{self._profiler.max_overhead * 100:g})"
+                  f"{Style.RESET_ALL}")
+
+    def _profile_window(self, seconds: float = 10.0):
+        """control socket "profile": sonraki N saniyenin collapsed stack sayıları"""
+        seconds = max(0.1, min(float(seconds), 300.0))
+        return {"counts": self._profiler.window(seconds), "seconds": seconds, **self._profiler.get_stats()}
+
+    def _persona_version(self):
+        """Persona ön ekinin parmak izi (prefix cache yoksa bir kez hesaplanıp saklanır)"""
+        if self._prefix_cache:
+            return self._prefix_cache.current_prefix()[0]
+        version = self._persona_fingerprint
+        if version is None:
+            from core.prefix_cache import build_persona_prefix, fingerprint
+            generation = self._persona_generation
+            version = fingerprint(build_persona_prefix())
+            if generation == self._persona_generation:  # Hesaplarken persona değişmediyse sakla
+                self._persona_fingerprint = version
+        return version
+
+    def _invalidate_persona(self, event=None):
+        self._persona_generation += 1
+        self._persona_fingerprint = None
+
+    def _mood_bucket(self):
+        """Limbic durumunun kaba kovası - değişince cache geçersiz olur"""
+        limbic = self._limbic
+        if limbic and hasattr(limbic, 'get_dominant_emotion'):
+            return str(limbic.get_dominant_emotion())
+        return None
+
+    def respond(self, query: str, user_id: str = "default") -> str:
+        """Kullanıcı sorgusuna cevap: semantik cache → spekülatif hiyerarşik beyin"""
+        cache = self._semantic_cache
+        if cache:
+            cache.set_context(self._persona_version(), self._mood_bucket())
+            cached = cache.lookup(query, user_id)
+            if cached is not None:
+                self._speak_response(cached, "answer")
+                return cached
+
+        if self._speculative:
+            result = self._speculative.respond(query)
+            text, layer = result.text, result.layer
+        elif self._hierarchical_brain:
+            text, layer = self._generate(query, source="user"), None
+            self._speak_response(text, "answer")
+        else:
+            raise RuntimeError("Cevap verecek model yok")
+
+        if cache and layer:
+            cache.put(query, text, user_id, layer=layer)
+        return text
+
+    def _build_boot_graph(self):
+        """
+        Organ bağımlılık grafiği.
+
+        Kritik aşamalar (critical=True) hata verirse boot durur;
+        diğerleri kendi hatalarını yakalayıp None olarak kalır.
+        """
+        from core.boot_graph import BootGraph
+
+        graph = BootGraph()
+
+        def stage(name, func, deps=(), critical=True):
+            def run():
+                print(f"{Fore.CYAN}[BOOT] {name}...{Style.RESET_ALL}")
+                func()
+                if name in self._SNAPSHOT_ORGANS:
+                    self._attach_snapshot(name)
+            graph.add(name, run, deps=deps, critical=critical)
+
+        # Çekirdek (v8.0)
+        stage("container", self._boot_container)
+        stage("event_bus", self._boot_event_bus)
+        stage("dna", self._boot_dna)
+        stage("brainstem", self._boot_brainstem)
+        stage("hypothalamus", self._boot_hypothalamus)
+        stage("hippocampus", self._boot_hippocampus)
+        stage("limbic", self._boot_limbic)
+        stage("stats_exporter", self._boot_stats_exporter)
+        stage("latency", self._boot_latency, deps=["event_bus", "stats_exporter"])
+        stage("life_log", self._boot_life_log, deps=["event_bus", "stats_exporter"], critical=False)
+        stage("control_socket", self._boot_control_socket, deps=["stats_exporter", "latency", "life_log"],
+              critical=False)
+        stage("broca", self._boot_broca, deps=["event_bus", "brainstem", "latency"])
+        stage("frontal", self._boot_frontal, deps=["event_bus", "brainstem", "latency"])
+        stage("speech_stream", self._boot_speech_stream, deps=["broca", "frontal"], critical=False)
+        stage("temporal", self._boot_temporal, deps=["event_bus"])
+        stage("occipital", self._boot_occipital, deps=["event_bus"])
+        stage("vision_scheduler", self._boot_vision_scheduler,
+              deps=["occipital", "stats_exporter"], critical=False)
+
+        # v10.1 İnsansı modüller
+        stage("meta_cognition", self._boot_meta_cognition, critical=False)
+        stage("episodic_memory", self._boot_episodic_memory, critical=False)
+        stage("tiered_memory", self._boot_tiered_memory,
+              deps=["hippocampus", "episodic_memory", "stats_exporter"], critical=False)
+        stage("brain_integration", self._boot_brain_integration,
+              deps=["limbic", "hypothalamus", "episodic_memory", "meta_cognition", "tiered_memory"],
+              critical=False)
+
+        # v11.0 - v18.0 bilinç ve kognitif modüller
+        stage("consciousness", self._boot_consciousness,
+              deps=["event_bus", "occipital", "speech_stream"], critical=False)
+        stage("emergent_ai", self._boot_emergent_ai, critical=False)
+        stage("self_improvement", self._boot_self_improvement, critical=False)
+        stage("faz1", self._boot_faz1, critical=False)
+        stage("context_bridge", self._boot_context_bridge, critical=False)
+        stage("goal_manager", self._boot_goal_manager, critical=False)
+        stage("self_model", self._boot_self_model, critical=False)
+
+        # v10.2 Chappie/Finch modüller
+        stage("smooth_motion", self._boot_smooth_motion, critical=False)
+        stage("continuous_vision", self._boot_continuous_vision, deps=["smooth_motion"], critical=False)
+        stage("stereo_coordination", self._boot_stereo_coordination, critical=False)
+        stage("robotics", self._boot_robotics, deps=["smooth_motion"], critical=False)
+
+        # Kontrol döngüsü - tükettiği organlar hazır olunca
+        stage("control_loop", self._boot_control_loop,
+              deps=["event_bus", "hypothalamus", "limbic", "occipital", "meta_cognition",
+                    "vision_scheduler"])
+
+        # v20.0 Modeller - organlarla paralel yüklenir
+        stage("models", self._boot_models, deps=["event_bus", "stats_exporter"], critical=False)
+        stage("prefix_cache", self._boot_prefix_cache, deps=["models", "dna", "faz1", "stats_exporter"],
+              critical=False)
+        stage("batch_scheduler", self._boot_batch_scheduler, deps=["models", "stats_exporter", "consciousness"],
+              critical=False)
+        stage("qos_governor", self._boot_qos_governor,
+              deps=["event_bus", "stats_exporter", "vision_scheduler", "models", "batch_scheduler",
+                    "consciousness", "emergent_ai"], critical=False)
+        stage("semantic_cache", self._boot_semantic_cache,
+              deps=["models", "prefix_cache", "limbic", "frontal", "stats_exporter"], critical=False)
+
+        # Gözlemlenebilirlik - ölçtüğü organlar hazır olunca
+        stage("metrics", self._boot_metrics,
+              deps=["event_bus", "stats_exporter", "control_socket", "batch_scheduler", "vision_scheduler",
+                    "qos_governor", "tiered_memory", "prefix_cache"], critical=False)
+        stage("profiler", self._boot_profiler, deps=["stats_exporter", "control_socket"], critical=False)
+
+        return graph
+
+    def _prepare_snapshot(self):
+        """Anlık görüntü yazıcısını kur; --warm-start ise son görüntüyü oku"""
+        from core.platform_config import get_section
+        from core.state_snapshot import StateSnapshotter, load_latest
+
+        config = get_section("system", "snapshot", default={}) or {}
+        if not config.get("enabled", True):
+            return
+        self._snapshotter = StateSnapshotter()
+        if self._warm_start:
+            self._warm_snapshot = load_latest(max_age=config.get("max_age_hours", 24) * 3600)
+            if self._warm_snapshot is None:
+                print(f"{Fore.YELLOW}[SNAPSHOT] Geçerli anlık görüntü yok - soğuk boot{Style.RESET_ALL}")
+
+    def _attach_snapshot(self, name: str):
+        """
+        Organı anlık görüntüye kaydet; warm start ise durumunu hemen geri yükle.
+
+        Thread başlatan organların boot fonksiyonları bunu start()'tan önce
+        çağırır (thread'ler soğuk durumla hiç çalışmaz); aşama sonundaki
+        çağrı o zaman etkisizdir.
+        """
+        if name in self._snapshot_attached:
+            return
+        organ = getattr(self, self._SNAPSHOT_ORGANS[name])
+        if not self._snapshotter or not self._snapshotter.register_organ(name, organ):
+            return
+        self._snapshot_attached.add(name)
+        if self._warm_snapshot is not None:
+            self._restore_report[name] = self._snapshotter.restore(self._warm_snapshot, name)
+
+    def _start_snapshot(self):
+        from core.platform_config import get_section
+        from core.state_snapshot import format_restore_report
+
+        if not self._snapshotter:
+            return
+        if self._warm_snapshot is not None:
+            print(f"{Fore.CYAN}{format_restore_report(self._restore_report, self._warm_snapshot)}{Style.RESET_ALL}")
+        self._snapshotter.start(get_section("system", "snapshot", "interval_seconds", default=60))
+        if self._stats_exporter:
+            self._stats_exporter.register("snapshot", self._snapshotter.get_stats)
+
+    def boot(self):
+        """Sistemi başlat - paralel boot (bağımlılık grafiği)"""
+        print(f"{Fore.YELLOW}[CNS] Boot sequence başlatılıyor ({self._boot_workers} worker)...{Style.RESET_ALL}")
+
+        from core.boot_graph import BootError
+
+        self._prepare_snapshot()
+        self._boot_graph = self._build_boot_graph()
+        try:
+            self._boot_report = self._boot_graph.run(max_workers=self._boot_workers)
+        except BootError as e:
+            self._boot_report = getattr(e, "report", None)
+            if self._boot_report:
+                print(f"{Fore.RED}{self._boot_report.format()}{Style.RESET_ALL}")
+            raise
+
+        print(f"{Fore.CYAN}{self._boot_report.format()}{Style.RESET_ALL}")
+        self._record_boot_metrics()
+        self._start_snapshot()
+
+        identity = self._identity
         print(f"""
 {Fore.GREEN}
 ╔═══════════════════════════════════════════════════════════════╗
@@ -445,92 +1164,231 @@ class DerinCNS:
 ║     👁️ Sürekli Görme: Aktif                                   ║
 ║     🤖 Akıcı Hareket: Aktif                                   ║
 ║                                                               ║
-║     Model yükleme başlıyor...                                ║
+║     Modeller arka planda yükleniyor...                       ║
 ║                                                               ║
 ╚═══════════════════════════════════════════════════════════════╝
 {Style.RESET_ALL}
 """)
-        
+
         # ═══════════════════════════════════════════════════════════════
         # AŞAMALI MODEL YÜKLEME (Thor için optimize)
-        # Modeller sırayla yüklenir - memory spike önlenir
+        # Boot ile paralel başladı; reflex katmanı gelince dinlemeye geç,
+        # üst katmanlar arka planda yüklenmeye devam eder.
         # ═══════════════════════════════════════════════════════════════
-        self._load_models_staged()
-        
+        if self._model_pipeline:
+            if self._model_pipeline.wait_for_layer("reflex"):
+                print(f"{Fore.GREEN}[MODEL] Reflex katmanı hazır - üst katmanlar arka planda yükleniyor{Style.RESET_ALL}")
+            else:
+                print(f"{Fore.RED}[MODEL] Reflex katmanı yüklenemedi{Style.RESET_ALL}")
+
         print(f"{Fore.GREEN}[CNS] Konuşmaya başla, dinliyorum... (Ctrl+C ile çık){Style.RESET_ALL}")
-        
+
         self._running = True
-    
+
     def run(self):
-        """Ana döngü"""
+        """Ana döngü - olay tabanlı; organlar Event Bus üzerinden tepki verir"""
         try:
-            while self._running:
-                # Hypothalamus durumunu Limbic'e aktar
-                if self._hypothalamus and self._limbic:
-                    state = self._hypothalamus.state
-                    self._limbic.update_from_hypothalamus(
-                        state.energy,
-                        state.is_sleeping or state.energy < 30
-                    )
-                
-                # Sıcaklık kontrolü - Occipital FPS ayarla
-                if self._hypothalamus and self._occipital:
-                    fps = self._hypothalamus.get_vision_fps()
-                    self._occipital.set_fps(fps)
-                
-                # v10.1: Meta-cognition güncelle
-                if self._meta_cognition:
-                    try:
-                        self._meta_cognition.update_cognitive_load()
-                    except:
-                        pass
-                
-                # v10.2: Smooth motion idle animasyonu
-                if self._smooth_motion and not self._smooth_motion.is_moving():
-                    # Canlılık sistemi zaten çalışıyor (nefes, jitter)
-                    pass
-                
-                time.sleep(5.0)
-                
+            # Ana thread sadece kapanış sinyalini bekler (boşta uyanma yok)
+            while self._running and not self._shutdown_event.wait():
+                pass
         except KeyboardInterrupt:
-            print(f"\n{Fore.YELLOW}[CNS] Kapatılıyor...{Style.RESET_ALL}")
-            self.shutdown()
-    
-    def shutdown(self):
-        """Sistemi kapat"""
+            pass
+        print(f"\n{Fore.YELLOW}[CNS] Kapatılıyor...{Style.RESET_ALL}")
+        return self.shutdown()
+
+    def request_shutdown(self):
+        """Sinyal güvenli: ana thread'i uyandırır, kapanışı run() yapar"""
         self._running = False
-        
-        # Event bus'ı durdur
-        if self._event_bus:
-            self._event_bus.stop()
-        
-        # Thread'leri durdur
-        for t in self._threads:
+        self._shutdown_event.set()
+
+    # Kapanışta kalıcı depolarını diske yazan organlar (flush/save/persist sunanlar)
+    _PERSISTENT_ORGANS = ("hippocampus", "episodic_memory", "goal_manager", "self_model")
+    _FLUSH_HOOKS = ("flush", "save", "persist")
+
+    def _flush_organ(self, name: str):
+        organ = getattr(self, f"_{name}")
+        for hook in self._FLUSH_HOOKS:
+            if callable(getattr(organ, hook, None)):
+                getattr(organ, hook)()
+                return
+
+    def _stop_threads(self, threads, graph):
+        """Aşamanın thread'lerini durdur ve kalan süre içinde bekle"""
+        for t in threads:
             if hasattr(t, 'stop'):
                 t.stop()
-        
-        # Bekle
-        for t in self._threads:
-            if t.is_alive():
-                t.join(timeout=2.0)
-        
+        for t in threads:
+            if hasattr(t, 'join') and t.is_alive():
+                t.join(timeout=graph.remaining())
+
+    def _build_shutdown_graph(self):
+        """
+        Kapanış grafiği = boot grafiğinin tersi (tüketen organ önce durur).
+
+        Ek sıralar: anlık görüntü her şeyden önce alınır; event bus, ona bağlı
+        (olay üreten) tüm organlar durduktan sonra ve abone havuzları (life_log,
+        tiered_memory) kapanmadan önce boşaltılır;
+        frame bus, kareleri okuyan/yazan tüm görme organları durduktan sonra kapanır.
+        """
+        from core.shutdown_graph import ShutdownGraph
+
+        stops = {}
+
+        def add_stop(name, func):
+            previous = stops.get(name)
+            stops[name] = (lambda: (previous(), func())) if previous else func
+
+        with self._threads_lock:
+            stage_threads = {name: list(threads) for name, threads in self._stage_threads.items()}
+        for name, threads in stage_threads.items():
+            add_stop(name, lambda threads=threads: self._stop_threads(threads, graph))
+        for name in self._PERSISTENT_ORGANS:
+            if getattr(self, f"_{name}") is not None:
+                add_stop(name, lambda name=name: self._flush_organ(name))
+
+        if self._state_publisher or self._control_loop:
+            add_stop("control_loop", lambda: [organ.stop() for organ in (self._state_publisher, self._control_loop)
+                                              if organ])
+        if self._supervision or self._speculative:
+            def stop_responders():
+                if self._speculative:
+                    self._speculative.shutdown()
+                if self._supervision:
+                    self._supervision.stop(timeout=graph.remaining(2.0))
+            add_stop("models", stop_responders)
+        if self._qos_governor:
+            add_stop("qos_governor", self._qos_governor.stop)
+        if self._batch_scheduler:
+            add_stop("batch_scheduler", lambda: self._batch_scheduler.stop(timeout=graph.remaining(2.0)))
+        if self._control_server:
+            add_stop("control_socket", self._control_server.stop)
+        if self._metrics_server:
+            add_stop("metrics", self._metrics_server.stop)
+        if self._profiler:
+            add_stop("profiler", self._profiler.stop)
+        if self._stats_exporter:
+            # Son istatistikleri yaz (derin_cli okur)
+            add_stop("stats_exporter", lambda: self._stats_exporter.stop(flush=True))
+        if self._life_log:
+            add_stop("life_log", self._life_log.close)
+        if self._tiered_memory:
+            add_stop("tiered_memory", lambda: self._tiered_memory.stop(save=True))
+        if self._vision_scheduler:
+            add_stop("vision_scheduler", self._vision_scheduler.stop)
+        for name in ("continuous_vision", "stereo_coordination"):
+            organ = getattr(self, f"_{name}")
+            if organ is not None and hasattr(organ, 'stop'):
+                add_stop(name, organ.stop)
+        if self._event_bus:
+            add_stop("event_bus", self._event_bus.stop)
+
+        graph = ShutdownGraph.reverse_of(self._boot_graph, stops)
+        if self._event_bus:
+            sinks = {"event_bus", "life_log", "tiered_memory"}
+            graph.add("event_bus_drain", lambda: self._event_bus.drain(timeout=graph.remaining(2.0)),
+                      after=self._event_producers(sinks), before=sorted(sinks))
+        if self._frame_bus:
+            # Kare halkasının shared memory'si, yazan ve okuyan tüm organlar durduktan sonra bırakılır
+            graph.add("frame_bus", self._frame_bus.close,
+                      after=["occipital", "continuous_vision", "stereo_coordination", "vision_scheduler"])
+        if self._snapshotter:
+            # Son anlık görüntü (organlar durmadan önce)
+            graph.add("snapshot", lambda: self._snapshotter.stop(final_save=True), before=list(graph.steps))
+        return graph
+
+    def _event_producers(self, sinks):
+        """
+        Event bus'a (geçişli) bağımlı aşamalar = olay üretebilecek organlar.
+        Abone havuzları ve onların kendi boot bağımlılıkları hariç (onlar
+        havuzdan sonra durur; drain'i beklemeleri kapanışta döngü yaratır).
+        """
+        dependents = self._boot_graph.dependents()
+        stages = self._boot_graph.stages
+        deps = {name: set(stage.deps) for name, stage in stages.items()}
+
+        def closure(start, edges):
+            seen, frontier = set(), list(start)
+            while frontier:
+                name = frontier.pop()
+                if name not in seen:
+                    seen.add(name)
+                    frontier.extend(edges[name])
+            return seen
+
+        producers = closure(dependents["event_bus"], dependents)
+        return sorted(producers - sinks - closure([d for s in sinks if s in deps for d in deps[s]], deps))
+
+    def shutdown(self):
+        """
+        Sistemi kapat: ters bağımlılık sırasıyla, paralel, tek süre sınırı altında
+        (config.yaml → system.shutdown.deadline_seconds). Rapor döner; tekrar çağrılırsa None.
+        """
+        with self._shutdown_lock:
+            if self._stopped:
+                return None
+            self._stopped = True
+        self.request_shutdown()
+
+        from core.platform_config import get_section
+        deadline = get_section("system", "shutdown", "deadline_seconds", default=10.0)
+        if self._boot_graph is None:
+            print(f"{Fore.GREEN}[CNS] Hoşçakal!{Style.RESET_ALL}")
+            return None
+
+        report = self._build_shutdown_graph().run(deadline=deadline)
+        color = Fore.CYAN if report.clean else Fore.YELLOW
+        print(f"{color}{report.format()}{Style.RESET_ALL}")
         print(f"{Fore.GREEN}[CNS] Hoşçakal!{Style.RESET_ALL}")
+        return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="DERİN - Central Nervous System")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='Import süresi ağacı + boot aşama süreleri yazdır ve çık')
+    parser.add_argument('--boot-workers', type=int, default=4, help='Paralel boot worker sayısı')
+    parser.add_argument('--warm-start', action='store_true',
+                        help='Organ durumlarını son anlık görüntüden geri yükle (data/state/organism.snap)')
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv=None):
     """Ana giriş noktası"""
-    cns = DerinCNS()
+    args = parse_args(argv)
+    profiler = None
+    if args.profile_startup:
+        from core.startup_profiler import start_import_profiler
+        profiler = start_import_profiler()
+
+    setup_console()
+    print(BANNER)
+    start_autonomous()
+
+    cns = DerinCNS(boot_workers=args.boot_workers, warm_start=args.warm_start)
     
-    # SIGINT handler
+    # SIGINT / SIGTERM: kapanışı ana thread'de run() yapar; ikinci sinyal zorla çıkar
     def signal_handler(sig, frame):
-        cns.shutdown()
-        sys.exit(0)
+        if cns._shutdown_event.is_set():
+            print(f"{Fore.RED}[CNS] Zorla çıkılıyor{Style.RESET_ALL}")
+            os._exit(130)
+        cns.request_shutdown()
     
     signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
     
     # Boot ve çalıştır
     cns.boot()
-    cns.run()
+    if profiler:
+        profiler.stop()
+        print(f"{Fore.CYAN}{profiler.format()}{Style.RESET_ALL}")
+        print(f"{Fore.CYAN}{cns._boot_report.format()}{Style.RESET_ALL}")
+        cns.shutdown()
+        return
+    report = cns.run()
+    if report is not None and report.overdue:
+        # Süreyi aşan organın thread'i süreci açık tutmasın (durum zaten diske yazıldı)
+        sys.stdout.flush()
+        os._exit(1)
 
 
 if __name__ == "__main__":
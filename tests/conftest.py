@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Derin root'u ekle (benchmarks/ ile aynı)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,147 @@
+"""BackupRepository: yerel dizin ağacında simüle edilmiş günlük değişimle artımlı yedekleme"""
+
+import os
+import random
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+import core.backup_store as backup_store
+from core.backup_store import BackupError, BackupRepository
+
+CHUNK = 4096
+PAGE = CHUNK  # SQLite sayfası = chunk boyutu (sayfa değişimi = tek chunk)
+
+
+class FakeDatetime(datetime):
+    """Snapshot kimlikleri için kontrol edilen 'şimdi'"""
+    current = datetime(2026, 1, 1, 3, 0, 0)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.current
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    monkeypatch.setattr(backup_store, "datetime", FakeDatetime)
+    FakeDatetime.current = datetime(2026, 1, 1, 3, 0, 0)
+    return FakeDatetime
+
+
+class Tree:
+    """vector_store (sayfa güncellemeli SQLite), checkpoints (ekleme), voice profilleri (yeni/silinen)"""
+
+    def __init__(self, root: Path, seed: int = 1):
+        self.root = root
+        self.rng = random.Random(seed)
+        self.day = 0
+        self.targets = {name: str(root / name) for name in ("vector_store", "checkpoints", "voice_profiles")}
+        for path in self.targets.values():
+            Path(path).mkdir(parents=True)
+        self._write("vector_store/memory.sqlite", self._random(64 * PAGE))
+        self._write("checkpoints/log.jsonl", self._random(8 * CHUNK))
+        self._write("voice_profiles/sahip.npy", self._random(3 * CHUNK))
+        # Aynı içerik iki yerde: chunk'lar bir kez saklanmalı
+        self._write("vector_store/copy.sqlite", (self.root / "vector_store/memory.sqlite").read_bytes())
+
+    def _random(self, size: int) -> bytes:
+        return self.rng.randbytes(size)
+
+    def _write(self, rel: str, data: bytes, mode: str = "wb"):
+        path = self.root / rel
+        with open(path, mode) as f:
+            f.write(data)
+        stamp = 1_700_000_000 + self.day * 86400 + self.rng.randrange(86400)
+        os.utime(path, ns=(stamp * 10**9, stamp * 10**9))
+
+    def churn(self):
+        """Bir gün: 3 sayfa güncellenir, checkpoint'e ekleme, yeni profil, bazen silme"""
+        self.day += 1
+        db = self.root / "vector_store/memory.sqlite"
+        data = bytearray(db.read_bytes())
+        for page in self.rng.sample(range(len(data) // PAGE), 3):
+            data[page * PAGE:(page + 1) * PAGE] = self._random(PAGE)
+        self._write("vector_store/memory.sqlite", bytes(data))
+        self._write("checkpoints/log.jsonl", self._random(CHUNK), mode="ab")
+        self._write(f"voice_profiles/misafir{self.day}.npy", self._random(CHUNK))
+        if self.day % 3 == 0:
+            (self.root / f"voice_profiles/misafir{self.day - 1}.npy").unlink()
+
+    def contents(self):
+        return {path.relative_to(self.root).as_posix(): path.read_bytes()
+                for path in sorted(self.root.rglob("*")) if path.is_file()}
+
+
+def restored_contents(destination: Path):
+    return {path.relative_to(destination).as_posix(): path.read_bytes()
+            for path in sorted(destination.rglob("*")) if path.is_file()}
+
+
+def test_daily_churn_is_incremental_and_restorable(tmp_path, clock):
+    tree = Tree(tmp_path / "data")
+    repo = BackupRepository(tmp_path / "backups", chunk_size=CHUNK, workers=2)
+
+    first = repo.backup(tree.targets, tag="ilk")
+    assert first["new_bytes"] < first["total_size_bytes"]  # Kopya dosya tekilleşti
+    expected = {first["id"]: tree.contents()}
+
+    for _ in range(7):
+        clock.current += timedelta(days=1)
+        tree.churn()
+        manifest = repo.backup(tree.targets)
+        expected[manifest["id"]] = tree.contents()
+        # Gün başına: 3 sayfa + 1 ekleme chunk'ı + 1 yeni profil (son kısmi chunk dahil)
+        assert manifest["new_chunks"] <= 6
+        assert manifest["new_bytes"] <= 6 * CHUNK
+        assert manifest["unchanged_files"] >= 2  # copy.sqlite ve sahip.npy okunmadı
+        assert manifest["reused_bytes"] > 10 * manifest["new_bytes"]
+
+    for snapshot_id, contents in expected.items():
+        destination = tmp_path / "restore" / snapshot_id
+        repo.restore(snapshot_id, destination)
+        assert restored_contents(destination) == contents
+        assert repo.verify(snapshot_id)["errors"] == []
+
+
+def test_unchanged_tree_stores_nothing(tmp_path, clock):
+    tree = Tree(tmp_path / "data")
+    repo = BackupRepository(tmp_path / "backups", chunk_size=CHUNK, workers=2)
+    repo.backup(tree.targets)
+    clock.current += timedelta(hours=1)
+    again = repo.backup(tree.targets)
+    assert again["new_bytes"] == 0 and again["new_chunks"] == 0
+    assert again["unchanged_files"] == again["file_count"]
+
+
+def test_retention_and_gc_reclaim_only_unreferenced_chunks(tmp_path, clock):
+    tree = Tree(tmp_path / "data")
+    repo = BackupRepository(tmp_path / "backups", chunk_size=CHUNK, workers=2)
+    for _ in range(10):
+        repo.backup(tree.targets)
+        clock.current += timedelta(days=1)
+        tree.churn()
+    latest = repo.latest()["id"]
+
+    removed = repo.prune(keep_last=2, keep_daily=3, keep_weekly=0, keep_monthly=0)
+    assert len(removed) == 7
+    assert len(repo.snapshot_ids()) == 3 and latest in repo.snapshot_ids()
+
+    freed = repo.gc()
+    assert freed["chunks_removed"] > 0
+    for snapshot_id in repo.snapshot_ids():
+        assert repo.verify(snapshot_id)["errors"] == []
+    assert repo.gc()["chunks_removed"] == 0
+
+
+def test_corrupt_chunk_is_detected(tmp_path, clock):
+    tree = Tree(tmp_path / "data")
+    repo = BackupRepository(tmp_path / "backups", chunk_size=CHUNK, workers=2)
+    snapshot_id = repo.backup(tree.targets)["id"]
+    chunk_id = repo.load_manifest(snapshot_id)["files"][0]["chunks"][0]
+    path = repo._chunk_path(chunk_id)
+    path.write_bytes(b"r" + b"\0" * CHUNK)
+    assert repo.verify(snapshot_id)["errors"]
+    with pytest.raises(BackupError):
+        repo.read_chunk(chunk_id)
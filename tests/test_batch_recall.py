@@ -0,0 +1,47 @@
+"""Batch recall: çok sorgulu top-k ve tur bağlamından sorgu üretimi"""
+
+from types import SimpleNamespace
+
+import numpy as np
+
+from core.batch_recall import batch_topk, context_queries
+
+
+class StubGoalManager:
+    """Gerçek GoalManager yüzeyi: sadece get_active()"""
+
+    def __init__(self, goals):
+        self.goals = goals
+
+    def get_active(self):
+        return list(self.goals)
+
+
+def test_context_queries_uses_goal_manager_get_active():
+    goals = [SimpleNamespace(description="Python öğren"), SimpleNamespace(name="kitap bitir"), "spor"]
+    texts = context_queries("merhaba", scene="masa başı", goal_manager=StubGoalManager(goals))
+    assert texts == {
+        "utterance": "merhaba",
+        "scene": "masa başı",
+        "goal:0": "Python öğren",
+        "goal:1": "kitap bitir",
+        "goal:2": "spor",
+    }
+
+
+def test_context_queries_caps_goals():
+    manager = StubGoalManager([f"hedef {i}" for i in range(10)])
+    texts = context_queries(goal_manager=manager, max_goals=3)
+    assert list(texts) == ["goal:0", "goal:1", "goal:2"]
+
+
+def test_batch_topk_matches_per_query_argsort():
+    rng = np.random.default_rng(0)
+    memory = rng.standard_normal((1000, 16)).astype(np.float32)
+    memory /= np.linalg.norm(memory, axis=1, keepdims=True)
+    queries = memory[[3, 500, 999]]
+    prior = rng.random(1000).astype(np.float32) * 0.1
+    idx, score, _ = batch_topk(queries, memory, prior, k=5, block=128)
+    expected = np.argsort(-(queries @ memory.T + prior), axis=1)[:, :5]
+    assert np.array_equal(idx, expected)
+    assert np.all(np.diff(score, axis=1) <= 0)
@@ -0,0 +1,171 @@
+"""LayerScheduler / BatchSchedulerPool: StubModel ile batching, öncelik, preemption, kapanış"""
+
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from core.batch_scheduler import BatchSchedulerPool, GenerationRequest, LayerScheduler, Priority, StubModel
+
+
+class GatedModel(StubModel):
+    """İlk decode adımı gate açılana kadar bekler (kuyruğu doldurmak için)"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.gate = threading.Event()
+        self.batches = []
+
+    def decode(self, requests):
+        self.gate.wait(2.0)
+        self.batches.append([r.source for r in requests])
+        return super().decode(requests)
+
+
+@pytest.fixture
+def scheduler_factory():
+    schedulers = []
+
+    def make(model, **kwargs):
+        scheduler = LayerScheduler("social", model, **kwargs)
+        scheduler.start()
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in schedulers:
+        scheduler.stop(timeout=1.0)
+
+
+def test_concurrent_requests_share_decode_steps(scheduler_factory):
+    scheduler = scheduler_factory(StubModel(step_cost=0.001, per_request_cost=0.0), max_batch=8, max_wait=0.05)
+    requests = [scheduler.submit(GenerationRequest(f"p{i}", Priority.PROACTIVE, max_tokens=5)) for i in range(8)]
+    assert all(r.result(5.0) == "x " * 5 for r in requests)
+    stats = scheduler.get_stats()
+    assert stats["completed"] == 8 and stats["tokens"] == 40
+    assert stats["steps"] < 40  # Sıralı olsaydı istek başına 6 adım
+
+
+def test_user_turn_is_served_before_background(scheduler_factory):
+    model = GatedModel(step_cost=0.0, per_request_cost=0.0)
+    scheduler = scheduler_factory(model, max_batch=1, max_wait=0.0)
+    blocker = scheduler.submit(GenerationRequest("ilk", Priority.USER_TURN, max_tokens=1, source="blocker"))
+    time.sleep(0.05)  # blocker aktif, decode gate'te bekliyor
+    background = scheduler.submit(GenerationRequest("b", Priority.BACKGROUND, max_tokens=1, source="background"))
+    user = scheduler.submit(GenerationRequest("u", Priority.USER_TURN, max_tokens=1, source="user"))
+    model.gate.set()
+    for request in (blocker, background, user):
+        request.result(5.0)
+    order = [batch[0] for batch in model.batches]
+    assert order.index("user") < order.index("background")
+
+
+def test_full_batch_preempts_background_for_user_turn(scheduler_factory):
+    model = StubModel(step_cost=0.005, per_request_cost=0.0)
+    scheduler = scheduler_factory(model, max_batch=1, max_wait=0.0)
+    background = scheduler.submit(GenerationRequest("b", Priority.BACKGROUND, max_tokens=40))
+    time.sleep(0.03)
+    user = scheduler.submit(GenerationRequest("u", Priority.USER_TURN, max_tokens=3))
+    assert user.result(5.0) == "x " * 3
+    assert not background.future.done()  # Kaldığı yerden devam edecek
+    assert background.result(5.0) == "x " * 40
+    assert background.preemptions >= 1
+
+
+def test_preempt_background_holds_background_work(scheduler_factory):
+    scheduler = scheduler_factory(StubModel(step_cost=0.001, per_request_cost=0.0), max_wait=0.0)
+    scheduler.preempt_background(hold_seconds=0.3)
+    started = time.monotonic()
+    background = scheduler.submit(GenerationRequest("b", Priority.BACKGROUND, max_tokens=1))
+    user = scheduler.submit(GenerationRequest("u", Priority.USER_TURN, max_tokens=1))
+    user.result(2.0)
+    assert not background.future.done()
+    background.result(2.0)
+    assert time.monotonic() - started >= 0.25
+
+
+def test_cancelled_request_is_dropped(scheduler_factory):
+    model = GatedModel(step_cost=0.0, per_request_cost=0.0)
+    scheduler = scheduler_factory(model, max_batch=1, max_wait=0.0)
+    scheduler.submit(GenerationRequest("ilk", max_tokens=1, source="blocker"))
+    time.sleep(0.05)
+    doomed = scheduler.submit(GenerationRequest("iptal", max_tokens=1, source="doomed"))
+    doomed.cancel()
+    model.gate.set()
+    with pytest.raises(CancelledError):
+        doomed.result(2.0)
+    assert scheduler.get_stats()["cancelled"] == 1
+    assert all("doomed" not in batch for batch in model.batches)
+
+
+def test_stop_fails_pending_requests():
+    model = GatedModel(step_cost=0.0, per_request_cost=0.0)
+    scheduler = LayerScheduler("social", model, max_batch=1, max_wait=0.0)
+    scheduler.start()
+    scheduler.submit(GenerationRequest("ilk", max_tokens=1))
+    time.sleep(0.05)
+    pending = scheduler.submit(GenerationRequest("bekleyen", max_tokens=1))
+    scheduler.stop(timeout=0.1)
+    model.gate.set()
+    with pytest.raises(RuntimeError):
+        pending.result(1.0)
+
+
+def test_pool_scale_and_stop_within_budget():
+    pool = BatchSchedulerPool(max_batch=8, max_wait=0.0)
+    models = {layer: GatedModel(step_cost=0.0, per_request_cost=0.0) for layer in ("social", "social_plus")}
+    for layer, model in models.items():
+        pool.add_layer(layer, model)
+    pool.scale_batch(0.25)
+    assert pool._schedulers["social"].max_batch == 2
+    for layer in models:
+        pool.submit(layer, "takılan", max_tokens=1)
+    time.sleep(0.05)
+    started = time.monotonic()
+    pool.stop(timeout=0.2)  # Decode gate'te takılı; toplam süre katman sayısıyla katlanmamalı
+    assert time.monotonic() - started < 0.4
+    for model in models.values():
+        model.gate.set()
+
+
+def test_pool_generate_batches_concurrent_traffic():
+    """Kullanıcı turu + proaktif + denetim trafiği aynı katmanda paylaşılan decode adımlarında"""
+    pool = BatchSchedulerPool(max_batch=8, max_wait=0.02)
+    pool.add_layer("social", StubModel(step_cost=0.005, per_request_cost=0.0))
+    results = {}
+
+    def caller(name, priority):
+        results[name] = pool.generate("social", name, priority, max_tokens=4, timeout=5.0, source=name)
+
+    callers = [threading.Thread(target=caller, args=(f"{p.name}-{i}", p))
+               for i in range(3) for p in (Priority.USER_TURN, Priority.PROACTIVE, Priority.BACKGROUND)]
+    try:
+        for t in callers:
+            t.start()
+        for t in callers:
+            t.join(5.0)
+        stats = pool.get_stats()["social"]
+    finally:
+        pool.stop(timeout=0.5)
+    assert len(results) == 9 and all(text == "x " * 4 for text in results.values())
+    assert stats["completed"] == 9 and stats["tokens"] == 36
+    assert stats["steps"] < 36 / 2  # İstekler adımları paylaştı
+    assert pool.has_layer("social") and not pool.has_layer("cortical")
+
+
+def test_pool_generate_timeout_cancels_request():
+    pool = BatchSchedulerPool(max_batch=1, max_wait=0.0)
+    model = GatedModel(step_cost=0.0, per_request_cost=0.0)
+    pool.add_layer("social", model)
+    try:
+        pool.submit("social", "takılan", max_tokens=1)
+        time.sleep(0.05)
+        with pytest.raises(TimeoutError):
+            pool.generate("social", "geç", timeout=0.05)
+        model.gate.set()
+        time.sleep(0.1)
+        assert pool.get_stats()["social"]["cancelled"] == 1
+    finally:
+        model.gate.set()
+        pool.stop(timeout=0.5)
@@ -0,0 +1,55 @@
+"""HypothalamusStatePublisher: polling geri çekilmesi değişikliği 1 sn'den fazla geciktirmez"""
+
+import time
+import threading
+from types import SimpleNamespace
+
+from core.control_loop import HYPOTHALAMUS_STATE, HypothalamusStatePublisher
+
+
+class PollOnlyHypothalamus:
+    """register_state_callback sunmayan hypothalamus (izleme thread'i yolu)"""
+
+    def __init__(self):
+        self.state = SimpleNamespace(energy=80.0, is_sleeping=False, temperature=45.0)
+
+    def get_vision_fps(self):
+        return 30 if self.state.temperature < 70 else 10
+
+
+class Bus:
+    def __init__(self):
+        self.published = []
+        self.event = threading.Event()
+
+    def publish(self, topic, data, source=None):
+        self.published.append((time.monotonic(), topic, data))
+        self.event.set()
+
+
+def test_publishes_initial_state_once():
+    bus = Bus()
+    publisher = HypothalamusStatePublisher(PollOnlyHypothalamus(), bus)
+    publisher.start()
+    try:
+        time.sleep(0.3)
+    finally:
+        publisher.stop()
+    assert [topic for _, topic, _ in bus.published] == [HYPOTHALAMUS_STATE]
+
+
+def test_change_after_idle_reaches_bus_within_max_interval():
+    hypothalamus, bus = PollOnlyHypothalamus(), Bus()
+    publisher = HypothalamusStatePublisher(hypothalamus, bus)
+    publisher.start()
+    try:
+        time.sleep(1.5)  # Geri çekilme tavana ulaşsın
+        bus.event.clear()
+        changed_at = time.monotonic()
+        hypothalamus.state.temperature = 85.0
+        assert bus.event.wait(2.0)
+    finally:
+        publisher.stop()
+    published_at, _, state = bus.published[-1]
+    assert state["vision_fps"] == 10
+    assert published_at - changed_at < 0.5 + 0.2
@@ -0,0 +1,97 @@
+"""FrameBus: SyntheticFrameSource ile kopyasız paylaşım, referans sayımı, stereo eşleme"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from core.frame_bus import FrameBus, SyntheticFrameSource
+
+WIDTH, HEIGHT = 64, 48
+
+
+@pytest.fixture
+def bus():
+    bus = FrameBus(width=WIDTH, height=HEIGHT, slots=4)
+    yield bus
+    bus.close()
+
+
+def test_consumers_share_one_copy(bus):
+    source = SyntheticFrameSource(WIDTH, HEIGHT)
+    frame = source.next_frame()
+    seq = bus.write(frame)
+    with bus.latest() as a, bus.latest() as b:
+        assert a.seq == b.seq == seq
+        assert np.array_equal(a.array, frame)
+        assert np.shares_memory(a.array, b.array)  # Kopya yok
+        assert not a.array.flags.writeable
+        with pytest.raises(ValueError):
+            a.array[0, 0, 0] = 1
+
+
+def test_held_slot_is_not_overwritten(bus):
+    source = SyntheticFrameSource(WIDTH, HEIGHT)
+    bus.write(source.next_frame())
+    held = bus.latest()
+    snapshot = held.array.copy()
+    source.run(bus, frames=10)
+    assert np.array_equal(held.array, snapshot)
+    assert bus.latest().seq > held.seq
+    held.release()
+
+
+def test_frames_dropped_when_every_slot_is_held(bus):
+    source = SyntheticFrameSource(WIDTH, HEIGHT)
+    handles = []
+    for _ in range(bus.slots):
+        bus.write(source.next_frame())
+        handles.append(bus.latest())
+    assert bus.write(source.next_frame()) is None
+    assert bus.get_stats()["dropped_busy"] == 1
+    handles[0].release()
+    assert bus.write(source.next_frame()) is not None
+    for handle in handles[1:]:
+        handle.release()
+    assert bus.get_stats()["in_use"] == 0
+
+
+def test_wait_next_wakes_on_new_frame(bus):
+    source = SyntheticFrameSource(WIDTH, HEIGHT)
+    received = []
+
+    def consumer():
+        handle = bus.wait_next(after_seq=0, timeout=2.0)
+        received.append(handle.seq if handle else None)
+        if handle:
+            handle.release()
+
+    thread = threading.Thread(target=consumer)
+    thread.start()
+    source.run(bus, frames=1)
+    thread.join(2.0)
+    assert received == [1]
+    assert bus.wait_next(after_seq=1, timeout=0.05) is None
+
+
+def test_pair_matches_nearest_timestamps(bus):
+    frame = SyntheticFrameSource(WIDTH, HEIGHT).next_frame()
+    bus.write(frame, timestamp=10.000, camera_id=0)
+    bus.write(frame, timestamp=10.030, camera_id=1)
+    assert bus.pair(max_skew=0.010) is None
+    bus.write(frame, timestamp=10.033, camera_id=0)
+    left, right = bus.pair(max_skew=0.010)
+    assert (left.camera_id, right.camera_id) == (0, 1)
+    assert abs(left.timestamp - right.timestamp) <= 0.010
+    left.release()
+    right.release()
+
+
+def test_attached_bus_reads_producer_frames(bus):
+    frame = SyntheticFrameSource(WIDTH, HEIGHT).next_frame()
+    bus.write(frame)
+    reader = FrameBus.attach(bus.name, width=WIDTH, height=HEIGHT, slots=4)
+    try:
+        assert any(np.array_equal(reader._frames[slot], frame) for slot in range(reader.slots))
+    finally:
+        reader.close()
@@ -0,0 +1,110 @@
+"""PrefixCache: katman başına tek kodlama, parmak izi / olay ile geçersiz kılma, prefill tasarrufu"""
+
+import threading
+import time
+
+from core.event_bus import EventBus
+from core.metrics import prefix_cache_collector
+from core.prefix_cache import PrefixCache, describe, fingerprint
+
+
+class Persona:
+    def __init__(self, text):
+        self.text = text
+
+    def __call__(self):
+        return self.text
+
+
+class CountingEncoder:
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, layer, text):
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls.append(layer)
+        return f"kv:{layer}:{fingerprint(text)}"
+
+
+def test_each_layer_encoded_once_and_hits_save_prefill():
+    encoder = CountingEncoder()
+    cache = PrefixCache(Persona("ben derin kişilik değerler"), encode=encoder)
+    for _ in range(3):
+        for layer in ("reflex", "social"):
+            cache.get(layer)
+    stats = cache.get_stats()
+    assert sorted(encoder.calls) == ["reflex", "social"]
+    assert stats["hits"] == 4 and stats["misses"] == 2
+    assert stats["saved_prefill_tokens"] == 4 * 4
+    assert stats["hit_rate"] == 4 / 6
+
+
+def test_concurrent_gets_encode_a_layer_once():
+    encoder = CountingEncoder(delay=0.05)
+    cache = PrefixCache(Persona("persona"), encode=encoder)
+    threads = [threading.Thread(target=cache.get, args=("social",)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert encoder.calls == ["social"]
+
+
+def test_changed_persona_reencodes_after_recheck():
+    persona = Persona("eski kişilik")
+    encoder = CountingEncoder()
+    cache = PrefixCache(persona, encode=encoder, recheck_interval=0.0)
+    first = cache.get("social")
+    persona.text = "yeni kişilik"
+    second = cache.get("social")
+    assert first.fingerprint != second.fingerprint
+    assert encoder.calls == ["social", "social"]
+
+
+def test_unchanged_persona_survives_recheck():
+    encoder = CountingEncoder()
+    cache = PrefixCache(Persona("aynı"), encode=encoder, recheck_interval=0.0)
+    cache.get("social")
+    cache.get("social")
+    assert encoder.calls == ["social"]
+
+
+def test_invalidation_event_clears_cache():
+    encoder = CountingEncoder()
+    cache = PrefixCache(Persona("persona"), encode=encoder)
+    bus = EventBus()
+    cache.attach_event_bus(bus)
+    bus.start()
+    try:
+        cache.get("reflex")
+        bus.publish("PERSONA_CHANGED", {})
+        assert bus.drain(2.0)
+    finally:
+        bus.stop()
+    cache.get("reflex")
+    assert encoder.calls == ["reflex", "reflex"]
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_metrics_collector_exports_hit_rate_and_saved_tokens():
+    cache = PrefixCache(Persona("a b c"))
+    cache.get("reflex")
+    cache.get("reflex")
+    samples = {name: value for name, _, _, _, value in prefix_cache_collector(cache)()}
+    assert samples["derin_prefix_cache_hit_ratio"] == 0.5
+    assert samples["derin_prefix_cache_saved_prefill_tokens_total"] == 3
+
+
+def test_describe_prefers_prompt_methods():
+    class Module:
+        def to_prompt(self):
+            return "prompt"
+
+        def to_dict(self):
+            return {"x": 1}
+
+    assert describe(Module()) == "prompt"
+    assert describe(None) == ""
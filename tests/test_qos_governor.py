@@ -0,0 +1,142 @@
+"""QoSGovernor: SimulatedSensor ile kademe geçişleri, histerezis, eylemler"""
+
+import time
+
+from core.batch_scheduler import BatchSchedulerPool, StubModel
+from core.event_bus import EventBus
+from core.qos_governor import (QOS_TIER_CHANGED, QoSGovernor, QoSPolicy, SensorReading, SimulatedSensor, Tier,
+                               allowed_layers, batch_action, pause_action, vision_action)
+from core.vision_scheduler import VisionScheduler
+
+
+class ManualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def temps(*values):
+    return [SensorReading(temperature=t) for t in values]
+
+
+def run(governor, sensor, clock, steps, dt=1.0):
+    tiers = []
+    for _ in range(steps):
+        clock.now += dt
+        tiers.append(governor.evaluate(sensor.read()))
+    return tiers
+
+
+def test_tiers_follow_temperature_with_hysteresis_and_dwell():
+    clock = ManualClock()
+    sensor = SimulatedSensor(temps(60, 76, 86, 96, 84, 84, 70))
+    governor = QoSGovernor(sensor, QoSPolicy(min_dwell=0.0), clock=clock)
+    tiers = run(governor, sensor, clock, 7)
+    # 84°C: critical eşiğinin altında ama histerezis payı (3°C) içinde → CRITICAL'da kalır
+    assert tiers == [Tier.NORMAL, Tier.ELEVATED, Tier.CRITICAL, Tier.EMERGENCY, Tier.CRITICAL,
+                     Tier.CRITICAL, Tier.NORMAL]
+
+
+def test_min_dwell_delays_step_down_but_not_step_up():
+    clock = ManualClock()
+    sensor = SimulatedSensor(temps(90, 60, 60, 60, 96))
+    governor = QoSGovernor(sensor, QoSPolicy(min_dwell=2.5), clock=clock)
+    tiers = run(governor, sensor, clock, 5)
+    assert tiers == [Tier.CRITICAL, Tier.CRITICAL, Tier.CRITICAL, Tier.NORMAL, Tier.EMERGENCY]
+
+
+def test_cpu_and_gpu_load_raise_tier():
+    policy = QoSPolicy(max_cpu_percent=80, gpu_memory_fraction=0.8)
+    assert policy.classify(SensorReading(cpu_percent=85)) == Tier.ELEVATED
+    assert policy.classify(SensorReading(cpu_percent=97)) == Tier.CRITICAL
+    assert policy.classify(SensorReading(gpu_memory_fraction=0.9)) == Tier.ELEVATED
+    assert policy.classify(SensorReading(temperature=60, cpu_percent=20)) == Tier.NORMAL
+
+
+def test_actions_applied_on_register_and_transition():
+    clock = ManualClock()
+    sensor = SimulatedSensor(temps(60, 90))
+    governor = QoSGovernor(sensor, QoSPolicy(min_dwell=0.0), clock=clock)
+
+    vision = VisionScheduler()
+    pool = BatchSchedulerPool(max_batch=8)
+    pool.add_layer("social", StubModel(step_cost=0.0, per_request_cost=0.0))
+    paused = []
+
+    class Thinker:
+        def pause_background(self):
+            paused.append(True)
+
+        def resume_background(self):
+            paused.append(False)
+
+    try:
+        governor.add_action("vision", vision_action(vision))
+        governor.add_action("batch", batch_action(pool))
+        governor.add_action("thoughts", pause_action([Thinker(), None]))
+        assert vision.effective_budget == 1.0 and paused == [False]
+
+        run(governor, sensor, clock, 2)
+        assert governor.tier == Tier.CRITICAL
+        assert vision.effective_budget == 0.3
+        assert pool._schedulers["social"].max_batch == 4
+        assert paused == [False, True]
+    finally:
+        pool.stop(timeout=0.5)
+
+
+def test_failing_action_does_not_block_others():
+    governor = QoSGovernor(SimulatedSensor(temps(90)), QoSPolicy(min_dwell=0.0))
+    applied = []
+    governor.add_action("broken", lambda tier: 1 / 0)
+    governor.add_action("ok", applied.append)
+    governor.evaluate()
+    assert applied == [Tier.NORMAL, Tier.CRITICAL]
+
+
+def test_transition_is_published_and_recorded():
+    bus = EventBus()
+    received = []
+    bus.subscribe(QOS_TIER_CHANGED, lambda event: received.append(event.data))
+    bus.start()
+    try:
+        governor = QoSGovernor(SimulatedSensor(temps(80)), event_bus=bus)
+        governor.evaluate()
+        assert bus.drain(2.0)
+    finally:
+        bus.stop()
+    assert received == [{"tier": "ELEVATED", "previous": "NORMAL"}]
+    assert governor.get_status()["transitions"][-1]["to"] == "ELEVATED"
+
+
+def test_state_round_trip_restores_tier():
+    governor = QoSGovernor(SimulatedSensor(temps(90)))
+    governor.evaluate()
+    restored = QoSGovernor(SimulatedSensor([]))
+    applied = []
+    restored.add_action("probe", applied.append)
+    restored.set_state(governor.get_state())
+    assert restored.tier == Tier.CRITICAL
+    assert applied[-1] == Tier.CRITICAL
+
+
+def test_allowed_layers_shrink_with_tier():
+    layers = ["reflex", "social", "social_plus", "cortical"]
+    assert allowed_layers(layers, Tier.NORMAL) == layers
+    assert allowed_layers(layers, Tier.ELEVATED) == ["reflex", "social", "social_plus"]
+    assert allowed_layers(layers, Tier.EMERGENCY) == ["reflex"]
+
+
+def test_background_loop_reads_sensor():
+    sensor = SimulatedSensor(temps(90))
+    governor = QoSGovernor(sensor, interval=0.01)
+    governor.start()
+    try:
+        deadline = time.monotonic() + 2.0
+        while governor.tier == Tier.NORMAL and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        governor.stop()
+    assert governor.tier == Tier.CRITICAL
@@ -0,0 +1,117 @@
+"""ResidencyManager: sahte boyutlu modellerle bütçe / eviction / gece takası"""
+
+import pytest
+
+from core.residency_manager import GB, BudgetedModelManager, ResidencyError, ResidencyManager
+
+
+class FakeModel:
+    def __init__(self, layer, size_gb):
+        self.layer = layer
+        self.size_bytes = int(size_gb * GB)
+
+
+class FakeManager:
+    """MultiModelManager yerine: katman başına sabit boyutlu sahte model"""
+
+    def __init__(self, sizes_gb):
+        self.sizes_gb = sizes_gb
+        self.loaded = {}
+        self.unloaded = []
+
+    def load_model(self, layer):
+        model = FakeModel(layer, self.sizes_gb[layer])
+        self.loaded[layer] = model
+        return model
+
+    def unload_model(self, layer):
+        self.loaded.pop(layer, None)
+        self.unloaded.append(layer)
+
+    def get_model(self, layer):
+        return self.loaded.get(layer)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+def make_manager(sizes_gb, total_gb=20, budgets_gb=None):
+    budgets_gb = budgets_gb or {"reflex": 3, "social": 6, "social_plus": 10, "coder": 15, "vision": 10}
+    residency = ResidencyManager({k: int(v * GB) for k, v in budgets_gb.items()}, int(total_gb * GB),
+                                 clock=Clock())
+    return BudgetedModelManager(FakeManager(sizes_gb), residency)
+
+
+def test_from_profile_reads_config_budget():
+    from core.platform_config import get_platform_profile
+    residency = ResidencyManager.from_profile(get_platform_profile("thor"))
+    budget = get_platform_profile("thor")["vram_budget"]
+    assert residency.capacity_bytes == int(budget["total_gb"] * GB)
+    assert residency.budgets["cortical"] == int(budget["cortical_gb"] * GB)
+    assert "total" not in residency.budgets and "buffer" not in residency.budgets
+
+
+def test_actual_size_is_recorded():
+    manager = make_manager({"reflex": 2})
+    manager.load_model("reflex")
+    assert manager.residency.used_bytes == 2 * GB
+
+
+def test_layer_over_its_own_budget_is_rejected():
+    manager = make_manager({"reflex": 4})
+    with pytest.raises(ResidencyError):
+        manager.load_model("reflex")
+    assert not manager.residency.is_resident("reflex")
+    assert manager.residency.used_bytes == 0
+
+
+def test_lru_lower_priority_layer_is_evicted():
+    manager = make_manager({"reflex": 3, "social": 6, "social_plus": 10}, total_gb=18)
+    manager.load_model("social_plus")
+    manager.load_model("social")
+    manager.load_model("reflex")  # 3 + 6 + 10 > 18 → en düşük öncelikli social_plus çıkar
+    residency = manager.residency
+    assert set(residency.resident()) == {"reflex", "social"}
+    assert manager._manager.unloaded == ["social_plus"]
+    assert residency.used_bytes <= residency.capacity_bytes
+
+
+def test_pinned_layer_is_never_evicted():
+    manager = make_manager({"reflex": 3, "social_plus": 10, "coder": 15}, total_gb=20)
+    manager.load_model("social_plus", pin=True)
+    with pytest.raises(ResidencyError):
+        manager.load_model("coder")
+    assert manager.residency.is_resident("social_plus")
+
+
+def test_night_mode_swaps_coder_for_social_plus_and_back():
+    manager = make_manager({"reflex": 3, "social_plus": 10, "coder": 15}, total_gb=20)
+    manager.load_model("reflex", pin=True)
+    manager.load_model("social_plus")
+
+    manager.enter_night_mode()
+    assert set(manager.residency.resident()) == {"reflex", "coder"}
+
+    manager.exit_night_mode()
+    assert set(manager.residency.resident()) == {"reflex", "social_plus"}
+
+
+def test_night_mode_deferred_under_qos():
+    manager = make_manager({"social_plus": 10, "coder": 15}, total_gb=20)
+    manager.load_model("social_plus")
+    manager.residency.defer_night_mode()
+    assert manager.enter_night_mode() is None
+    assert manager.residency.is_resident("social_plus")
+
+
+def test_get_model_loads_lazily():
+    manager = make_manager({"coder": 15})
+    model = manager.get_model("coder")
+    assert model.layer == "coder"
+    assert manager.residency.is_resident("coder")
@@ -0,0 +1,63 @@
+"""SpeculativeResponder: taslak zamanlaması ve zaman aşımına uğrayan upgrade'ler"""
+
+import time
+import threading
+
+from core.speculative_response import SpeculationPolicy, SpeculativeResponder
+
+
+def make_responder(latencies, mode="draft", **policy):
+    """latencies: katman → saniye (veya threading.Event: set edilene kadar bekler)"""
+    spoken = []
+
+    def generate(layer, prompt, max_tokens=None):
+        delay = latencies[layer]
+        if isinstance(delay, threading.Event):
+            delay.wait(5)
+        else:
+            time.sleep(delay)
+        return f"{layer} cevap"
+
+    policy = SpeculationPolicy(mode=mode, upgrade_grace_ms=20, **policy)
+    responder = SpeculativeResponder(lambda query: "cortical", generate,
+                                     on_speak=lambda text, kind: spoken.append((kind, text)),
+                                     policy=policy, max_workers=1)
+    return responder, spoken
+
+
+def test_draft_spoken_as_soon_as_ready_then_upgraded():
+    responder, spoken = make_responder({"cortical": 0.4, "social": 0.05})
+    try:
+        result = responder.respond("soru")
+    finally:
+        responder.shutdown()
+    assert spoken == [("draft", "social cevap"), ("answer", "cortical cevap")]
+    assert result.committed == "upgrade"
+    assert result.perceived_ms < 300 < result.final_ms
+
+
+def test_upgrade_timeout_commits_already_spoken_draft():
+    release = threading.Event()
+    responder, spoken = make_responder({"cortical": release, "social": 0.02}, upgrade_timeout_s=0.2)
+    try:
+        result = responder.respond("soru")
+    finally:
+        release.set()
+        responder.shutdown()
+    assert result.committed == "draft"
+    assert spoken == [("draft", "social cevap")]
+    assert responder.get_stats()["counts"]["abandoned"] == 1
+
+
+def test_stuck_upgrades_do_not_block_drafts():
+    release = threading.Event()
+    responder, spoken = make_responder({"cortical": release, "social": 0.02}, upgrade_timeout_s=0.1)
+    try:
+        # Tek upgrade worker'ı takılı; ikinci sorunun taslağı yine de konuşulur
+        first = responder.respond("bir")
+        second = responder.respond("iki")
+    finally:
+        release.set()
+        responder.shutdown()
+    assert first.committed == second.committed == "draft"
+    assert second.perceived_ms < 100
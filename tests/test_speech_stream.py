@@ -0,0 +1,99 @@
+"""StreamingSpeechPipeline: parçalama, sıralı çalma, barge-in, Event Bus deltaları (NullAudioSink)"""
+
+import threading
+
+from core.event_bus import EventBus
+from core.speech_stream import NullAudioSink, SentenceChunker, StreamingSpeechPipeline, TokenStream
+
+
+class RecordingTracer:
+    def __init__(self):
+        self.marks = []
+
+    def mark(self, stage, utterance_id):
+        self.marks.append((stage, utterance_id))
+
+
+def test_chunker_cuts_at_sentence_and_clause_boundaries():
+    chunker = SentenceChunker(min_clause_chars=20)
+    chunks = []
+    for delta in "Merhaba dünya. Bugün hava çok güzel, dışarı çıkalım mı? Evet".split(" "):
+        chunks += chunker.feed(delta + " ")
+    chunks += chunker.flush()
+    assert chunks == ["Merhaba dünya.", "Bugün hava çok güzel,", "dışarı çıkalım mı?", "Evet"]
+
+
+def test_chunker_forces_cut_at_max_chars():
+    chunker = SentenceChunker(max_chars=20)
+    chunks = chunker.feed("kelime " * 10) + chunker.flush()
+    assert all(len(c) <= 20 for c in chunks)
+    assert " ".join(chunks).split() == ["kelime"] * 10
+
+
+def test_pipeline_plays_chunks_in_order():
+    sink = NullAudioSink()
+    pipeline = StreamingSpeechPipeline(lambda text: f"ses:{text}", sink=sink)
+    pipeline.speak(iter(["Birinci cümle. ", "İkinci. ", "Üçüncü."]))
+    assert pipeline.wait(2.0)
+    assert sink.played == ["ses:Birinci cümle.", "ses:İkinci.", "ses:Üçüncü."]
+    assert pipeline.stats["chunks"] == 3
+
+
+def test_first_chunk_plays_before_generation_ends():
+    sink = NullAudioSink()
+    played = threading.Event()
+    pipeline = StreamingSpeechPipeline(lambda text: text, sink=sink)
+    original_play = sink.play
+    sink.play = lambda audio: (original_play(audio), played.set())
+    stream = TokenStream()
+    pipeline.speak(stream)
+    stream.push("İlk cümle burada. ")
+    assert played.wait(2.0)  # Akış hâlâ açık
+    stream.push("İkinci.")
+    stream.close()
+    assert pipeline.wait(2.0)
+    assert sink.played == ["İlk cümle burada.", "İkinci."]
+
+
+def test_cancel_stops_generation_and_audio():
+    sink = NullAudioSink()
+    pipeline = StreamingSpeechPipeline(lambda text: text, sink=sink)
+    stream = TokenStream()
+    session = pipeline.speak(stream)
+    stream.push("Konuşuyorum")
+    pipeline.cancel()
+    assert session.finished.wait(2.0)
+    assert session.cancelled.is_set()
+    assert sink.stopped >= 1
+    assert pipeline.stats["cancelled"] == 1
+    assert not pipeline.is_speaking
+
+
+def test_latency_marks_only_for_tracked_utterances():
+    tracer = RecordingTracer()
+    pipeline = StreamingSpeechPipeline(lambda text: text, sink=NullAudioSink(), tracer=tracer)
+    pipeline.speak_text("İzlenmeyen.")
+    assert pipeline.wait(2.0)
+    assert tracer.marks == []
+
+    pipeline.speak_text("İzlenen.", utterance_id="u1")
+    assert pipeline.wait(2.0)
+    assert [uid for _, uid in tracer.marks] == ["u1", "u1", "u1"]
+
+
+def test_event_bus_deltas_become_one_utterance():
+    sink = NullAudioSink()
+    pipeline = StreamingSpeechPipeline(lambda text: text, sink=sink)
+    bus = EventBus()
+    pipeline.attach_event_bus(bus)
+    bus.start()
+    try:
+        for delta in ["Merhaba ", "dünya. ", "Nasılsın?"]:
+            bus.publish("AI_SPEECH_DELTA", {"utterance_id": "u1", "delta": delta})
+        bus.publish("AI_SPEECH_DELTA", {"utterance_id": "u1", "final": True})
+        assert bus.drain(2.0)
+        assert pipeline.wait(2.0)
+    finally:
+        bus.stop()
+    assert sink.played == ["Merhaba dünya.", "Nasılsın?"]
+    assert pipeline.stats["utterances"] == 1
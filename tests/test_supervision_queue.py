@@ -0,0 +1,78 @@
+"""SupervisionQueue: yük altında erteleme, hazır olunca uyanma, ReviewStore döndürme"""
+
+import time
+import threading
+
+from core.supervision_queue import (ReviewItem, ReviewResult, ReviewStore, SamplingPolicy,
+                                    SupervisionQueue)
+
+
+class Supervisor:
+    def __init__(self):
+        self.batches = []
+        self.event = threading.Event()
+
+    def __call__(self, batch):
+        self.batches.append([item.response_id for item in batch])
+        self.event.set()
+        return [ReviewResult(item.response_id, item.layer, item.category, 8.0, "iyi") for item in batch]
+
+
+def make_queue(supervisor, **kwargs):
+    return SupervisionQueue(supervisor, policy=SamplingPolicy(sample_rate=1.0),
+                            store=ReviewStore(path=None), batch_size=4, max_wait=0.01, **kwargs)
+
+
+def item(response_id, category="chat"):
+    return ReviewItem(response_id=response_id, layer="social", query="soru", response="cevap",
+                      category=category)
+
+
+def test_low_priority_reviews_deferred_under_load_not_dropped():
+    supervisor, load = Supervisor(), {"high": True}
+    queue = make_queue(supervisor, is_under_load=lambda: load["high"])
+    queue.start()
+    try:
+        assert queue.submit(item("a")) and queue.submit(item("r", category="medical"))
+        assert supervisor.event.wait(2)
+        time.sleep(0.05)
+        assert supervisor.batches == [["r"]]  # Riskli olan yük altında da denetlenir
+        assert queue.depth == 1
+
+        supervisor.event.clear()
+        load["high"] = False
+        queue.notify()
+        assert supervisor.event.wait(2)
+        assert supervisor.batches[-1] == ["a"]
+    finally:
+        queue.stop()
+    status = queue.get_status()
+    assert status["deferred"] == 1 and status["dropped"] == 0
+
+
+def test_worker_waits_for_ready_notification():
+    supervisor, ready = Supervisor(), {"cortical": False}
+    queue = make_queue(supervisor, is_supervisor_ready=lambda: ready["cortical"])
+    queue.start()
+    try:
+        queue.submit(item("a"))
+        assert not supervisor.event.wait(0.1)
+        ready["cortical"] = True
+        started = time.monotonic()
+        queue.notify()  # MODEL_LAYER_READY
+        assert supervisor.event.wait(2)
+        assert time.monotonic() - started < 0.5
+    finally:
+        queue.stop()
+
+
+def test_review_store_rotates_and_reads_both_files(tmp_path):
+    store = ReviewStore(path=tmp_path / "reviews.jsonl", max_bytes=400)
+    for i in range(20):
+        store.add([ReviewResult(f"id{i}", "social", "chat", 7.0, "not", reviewed_at=1000.0 + i)])
+    assert (tmp_path / "reviews.jsonl.1").exists()
+    assert (tmp_path / "reviews.jsonl").stat().st_size < 400
+    records = store.load_since(0)
+    ids = [r["response_id"] for r in records]
+    assert ids == sorted(ids, key=lambda s: int(s[2:]))
+    assert ids[-1] == "id19"
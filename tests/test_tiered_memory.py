@@ -0,0 +1,64 @@
+"""TieredMemory kalıcılığı: live.json ↔ vektör dosyası tutarlılığı"""
+
+import json
+
+import numpy as np
+
+from core.tiered_memory import TieredMemory
+
+DIM = 8
+
+
+def make_memory(directory):
+    return TieredMemory(dim=DIM, directory=directory, migrate_interval=3600)
+
+
+def add_memories(memory, n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [memory.add(f"anı {i}", vector=rng.standard_normal(DIM)) for i in range(n)]
+
+
+def test_save_load_roundtrip_and_stale_vectors_removed(tmp_path):
+    memory = make_memory(tmp_path)
+    ids = add_memories(memory, 5)
+    memory.save()
+    add_memories(memory, 3, seed=1)
+    memory.save()
+
+    state = json.loads((tmp_path / "live.json").read_text(encoding="utf-8"))
+    assert state["count"] == 8
+    assert sorted(p.name for p in tmp_path.glob("live*.npy")) == [state["vectors"]]
+    assert not list(tmp_path.glob("*.tmp"))
+
+    reloaded = make_memory(tmp_path)
+    assert reloaded.get_stats()["hot"] + reloaded.get_stats()["warm"] == 8
+    assert set(ids) <= set(reloaded._records)
+
+
+def test_count_mismatch_cold_starts_live_tier(tmp_path):
+    memory = make_memory(tmp_path)
+    add_memories(memory, 4)
+    memory.save()
+    # json'dan önce yazılmış yarım kayıt: vektör dosyası farklı satır sayısında
+    state = json.loads((tmp_path / "live.json").read_text(encoding="utf-8"))
+    np.save(tmp_path / state["vectors"], np.zeros((3, DIM), dtype=np.float16))
+
+    reloaded = make_memory(tmp_path)
+    stats = reloaded.get_stats()
+    assert stats["hot"] == 0 and stats["warm"] == 0
+
+
+def test_loads_legacy_live_npy(tmp_path):
+    memory = make_memory(tmp_path)
+    add_memories(memory, 2)
+    memory.save()
+    state = json.loads((tmp_path / "live.json").read_text(encoding="utf-8"))
+    (tmp_path / state.pop("vectors")).rename(tmp_path / "live.npy")
+    for key in ("count", "generation"):
+        state.pop(key)
+    (tmp_path / "live.json").write_text(json.dumps(state), encoding="utf-8")
+
+    reloaded = make_memory(tmp_path)
+    assert len(reloaded._records) == 2
+    reloaded.save()
+    assert not (tmp_path / "live.npy").exists()
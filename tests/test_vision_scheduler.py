@@ -0,0 +1,171 @@
+"""VisionScheduler: SyntheticFrameSource ile hareket kapısı, ritimler, termal bütçe paylaşımı"""
+
+import time
+
+from core.frame_bus import FrameBus, SyntheticFrameSource
+from core.vision_scheduler import EVERY_FRAME, NEW_TRACKS, SCENE_CHANGE, VisionScheduler
+
+WIDTH, HEIGHT = 128, 96
+
+
+class StepClock:
+    """Her çağrıda bir kare aralığı ilerleyen saat"""
+
+    def __init__(self, fps=30.0):
+        self.now = 0.0
+        self.step = 1.0 / fps
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class Recorder:
+    def __init__(self, result=None):
+        self.calls = 0
+        self.result = result
+
+    def __call__(self, frame):
+        self.calls += 1
+        return self.result(self.calls) if callable(self.result) else self.result
+
+
+def make_scheduler(**kwargs):
+    return VisionScheduler(clock=StepClock(), compute_budget_ms=10_000, **kwargs)
+
+
+def test_static_frames_skip_detection():
+    scheduler = make_scheduler()
+    detection = Recorder([])
+    scheduler.register("yolo", detection, cadence=EVERY_FRAME, cost_ms=1)
+    frame = SyntheticFrameSource(WIDTH, HEIGHT).next_frame()
+    for _ in range(10):
+        scheduler.process(frame)
+    stats = scheduler.get_stats()
+    assert detection.calls == 1
+    assert stats["static_frames"] == 9
+    assert stats["models"]["yolo"]["skipped"] == {"static": 9}
+
+
+def test_moving_frames_run_detection_every_frame():
+    scheduler = make_scheduler()
+    detection = Recorder([])
+    scheduler.register("yolo", detection, cadence=EVERY_FRAME, cost_ms=1)
+    source = SyntheticFrameSource(WIDTH, HEIGHT)
+    for _ in range(10):
+        scheduler.process(source.next_frame())
+    assert detection.calls == 10
+
+
+def test_face_recognition_runs_only_on_new_tracks():
+    scheduler = make_scheduler()
+    # Track 1 ilk 5 karede, sonra track 2 de görünür
+    detection = Recorder(lambda n: [{"track_id": 1}] + ([{"track_id": 2}] if n > 5 else []))
+    faces = Recorder("yüz")
+    scheduler.register("yolo", detection, cadence=EVERY_FRAME, priority=0, cost_ms=1)
+    scheduler.register("face", faces, cadence=NEW_TRACKS, priority=1, cost_ms=1)
+    source = SyntheticFrameSource(WIDTH, HEIGHT)
+    for _ in range(10):
+        scheduler.process(source.next_frame())
+    assert faces.calls == 2
+
+
+def test_detection_runs_before_new_track_gate_regardless_of_priority():
+    scheduler = make_scheduler()
+    detection = Recorder(lambda n: [{"track_id": 1}] + ([{"track_id": 2}] if n > 5 else []))
+    faces = Recorder("yüz")
+    # Yüz tanıma bütçede öncelikli olsa da yeni track kararı aynı karenin detection'ından gelir
+    scheduler.register("face", faces, cadence=NEW_TRACKS, priority=0, cost_ms=1)
+    scheduler.register("yolo", detection, cadence=EVERY_FRAME, priority=1, cost_ms=1)
+    source = SyntheticFrameSource(WIDTH, HEIGHT)
+    for _ in range(10):
+        scheduler.process(source.next_frame())
+    assert faces.calls == 2
+
+
+def test_stats_do_not_wait_for_running_model():
+    import threading
+
+    scheduler = make_scheduler()
+    started, release = threading.Event(), threading.Event()
+
+    def slow_vlm(frame):
+        started.set()
+        release.wait(5)
+        return "sahne"
+
+    scheduler.register("vlm", slow_vlm, cadence=SCENE_CHANGE, cost_ms=1)
+    worker = threading.Thread(target=scheduler.process,
+                              args=(SyntheticFrameSource(WIDTH, HEIGHT).next_frame(),))
+    worker.start()
+    try:
+        assert started.wait(5)
+        t0 = time.perf_counter()
+        stats = scheduler.get_stats()
+        scheduler.set_budget(0.5)
+        assert time.perf_counter() - t0 < 0.5
+        assert stats["frames"] == 1
+    finally:
+        release.set()
+        worker.join(5)
+    assert scheduler.get_stats()["models"]["vlm"]["runs"] == 1
+
+
+def test_vlm_runs_on_scene_change():
+    scheduler = make_scheduler()
+    vlm = Recorder("sahne")
+    scheduler.register("vlm", vlm, cadence=SCENE_CHANGE, cost_ms=1)
+    source = SyntheticFrameSource(WIDTH, HEIGHT)
+    frame = source.next_frame()
+    scheduler.process(frame)
+    scheduler.process(frame)
+    scheduler.process(255 - frame)  # Tamamen farklı sahne
+    assert vlm.calls == 2
+    assert scheduler.get_stats()["scene_changes"] == 2
+
+
+def test_budget_goes_to_higher_priority_first():
+    scheduler = VisionScheduler(compute_budget_ms=1000)
+    yolo = scheduler.register("yolo", Recorder(), priority=0, max_hz=30, cost_ms=20)
+    vlm = scheduler.register("vlm", Recorder(), priority=2, max_hz=2, cost_ms=200, min_hz=0.5)
+    assert (yolo.allowed_hz, vlm.allowed_hz) == (30, 2)
+
+    scheduler.set_budget(0.5)  # 500ms/s: önce vlm tabanı (100), kalan yolo'ya
+    assert vlm.allowed_hz == 0.5
+    assert yolo.allowed_hz == 20
+
+    scheduler.set_budget_cap(0.1)  # QoS tavanı hypothalamus bütçesinden düşük
+    assert scheduler.effective_budget == 0.1
+    assert vlm.allowed_hz == 0.5 and yolo.allowed_hz == 0
+
+
+def test_budget_limits_run_rate():
+    scheduler = VisionScheduler(clock=StepClock(fps=30), compute_budget_ms=100)
+    detection = Recorder(lambda n: time.sleep(0.01) or [])  # Ölçülen maliyet ~10ms
+    scheduler.register("yolo", detection, max_hz=30, cost_ms=10)  # bütçe ~10 Hz'e izin verir
+    source = SyntheticFrameSource(WIDTH, HEIGHT)
+    for _ in range(30):
+        scheduler.process(source.next_frame())
+    assert 8 <= detection.calls <= 12
+    assert scheduler.get_stats()["models"]["yolo"]["skipped"].get("budget", 0) > 0
+
+
+def test_attached_scheduler_processes_frame_bus():
+    bus = FrameBus(width=WIDTH, height=HEIGHT, slots=4)
+    scheduler = VisionScheduler()
+    detection = Recorder([])
+    scheduler.register("yolo", detection, cost_ms=1)
+    scheduler.attach(bus)
+    try:
+        source = SyntheticFrameSource(WIDTH, HEIGHT)
+        for seq in range(1, 6):
+            source.run(bus, frames=1)
+            for _ in range(200):  # Her kare işlenmeden sonrakini yazma (araya girenler atlanır)
+                if scheduler.get_stats()["frames"] >= seq:
+                    break
+                time.sleep(0.005)
+        assert scheduler.get_stats()["frames"] == 5
+        assert detection.calls >= 1
+    finally:
+        scheduler.stop()
+        bus.close()